@@ -6,6 +6,11 @@ Building Block: MyPlayerAI (4 SDK callbacks)
     Input Data:  ctx dicts from SDK with dynamic fields per callback
     Output Data: warmup answer, 20 questions, final guess (sentence + word), score log
     Setup Data:  knowledge_base (SQLite + ChromaDB), ANTHROPIC_API_KEY, skills/*.md prompts
+
+LLM-backed callbacks run inside a deadline scope (knowledge_base.deadline).
+The player SDK ctx carries no service deadline, so the budgets below are
+derived from the referee's 2-minute Q21WARMUPCALL and 5-minute
+Q21ROUNDSTART / Q21ANSWERSBATCH deadlines minus polling and send latency.
 """
 
 import sys
@@ -14,6 +19,7 @@ from pathlib import Path
 import anthropic
 from q21_player import PlayerAI
 from knowledge_base.db import ParagraphDB
+from knowledge_base.deadline import deadline_from_ctx
 from knowledge_base.vector_store import VectorStore
 
 # Add player dir to path for helper imports
@@ -28,6 +34,10 @@ from player_helpers import (
     make_guess,
 )
 
+WARMUP_BUDGET_SECONDS = 60
+QUESTIONS_BUDGET_SECONDS = 180
+GUESS_BUDGET_SECONDS = 180
+
 
 class MyPlayerAI(PlayerAI):
 
@@ -42,9 +52,10 @@ class MyPlayerAI(PlayerAI):
     # ── Callback 1: Warmup Answer ──────────────────────────
 
     def get_warmup_answer(self, ctx: dict) -> dict:
-        """Parse and solve the math question (no LLM needed)."""
+        """Parse and solve the math question (LLM only if the regex fails)."""
         question = ctx["dynamic"]["warmup_question"]
-        return {"answer": solve_warmup(question)}
+        with deadline_from_ctx(ctx, default_seconds=WARMUP_BUDGET_SECONDS):
+            return {"answer": solve_warmup(question, self._client)}
 
     # ── Callback 2: Generate 20 Questions ──────────────────
 
@@ -60,10 +71,11 @@ class MyPlayerAI(PlayerAI):
         )
 
         # Generate 20 strategic questions via LLM
-        questions = generate_questions(
-            self._client, self._candidates,
-            book_name, book_hint, association_word,
-        )
+        with deadline_from_ctx(ctx, default_seconds=QUESTIONS_BUDGET_SECONDS):
+            questions = generate_questions(
+                self._client, self._candidates,
+                book_name, book_hint, association_word,
+            )
         self._questions_sent = questions
         return {"questions": questions}
 
@@ -82,10 +94,11 @@ class MyPlayerAI(PlayerAI):
                 self._vs, self._db, book_name, book_hint, n=20,
             )
 
-        return make_guess(
-            self._client, self._candidates, self._questions_sent,
-            answers, book_name, book_hint, association_word,
-        )
+        with deadline_from_ctx(ctx, default_seconds=GUESS_BUDGET_SECONDS):
+            return make_guess(
+                self._client, self._candidates, self._questions_sent,
+                answers, book_name, book_hint, association_word,
+            )
 
     # ── Callback 4: Score Received ─────────────────────────
 
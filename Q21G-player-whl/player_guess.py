@@ -8,7 +8,6 @@ Building Block: make_guess
     Setup Data:  skills/player_guess_maker.md, ANTHROPIC_API_KEY
 """
 
-import json
 import logging
 import random
 import re
@@ -16,14 +15,54 @@ from pathlib import Path
 
 import anthropic
 
+from knowledge_base.structured_output import complete_structured
+
 SKILLS_DIR = Path(__file__).resolve().parents[1] / "skills"
 logger = logging.getLogger(__name__)
 
 
+GUESS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {"type": "string"},
+        "chosen_candidate": {"type": "integer", "minimum": 1, "maximum": 8},
+        "sentence_justification": {"type": "string", "minLength": 20},
+        "associative_word": {"type": "string", "minLength": 1},
+        "word_justification": {"type": "string", "minLength": 10},
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+    },
+    "required": ["chosen_candidate", "sentence_justification", "associative_word",
+                 "word_justification", "confidence"],
+}
+
+
 def _load_skill(name: str) -> str:
     return (SKILLS_DIR / name).read_text(encoding="utf-8")
 
 
+def _words(text: str) -> set[str]:
+    return {c for w in str(text).split()
+            if len(c := re.sub(r'[^\w]', '', w).lower()) > 1}
+
+
+def local_rank(candidates: list, questions_sent: list, answers: list) -> int:
+    """Index of the candidate best matching the answered options (no LLM).
+
+    Each A-D answer votes for candidates whose text shares words with the
+    chosen option; ties keep the search ranking.
+    """
+    options = {q["question_number"]: q.get("options", {}) for q in questions_sent}
+    chosen = [_words(options.get(a["question_number"], {}).get(a["answer"], ""))
+              for a in answers]
+    best_idx, best_score = 0, 0
+    for idx, c in enumerate(candidates[:8]):
+        text = _words(c.get("full_text", c.get("text", c.get("document", ""))))
+        score = sum(len(words & text) for words in chosen)
+        if score > best_score:
+            best_idx, best_score = idx, score
+    return best_idx
+
+
 def make_guess(client, candidates: list, questions_sent: list,
                answers: list, book_name: str, book_hint: str,
                association_word: str) -> dict:
@@ -86,16 +125,15 @@ Respond as JSON:
   "confidence": 0.8}}"""
 
     try:
-        raw = call_llm(client, prompt, max_tokens=1500)
+        data, _ = complete_structured(client, prompt, GUESS_SCHEMA, call=call_llm,
+                                      max_tokens=1500, skill="player_guess_maker")
+        data = data if isinstance(data, dict) else {}
     except (anthropic.APIError, anthropic.APIConnectionError):
-        logger.error("LLM failed for guess — falling back to top candidate")
-        raw = ""
-
-    try:
-        match = re.search(r'\{[\s\S]*\}', raw)
-        data = json.loads(match.group()) if match else {}
-    except (json.JSONDecodeError, AttributeError):
+        logger.error("LLM failed for guess — ranking candidates locally")
         data = {}
+        if candidates:
+            pick = local_rank(candidates, questions_sent, answers)
+            candidates = [candidates[pick]] + candidates[:pick] + candidates[pick + 1:]
 
     # CRITICAL: Use the candidate's stored opening sentence, not the LLM's copy.
     # Map shuffled position back to original candidate index.
@@ -8,7 +8,6 @@ Building Block: solve_warmup, search_candidates, generate_questions
                  knowledge_base (SQLite + ChromaDB)
 """
 
-import json
 import logging
 import re
 from pathlib import Path
@@ -17,7 +16,9 @@ import anthropic
 
 from player_guess import make_guess  # noqa: F401 — re-exported for my_player
 from knowledge_base.llm_client import call_llm  # shared retry logic
+from knowledge_base.model_router import router
 from knowledge_base.skill_plugin import build_default_registry
+from knowledge_base.structured_output import complete_structured, decode
 
 SKILLS_DIR = Path(__file__).resolve().parents[1] / "skills"
 logger = logging.getLogger(__name__)
@@ -28,8 +29,70 @@ def _load_skill(name: str) -> str:
     return _registry.get(name).get_prompt()
 
 
-def solve_warmup(question: str) -> str:
-    """Parse and solve a simple math question."""
+WARMUP_MIN_CONFIDENCE = 0.7
+
+WARMUP_SCHEMA = {
+    "type": "object",
+    "properties": {"answer": {"type": "integer"},
+                   "confidence": {"type": "number", "minimum": 0, "maximum": 1}},
+    "required": ["answer", "confidence"],
+}
+
+QUESTIONS_SCHEMA = {
+    "type": "array", "minItems": 20, "maxItems": 20,
+    "items": {
+        "type": "object",
+        "properties": {
+            "question_number": {"type": "integer", "minimum": 1, "maximum": 20},
+            "question_text": {"type": "string", "minLength": 5},
+            "options": {
+                "type": "object",
+                "properties": {k: {"type": "string"} for k in "ABCD"},
+                "required": list("ABCD"),
+            },
+        },
+        "required": ["question_number", "question_text", "options"],
+    },
+}
+
+
+def _parse_warmup(raw: str) -> tuple[str, float] | None:
+    """Decode {"answer": int, "confidence": float}; None if malformed."""
+    data, errors = decode(raw, WARMUP_SCHEMA)
+    if errors:
+        return None
+    return str(data["answer"]), float(data["confidence"])
+
+
+def _solve_warmup_llm(client, question: str) -> str:
+    """LLM fallback for warmup phrasings the regex cannot parse."""
+    prompt = f"""Solve this short arithmetic question (it may be in Hebrew or words):
+{question}
+
+Respond in this exact JSON format only:
+{{"answer": <integer>, "confidence": <0.0-1.0>}}"""
+
+    def _confident(raw: str) -> bool:
+        parsed = _parse_warmup(raw)
+        return parsed is not None and parsed[1] >= WARMUP_MIN_CONFIDENCE
+
+    try:
+        raw = router.complete(client, prompt, skill="warmup_solver",
+                              accept=_confident, call=call_llm, schema=WARMUP_SCHEMA,
+                              max_tokens=50, timeout=15.0)
+    except (anthropic.APIError, anthropic.APIConnectionError):
+        logger.error("LLM failed for warmup — answering 0")
+        return "0"
+    parsed = _parse_warmup(raw)
+    return parsed[0] if parsed else "0"
+
+
+def solve_warmup(question: str, client=None) -> str:
+    """Parse and solve a simple math question.
+
+    Falls back to the LLM (small model first) when the regex finds no
+    expression and a client is given; otherwise answers "0".
+    """
     match = re.search(r'(\d+)\s*([+\-*/])\s*(\d+)', question)
     if match:
         a, op, b = int(match.group(1)), match.group(2), int(match.group(3))
@@ -37,6 +100,8 @@ def solve_warmup(question: str) -> str:
         if op == '-': return str(a - b)
         if op == '*': return str(a * b)
         if op == '/': return str(a // b) if b != 0 else "0"
+    if client is not None:
+        return _solve_warmup_llm(client, question)
     return "0"
 
 
@@ -69,6 +134,63 @@ def search_candidates(vs, db, book_name: str, book_hint: str, n: int = 20) -> li
     return rows[:n] if rows else []
 
 
+def _cand_text(c: dict) -> str:
+    return c.get("full_text", c.get("text", c.get("document", "")))
+
+
+def _content_words(text: str) -> list[str]:
+    return [c for w in text.split()
+            if len(c := re.sub(r'[^\w]', '', w).lower()) > 3]
+
+
+def local_questions(candidates: list, book_hint: str, n: int = 20) -> list[dict]:
+    """Build discriminating questions from candidate text, without the LLM.
+
+    Each question offers four terms, each distinctive to a different
+    candidate (appears in no other one), so the referee's answer
+    — LLM or lexical — points at one candidate. Slots that cannot be
+    filled fall back to a generic hint question.
+    """
+    texts = [_content_words(_cand_text(c)) for c in candidates[:8]]
+    doc_freq: dict[str, int] = {}
+    for words in texts:
+        for w in set(words):
+            doc_freq[w] = doc_freq.get(w, 0) + 1
+    distinctive = [
+        list(dict.fromkeys(w for w in words if doc_freq[w] == 1))
+        for words in texts
+    ]
+
+    groups: list[list[str]] = []
+    for depth in range(max((len(d) for d in distinctive), default=0)):
+        terms = [d[depth] for d in distinctive if len(d) > depth]
+        if len(terms) < 2:
+            break
+        shift = depth % len(terms)  # vary which candidates share a question
+        terms = terms[shift:] + terms[:shift]
+        groups += [terms[j:j + 4] for j in range(0, len(terms), 4)
+                   if len(terms[j:j + 4]) >= 2]
+        if len(groups) >= n:
+            break
+
+    questions = []
+    for i in range(n):
+        if i < len(groups):
+            terms = groups[i] + ["none of these"] * (4 - len(groups[i]))
+            questions.append({
+                "question_number": i + 1,
+                "question_text": "Which of these terms does the paragraph use?",
+                "options": dict(zip("ABCD", terms)),
+            })
+        else:
+            questions.append({
+                "question_number": i + 1,
+                "question_text": f"Does the paragraph discuss a specific concept related to {book_hint}?",
+                "options": {"A": "Yes", "B": "No", "C": "Partially", "D": "Not applicable"},
+            })
+    return questions
+
+
 def generate_questions(client, candidates: list, book_name: str,
                        book_hint: str, association_word: str) -> list[dict]:
     """Generate 20 strategic questions via LLM."""
@@ -95,19 +217,16 @@ Generate exactly 20 questions as a JSON array:
 [{{"question_number": 1, "question_text": "...", "options": {{"A": "...", "B": "...", "C": "...", "D": "..."}}}}]"""
 
     try:
-        raw = call_llm(client, prompt, max_tokens=3000, timeout=90.0)
+        questions, _ = complete_structured(
+            client, prompt, QUESTIONS_SCHEMA, call=call_llm,
+            max_tokens=3000, timeout=90.0, skill="player_question_generator")
     except (anthropic.APIError, anthropic.APIConnectionError):
-        logger.error("LLM failed for question generation — using generic questions")
-        raw = ""
-
-    try:
-        match = re.search(r'\[[\s\S]*\]', raw)
-        questions = json.loads(match.group()) if match else []
-    except (json.JSONDecodeError, AttributeError):
-        questions = []
+        logger.error("LLM failed for question generation — building locally")
+        return local_questions(candidates, book_hint)
 
     # Ensure exactly 20 questions, fill gaps with generic ones
-    q_map = {q["question_number"]: q for q in questions if "question_number" in q}
+    q_map = {q["question_number"]: q for q in questions or []
+             if isinstance(q, dict) and "question_number" in q}
     result = []
     for i in range(1, 21):
         if i in q_map:
@@ -2,36 +2,100 @@
 my_ai.py — Q21G Referee AI Implementation
 ==========================================
 
-Building Block: MyRefereeAI (4 SDK callbacks)
+Building Block: MyRefereeAI (4 SDK callbacks + prepare_game, get_answers_batch)
     Input Data:  ctx dicts from SDK with dynamic fields per callback
     Output Data: warmup question, round info (hint/word), answers, score/feedback
     Setup Data:  knowledge_base (SQLite + ChromaDB), ANTHROPIC_API_KEY, skills/*.md prompts
+
+Each LLM-backed callback runs inside a deadline scope built from
+ctx["service"]["deadline_seconds"], so every LLM call and retry loop
+below it finishes (or falls back) before the SDK's timeout fires. The
+scope also ends when the SDK cancels the callback (thread executor), so
+an abandoned callback stops starting LLM calls.
+
+prepare_game runs in the background after round start and digests the
+paragraph into a fact sheet that get_answers and get_score_feedback use.
+get_answers_batch answers both players with the paragraph sent once
+(used when the config sets answer_batch_window_seconds).
+
+One instance serves every match the referee runs, possibly at the same
+time, so the round state lives in a GameMemory per ctx match_id.
 """
 
 import random
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
 
 import anthropic
-from q21_referee import RefereeAI
+from q21_referee import RefereeAI, current_cancel_token
 from knowledge_base.db import ParagraphDB
+from knowledge_base.deadline import deadline_from_ctx, time_left
+from knowledge_base.hint_pool import HintPool
 from knowledge_base.vector_store import VectorStore
 
+from referee_answer_cache import AnswerCache
+from referee_answering import HybridAnswerer
+from referee_fact_sheet import build_fact_sheet
 from referee_helpers import (
+    HINT_ATTEMPT_SECONDS,
     generate_hint_and_word,
     answer_questions,
+    answer_questions_batch,
     score_guess,
 )
 
 
+MAX_GAMES = 16  # game memories kept; the oldest match is forgotten first
+
+
+def _deadline(ctx):
+    """Deadline scope of a callback that also ends when the SDK cancels it."""
+    token = current_cancel_token()
+    return deadline_from_ctx(ctx, cancelled=lambda: token.cancelled)
+
+
+@dataclass
+class GameMemory:
+    """What one match's callbacks remember between calls."""
+
+    answer_cache: AnswerCache
+    paragraph_text: Optional[str] = None
+    opening_sentence: Optional[str] = None
+    association_word: Optional[str] = None
+    fact_sheet: Optional[dict] = None
+
+
 class MyRefereeAI(RefereeAI):
 
     def __init__(self):
         self._db = ParagraphDB()
+        self._hint_pool = HintPool()  # filled offline by precompute_hints.py
         self._vs = VectorStore()
         self._client = anthropic.Anthropic()
-        # State stored across callbacks (per round)
-        self._paragraph_text = None
-        self._opening_sentence = None
-        self._association_word = None
+        # State stored across callbacks, per match
+        self._games: OrderedDict[Optional[str], GameMemory] = OrderedDict()
+        self._games_lock = threading.Lock()
+        # Kept across rounds so its LLM agreement stats accumulate; it only
+        # answers locally once those stats have calibrated its margin
+        self._answerer = HybridAnswerer(embed=self._vs.embed)
+
+    @staticmethod
+    def _match_id(ctx) -> Optional[str]:
+        return ((ctx or {}).get("dynamic") or {}).get("match_id")
+
+    def _game(self, match_id: Optional[str] = None, fresh: bool = False) -> GameMemory:
+        """The match's memory (created on first use; ``fresh`` starts it over)."""
+        with self._games_lock:
+            game = None if fresh else self._games.get(match_id)
+            if game is None:
+                game = GameMemory(answer_cache=AnswerCache(embed=self._vs.embed))
+                self._games.pop(match_id, None)
+                self._games[match_id] = game
+                while len(self._games) > MAX_GAMES:
+                    self._games.popitem(last=False)
+            return game
 
     # ── Callback 1: Warmup ──────────────────────────────
 
@@ -50,25 +114,40 @@ class MyRefereeAI(RefereeAI):
         """Select paragraph, generate hint, choose association word."""
         _FALLBACK_HINT = "Academic discussion of theoretical concepts"
 
-        # Try up to 3 paragraphs — retry if hint generation fails self-test
-        for _attempt in range(3):
-            paragraph = self._db.get_random(
-                min_words=30, max_words=200,
-                min_difficulty=0.4, max_difficulty=0.7,
-            )
-            if not paragraph:
-                paragraph = self._db.get_random(min_words=30, max_words=300)
-
-            result = generate_hint_and_word(
-                self._client, paragraph, vs=self._vs,
-            )
-            hint = result.get("book_hint", "")
-            if hint and _FALLBACK_HINT not in hint:
-                break  # Good hint found
-
-        self._paragraph_text = paragraph["full_text"]
-        self._opening_sentence = paragraph["opening_sentence"]
-        self._association_word = result.get("association_word", "concept")
+        # Pre-generated, validated hint: no LLM call needed
+        pooled = self._hint_pool.take()
+        if pooled:
+            return self._start_round(ctx, pooled, pooled)
+
+        # Try up to 3 paragraphs — retry if hint generation fails self-test,
+        # but only while the deadline still fits another hint attempt
+        with _deadline(ctx):
+            for attempt in range(3):
+                if attempt and time_left() < HINT_ATTEMPT_SECONDS:
+                    break
+                paragraph = self._db.get_random(
+                    min_words=30, max_words=200,
+                    min_difficulty=0.4, max_difficulty=0.7,
+                )
+                if not paragraph:
+                    paragraph = self._db.get_random(min_words=30, max_words=300)
+
+                result = generate_hint_and_word(
+                    self._client, paragraph, vs=self._vs,
+                )
+                hint = result.get("book_hint", "")
+                if hint and _FALLBACK_HINT not in hint:
+                    break  # Good hint found
+
+        return self._start_round(ctx, paragraph, result)
+
+    def _start_round(self, ctx, paragraph: dict, result: dict) -> dict:
+        """Remember the round's paragraph and build the callback result."""
+        # Answers and facts are only valid for this paragraph: start over
+        game = self._game(self._match_id(ctx), fresh=True)
+        game.paragraph_text = paragraph["full_text"]
+        game.opening_sentence = paragraph["opening_sentence"]
+        game.association_word = result.get("association_word", "concept")
 
         return {
             "book_name": paragraph["pdf_name"],
@@ -76,40 +155,79 @@ class MyRefereeAI(RefereeAI):
             "association_word": result.get("association_domain", "academia"),
         }
 
+    # ── Idle time: Fact Sheet ───────────────────────────
+
+    def prepare_game(self, ctx):
+        """Digest the paragraph while the players write their questions."""
+        game = self._game(self._match_id(ctx))
+        if not game.paragraph_text:
+            return
+        with _deadline(ctx):
+            game.fact_sheet = build_fact_sheet(
+                self._client, game.paragraph_text, game.opening_sentence or "",
+            )
+
     # ── Callback 3: Answer 20 Questions ─────────────────
 
     def get_answers(self, ctx):
         """Answer player's 20 questions about the secret paragraph."""
         questions = ctx["dynamic"]["questions"]
+        game = self._game(self._match_id(ctx))
 
-        if not self._paragraph_text:
+        if not game.paragraph_text:
             return {"answers": [
                 {"question_number": q["question_number"], "answer": "Not Relevant"}
                 for q in questions
             ]}
 
-        answers = answer_questions(
-            self._client, self._paragraph_text, questions
-        )
+        with _deadline(ctx):
+            answers = answer_questions(
+                self._client, game.paragraph_text, questions,
+                cache=game.answer_cache, fact_sheet=game.fact_sheet,
+                answerer=self._answerer,
+            )
         return {"answers": answers}
 
+    def get_answers_batch(self, ctx):
+        """Answer both players' questions in one LLM call (shared paragraph)."""
+        players = ctx["dynamic"]["players"]
+        game = self._game(self._match_id(ctx))
+
+        if not game.paragraph_text:
+            return {"answers_by_player": {p["player_id"]: [
+                {"question_number": q["question_number"], "answer": "Not Relevant"}
+                for q in p["questions"]
+            ] for p in players}}
+
+        with _deadline(ctx):
+            answers = answer_questions_batch(
+                self._client, game.paragraph_text,
+                {p["player_id"]: p["questions"] for p in players},
+                cache=game.answer_cache, fact_sheet=game.fact_sheet,
+                answerer=self._answerer,
+            )
+        return {"answers_by_player": answers}
+
     # ── Callback 4: Score Player's Guess ────────────────
 
     def get_score_feedback(self, ctx):
         """Score the player's guess against actual answers."""
         guess = ctx["dynamic"]["player_guess"]
+        game = self._game(self._match_id(ctx))
 
         # Use stored values (ctx may have None for these)
         actual_sentence = (
-            self._opening_sentence
+            game.opening_sentence
             or ctx["dynamic"].get("actual_opening_sentence", "")
         )
         actual_word = (
-            self._association_word
+            game.association_word
             or ctx["dynamic"].get("actual_associative_word", "")
         )
-        paragraph = self._paragraph_text or ""
+        paragraph = game.paragraph_text or ""
 
-        return score_guess(
-            self._client, actual_sentence, actual_word, paragraph, guess
-        )
+        with _deadline(ctx):
+            return score_guess(
+                self._client, actual_sentence, actual_word, paragraph, guess,
+                fact_sheet=game.fact_sheet, embed=self._vs.embed,
+            )
@@ -0,0 +1,48 @@
+"""
+precompute_hints.py — Fill the referee hint pool offline
+=========================================================
+
+    python precompute_hints.py [--workers 5]
+
+Generates a taboo-checked hint / association word / domain for every
+medium-difficulty paragraph that has none yet, ranks how findable each
+hint is in the vector index, and stores the usable ones in the `hints`
+table. MyRefereeAI.get_round_start_info then takes a pooled hint instead
+of calling the LLM during the 60 s round-start deadline.
+
+Safe to re-run: pooled paragraphs are skipped.
+"""
+
+import argparse
+import logging
+
+import anthropic
+
+from knowledge_base.hint_pool import build_hint_pool
+from knowledge_base.vector_store import VectorStore
+from referee_helpers import FALLBACK_HINT, generate_hint_and_word
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=5,
+                        help="concurrent LLM calls (default: 5)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s")
+
+    client = anthropic.Anthropic()
+    vs = VectorStore()
+
+    def generate(paragraph: dict):
+        # The self-test picks the candidate nearest PREFERRED_RANK (and
+        # retries when none is findable); the pool re-ranks it for storage
+        result = generate_hint_and_word(client, paragraph, vs=vs)
+        return None if result == FALLBACK_HINT else result
+
+    added = build_hint_pool(generate, vs=vs, max_workers=args.workers)
+    print(f"Added {added} hints to the pool")
+
+
+if __name__ == "__main__":
+    main()
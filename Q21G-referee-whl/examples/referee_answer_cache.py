@@ -0,0 +1,129 @@
+"""Referee answer cache — per-game memo of already answered questions.
+
+Building Block: AnswerCache
+    Input Data:  player question dicts {question_number, question_text, options}
+    Output Data: cached answers {question_number: answer} + questions still to ask
+    Setup Data:  optional embed(texts) -> vectors (e.g. VectorStore.embed), threshold
+
+Both players in a match question the same secret paragraph, and many
+questions repeat almost verbatim. A question is keyed by its normalized
+text plus its normalized option set; the answer is stored as the chosen
+option's text, so the same options under different letters still hit.
+With an embedder, a question whose option set matches exactly and whose
+text embedding is within ``threshold`` cosine similarity also hits.
+Embedding runs outside the lock, so one player's lookup never waits on
+the other's embed call.
+"""
+
+import logging
+import math
+import re
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+NOT_RELEVANT = "Not Relevant"
+LETTERS = ("A", "B", "C", "D")
+
+
+def _norm(text) -> str:
+    """Lowercase, punctuation to spaces, collapsed whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", str(text or "")).lower().split())
+
+
+def _options(question: dict) -> dict[str, str]:
+    opts = question.get("options") or {}
+    return {letter: _norm(opts.get(letter, "")) for letter in LETTERS}
+
+
+def _key(question: dict) -> tuple[str, tuple[str, ...]]:
+    return _norm(question.get("question_text")), tuple(sorted(_options(question).values()))
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class AnswerCache:
+    """Thread-safe question → answer memo for one game (one paragraph)."""
+
+    def __init__(self, embed: Optional[Callable[[list[str]], list]] = None,
+                 threshold: float = 0.95):
+        self._embed = embed
+        self._threshold = threshold
+        self._answers: dict[tuple, str] = {}           # key → option text / Not Relevant
+        self._vectors: dict[tuple, list[tuple]] = {}   # option set → [(vector, answer)]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+
+    def lookup(self, questions: list[dict]) -> tuple[dict[int, str], list[dict]]:
+        """Split questions into cached answers and the ones still to answer."""
+        hits: dict[int, str] = {}
+        misses: list[dict] = []
+        with self._lock:
+            for q in questions:
+                letter = self._letter(q, self._answers.get(_key(q)))
+                if letter is None:
+                    misses.append(q)
+                else:
+                    hits[q["question_number"]] = letter
+            candidates = [q for q in misses if _key(q)[1] in self._vectors]
+        exact = len(hits)
+        if self._embed and candidates:
+            vectors = self._embed([_key(q)[0] for q in candidates])
+            with self._lock:
+                misses = self._semantic_lookup(misses, hits, candidates, vectors)
+        with self._lock:
+            self.hits += len(hits)
+            self.semantic_hits += len(hits) - exact
+        if hits:
+            logger.info("Answer cache: %d/%d hits (%d semantic)",
+                        len(hits), len(questions), len(hits) - exact)
+        return hits, misses
+
+    def store(self, questions: list[dict], answers: list[dict]) -> None:
+        """Remember answers (as returned by the LLM) for these questions."""
+        by_number = {a["question_number"]: a["answer"] for a in answers}
+        fresh = []
+        with self._lock:
+            for q in questions:
+                answer = by_number.get(q["question_number"])
+                value = NOT_RELEVANT if answer == NOT_RELEVANT else _options(q).get(answer)
+                if not value:
+                    continue
+                key = _key(q)
+                if key not in self._answers:
+                    fresh.append((key, value))
+                self._answers[key] = value
+        if self._embed and fresh:
+            vectors = self._embed([key[0] for key, _ in fresh])
+            with self._lock:
+                for (key, value), vector in zip(fresh, vectors):
+                    self._vectors.setdefault(key[1], []).append((vector, value))
+
+    def _semantic_lookup(self, misses: list[dict], hits: dict[int, str],
+                         candidates: list[dict], vectors: list) -> list[dict]:
+        """Match embedded candidates; same option set required (caller holds the lock)."""
+        matched = set()
+        for q, vector in zip(candidates, vectors):
+            score, value = max((_cosine(vector, v), value)
+                               for v, value in self._vectors[_key(q)[1]])
+            letter = self._letter(q, value) if score >= self._threshold else None
+            if letter is not None:
+                hits[q["question_number"]] = letter
+                matched.add(q["question_number"])
+        return [q for q in misses if q["question_number"] not in matched]
+
+    @staticmethod
+    def _letter(question: dict, value: Optional[str]) -> Optional[str]:
+        """Map a stored option text back to this question's letter."""
+        if value is None or value == NOT_RELEVANT:
+            return value
+        for letter, text in _options(question).items():
+            if text == value:
+                return letter
+        return None
@@ -0,0 +1,171 @@
+"""Referee hybrid answering — decide clear-cut questions locally by embedding.
+
+Building Block: HybridAnswerer
+    Input Data:  paragraph text, player question dicts {question_number,
+                 question_text, options}
+    Output Data: confident local answers {question_number: letter}; the
+                 rest are left for the LLM
+    Setup Data:  embed(texts) -> vectors (e.g. VectorStore.embed), margin,
+                 min_similarity, audit_rate, target, min_samples
+
+Each option is turned into a statement ("question + option") and scored
+by its best cosine similarity to any paragraph sentence. A question whose
+best option beats the runner-up by ``margin`` (and is similar enough) is
+a local candidate. Yes/no style questions and negated ones ("Which is
+NOT mentioned?", whose answer is the least similar option) stay with the LLM.
+
+Until calibrated_margin() has ``min_samples`` audits agreeing at
+``target``, every candidate is audited (sent to the LLM and compared).
+Afterwards candidates at or above the calibrated margin are answered
+locally, except an ``audit_rate`` sample that keeps the stats current.
+"""
+
+import logging
+import math
+import random
+import re
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+LETTERS = ("A", "B", "C", "D")
+MARGIN_BUCKETS = (0.02, 0.05, 0.1, 0.15, 0.2, 0.3)
+
+# English and Hebrew negations / exclusions ("NOT", "except", "לא", "למעט")
+_NEGATION = re.compile(
+    r"\b(?:not|never|none|except|excluding)\b|n't\b|"
+    r"(?<![\w\u0590-\u05FF])[ושהכ]?(?:לא|אין|אינו|אינה|אינם|חוץ|למעט)(?![\w\u0590-\u05FF])",
+    re.IGNORECASE,
+)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Rough sentence split; sentences under 3 words are merged away."""
+    return [s.strip() for s in _SENTENCE_END.split(text) if len(s.split()) >= 3]
+
+
+def is_negated(question_text: str) -> bool:
+    """Whether the question asks for the option that does NOT fit."""
+    return bool(_NEGATION.search(question_text or ""))
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class HybridAnswerer:
+    """Local option scoring with an LLM audit trail; thread-safe."""
+
+    def __init__(self, embed: Callable[[list[str]], list], margin: float = 0.1,
+                 min_similarity: float = 0.5, audit_rate: float = 0.1,
+                 target: float = 0.95, min_samples: int = 20,
+                 rng: Optional[random.Random] = None):
+        self._embed = embed
+        self.margin = margin
+        self.min_similarity = min_similarity
+        self.audit_rate = audit_rate
+        self.target = target
+        self.min_samples = min_samples
+        self._rng = rng or random.Random()
+        self._paragraph: Optional[str] = None
+        self._sentence_vectors: list = []
+        self._agreement: list[tuple[float, bool]] = []  # (margin, agreed)
+        self._lock = threading.Lock()
+
+    def score(self, paragraph_text: str, questions: list[dict]) -> dict[int, dict[str, float]]:
+        """{question_number: {letter: best sentence similarity}} for all options."""
+        sentences = self._sentences(paragraph_text)
+        statements, index = [], []
+        for q in questions:
+            for letter in LETTERS:
+                option = str((q.get("options") or {}).get(letter, "")).strip()
+                if option:
+                    statements.append(f"{q.get('question_text', '')} {option}")
+                    index.append((q["question_number"], letter))
+        scores: dict[int, dict[str, float]] = {q["question_number"]: {} for q in questions}
+        if not sentences or not statements:
+            return scores
+        for (number, letter), vector in zip(index, self._embed(statements)):
+            scores[number][letter] = max(cosine(vector, s) for s in sentences)
+        return scores
+
+    def split(self, paragraph_text: str,
+              questions: list[dict]) -> tuple[dict[int, str], dict[int, tuple[str, float]]]:
+        """(local answers, audited answers {number: (letter, margin)}).
+
+        Audited questions are confident but must still go to the LLM so
+        that record() can compare the two answers. Before calibration
+        every confident question is audited.
+        """
+        threshold = self.calibrated_margin(self.target, self.min_samples)
+        asked = [q for q in questions if not is_negated(q.get("question_text", ""))]
+        local: dict[int, str] = {}
+        audit: dict[int, tuple[str, float]] = {}
+        for number, option_scores in self.score(paragraph_text, asked).items():
+            decided = self._decide(option_scores)
+            if decided is None:
+                continue
+            if (threshold is None or decided[1] < threshold
+                    or self._rng.random() < self.audit_rate):
+                audit[number] = decided
+            else:
+                local[number] = decided[0]
+        if local or audit:
+            logger.info("Hybrid answerer: %d/%d local, %d audited (margin %s)",
+                        len(local), len(questions), len(audit),
+                        "uncalibrated" if threshold is None else threshold)
+        return local, audit
+
+    def record(self, audit: dict[int, tuple[str, float]], llm_answers: dict[int, str]) -> None:
+        """Compare audited local answers with the LLM's."""
+        with self._lock:
+            for number, (letter, margin) in audit.items():
+                if number in llm_answers:
+                    self._agreement.append((margin, llm_answers[number] == letter))
+
+    def agreement(self) -> dict:
+        """Overall and per-margin-bucket agreement with the LLM."""
+        with self._lock:
+            samples = list(self._agreement)
+        buckets = {}
+        for low in MARGIN_BUCKETS:
+            hits = [agreed for m, agreed in samples if m >= low]
+            if hits:
+                buckets[low] = {"samples": len(hits), "agreement": sum(hits) / len(hits)}
+        total = sum(agreed for _, agreed in samples)
+        return {"samples": len(samples),
+                "agreement": total / len(samples) if samples else None,
+                "by_margin": buckets}
+
+    def calibrated_margin(self, target: float = 0.95, min_samples: int = 20) -> Optional[float]:
+        """Smallest bucket margin whose audited answers meet ``target``, or None."""
+        for low, bucket in self.agreement()["by_margin"].items():
+            if bucket["samples"] >= min_samples and bucket["agreement"] >= target:
+                return low
+        return None
+
+    def _decide(self, option_scores: dict[str, float]) -> Optional[tuple[str, float]]:
+        if len(option_scores) < 2:
+            return None
+        ranked = sorted(option_scores.items(), key=lambda kv: kv[1], reverse=True)
+        (best, top), (_, second) = ranked[0], ranked[1]
+        margin = top - second
+        if top < self.min_similarity or margin < self.margin:
+            return None
+        return best, margin
+
+    def _sentences(self, paragraph_text: str) -> list:
+        """Sentence vectors of the paragraph, embedded once per paragraph."""
+        with self._lock:
+            if paragraph_text == self._paragraph:
+                return self._sentence_vectors
+        sentences = split_sentences(paragraph_text) or [paragraph_text]
+        vectors = self._embed(sentences)
+        with self._lock:
+            self._paragraph, self._sentence_vectors = paragraph_text, vectors
+        return vectors
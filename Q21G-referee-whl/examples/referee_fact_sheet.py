@@ -0,0 +1,81 @@
+"""Referee fact sheet — structured digest of the secret paragraph.
+
+Building Block: build_fact_sheet, render_fact_sheet
+    Input Data:  paragraph text, opening sentence
+    Output Data: {topics, entities, claims, sentence_types} lists (+ word_count),
+                 or None when the LLM is unavailable
+    Setup Data:  ANTHROPIC_API_KEY
+
+Built in MyRefereeAI.prepare_game while the players write their
+questions. answer_questions and score_guess then put the compact sheet
+in their prompts instead of the full paragraph (answer_questions also
+drops the long answering instructions), so each call has less to read
+and reason over.
+"""
+
+import logging
+from typing import Optional
+
+import anthropic
+
+from knowledge_base.structured_output import complete_structured
+
+logger = logging.getLogger(__name__)
+
+_LIST = {"type": "array", "items": {"type": "string"}}
+
+FACT_SHEET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "topics": _LIST,
+        "entities": _LIST,
+        "claims": _LIST,
+        "sentence_types": _LIST,
+    },
+    "required": ["topics", "entities", "claims", "sentence_types"],
+}
+
+
+def build_fact_sheet(client, paragraph_text: str, opening_sentence: str = "") -> Optional[dict]:
+    """One LLM call that digests the paragraph; None if it fails."""
+    from referee_helpers import call_llm
+
+    prompt = f"""Build a fact sheet of this paragraph for answering multiple-choice
+questions about it later. Use the paragraph's own language.
+
+PARAGRAPH TEXT:
+{paragraph_text}
+
+Respond as JSON:
+{{"topics": [...],          // 2-5 subjects the paragraph is about
+  "entities": [...],        // named concepts, people, systems, terms it mentions
+  "claims": [...],          // every factual statement, one short sentence each
+  "sentence_types": [...]}} // per sentence, in order: definition / example / claim / question / list ..."""
+
+    try:
+        sheet, errors = complete_structured(client, prompt, FACT_SHEET_SCHEMA, call=call_llm,
+                                            max_tokens=1024, timeout=60.0,
+                                            skill="referee_fact_sheet")
+    except (anthropic.APIError, anthropic.APIConnectionError):
+        logger.warning("LLM failed for the fact sheet — answering from the paragraph")
+        return None
+    if not isinstance(sheet, dict) or errors:
+        return None
+    sheet["word_count"] = len(paragraph_text.split())
+    sheet["opening_sentence"] = opening_sentence
+    return sheet
+
+
+def render_fact_sheet(sheet: dict) -> str:
+    """Compact prompt text for a fact sheet."""
+    lines = [
+        f"Topics: {'; '.join(sheet.get('topics', []))}",
+        f"Entities: {'; '.join(sheet.get('entities', []))}",
+        f"Sentence types: {', '.join(sheet.get('sentence_types', []))}",
+        f"Word count: {sheet.get('word_count', '?')}",
+    ]
+    if sheet.get("opening_sentence"):
+        lines.append(f"Opening sentence: {sheet['opening_sentence']}")
+    lines.append("Claims:")
+    lines.extend(f"- {claim}" for claim in sheet.get("claims", []))
+    return "\n".join(lines)
@@ -0,0 +1,101 @@
+"""Referee feedback templates — score feedback texts without the LLM.
+
+Building Block: template_feedback
+    Input Data:  breakdown scores, actual opening sentence / word, player
+                 guess dict, string similarities, whether the word is in
+                 the paragraph
+    Output Data: (opening sentence feedback, association word feedback)
+    Setup Data:  none
+
+Used by the tiered scorer (referee_tiered_scoring). The facts of the
+guess come first; generic advice sentences pad each text to the
+validator's 150-200 word window.
+"""
+
+import re
+
+from referee_scoring import _words
+
+FEEDBACK_MIN_WORDS = 150
+FEEDBACK_MAX_WORDS = 200
+
+_SENTENCE_ADVICE = (
+    "Opening sentences in this corpus usually introduce the paragraph's main concept "
+    "directly, so the topic words from the answers you received are the best raw material. "
+    "Try to reuse the exact terminology the referee confirmed rather than paraphrasing it, "
+    "because wording is compared closely. "
+    "Order matters as well: a guess that states the subject first and its defining "
+    "property second tends to match academic writing better. "
+    "When several candidate paragraphs remain, prefer the one whose first line would make "
+    "sense without any preceding context. "
+    "A strong justification names the specific questions and answers that led you to the "
+    "sentence and explains how each one narrowed the search. "
+    "Citing three or more answers, and quoting the words they confirmed, makes the "
+    "reasoning easy to verify. "
+    "Keep the justification focused on evidence rather than on general knowledge of the "
+    "subject, since only the game's answers are shared ground. "
+    "Finally, calibrate your confidence to the evidence: a cautious value after ambiguous "
+    "answers is better than certainty that the answers do not support."
+)
+
+_WORD_ADVICE = (
+    "The association word is chosen to connect the paragraph to a broader domain, so "
+    "the most useful clues are the hint and the answers that revealed the subject area. "
+    "Think about which single concept a reader would associate with the paragraph as a "
+    "whole rather than with one detail inside it. "
+    "Short, common nouns tend to work better than technical phrases or proper names. "
+    "A good word justification links the word to two or more confirmed answers and "
+    "explains the connection in a sentence each. "
+    "Mentioning terms that actually appear in the paragraph shows that the choice is "
+    "grounded in the game rather than a guess from the hint alone. "
+    "If several words seem plausible, prefer the one that fits the paragraph's domain "
+    "most broadly. "
+    "Reviewing which of your questions were answered Not Relevant can also rule out "
+    "domains early, leaving more questions for narrowing down the word itself."
+)
+
+
+def _fit_words(text: str, advice: str) -> str:
+    """Pad with advice sentences / trim so the text has 150-200 words (validator window)."""
+    words = text.split()
+    for sentence in re.split(r"(?<=\.) ", advice):
+        if len(words) >= FEEDBACK_MIN_WORDS:
+            break
+        words += sentence.split()
+    return " ".join(words[:FEEDBACK_MAX_WORDS])
+
+
+def _quality(score: float) -> str:
+    if score >= 85:
+        return "excellent"
+    if score >= 70:
+        return "good"
+    if score >= 50:
+        return "partial"
+    return "weak"
+
+
+def template_feedback(scores: dict, opening_sentence: str, association_word: str,
+                      guess: dict, sentence_sim: float, word_sim: float,
+                      in_paragraph: bool) -> tuple[str, str]:
+    """Feedback texts built from the breakdown, sized for the validator."""
+    ss, sj = scores["opening_sentence_score"], scores["sentence_justification_score"]
+    ws, wj = scores["associative_word_score"], scores["word_justification_score"]
+    shared = sorted(_words(guess["opening_sentence"]) & _words(opening_sentence))
+    sentence = (
+        f"Your opening sentence guess scored {ss:.0f}/100, a {_quality(ss)} result. "
+        f"Compared character by character with the actual first sentence it reached "
+        f"{sentence_sim:.0%} similarity. "
+        f"Words you got right: {', '.join(shared[:12]) or 'none'}. "
+        f"Your sentence justification scored {sj:.0f}/100 ({_quality(sj)}), based on how "
+        f"much of it is grounded in the paragraph and how many answers it cites. "
+        f"The actual sentence was: {opening_sentence} "
+    )
+    word = (
+        f"Your association word '{guess['associative_word']}' scored {ws:.0f}/100, a "
+        f"{_quality(ws)} result. It reached {word_sim:.0%} similarity with the actual "
+        f"word '{association_word}'"
+        f"{', and it does appear in the paragraph' if in_paragraph else ''}. "
+        f"Your word justification scored {wj:.0f}/100 ({_quality(wj)}). "
+    )
+    return _fit_words(sentence, _SENTENCE_ADVICE), _fit_words(word, _WORD_ADVICE)
@@ -1,26 +1,64 @@
 """Referee helpers — hint generation, question answering.
 
-Building Block: generate_hint_and_word, answer_questions
+Building Block: generate_hint_and_word (answer_questions re-exported)
     Input Data:  paragraph dict, Anthropic client, questions list
     Output Data: hint/word dict, answers list [{question_number, answer}]
     Setup Data:  skills/ prompts, ANTHROPIC_API_KEY, optional VectorStore
 """
 
-import json
 import logging
-import re
 from pathlib import Path
 
 import anthropic
 
+from knowledge_base.deadline import time_left
+from knowledge_base.hint_pool import findability_ranks, preferred_index
 from knowledge_base.llm_client import call_llm  # shared retry logic
+from knowledge_base.model_router import router
 from knowledge_base.skill_plugin import build_default_registry
+from knowledge_base.structured_output import decode
+from knowledge_base.taboo_index import extract_words, taboo_index
+from q21_referee import callback_json_schema
+from referee_questions import (  # noqa: F401 — re-exported for my_ai
+    answer_questions, answer_questions_batch, lexical_answers,
+)
 from referee_scoring import score_guess  # noqa: F401 — re-exported for my_ai
 
 SKILLS_DIR = Path(__file__).resolve().parents[2] / "skills"
 logger = logging.getLogger(__name__)
 _registry = build_default_registry(SKILLS_DIR)
 
+# Budget one hint attempt needs (LLM call + ChromaDB self-test); further
+# attempts are skipped when the callback deadline has less than this left.
+HINT_ATTEMPT_SECONDS = 20.0
+
+# Hint candidates requested per LLM call; the best is the one whose
+# findability rank is nearest PREFERRED_RANK (see knowledge_base.hint_pool)
+HINT_CANDIDATES = 5
+
+# Returned when no attempt produced a taboo-free, findable hint
+FALLBACK_HINT = {
+    "book_hint": "Academic discussion of theoretical concepts from course material",
+    "association_word": "concept",
+    "association_domain": "academia",
+}
+
+# Output schema, derived from the SDK's callback schema
+def _hint_schema() -> dict:
+    schema = callback_json_schema("round_start_info")
+    del schema["properties"]["book_name"]
+    schema["properties"]["association_domain"] = {"type": "string"}
+    schema["required"] = ["book_hint", "association_word", "association_domain"]
+    return schema
+
+
+HINT_SCHEMA = _hint_schema()
+HINT_CANDIDATES_SCHEMA = {
+    "type": "object",
+    "properties": {"candidates": {"type": "array", "items": HINT_SCHEMA}},
+    "required": ["candidates"],
+}
+
 
 def _load_skill(name: str) -> str:
     return _registry.get(name).get_prompt()
@@ -28,30 +66,43 @@ def _load_skill(name: str) -> str:
 
 def _extract_words(text: str) -> set[str]:
     """Extract normalized word set from text."""
-    return {c for w in text.split()
-            if len(c := re.sub(r'[^\w]', '', w).lower()) > 1}
+    return extract_words(text)
 
 
 def validate_taboo(hint: str, paragraph_text: str) -> set[str]:
-    """Return overlapping words between hint and paragraph."""
-    return _extract_words(hint) & _extract_words(paragraph_text)
+    """Return hint words that reuse a paragraph word (Hebrew prefixes ignored)."""
+    return taboo_index.check(hint, paragraph_text)
+
+
+def _parse_candidates(raw: str) -> list[dict]:
+    """Hint candidates from the LLM output; a lone hint object counts as one."""
+    result, _ = decode(raw, HINT_CANDIDATES_SCHEMA)
+    if isinstance(result, dict) and isinstance(result.get("candidates"), list):
+        return [c for c in result["candidates"] if isinstance(c, dict) and c.get("book_hint")]
+    single, _ = decode(raw, HINT_SCHEMA)
+    return [single] if isinstance(single, dict) and single.get("book_hint") else []
 
 
-def _hint_self_test(vs, hint: str, pdf_name: str, para_id: str) -> bool:
-    """Check if ChromaDB can find the paragraph using this hint."""
+def _pick_hint(vs, candidates: list[dict], paragraph: dict) -> dict | None:
+    """The findable candidate whose rank is nearest PREFERRED_RANK (better rank on ties).
+
+    All candidates are ranked with one batched vector search.
+    """
     if not vs:
-        return True
-    results = vs.search_by_pdf(hint, pdf_name, n_results=10)
-    return any(r.get("id") == para_id for r in results)
+        return candidates[0]
+    hints = [c["book_hint"] for c in candidates]
+    ranks = findability_ranks(vs, hints, paragraph)
+    best = preferred_index(ranks)
+    if best is None:
+        return None
+    logger.info("Hint candidates ranked %s — picked rank %d", ranks, ranks[best])
+    return candidates[best]
 
 
 def generate_hint_and_word(client, paragraph: dict, vs=None) -> dict:
-    """Generate hint + association word via LLM, with optional self-test."""
+    """Generate HINT_CANDIDATES hints in one LLM call, keep the best taboo-free, findable one."""
     text = paragraph["full_text"]
-    pdf_name = paragraph.get("pdf_name", "")
-    para_id = paragraph.get("id", "")
-    forbidden = _extract_words(text)
-    forbidden_sample = ", ".join(sorted(forbidden)[:60])
+    forbidden_sample, forbidden_count = taboo_index.sample(text, 60)
 
     prompt = f"""You are a referee in a 21-questions guessing game about Hebrew academic paragraphs.
 
@@ -61,88 +112,52 @@ PARAGRAPH TEXT:
 OPENING SENTENCE:
 {paragraph["opening_sentence"]}
 
-TASK: Generate THREE things:
+TASK: Generate {HINT_CANDIDATES} DIFFERENT candidates, each with THREE things:
 1. A book_hint: max 15 words describing the paragraph's topic using ONLY synonyms/paraphrases.
    CRITICAL: The hint must NOT contain ANY of these forbidden words: {forbidden_sample}
-   {"[...and more]" if len(forbidden) > 60 else ""}
+   {"[...and more]" if forbidden_count > 60 else ""}
 2. An association_word: a specific word thematically connected to the paragraph (e.g., "river", "focus", "gradient")
 3. An association_domain: the broad category of the association word (e.g., "nature", "technology", "mathematics")
 
-The hint should be semantically specific enough to find this paragraph via vector search.
+Vary the candidates from very specific to broader: the best hint lets a vector
+search find this paragraph among the top few of its PDF, but not as the only match.
 
 Respond in this exact JSON format only:
-{{"book_hint": "...", "association_word": "...", "association_domain": "..."}}"""
-
-    for attempt in range(2):  # Max 2 attempts per paragraph (budget: 60s total)
+{{"candidates": [{{"book_hint": "...", "association_word": "...", "association_domain": "..."}}, ...]}}"""
+
+    def _taboo_clean(raw: str) -> bool:
+        return any(not validate_taboo(c["book_hint"], text) for c in _parse_candidates(raw))
+
+    # Attempt 1 is creative work (large model only); attempt 2 repairs an all-taboo or
+    # unfindable batch (small model, escalating unless a hint is taboo-free). Each
+    # attempt needs HINT_ATTEMPT_SECONDS left; my_ai may try up to 3 paragraphs.
+    for attempt in range(2):
+        if attempt and time_left() < HINT_ATTEMPT_SECONDS:
+            logger.warning("Deadline too close for hint retry — using fallback")
+            break
+        skill = "hint_taboo_repair" if attempt else "referee_hint_generator"
         try:
-            raw = call_llm(client, prompt, max_tokens=200, timeout=15.0)
+            raw = router.complete(client, prompt, skill=skill,
+                                  accept=_taboo_clean if attempt else None,
+                                  call=call_llm, schema=HINT_CANDIDATES_SCHEMA,
+                                  max_tokens=200 * HINT_CANDIDATES, timeout=20.0)
         except (anthropic.APIError, anthropic.APIConnectionError):
             logger.warning("LLM failed in hint generation attempt %d", attempt + 1)
             continue
-        try:
-            match = re.search(r'\{[^}]+\}', raw, re.DOTALL)
-            result = json.loads(match.group()) if match else json.loads(raw)
-        except (json.JSONDecodeError, AttributeError):
+        candidates = _parse_candidates(raw)
+        if not candidates:
             continue
 
-        hint = result.get("book_hint", "")
-        overlap = validate_taboo(hint, text)
-        if overlap:
-            prompt += f"\n\nHint '{hint}' had forbidden words: {overlap}. Avoid them!"
+        clean = [c for c in candidates if not validate_taboo(c["book_hint"], text)]
+        if not clean:
+            overlap = set().union(*(validate_taboo(c["book_hint"], text) for c in candidates))
+            prompt += f"\n\nEvery hint had forbidden words: {overlap}. Avoid them!"
             continue
 
-        # Self-test: can ChromaDB find our paragraph with this hint?
-        if _hint_self_test(vs, hint, pdf_name, para_id):
-            return result
-        prompt += "\n\nHint was valid but not semantically findable. Make it MORE specific to the paragraph's unique content."
-
-    return {
-        "book_hint": "Academic discussion of theoretical concepts from course material",
-        "association_word": "concept",
-        "association_domain": "academia",
-    }
+        # Self-test: which candidates can ChromaDB find our paragraph with?
+        best = _pick_hint(vs, clean, paragraph)
+        if best is not None:
+            return best
+        prompt += "\n\nHints were valid but not semantically findable. Make them MORE specific to the paragraph's unique content."
 
-
-def answer_questions(client, paragraph_text: str, questions: list) -> list[dict]:
-    """Answer all 20 questions in one LLM call."""
-    q_text = ""
-    for q in questions:
-        opts = q.get("options", {})
-        q_text += (
-            f"Q{q['question_number']}: {q['question_text']}\n"
-            f"  A: {opts.get('A','')}, B: {opts.get('B','')}, "
-            f"C: {opts.get('C','')}, D: {opts.get('D','')}\n"
-        )
-
-    skill = _load_skill("referee_question_answerer.md")
-    prompt = f"""{skill}
-
-PARAGRAPH TEXT:
-{paragraph_text}
-
-QUESTIONS:
-{q_text}
-
-Answer each question from the paragraph's perspective. Be truthful.
-Respond as a JSON array of objects: [{{"question_number": 1, "answer": "A"}}, ...]
-Valid answers: "A", "B", "C", "D", or "Not Relevant"."""
-
-    try:
-        raw = call_llm(client, prompt, max_tokens=1024, timeout=60.0)
-    except (anthropic.APIError, anthropic.APIConnectionError):
-        logger.error("LLM failed for answer_questions — returning Not Relevant")
-        return [{"question_number": q["question_number"], "answer": "Not Relevant"}
-                for q in questions]
-
-    try:
-        match = re.search(r'\[[\s\S]*\]', raw)
-        answers = json.loads(match.group()) if match else []
-    except (json.JSONDecodeError, AttributeError):
-        answers = []
-
-    answer_map = {a["question_number"]: a["answer"] for a in answers}
-    return [
-        {"question_number": q["question_number"],
-         "answer": answer_map.get(q["question_number"], "Not Relevant")}
-        for q in questions
-    ]
+    return dict(FALLBACK_HINT)
@@ -0,0 +1,200 @@
+"""Referee question answering — one LLM call per player, or per player pair.
+
+Building Block: answer_questions, answer_questions_batch
+    Input Data:  paragraph text, question dicts {question_number,
+                 question_text, options}, optional fact sheet
+    Output Data: answers list [{question_number, answer}] (per player id
+                 for the batch)
+    Setup Data:  skills/referee_question_answerer.md, optional AnswerCache
+                 and HybridAnswerer
+
+The answering skill, the LLM retry logic (call_llm) and the skills
+registry live in referee_helpers, which re-exports these functions.
+"""
+
+import json
+import logging
+
+import anthropic
+
+from knowledge_base.model_router import router
+from knowledge_base.structured_output import decode
+from knowledge_base.taboo_index import extract_words
+from q21_referee import callback_json_schema
+from referee_fact_sheet import render_fact_sheet
+
+logger = logging.getLogger(__name__)
+
+VALID_ANSWERS = {"A", "B", "C", "D", "Not Relevant"}
+
+# Output schema, derived from the SDK's callback schema
+ANSWERS_SCHEMA = callback_json_schema("answers")["properties"]["answers"]
+
+
+def _parse_answers(raw: str) -> dict:
+    """Decode the LLM's answers array into {question_number: answer}."""
+    answers, _ = decode(raw, ANSWERS_SCHEMA)
+    if not isinstance(answers, list):
+        return {}
+    return {a["question_number"]: a["answer"] for a in answers
+            if isinstance(a, dict) and "question_number" in a and "answer" in a}
+
+
+def lexical_answers(paragraph_text: str, questions: list) -> list[dict]:
+    """Local fallback: pick the option sharing the most words with the paragraph.
+
+    Used when the LLM is unavailable (breaker open / API down). Ties and
+    zero overlap answer "Not Relevant".
+    """
+    para_words = extract_words(paragraph_text)
+    result = []
+    for q in questions:
+        overlaps = {letter: len(extract_words(str(text)) & para_words)
+                    for letter, text in q.get("options", {}).items()
+                    if letter in ("A", "B", "C", "D")}
+        best = max(overlaps.values(), default=0)
+        winners = [k for k, v in overlaps.items() if v == best]
+        answer = winners[0] if best > 0 and len(winners) == 1 else "Not Relevant"
+        result.append({"question_number": q["question_number"], "answer": answer})
+    return result
+
+
+# Replaces the answering skill when a fact sheet is available
+_FACT_SHEET_RULES = """You are the Q21G referee answering multiple-choice questions about
+your secret paragraph, given as a fact sheet (its claims list every
+factual statement of the paragraph). Answer truthfully from the
+paragraph's perspective. Read all four options; they differ per question.
+Use "Not Relevant" only when the fact sheet cannot answer the question.
+Keep answers consistent with each other."""
+
+
+def _format_questions(questions: list) -> str:
+    q_text = ""
+    for q in questions:
+        opts = q.get("options", {})
+        q_text += (
+            f"Q{q['question_number']}: {q['question_text']}\n"
+            f"  A: {opts.get('A','')}, B: {opts.get('B','')}, "
+            f"C: {opts.get('C','')}, D: {opts.get('D','')}\n"
+        )
+    return q_text
+
+
+def _answer_context(paragraph_text: str, fact_sheet: dict = None) -> str:
+    """Answering instructions plus the paragraph, shared by every question in a call.
+
+    A fact sheet replaces both the answering skill and the paragraph text:
+    its claims already carry the paragraph's content, and sending the text
+    as well would undo the shorter prompt the sheet was built for.
+    """
+    if fact_sheet:
+        return f"{_FACT_SHEET_RULES}\n\nFACT SHEET:\n{render_fact_sheet(fact_sheet)}"
+    from referee_helpers import _load_skill
+    return f"""{_load_skill("referee_question_answerer.md")}
+
+PARAGRAPH TEXT:
+{paragraph_text}"""
+
+
+def _ask(client, paragraph_text: str, asked: dict, fact_sheet: dict = None) -> dict:
+    """{player: {question_number: answer}} from one LLM call.
+
+    The single-player key None keeps the plain answers-array reply; any
+    other keys ask for an object of arrays keyed by player id.
+    """
+    from referee_helpers import call_llm
+    single = list(asked) == [None]
+    if single:
+        sections = f"QUESTIONS:\n{_format_questions(asked[None])}"
+        reply = ("Answer each question from the paragraph's perspective. Be truthful.\n"
+                 "Respond as a JSON array of objects: "
+                 '[{"question_number": 1, "answer": "A"}, ...]')
+        schema = ANSWERS_SCHEMA
+    else:
+        sections = "\n".join(f"PLAYER {pid} QUESTIONS:\n{_format_questions(pending)}"
+                             for pid, pending in asked.items())
+        reply = ("Answer each player's questions from the paragraph's perspective. Be truthful.\n"
+                 "Question numbers repeat across players; answer every player separately.\n"
+                 "Respond as a JSON object keyed by player id, each an array of objects:\n"
+                 '{"<player id>": [{"question_number": 1, "answer": "A"}, ...], ...}')
+        schema = {"type": "object", "properties": {pid: ANSWERS_SCHEMA for pid in asked},
+                  "required": list(asked)}
+    prompt = f"""{_answer_context(paragraph_text, fact_sheet)}
+
+{sections}
+{reply}
+Valid answers: "A", "B", "C", "D", or "Not Relevant"."""
+
+    def _maps(raw: str) -> dict:
+        if single:
+            return {None: _parse_answers(raw)}
+        result, _ = decode(raw, schema)
+        result = result if isinstance(result, dict) else {}
+        return {pid: _parse_answers(json.dumps(result.get(pid, []))) for pid in asked}
+
+    def _complete(raw: str) -> bool:
+        maps = _maps(raw)
+        return all(maps[pid].get(q["question_number"]) in VALID_ANSWERS
+                   for pid, pending in asked.items() for q in pending)
+
+    raw = router.complete(client, prompt, skill="referee_question_answerer",
+                          accept=_complete, call=call_llm, schema=schema,
+                          max_tokens=1024 * len(asked), timeout=60.0)
+    return _maps(raw)
+
+
+def answer_questions(client, paragraph_text: str, questions: list,
+                     cache=None, fact_sheet: dict = None, answerer=None) -> list[dict]:
+    """Answer all 20 questions in one LLM call.
+
+    With an AnswerCache, questions it already knows are answered from it
+    and only the rest go to the LLM; fresh LLM answers are added to it.
+    With a calibrated HybridAnswerer (see referee_answering), clear-cut
+    questions are answered locally and only the rest go to the LLM.
+    With a fact sheet (see referee_fact_sheet), the prompt carries the
+    sheet and short rules instead of the full answering skill.
+    """
+    return answer_questions_batch(client, paragraph_text, {None: questions},
+                                  cache, fact_sheet, answerer)[None]
+
+
+def answer_questions_batch(client, paragraph_text: str, questions_by_player: dict,
+                           cache=None, fact_sheet: dict = None,
+                           answerer=None) -> dict:
+    """Answer several players' questions about one paragraph in one LLM call.
+
+    The paragraph (or fact sheet) is sent once, followed by each player's
+    questions under its own heading. Returns {player_id: answers list};
+    cache and answerer work as in answer_questions.
+    """
+    split = {}
+    for pid, questions in questions_by_player.items():
+        known, pending = cache.lookup(questions) if cache else ({}, questions)
+        local, audit = (answerer.split(paragraph_text, pending)
+                        if answerer and pending else ({}, {}))
+        known.update(local)
+        split[pid] = (known, [q for q in pending if q["question_number"] not in local], audit)
+
+    asked = {pid: pending for pid, (_, pending, _) in split.items() if pending}
+    try:
+        replies = _ask(client, paragraph_text, asked, fact_sheet) if asked else {}
+    except (anthropic.APIError, anthropic.APIConnectionError):
+        logger.error("LLM failed for answer_questions — answering lexically")
+        replies = {pid: {a["question_number"]: a["answer"]
+                         for a in lexical_answers(paragraph_text, pending)}
+                   for pid, pending in asked.items()}
+        cache = answerer = None  # nothing to learn from lexical answers
+
+    result = {}
+    for pid, (known, pending, audit) in split.items():
+        answer_map = replies.get(pid, {})
+        if answerer:
+            answerer.record(audit, answer_map)
+        if cache and pending:
+            cache.store(pending, [{"question_number": n, "answer": a}
+                                  for n, a in answer_map.items() if a in VALID_ANSWERS])
+        answer_map = {**answer_map, **known}
+        result[pid] = [{"question_number": q["question_number"],
+                        "answer": answer_map.get(q["question_number"], "Not Relevant")}
+                       for q in questions_by_player[pid]]
+    return result
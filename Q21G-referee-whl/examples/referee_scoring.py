@@ -1,4 +1,4 @@
-"""Referee scoring — LLM-based guess evaluation and league point calculation.
+"""Referee scoring — tiered guess evaluation and league point calculation.
 
 Building Block: score_guess
     Input Data:  actual opening_sentence, association_word, paragraph_text,
@@ -6,9 +6,13 @@ Building Block: score_guess
                  associative_word, word_justification, confidence}
     Output Data: {league_points (0-3), private_score (0-100), breakdown dict, feedback dict}
     Setup Data:  skills/referee_scorer.md, ANTHROPIC_API_KEY
+
+Most guesses are scored by the tiered scorer (referee_tiered_scoring),
+which only asks the LLM about borderline components. This module holds
+the shared pieces (similarities, weights, league points) and the
+full-LLM scorer.
 """
 
-import json
 import logging
 import re
 from difflib import SequenceMatcher
@@ -16,11 +20,28 @@ from pathlib import Path
 
 import anthropic
 
+from knowledge_base.structured_output import complete_structured
+from q21_referee import callback_json_schema
+from referee_fact_sheet import render_fact_sheet
+
 MODEL = "claude-sonnet-4-20250514"
 SKILLS_DIR = Path(__file__).resolve().parents[2] / "skills"
 logger = logging.getLogger(__name__)
 
 
+def _scoring_schema() -> dict:
+    """LLM scorer output: the SDK's breakdown scores (0-100) + two feedback texts."""
+    breakdown = callback_json_schema("score_feedback")["properties"]["breakdown"]
+    properties = {name: {**prop, "minimum": 0, "maximum": 100}
+                  for name, prop in breakdown["properties"].items()}
+    properties["feedback_sentence"] = {"type": "string"}
+    properties["feedback_word"] = {"type": "string"}
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+SCORING_SCHEMA = _scoring_schema()
+
+
 def _load_skill(name: str) -> str:
     return (SKILLS_DIR / name).read_text(encoding="utf-8")
 
@@ -30,18 +51,78 @@ def _string_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a.strip(), b.strip()).ratio()
 
 
-def score_guess(client, opening_sentence: str, association_word: str,
-                paragraph_text: str, guess: dict) -> dict:
-    """Score a player's guess via LLM with string pre-check. Returns full scoring dict."""
-    from referee_helpers import call_llm
+def _words(text: str) -> set[str]:
+    return {c for w in text.split()
+            if len(c := re.sub(r'[^\w]', '', w).lower()) > 1}
 
-    # ── String pre-check: override LLM for obvious matches ──
-    sentence_sim = _string_similarity(
-        guess["opening_sentence"], opening_sentence)
-    word_sim = _string_similarity(
-        guess["associative_word"], association_word)
 
-    # Determine if pre-check should override sentence score
+def _justification_score(text: str, paragraph_words: set[str], min_cites: int) -> float:
+    """Share of justification words grounded in the paragraph, plus Q citations."""
+    words = _words(re.sub(r'Q\d+(\(\w+\))?', ' ', text))
+    grounded = len(words & paragraph_words) / len(words) if words else 0.0
+    cites = len(set(re.findall(r'Q\d+', text)))
+    return round(min(100.0, 70.0 * grounded + 30.0 * min(cites, min_cites) / min_cites), 1)
+
+
+def local_scores(opening_sentence: str, association_word: str,
+                 paragraph_text: str, guess: dict) -> dict:
+    """Score a guess without the LLM (used while the API is unavailable).
+
+    Returns the same keys the LLM scorer emits, with feedback built from
+    the computed similarities.
+    """
+    paragraph_words = _words(paragraph_text)
+    sentence_sim = _string_similarity(guess["opening_sentence"], opening_sentence)
+    word_sim = _string_similarity(guess["associative_word"], association_word)
+    in_paragraph = guess["associative_word"].strip().lower() in paragraph_words
+    ss = round(100 * sentence_sim, 1)
+    ws = round(max(100 * word_sim, 50.0 if in_paragraph else 0.0), 1)
+    sj = _justification_score(guess["sentence_justification"], paragraph_words, 3)
+    wj = _justification_score(guess["word_justification"], paragraph_words, 2)
+    shared = sorted(_words(guess["opening_sentence"]) & _words(opening_sentence))
+    return {
+        "opening_sentence_score": ss, "sentence_justification_score": sj,
+        "associative_word_score": ws, "word_justification_score": wj,
+        "feedback_sentence": (
+            f"Your opening sentence was compared character by character with the "
+            f"actual one and reached {sentence_sim:.0%} similarity ({ss}/100). "
+            f"Words you got right: {', '.join(shared[:12]) or 'none'}. "
+            f"Your justification scored {sj}/100 based on how much of it is "
+            f"grounded in the paragraph and how many questions it cites. "
+            f"The actual sentence was: {opening_sentence[:100]}..."),
+        "feedback_word": (
+            f"Your association word '{guess['associative_word']}' reached "
+            f"{word_sim:.0%} similarity with the actual word '{association_word}' "
+            f"({ws}/100)"
+            f"{', and it does appear in the paragraph' if in_paragraph else ''}. "
+            f"Your word justification scored {wj}/100."),
+    }
+
+
+WEIGHTS = {
+    "opening_sentence_score": 0.50,
+    "sentence_justification_score": 0.20,
+    "associative_word_score": 0.20,
+    "word_justification_score": 0.10,
+}
+
+
+def _league_points(private_score: float) -> int:
+    if private_score >= 85:
+        return 3
+    if private_score >= 70:
+        return 2
+    if private_score >= 50:
+        return 1
+    return 0
+
+
+def _private_score(scores: dict) -> float:
+    return round(sum(scores[name] * weight for name, weight in WEIGHTS.items()), 1)
+
+
+def _overrides(sentence_sim: float, word_sim: float) -> tuple:
+    """String pre-check: fixed scores for obvious sentence / word matches."""
     sentence_override = None
     if sentence_sim >= 0.95:
         sentence_override = 98.0
@@ -49,18 +130,64 @@ def score_guess(client, opening_sentence: str, association_word: str,
         sentence_override = 88.0
     elif sentence_sim >= 0.70:
         sentence_override = 75.0
+    word_override = 95.0 if word_sim >= 0.90 else None
+    return sentence_override, word_override
+
+
+def _result(scores: dict, feedback_sentence: str, feedback_word: str) -> dict:
+    private_score = _private_score(scores)
+    return {
+        "league_points": _league_points(private_score),
+        "private_score": private_score,
+        "breakdown": dict(scores),
+        "feedback": {"opening_sentence": feedback_sentence,
+                     "associative_word": feedback_word},
+    }
+
+
+def score_guess(client, opening_sentence: str, association_word: str,
+                paragraph_text: str, guess: dict, fact_sheet: dict = None,
+                tiered: bool = True, embed=None) -> dict:
+    """Score a player's guess; returns the full scoring dict.
+
+    Tiered (default, see referee_tiered_scoring): local estimates with
+    uncertainty bands, one short LLM call only for borderline components,
+    template feedback. ``embed`` (e.g. VectorStore.embed) lets it tell a
+    paraphrase from an unrelated guess. With ``tiered=False`` the LLM
+    scores everything and writes the feedback (the original scorer).
+    """
+    if tiered:
+        from referee_tiered_scoring import score_tiered
+        return score_tiered(client, opening_sentence, association_word,
+                            paragraph_text, guess, fact_sheet, embed)
+    return _score_with_llm(client, opening_sentence, association_word,
+                           paragraph_text, guess, fact_sheet)
+
+
+def _score_with_llm(client, opening_sentence: str, association_word: str,
+                    paragraph_text: str, guess: dict, fact_sheet: dict = None) -> dict:
+    """Score a player's guess via LLM with string pre-check.
+
+    With a fact sheet, the prompt carries it instead of the full paragraph.
+    """
+    from referee_helpers import call_llm
 
-    word_override = None
-    if word_sim >= 0.90:
-        word_override = 95.0
+    # ── String pre-check: override LLM for obvious matches ──
+    sentence_sim = _string_similarity(
+        guess["opening_sentence"], opening_sentence)
+    word_sim = _string_similarity(
+        guess["associative_word"], association_word)
+    sentence_override, word_override = _overrides(sentence_sim, word_sim)
 
     # ── LLM scoring ──
     skill = _load_skill("referee_scorer.md")
+    paragraph = (f"PARAGRAPH FACT SHEET:\n{render_fact_sheet(fact_sheet)}" if fact_sheet
+                 else f"PARAGRAPH TEXT: {paragraph_text}")
     prompt = f"""{skill}
 
 ACTUAL OPENING SENTENCE: {opening_sentence}
 ACTUAL ASSOCIATION WORD: {association_word}
-PARAGRAPH TEXT: {paragraph_text}
+{paragraph}
 
 PLAYER'S GUESS:
 - Opening sentence: {guess["opening_sentence"]}
@@ -80,16 +207,13 @@ Respond in this exact JSON format:
   "feedback_word": "150-200 words..."}}"""
 
     try:
-        raw = call_llm(client, prompt, max_tokens=2048, timeout=90.0)
+        data, _ = complete_structured(client, prompt, SCORING_SCHEMA, call=call_llm,
+                                      max_tokens=2048, timeout=90.0,
+                                      skill="referee_scorer")
+        data = data if isinstance(data, dict) else {}
     except (anthropic.APIError, anthropic.APIConnectionError):
-        logger.error("LLM failed for scoring — using pre-check scores only")
-        raw = ""
-
-    try:
-        match = re.search(r'\{[\s\S]*\}', raw)
-        data = json.loads(match.group()) if match else {}
-    except (json.JSONDecodeError, AttributeError):
-        data = {}
+        logger.error("LLM failed for scoring — scoring locally")
+        data = local_scores(opening_sentence, association_word, paragraph_text, guess)
 
     # Apply overrides or use LLM scores
     ss = sentence_override or float(data.get("opening_sentence_score", 30))
@@ -97,32 +221,18 @@ Respond in this exact JSON format:
     ws = word_override or float(data.get("associative_word_score", 20))
     wj = float(data.get("word_justification_score", 40))
 
-    private_score = round(ss * 0.50 + sj * 0.20 + ws * 0.20 + wj * 0.10, 1)
-
-    if private_score >= 85:
-        lp = 3
-    elif private_score >= 70:
-        lp = 2
-    elif private_score >= 50:
-        lp = 1
-    else:
-        lp = 0
-
-    return {
-        "league_points": lp,
-        "private_score": private_score,
-        "breakdown": {
-            "opening_sentence_score": ss,
-            "sentence_justification_score": sj,
-            "associative_word_score": ws,
-            "word_justification_score": wj,
-        },
-        "feedback": {
-            "opening_sentence": data.get("feedback_sentence",
-                f"Your guess was compared against the actual opening sentence. "
-                f"Score: {ss}/100. The actual sentence was: {opening_sentence[:100]}..."),
-            "associative_word": data.get("feedback_word",
-                f"Your association word was compared against the actual word. "
-                f"Score: {ws}/100. The actual word was: {association_word}."),
-        },
+    scores = {
+        "opening_sentence_score": ss,
+        "sentence_justification_score": sj,
+        "associative_word_score": ws,
+        "word_justification_score": wj,
     }
+    return _result(
+        scores,
+        data.get("feedback_sentence",
+            f"Your guess was compared against the actual opening sentence. "
+            f"Score: {ss}/100. The actual sentence was: {opening_sentence[:100]}..."),
+        data.get("feedback_word",
+            f"Your association word was compared against the actual word. "
+            f"Score: {ws}/100. The actual word was: {association_word}."),
+    )
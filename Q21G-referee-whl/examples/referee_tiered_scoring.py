@@ -0,0 +1,153 @@
+"""Referee tiered scoring — local estimates first, a short LLM call only when borderline.
+
+Building Block: score_tiered
+    Input Data:  actual opening_sentence, association_word, paragraph_text,
+                 player guess dict, optional fact sheet, optional embed
+    Output Data: {league_points (0-3), private_score (0-100), breakdown dict, feedback dict}
+    Setup Data:  ANTHROPIC_API_KEY (borderline guesses only), optional
+                 embed(texts) -> vectors (e.g. VectorStore.embed)
+
+String similarity and paragraph grounding give each component an
+estimate and an uncertainty band; the LLM is asked (briefly, scores
+only) only when the band straddles a league-point threshold. Feedback
+is filled from templates (referee_feedback).
+"""
+
+import logging
+
+import anthropic
+
+from knowledge_base.structured_output import complete_structured
+from referee_answering import cosine
+from referee_fact_sheet import render_fact_sheet
+from referee_feedback import template_feedback
+from referee_scoring import (
+    SCORING_SCHEMA, _justification_score, _league_points, _overrides,
+    _private_score, _result, _string_similarity, _words,
+)
+
+logger = logging.getLogger(__name__)
+
+# How far the LLM may plausibly move each local estimate (score points)
+SENTENCE_BAND = 25.0
+WORD_BAND = 30.0
+JUSTIFICATION_BAND = 15.0
+UNRELATED_SENTENCE_SIM = 0.2
+
+# A guess sharing no word with the actual sentence is only "unrelated" if
+# its meaning is far off too: paraphrases (and Hebrew words carrying
+# clitic prefixes) often share no surface word with a correct answer.
+UNRELATED_EMBEDDING_SIM = 0.3
+
+
+def _unrelated(guess_sentence: str, opening_sentence: str, sentence_sim: float,
+               embed=None) -> bool:
+    """No shared words, low string similarity and (with embed) low meaning similarity."""
+    if sentence_sim >= UNRELATED_SENTENCE_SIM or _words(guess_sentence) & _words(opening_sentence):
+        return False
+    if embed is None:
+        return False  # no way to tell a paraphrase from an unrelated guess
+    guess_vector, actual_vector = embed([guess_sentence, opening_sentence])
+    return cosine(guess_vector, actual_vector) < UNRELATED_EMBEDDING_SIM
+
+
+def _estimates(opening_sentence: str, association_word: str, paragraph_text: str,
+               guess: dict, sentence_sim: float, word_sim: float, embed=None) -> dict:
+    """Local score estimate and uncertainty band per component."""
+    paragraph_words = _words(paragraph_text)
+    sentence_override, word_override = _overrides(sentence_sim, word_sim)
+    unrelated = (sentence_override is None
+                 and _unrelated(guess["opening_sentence"], opening_sentence,
+                                sentence_sim, embed))
+    in_paragraph = guess["associative_word"].strip().lower() in paragraph_words
+
+    if sentence_override is not None:
+        sentence = (sentence_override, 0.0)
+    else:
+        sentence = (round(100 * sentence_sim, 1), 0.0 if unrelated else SENTENCE_BAND)
+    if word_override is not None:
+        word = (word_override, 0.0)
+    else:
+        word = (round(max(100 * word_sim, 50.0 if in_paragraph else 0.0), 1), WORD_BAND)
+    return {
+        "opening_sentence_score": sentence,
+        "sentence_justification_score": (
+            _justification_score(guess["sentence_justification"], paragraph_words, 3),
+            JUSTIFICATION_BAND),
+        "associative_word_score": word,
+        "word_justification_score": (
+            _justification_score(guess["word_justification"], paragraph_words, 2),
+            JUSTIFICATION_BAND),
+    }
+
+
+def _decisive(estimates: dict) -> bool:
+    """True if no score inside the bands changes the league points."""
+    low = {k: max(0.0, v - band) for k, (v, band) in estimates.items()}
+    high = {k: min(100.0, v + band) for k, (v, band) in estimates.items()}
+    return _league_points(_private_score(low)) == _league_points(_private_score(high))
+
+
+def _llm_component_scores(client, names: list, opening_sentence: str,
+                          association_word: str, paragraph: str, guess: dict) -> dict:
+    """Short LLM call for the borderline components only (no feedback text)."""
+    from referee_helpers import call_llm
+
+    schema = {"type": "object",
+              "properties": {n: SCORING_SCHEMA["properties"][n] for n in names},
+              "required": names}
+    prompt = f"""You score a guess in the Q21G paragraph guessing game. Score each
+listed component 0-100 by its linguistic and conceptual match to the actual values.
+
+ACTUAL OPENING SENTENCE: {opening_sentence}
+ACTUAL ASSOCIATION WORD: {association_word}
+{paragraph}
+
+PLAYER'S GUESS:
+- Opening sentence: {guess["opening_sentence"]}
+- Sentence justification: {guess["sentence_justification"]}
+- Associative word: {guess["associative_word"]}
+- Word justification: {guess["word_justification"]}
+
+Respond as JSON with only these keys: {", ".join(names)}."""
+    data, _ = complete_structured(client, prompt, schema, call=call_llm,
+                                  max_tokens=256, timeout=30.0, skill="referee_scorer")
+    if not isinstance(data, dict):
+        return {}
+    return {n: float(data[n]) for n in names if isinstance(data.get(n), (int, float))}
+
+
+def score_tiered(client, opening_sentence: str, association_word: str,
+                 paragraph_text: str, guess: dict, fact_sheet: dict = None,
+                 embed=None) -> dict:
+    """Score a guess from local estimates, asking the LLM only about borderline components.
+
+    If no score inside the bands changes the league points, the local
+    estimates are final; otherwise one short LLM call scores just the
+    uncertain components. Feedback comes from templates filled with the
+    breakdown.
+    """
+    sentence_sim = _string_similarity(guess["opening_sentence"], opening_sentence)
+    word_sim = _string_similarity(guess["associative_word"], association_word)
+    estimates = _estimates(opening_sentence, association_word, paragraph_text,
+                           guess, sentence_sim, word_sim, embed)
+    scores = {name: value for name, (value, _) in estimates.items()}
+
+    if not _decisive(estimates):
+        borderline = [name for name, (_, band) in estimates.items() if band]
+        paragraph = (f"PARAGRAPH FACT SHEET:\n{render_fact_sheet(fact_sheet)}" if fact_sheet
+                     else f"PARAGRAPH TEXT: {paragraph_text}")
+        try:
+            llm = _llm_component_scores(client, borderline, opening_sentence,
+                                        association_word, paragraph, guess)
+        except (anthropic.APIError, anthropic.APIConnectionError):
+            logger.error("LLM failed for borderline scores — keeping local estimates")
+            llm = {}
+        scores.update({n: max(0.0, min(100.0, v)) for n, v in llm.items()})
+    else:
+        logger.info("Scored locally (decisive evidence)")
+
+    in_paragraph = guess["associative_word"].strip().lower() in _words(paragraph_text)
+    feedback = template_feedback(scores, opening_sentence, association_word, guess,
+                                 sentence_sim, word_sim, in_paragraph)
+    return _result(scores, *feedback)
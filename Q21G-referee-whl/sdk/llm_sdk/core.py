@@ -18,11 +18,12 @@ from __future__ import annotations
 
 import os
 import re
+from itertools import chain, count
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -53,6 +54,9 @@ SENTENCE_JUST_MAX_WORDS = 50
 WORD_JUST_MIN_WORDS = 20
 WORD_JUST_MAX_WORDS = 30
 
+# Rows per NumPy pass in ScoreCalculator batch methods
+BATCH_CHUNK_SIZE = 65536
+
 # Default LLM settings
 DEFAULT_MODEL = "claude-3-haiku-20240307"
 DEFAULT_MAX_TOKENS = 1000
@@ -444,6 +448,189 @@ class ScoreCalculator:
             return {"winner": "B", "is_draw": False}
         return {"winner": None, "is_draw": True}
 
+    # ── Batch scoring (NumPy) ──────────────────────────────────
+
+    def calculate_similarity_batch(
+        self,
+        actuals: Sequence[str],
+        guesses: Sequence[str],
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ):
+        """calculate_similarity for many pairs; returns a float64 array.
+
+        Every distinct string is lowercased, tokenized and interned once.
+        Jaccard is computed by intersecting sorted (pair, token-id) keys,
+        the positional character matches by gathering code points of all
+        pairs into flat arrays. Results equal the scalar path exactly.
+        """
+        import numpy as np
+
+        actuals, guesses = _broadcast_pairs(actuals, guesses)
+        n = len(guesses)
+        out = np.empty(n, dtype=np.float64)
+        texts = _InternedTexts(actuals, guesses)
+        a_ids, g_ids = texts.columns
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            out[start:stop] = texts.similarity(a_ids[start:stop], g_ids[start:stop])
+        return out
+
+    def calculate_player_scores_batch(
+        self,
+        actual_sentences: Union[str, Sequence[str]],
+        actual_words: Union[str, Sequence[str]],
+        opening_sentence_guesses: Sequence[str],
+        sentence_justifications: Sequence[str],
+        associative_word_guesses: Sequence[str],
+        word_justifications: Sequence[str],
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """calculate_player_scores for many guesses at once.
+
+        ``actual_sentences`` / ``actual_words`` may be a single string
+        (one paragraph, many guesses). Returns the same keys as
+        calculate_player_scores, each a NumPy array (float64; league_points
+        int64), bit-identical to scoring the rows one by one.
+        """
+        import numpy as np
+
+        n = len(opening_sentence_guesses)
+        for name, seq in (("sentence_justifications", sentence_justifications),
+                          ("associative_word_guesses", associative_word_guesses),
+                          ("word_justifications", word_justifications)):
+            if len(seq) != n:
+                raise ValueError(f"{name} has {len(seq)} rows, expected {n}")
+
+        sentence = self.calculate_similarity_batch(actual_sentences,
+                                                   opening_sentence_guesses, chunk_size)
+        actual_words, associative_word_guesses = _broadcast_pairs(actual_words,
+                                                                  associative_word_guesses)
+        pairs = list(zip(actual_words, associative_word_guesses))
+        word_scores = {pair: self.calculate_word_score(*pair) for pair in dict.fromkeys(pairs)}
+        word = np.fromiter(map(word_scores.__getitem__, pairs), dtype=np.float64, count=n)
+        sentence_just = _justification_scores(sentence_justifications,
+                                              evaluate_sentence_justification)
+        word_just = _justification_scores(word_justifications, evaluate_word_justification)
+
+        weighted = (sentence * SENTENCE_WEIGHT + sentence_just * SENTENCE_REASONING_WEIGHT
+                    + word * WORD_WEIGHT + word_just * WORD_REASONING_WEIGHT)
+        # Python's round() (correctly rounded), not np.round, to match the scalar path
+        private = np.fromiter((round(x, 2) for x in weighted.tolist()),
+                              dtype=np.float64, count=n)
+        league_points = np.select([private >= 85, private >= 70, private >= 50],
+                                  [3, 2, 1], default=0).astype(np.int64)
+        return {
+            "opening_sentence_score": sentence,
+            "sentence_justification_score": sentence_just,
+            "associative_word_score": word,
+            "word_justification_score": word_just,
+            "private_score": private,
+            "league_points": league_points,
+        }
+
+
+def _broadcast_pairs(actuals, guesses) -> Tuple[List[str], List[str]]:
+    """Lists of equal length; a single actual string applies to every guess."""
+    guesses = list(guesses)
+    if isinstance(actuals, str):
+        return [actuals] * len(guesses), guesses
+    actuals = list(actuals)
+    if len(actuals) != len(guesses):
+        raise ValueError(f"{len(actuals)} actual values for {len(guesses)} guesses")
+    return actuals, guesses
+
+
+def _justification_scores(texts: Sequence[str], evaluate):
+    """evaluate(text)[0] for each text, computed once per distinct text."""
+    import numpy as np
+
+    scores = {text: evaluate(text)[0] for text in dict.fromkeys(texts)}
+    return np.fromiter(map(scores.__getitem__, texts), dtype=np.float64, count=len(texts))
+
+
+class _InternedTexts:
+    """Distinct strings of a batch, lowercased, tokenized and interned once.
+
+    ``columns[k]`` holds the string id of each row of the k-th input.
+    Per string id: lowercase code points (a slice of ``flat_codes``),
+    its set of token ids (a slice of ``flat_tokens``), and the flags
+    calculate_similarity checks before comparing.
+    """
+
+    def __init__(self, *columns: Sequence[str]):
+        import numpy as np
+
+        columns = [[text or "" for text in column] for column in columns]
+        strings = list(dict.fromkeys(chain.from_iterable(columns)))
+        index = {text: sid for sid, text in enumerate(strings)}
+        self.columns = [np.fromiter(map(index.__getitem__, column), dtype=np.int64,
+                                    count=len(column))
+                        for column in columns]
+
+        lowered = [text.lower() for text in strings]
+        lowered_index: Dict[str, int] = {}
+        self.lower_id = np.fromiter(map(lowered_index.setdefault, lowered, count()),
+                                    dtype=np.int64, count=len(lowered))
+        self.empty = np.array([not text for text in strings], dtype=bool)
+        self.lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=len(lowered))
+        self.offsets = np.cumsum(self.lengths) - self.lengths
+        self.flat_codes = np.frombuffer(
+            "".join(lowered).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+        # Token ids are unique per word, not dense; vocab bounds them
+        word_sets = [set(text.split()) for text in lowered]
+        words = list(chain.from_iterable(word_sets))
+        token_ids: Dict[str, int] = {}
+        ids = count()
+        self.flat_tokens = np.fromiter(map(token_ids.setdefault, words, ids),
+                                       dtype=np.int64, count=len(words))
+        self.vocab = next(ids) or 1
+        self.n_tokens = np.fromiter(map(len, word_sets), dtype=np.int64, count=len(word_sets))
+        self.token_offsets = np.cumsum(self.n_tokens) - self.n_tokens
+
+    @staticmethod
+    def _gather(flat, offsets, counts, ids):
+        """(row index, values) of the first counts[row] items of each row's string."""
+        import numpy as np
+
+        row = np.repeat(np.arange(len(ids)), counts)
+        pos = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        return row, flat[offsets[ids][row] + pos]
+
+    def similarity(self, a_ids, g_ids):
+        import numpy as np
+
+        n = len(a_ids)
+        vocab = self.vocab
+
+        # Jaccard: |A ∩ G| from sorted (row, token) keys; |A ∪ G| = |A| + |G| - |A ∩ G|
+        a_row, a_tok = self._gather(self.flat_tokens, self.token_offsets,
+                                    self.n_tokens[a_ids], a_ids)
+        g_row, g_tok = self._gather(self.flat_tokens, self.token_offsets,
+                                    self.n_tokens[g_ids], g_ids)
+        common = np.intersect1d(a_row * vocab + a_tok, g_row * vocab + g_tok,
+                                assume_unique=True)
+        inter = np.bincount(common // vocab, minlength=n).astype(np.float64)
+        union = self.n_tokens[a_ids] + self.n_tokens[g_ids] - inter
+        with np.errstate(divide="ignore", invalid="ignore"):
+            jaccard = inter / union
+
+        # Positional character matches over the shorter lowercase string
+        a_len, g_len = self.lengths[a_ids], self.lengths[g_ids]
+        shared = np.minimum(a_len, g_len)
+        row, a_chars = self._gather(self.flat_codes, self.offsets, shared, a_ids)
+        _, g_chars = self._gather(self.flat_codes, self.offsets, shared, g_ids)
+        matches = np.bincount(row, weights=(a_chars == g_chars), minlength=n)
+        sequence_ratio = matches / np.maximum(a_len, 1)
+
+        raw = np.minimum(100.0, jaccard * 70 + sequence_ratio * 30)
+        scores = np.fromiter((round(x, 2) for x in raw.tolist()),
+                             dtype=np.float64, count=n)
+        scores[self.n_tokens[a_ids] == 0] = 0.0
+        scores[self.lower_id[a_ids] == self.lower_id[g_ids]] = 100.0
+        scores[self.empty[a_ids] | self.empty[g_ids]] = 0.0
+        return scores
+
 
 # ═══════════════════════════════════════════════════════════════════
 # 6. OUTPUT VALIDATORS
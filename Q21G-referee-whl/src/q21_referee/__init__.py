@@ -21,6 +21,7 @@ Custom Implementation:
 
 Two operating modes:
 1. Season Mode (RLGMRunner) - Full league integration
+   (AsyncRLGMRunner runs the same protocol on asyncio, games in parallel)
 2. Single-Game Mode (RefereeRunner) - For testing
 
 Type Definitions
@@ -38,12 +39,15 @@ from .callbacks import RefereeAI
 from .demo_ai import DemoAI
 from .runner import RefereeRunner
 from .rlgm_runner import RLGMRunner
+from .async_runner import AsyncRLGMRunner
 from .errors import (
     Q21RefereeError,
     CallbackTimeoutError,
     InvalidJSONResponseError,
     SchemaValidationError,
 )
+from ._gmc.json_schema import callback_json_schema
+from ._gmc.executors import current_cancel_token, callback_stats
 from .types import (
     # Warmup types
     PlayerInfo,
@@ -59,6 +63,10 @@ from .types import (
     AnswersContext,
     Answer,
     AnswersResponse,
+    PlayerQuestions,
+    AnswersBatchContext,
+    AnswersBatchResponse,
+    PrepareGameContext,
     # Score feedback types
     ScoreFeedbackContext,
     ScoreBreakdown,
@@ -72,11 +80,17 @@ __all__ = [
     "DemoAI",
     "RefereeRunner",
     "RLGMRunner",
+    "AsyncRLGMRunner",
     # Errors
     "Q21RefereeError",
     "CallbackTimeoutError",
     "InvalidJSONResponseError",
     "SchemaValidationError",
+    # Output schemas
+    "callback_json_schema",
+    # Callback execution
+    "current_cancel_token",
+    "callback_stats",
     # Warmup types
     "PlayerInfo",
     "WarmupContext",
@@ -91,6 +105,10 @@ __all__ = [
     "AnswersContext",
     "Answer",
     "AnswersResponse",
+    "PlayerQuestions",
+    "AnswersBatchContext",
+    "AnswersBatchResponse",
+    "PrepareGameContext",
     # Score feedback types
     "ScoreFeedbackContext",
     "ScoreBreakdown",
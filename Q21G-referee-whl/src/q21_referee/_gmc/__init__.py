@@ -15,9 +15,16 @@ from .state import GameState, GamePhase, PlayerState
 from .envelope_builder import EnvelopeBuilder
 from .context_builder import ContextBuilder, SERVICE_DEFINITIONS
 from .callback_executor import execute_callback
+from .executors import (
+    CancelToken,
+    callback_stats,
+    configure_executor,
+    current_cancel_token,
+)
 from .router import MessageRouter
 from .validator import validate_output
-from .gmc import GameManagementCycle
+from .json_schema import callback_json_schema
+from .gmc import GameManagementCycle, TIMEOUT_ACTIONS
 
 __all__ = [
     "GameState",
@@ -27,7 +34,13 @@ __all__ = [
     "ContextBuilder",
     "SERVICE_DEFINITIONS",
     "execute_callback",
+    "CancelToken",
+    "callback_stats",
+    "configure_executor",
+    "current_cancel_token",
     "MessageRouter",
     "validate_output",
+    "callback_json_schema",
     "GameManagementCycle",
+    "TIMEOUT_ACTIONS",
 ]
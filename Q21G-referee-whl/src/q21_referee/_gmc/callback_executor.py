@@ -5,16 +5,18 @@ q21_referee._gmc.callback_executor — Safe callback execution
 ============================================================
 
 Wraps callback invocation with:
-1. Timeout enforcement
+1. Timeout enforcement (via the executor backend, see executors.py)
 2. JSON validation (ensure dict returned)
 3. Schema validation
 4. Error handling (log + terminate on failure)
+
+A timeout terminates the process only under SIGALRM in the main thread;
+with the thread and process backends it is logged and raised, and
+GameManagementCycle forfeits the game that made the call.
 """
 
 from __future__ import annotations
-import signal
-import sys
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 import logging
 
 from ..errors import (
@@ -23,49 +25,20 @@ from ..errors import (
     SchemaValidationError,
 )
 from .validator import validate_output, apply_score_feedback_penalties
-from .._shared.logging_config import log_and_terminate
+from .executors import CallbackExecutor, TimeoutHandler, get_executor  # noqa: F401
+from .._shared.logging_config import log_and_terminate, log_callback_error
 from .._shared.protocol_logger import get_protocol_logger
 
 logger = logging.getLogger("q21_referee.executor")
 
 
-class TimeoutHandler:
-    """Context manager for callback timeout enforcement."""
-
-    def __init__(self, seconds: int, callback_name: str, input_payload: Dict):
-        self.seconds = seconds
-        self.callback_name = callback_name
-        self.input_payload = input_payload
-        self._old_handler = None
-
-    def _timeout_handler(self, signum, frame):
-        raise CallbackTimeoutError(
-            callback_name=self.callback_name,
-            deadline_seconds=self.seconds,
-            input_payload=self.input_payload,
-        )
-
-    def __enter__(self):
-        # Only use signal-based timeout on Unix systems
-        if hasattr(signal, "SIGALRM"):
-            self._old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
-            signal.alarm(self.seconds)
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if hasattr(signal, "SIGALRM"):
-            signal.alarm(0)  # Cancel the alarm
-            if self._old_handler is not None:
-                signal.signal(signal.SIGALRM, self._old_handler)
-        return False  # Don't suppress exceptions
-
-
 def execute_callback(
     callback_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
     callback_name: str,
     ctx: Dict[str, Any],
     deadline_seconds: int,
     terminate_on_error: bool = True,
+    executor: Optional[CallbackExecutor] = None,
 ) -> Dict[str, Any]:
     """
     Execute a callback with timeout, validation, and error handling.
@@ -82,7 +55,11 @@ def execute_callback(
         Maximum time allowed for the callback to complete.
     terminate_on_error : bool
         If True, terminate process on error. If False, raise exception.
-        Defaults to True.
+        Defaults to True. Timeouts raise instead whenever the executor
+        isolates them (thread and process backends).
+    executor : CallbackExecutor, optional
+        Deadline backend. Defaults to the one installed by
+        configure_executor() (SIGALRM in the main thread).
 
     Returns
     -------
@@ -92,7 +69,8 @@ def execute_callback(
     Raises
     ------
     CallbackTimeoutError
-        If callback exceeds deadline (only if terminate_on_error=False).
+        If callback exceeds deadline (terminate_on_error=False, or an
+        executor that isolates timeouts).
     InvalidJSONResponseError
         If callback returns non-dict (only if terminate_on_error=False).
     SchemaValidationError
@@ -103,12 +81,15 @@ def execute_callback(
     protocol_logger.log_callback_call(callback_name)
 
     # ── Step 1: Execute with timeout ──────────────────────────
+    executor = executor or get_executor()
     try:
-        with TimeoutHandler(deadline_seconds, callback_name, ctx):
-            result = callback_fn(ctx)
+        result = executor.run(callback_fn, ctx, callback_name, deadline_seconds)
     except CallbackTimeoutError as e:
-        if terminate_on_error:
+        if not terminate_on_error:
+            raise
+        if not executor.isolates_timeouts():
             log_and_terminate(e)
+        log_callback_error(e)
         raise
 
     # ── Step 2: Validate return type is dict ──────────────────
@@ -12,7 +12,7 @@ Each ctx has two sections:
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import logging
 
 from .state import GameState, PlayerState
@@ -37,12 +37,24 @@ SERVICE_DEFINITIONS: Dict[str, Dict[str, Any]] = {
         "required_output_fields": ["book_name", "book_hint", "association_word"],
         "deadline_seconds": 60,
     },
+    "prepare_game": {
+        "name": "prepare_game",
+        "description": "Optional: precompute per-game data while the players write their questions",
+        "required_output_fields": [],
+        "deadline_seconds": 30,
+    },
     "answers": {
         "name": "answers",
         "description": "Answer each multiple-choice question with A, B, C, D, or 'Not Relevant'",
         "required_output_fields": ["answers"],
         "deadline_seconds": 120,
     },
+    "answers_batch": {
+        "name": "answers_batch",
+        "description": "Answer both players' questions in one call, keyed by player_id",
+        "required_output_fields": ["answers_by_player"],
+        "deadline_seconds": 120,
+    },
     "score_feedback": {
         "name": "score_feedback",
         "description": "Score the player's guess and provide 150-200 word feedback for each component",
@@ -131,7 +143,8 @@ class ContextBuilder:
         """
         Build context for get_round_start_info callback.
 
-        Called when both players have responded to warmup.
+        Called when both players have responded to warmup, or right after
+        the warmup calls with speculative_round_start (warmup answers None).
 
         Returns
         -------
@@ -160,6 +173,27 @@ class ContextBuilder:
             "service": SERVICE_DEFINITIONS["round_start_info"].copy(),
         }
 
+    def build_prepare_game_ctx(self) -> Dict[str, Any]:
+        """
+        Build context for the optional prepare_game callback.
+
+        Called in the background right after Q21ROUNDSTART is sent, with
+        the book fields chosen in get_round_start_info.
+        """
+        dynamic = self._base_dynamic()
+        dynamic.update({
+            "round_number": self.state.round_number,
+            "round_id": self.state.round_id,
+            "book_name": self.state.book_name,
+            "book_hint": self.state.book_hint,
+            "association_word": self.state.association_word,
+        })
+
+        return {
+            "dynamic": dynamic,
+            "service": SERVICE_DEFINITIONS["prepare_game"].copy(),
+        }
+
     # ── Callback 3: get_answers ───────────────────────────────
 
     def build_answers_ctx(
@@ -202,6 +236,33 @@ class ContextBuilder:
             "service": SERVICE_DEFINITIONS["answers"].copy(),
         }
 
+    def build_answers_batch_ctx(self, players: List[PlayerState]) -> Dict[str, Any]:
+        """
+        Build context for the optional get_answers_batch callback.
+
+        Same book fields as build_answers_ctx, with every player's
+        questions under ``players``.
+        """
+        dynamic = self._base_dynamic()
+        dynamic.update({
+            "round_number": self.state.round_number,
+            "round_id": self.state.round_id,
+            "assignment_table_id": self.config.get("assignment_table_id"),
+            "book_name": self.state.book_name,
+            "book_hint": self.state.book_hint,
+            "association_word": self.state.association_word,
+            "players": [
+                {"player_id": p.participant_id, "player_email": p.email,
+                 "questions": p.questions}
+                for p in players
+            ],
+        })
+
+        return {
+            "dynamic": dynamic,
+            "service": SERVICE_DEFINITIONS["answers_batch"].copy(),
+        }
+
     # ── Callback 4: get_score_feedback ────────────────────────
 
     def build_score_feedback_ctx(
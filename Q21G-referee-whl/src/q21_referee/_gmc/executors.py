@@ -0,0 +1,399 @@
+# Area: GMC
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._gmc.executors — Callback deadline enforcement backends
+===================================================================
+
+execute_callback() hands the student callback to a CallbackExecutor,
+which enforces the deadline and records latency:
+
+    "signal"  — SIGALRM in the main thread (the original behaviour); off
+                the main thread, or without SIGALRM, it uses threads
+    "thread"  — runs the callback on a worker thread and stops waiting at
+                the deadline; the callback's CancelToken is set so it can
+                stop cooperatively (see current_cancel_token())
+    "process" — runs each callback in a fresh child process that is
+                terminated at the deadline (hard stop)
+
+PROCESS BACKEND: STATELESS AIs ONLY. The child gets a pickled copy of the
+RefereeAI, ctx and callback, and only the return value comes back.
+Anything the callback stores on ``self`` (the chosen paragraph, caches,
+...) is lost when the child exits, so an AI that remembers state between
+callbacks - like examples/my_ai.py - must not use it. An AI that cannot
+be pickled (open database or HTTP connections) is refused with a
+TypeError. Children start via "forkserver" (or "spawn"), never a plain
+fork of the runner, which already runs poll, outbox and prefetch threads.
+
+CANCELLATION: the thread backend sets the callback's CancelToken at the
+deadline. It only helps callbacks that check it: poll
+current_cancel_token().cancelled in long loops, or tie it into the
+deadline budget the way examples/my_ai.py does.
+
+ABANDONED CALLBACKS: Python cannot kill a thread, so a thread-backend
+callback that ignores its token keeps its worker until it returns. The
+pool size (``callback_workers``) caps how many can pile up; while every
+worker is held, new callbacks queue and time out. The executor logs how
+many callbacks are still running past their deadline.
+
+TIMEOUTS: with the thread and process backends (and the signal backend
+off the main thread) a timeout only fails the current call - the game
+that made it is forfeited and the process keeps running. Only a SIGALRM
+timeout in the main thread terminates the process, as it always has.
+
+Thread and process backends are safe to call from several threads at once,
+so callbacks for different players or games can run in parallel.
+"""
+
+from __future__ import annotations
+import contextvars
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Optional
+
+from ..errors import CallbackTimeoutError
+
+logger = logging.getLogger("q21_referee.executor")
+
+EXECUTOR_SIGNAL = "signal"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+# ══════════════════════════════════════════════════════════════
+# CANCELLATION
+# ══════════════════════════════════════════════════════════════
+
+
+class CancelToken:
+    """Set when the callback's deadline passes; callbacks may poll it."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+_NEVER_CANCELLED = CancelToken()
+_current_token: contextvars.ContextVar[CancelToken] = contextvars.ContextVar(
+    "q21_cancel_token", default=_NEVER_CANCELLED
+)
+
+
+def current_cancel_token() -> CancelToken:
+    """Token of the callback running in this context (never cancelled if none)."""
+    return _current_token.get()
+
+
+def _run_with_token(fn: Callable, ctx: Dict[str, Any], token: CancelToken) -> Any:
+    _current_token.set(token)
+    return fn(ctx)
+
+
+# ══════════════════════════════════════════════════════════════
+# LATENCY STATS
+# ══════════════════════════════════════════════════════════════
+
+
+class CallbackStats:
+    """Per-callback call count, timeouts and latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, float]] = {}
+
+    def record(self, callback_name: str, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            s = self._data.setdefault(callback_name, {
+                "calls": 0, "timeouts": 0, "total_seconds": 0.0,
+                "max_seconds": 0.0, "last_seconds": 0.0,
+            })
+            s["calls"] += 1
+            s["timeouts"] += int(timed_out)
+            s["total_seconds"] += seconds
+            s["max_seconds"] = max(s["max_seconds"], seconds)
+            s["last_seconds"] = seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                name: dict(s, mean_seconds=s["total_seconds"] / s["calls"])
+                for name, s in self._data.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+callback_stats = CallbackStats()
+
+
+# ══════════════════════════════════════════════════════════════
+# EXECUTORS
+# ══════════════════════════════════════════════════════════════
+
+
+class TimeoutHandler:
+    """Context manager for callback timeout enforcement."""
+
+    def __init__(self, seconds: int, callback_name: str, input_payload: Dict):
+        self.seconds = seconds
+        self.callback_name = callback_name
+        self.input_payload = input_payload
+        self._old_handler = None
+
+    def _timeout_handler(self, signum, frame):
+        raise CallbackTimeoutError(
+            callback_name=self.callback_name,
+            deadline_seconds=self.seconds,
+            input_payload=self.input_payload,
+        )
+
+    def __enter__(self):
+        # Only use signal-based timeout on Unix systems
+        if hasattr(signal, "SIGALRM"):
+            self._old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)  # float-safe alarm
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if hasattr(signal, "SIGALRM"):
+            signal.setitimer(signal.ITIMER_REAL, 0)  # Cancel the alarm
+            if self._old_handler is not None:
+                signal.signal(signal.SIGALRM, self._old_handler)
+        return False  # Don't suppress exceptions
+
+
+class CallbackExecutor:
+    """Base executor: times the call and records it in callback_stats."""
+
+    name = ""
+
+    def run(
+        self,
+        fn: Callable[[Dict[str, Any]], Any],
+        ctx: Dict[str, Any],
+        callback_name: str,
+        deadline_seconds: float,
+    ) -> Any:
+        """Call fn(ctx), raising CallbackTimeoutError past the deadline."""
+        started = time.monotonic()
+        timed_out = False
+        try:
+            return self._invoke(fn, ctx, callback_name, deadline_seconds)
+        except CallbackTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            callback_stats.record(callback_name, time.monotonic() - started, timed_out)
+
+    def _invoke(self, fn, ctx, callback_name, deadline_seconds) -> Any:
+        raise NotImplementedError
+
+    def isolates_timeouts(self) -> bool:
+        """True when a timeout in this thread leaves the process usable."""
+        return True
+
+    def shutdown(self) -> None:
+        """Release worker resources."""
+
+    @staticmethod
+    def _timeout(callback_name, deadline_seconds, ctx) -> CallbackTimeoutError:
+        return CallbackTimeoutError(
+            callback_name=callback_name,
+            deadline_seconds=deadline_seconds,
+            input_payload=ctx,
+        )
+
+
+class ThreadExecutor(CallbackExecutor):
+    """Deadline enforced by waiting on a worker thread."""
+
+    name = EXECUTOR_THREAD
+
+    def __init__(self, max_workers: int = 8):
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="q21-callback")
+        self._lock = threading.Lock()
+        self._abandoned = 0
+
+    @property
+    def abandoned(self) -> int:
+        """Callbacks still running after their deadline passed."""
+        with self._lock:
+            return self._abandoned
+
+    def _invoke(self, fn, ctx, callback_name, deadline_seconds):
+        token = CancelToken()
+        run_ctx = contextvars.copy_context()
+        future = self._pool.submit(run_ctx.run, _run_with_token, fn, ctx, token)
+        try:
+            return future.result(timeout=deadline_seconds)
+        except FutureTimeout:
+            token.cancel()
+            if not future.cancel():
+                self._abandon(future)
+            logger.warning(f"[CALLBACK] {callback_name} abandoned at its "
+                           f"{deadline_seconds}s deadline (cancel requested, "
+                           f"{self.abandoned}/{self._max_workers} workers still busy "
+                           f"with abandoned callbacks)")
+            raise self._timeout(callback_name, deadline_seconds, ctx) from None
+
+    def _abandon(self, future) -> None:
+        """Count ``future`` as abandoned until its worker is free again."""
+        with self._lock:
+            self._abandoned += 1
+        future.add_done_callback(self._released)
+
+    def _released(self, _future) -> None:
+        with self._lock:
+            self._abandoned -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SignalExecutor(CallbackExecutor):
+    """SIGALRM in the main thread; threads everywhere else."""
+
+    name = EXECUTOR_SIGNAL
+
+    def __init__(self, max_workers: int = 8):
+        self._max_workers = max_workers
+        self._fallback: Optional[ThreadExecutor] = None
+        self._lock = threading.Lock()
+
+    def _invoke(self, fn, ctx, callback_name, deadline_seconds):
+        if hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread():
+            with TimeoutHandler(deadline_seconds, callback_name, ctx):
+                return fn(ctx)
+        with self._lock:
+            if self._fallback is None:
+                self._fallback = ThreadExecutor(self._max_workers)
+        return self._fallback._invoke(fn, ctx, callback_name, deadline_seconds)
+
+    def isolates_timeouts(self) -> bool:
+        return not (hasattr(signal, "SIGALRM")
+                    and threading.current_thread() is threading.main_thread())
+
+    def shutdown(self) -> None:
+        if self._fallback:
+            self._fallback.shutdown()
+
+
+def _child_main(conn, fn, ctx) -> None:
+    """Process-backend child: run the callback and send back the outcome."""
+    try:
+        outcome = ("ok", fn(ctx))
+    except BaseException as e:  # report anything, the parent re-raises
+        outcome = ("error", e)
+    try:
+        conn.send(outcome)
+    except Exception as e:  # unpicklable result or exception
+        conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+    finally:
+        conn.close()
+
+
+class ProcessExecutor(CallbackExecutor):
+    """Deadline enforced by terminating a per-call child process.
+
+    For stateless AIs only: see the module docstring.
+    """
+
+    name = EXECUTOR_PROCESS
+
+    def __init__(self, max_workers: int = 4):
+        methods = multiprocessing.get_all_start_methods()
+        # Never fork the multi-threaded runner itself
+        self._mp = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn")
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    def _invoke(self, fn, ctx, callback_name, deadline_seconds):
+        deadline = time.monotonic() + deadline_seconds
+        if not self._slots.acquire(timeout=deadline_seconds):
+            raise self._timeout(callback_name, deadline_seconds, ctx)
+        try:
+            recv, send = self._mp.Pipe(duplex=False)
+            proc = self._mp.Process(target=_child_main, args=(send, fn, ctx), daemon=True)
+            try:
+                proc.start()
+            except Exception as e:  # the AI, callback or ctx cannot be pickled
+                recv.close()
+                raise TypeError(
+                    f"callback_executor='process' needs a stateless, picklable "
+                    f"RefereeAI; '{callback_name}' could not be sent to a child "
+                    f"process: {e}") from e
+            finally:
+                send.close()
+            ready = recv.poll(max(0.0, deadline - time.monotonic()))
+            if not ready:
+                proc.terminate()
+                proc.join(1.0)
+                raise self._timeout(callback_name, deadline_seconds, ctx)
+            try:
+                status, value = recv.recv()
+            except EOFError:  # child died without reporting
+                proc.join(1.0)
+                status, value = "error", RuntimeError(
+                    f"Callback '{callback_name}' process exited with code {proc.exitcode}")
+            proc.join(1.0)
+            recv.close()
+        finally:
+            self._slots.release()
+        if status == "error":
+            raise value
+        return value
+
+
+_EXECUTORS = {
+    EXECUTOR_SIGNAL: SignalExecutor,
+    EXECUTOR_THREAD: ThreadExecutor,
+    EXECUTOR_PROCESS: ProcessExecutor,
+}
+
+_default_executor: CallbackExecutor = SignalExecutor()
+
+
+def build_executor(name: str = EXECUTOR_SIGNAL, max_workers: int = 8) -> CallbackExecutor:
+    """Create an executor by backend name.
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    try:
+        cls = _EXECUTORS[(name or EXECUTOR_SIGNAL).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown callback executor: {name!r}") from None
+    return cls(max_workers=max_workers)
+
+
+def get_executor() -> CallbackExecutor:
+    """Executor used by execute_callback() when none is passed."""
+    return _default_executor
+
+
+def set_executor(executor: CallbackExecutor) -> CallbackExecutor:
+    """Replace the default executor; returns the previous one."""
+    global _default_executor
+    previous, _default_executor = _default_executor, executor
+    return previous
+
+
+def configure_executor(config: Dict[str, Any]) -> CallbackExecutor:
+    """Install the executor selected by config["callback_executor"]."""
+    executor = build_executor(config.get("callback_executor", EXECUTOR_SIGNAL),
+                              config.get("callback_workers", 8))
+    set_executor(executor).shutdown()
+    return executor
@@ -9,17 +9,23 @@ Encapsulates the internal router, state, and builder.
 """
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 from .state import GameState, GamePhase, PlayerState
 from .envelope_builder import EnvelopeBuilder
-from .router import MessageRouter
+from .router import MessageRouter, ANSWER_BATCH_FLUSH
+from .handlers import build_match_result
 from ..callbacks import RefereeAI
+from ..errors import CallbackTimeoutError
 from .._rlgm.gprm import GPRM
 from .._rlgm.game_result import GameResult, PlayerScore
 
 logger = logging.getLogger("q21_referee.gmc")
 
+# What to do when a player misses a response deadline
+TIMEOUT_ACTIONS = ("forfeit", "proceed", "ignore")
+
 
 class GameManagementCycle:
     """
@@ -41,6 +47,8 @@ class GameManagementCycle:
         self.ai = ai
         self.config = config
         self._result: Optional[GameResult] = None
+        # Held by the orchestrator while this game routes a message or event
+        self.lock = threading.RLock()
 
         # Build internal state from GPRM
         self.state = GameState(
@@ -91,7 +99,10 @@ class GameManagementCycle:
                 "round_number": self.gprm.round_number,
             },
         }
-        return self.router.route("BROADCAST_NEW_LEAGUE_ROUND", body, "")
+        outgoing = self._route("BROADCAST_NEW_LEAGUE_ROUND", body, "")
+        if self.state.phase == GamePhase.MATCH_REPORTED:
+            self._result = self._build_game_result()
+        return outgoing
 
     def route_message(
         self, message_type: str, body: dict, sender_email: str
@@ -107,14 +118,110 @@ class GameManagementCycle:
         Returns:
             List of (envelope, subject, recipient) tuples to send
         """
-        outgoing = self.router.route(message_type, body, sender_email)
+        if self._is_dropped(sender_email):
+            logger.info(f"[{self.state.game_id}] Ignoring late {message_type} from {sender_email}")
+            return []
+
+        outgoing = self._route(message_type, body, sender_email)
 
         # Check if game is complete
         if self.state.phase == GamePhase.MATCH_REPORTED:
             self._result = self._build_game_result()
 
+        # Players that timed out get no further messages
+        return [out for out in outgoing if not self._is_dropped(out[2])]
+
+    @property
+    def answer_batch_due(self) -> Optional[float]:
+        """Epoch seconds when held questions must be answered (None = none held)."""
+        return self.state.answer_batch_due
+
+    def flush_answers(self) -> List[Tuple[dict, str, str]]:
+        """Close the answer batching window, answering any held questions."""
+        if self.state.answer_batch_due is None:
+            return []
+        return self.route_message(ANSWER_BATCH_FLUSH, {}, "")
+
+    def expire_player(
+        self, player_email: str, action: str = "forfeit"
+    ) -> List[Tuple[dict, str, str]]:
+        """
+        Apply a response timeout: ``player_email`` missed a deadline.
+
+        Actions:
+            forfeit   end the match now; the silent player scores 0 and loses,
+                      an unscored responsive player gets ``forfeit_points``
+            proceed   carry on with the other player alone; the silent player
+                      is dropped from further messages and loses at the end
+            ignore    log only, keep waiting
+
+        Returns:
+            List of (envelope, subject, recipient) tuples to send
+        """
+        player = self.state.get_player_by_email(player_email)
+        if player is None or player.timed_out or player.score_sent or self.is_complete():
+            return []
+        logger.warning(
+            f"[{self.state.game_id}] {player.participant_id} missed a response deadline "
+            f"in phase {self.state.phase.value} ({action})"
+        )
+        if action == "ignore":
+            return []
+
+        player.timed_out = True
+        other = self.state.player2 if player is self.state.player1 else self.state.player1
+        if action == "proceed" and not other.timed_out:
+            outgoing = self._proceed_without(player, other)
+        else:
+            outgoing = self._forfeit()
+
+        if self.state.phase == GamePhase.MATCH_REPORTED:
+            self._result = self._build_game_result()
+        return [out for out in outgoing if not self._is_dropped(out[2])]
+
+    def _proceed_without(
+        self, player: PlayerState, other: PlayerState
+    ) -> List[Tuple[dict, str, str]]:
+        """Unblock the phase ``player`` was holding up."""
+        if self.state.phase == GamePhase.WARMUP_SENT:
+            if other.warmup_answer is None:
+                player.warmup_answer = ""  # the other reply starts the round
+                return []
+            body = {"message_type": "Q21WARMUPRESPONSE", "payload": {"answer": ""}}
+            return self._route("Q21WARMUPRESPONSE", body, player.email)
+        if self.state.answer_batch_due is not None:
+            return self._route(ANSWER_BATCH_FLUSH, {}, "")  # stop holding the other
+        if self.state.both_scores_sent():
+            return self._report()
+        return []  # the other player's guess completes the match
+
+    def _route(
+        self, message_type: str, body: dict, sender_email: str
+    ) -> List[Tuple[dict, str, str]]:
+        """Route through the handlers; a callback timeout forfeits this game only."""
+        try:
+            return self.router.route(message_type, body, sender_email)
+        except CallbackTimeoutError as e:
+            logger.error(f"[{self.state.game_id}] {e.callback_name} missed its "
+                         f"{e.deadline_seconds}s deadline; forfeiting the match")
+            return self._forfeit()
+
+    def _forfeit(self) -> List[Tuple[dict, str, str]]:
+        """End the match at once, scoring players who were not scored yet."""
+        for p in (self.state.player1, self.state.player2):
+            if not p.score_sent:
+                p.league_points = 0 if p.timed_out else self.config.get("forfeit_points", 3)
+        return self._report()
+
+    def _report(self) -> List[Tuple[dict, str, str]]:
+        outgoing = build_match_result(self.router.context({}, ""))
+        self.state.advance_phase(GamePhase.MATCH_REPORTED)
         return outgoing
 
+    def _is_dropped(self, recipient: str) -> bool:
+        player = self.state.get_player_by_email(recipient)
+        return player is not None and player.timed_out
+
     def is_complete(self) -> bool:
         """Check if the game has completed."""
         return self._result is not None
@@ -133,16 +240,7 @@ class GameManagementCycle:
         p1 = self.state.player1
         p2 = self.state.player2
 
-        # Determine winner
-        if p1.league_points > p2.league_points:
-            winner_id = p1.participant_id
-            is_draw = False
-        elif p2.league_points > p1.league_points:
-            winner_id = p2.participant_id
-            is_draw = False
-        else:
-            winner_id = None
-            is_draw = True
+        winner_id, is_draw = self.state.decide_winner()
 
         return GameResult(
             game_id=self.gprm.game_id,
@@ -8,12 +8,14 @@ Handler functions for different message types in the game flow.
 """
 
 from .warmup import handle_new_round, handle_warmup_response
-from .questions import handle_questions
-from .scoring import handle_guess
+from .questions import handle_questions, flush_answer_batch
+from .scoring import handle_guess, build_match_result
 
 __all__ = [
     "handle_new_round",
     "handle_warmup_response",
     "handle_questions",
+    "flush_answer_batch",
     "handle_guess",
+    "build_match_result",
 ]
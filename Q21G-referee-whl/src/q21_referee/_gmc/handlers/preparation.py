@@ -0,0 +1,76 @@
+# Area: GMC
+# PRD: docs/prd-rlgm.md
+"""
+GMC Background Work
+===================
+
+Shared worker pool for callbacks that run off the message path, and the
+optional prepare_game hook.
+
+Once Q21ROUNDSTART goes out, the players take minutes to write their
+questions. A RefereeAI that overrides prepare_game gets that idle time:
+the call starts in the background right after round start, through the
+callback executor with the prepare_game service deadline (30 s). Before
+get_answers / get_answers_batch / get_score_feedback the handlers wait
+for it to finish, at most ``prepare_wait_seconds`` (default: 30 s) and
+never more than half the waiting callback's deadline. The wait comes out
+of that deadline. Failures are logged and never affect the game.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from ..context_builder import SERVICE_DEFINITIONS
+from ..executors import get_executor
+from ...callbacks import RefereeAI
+
+logger = logging.getLogger("q21_referee.router")
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def background_pool() -> ThreadPoolExecutor:
+    """Lazily created pool shared by all games in the process."""
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="q21-prefetch")
+    return _pool
+
+
+def _prepare(ai: RefereeAI, callback_ctx: dict, game_id: str) -> None:
+    deadline_seconds = SERVICE_DEFINITIONS["prepare_game"]["deadline_seconds"]
+    try:
+        get_executor().run(ai.prepare_game, callback_ctx, "prepare_game", deadline_seconds)
+    except Exception as e:
+        logger.warning(f"[{game_id}] prepare_game failed: {e}")
+
+
+def start_preparation(ctx) -> None:
+    """Run prepare_game in the background, if the AI implements it."""
+    if type(ctx.ai).prepare_game is RefereeAI.prepare_game:
+        return
+    ctx.state.preparation = background_pool().submit(
+        _prepare, ctx.ai, ctx.context_builder.build_prepare_game_ctx(), ctx.state.game_id,
+    )
+
+
+def await_preparation(ctx, deadline_seconds: float) -> float:
+    """Wait (bounded) for prepare_game; returns what is left of ``deadline_seconds``.
+
+    A no-op once prepare_game has finished.
+    """
+    future: Optional[Future] = ctx.state.preparation
+    if future is None or future.done():
+        return deadline_seconds
+    wait = min(ctx.config.get("prepare_wait_seconds",
+                              SERVICE_DEFINITIONS["prepare_game"]["deadline_seconds"]),
+               deadline_seconds / 2)
+    started = time.monotonic()
+    try:
+        future.result(timeout=wait)
+    except Exception:
+        logger.warning(f"[{ctx.state.game_id}] prepare_game still running after {wait}s; "
+                       "continuing without it")
+    return deadline_seconds - (time.monotonic() - started)
@@ -5,14 +5,24 @@ GMC Questions Handler
 =====================
 
 Handler for Q21QUESTIONSBATCH messages.
+
+With ``answer_batch_window_seconds`` set and a RefereeAI that implements
+get_answers_batch, the first player's questions are held for up to that
+window. If the other player's batch lands in time, both are answered in
+one get_answers_batch call; otherwise flush_answer_batch (driven by the
+runner when the window closes) answers the waiting player alone.
 """
 
 import logging
+import time
 from typing import List, Tuple
 
-from ..state import GamePhase
+from ..state import GamePhase, PlayerState
 from ..context_builder import SERVICE_DEFINITIONS
 from ..callback_executor import execute_callback
+from ..validator import validate_output
+from .preparation import await_preparation
+from ...callbacks import RefereeAI
 
 logger = logging.getLogger("q21_referee.router")
 
@@ -32,29 +42,93 @@ def handle_questions(ctx) -> List[Tuple[dict, str, str]]:
         return []
 
     player.questions = payload.get("questions", [])
-    correlation_id = body.get("message_id")
+    player.questions_batch_id = body.get("message_id")
+
+    if _batching_enabled(ctx):
+        waiting = _waiting_players(ctx)
+        if len(waiting) == 2:
+            return _answer_together(ctx, waiting)
+        other = ctx.state.player2 if player is ctx.state.player1 else ctx.state.player1
+        if other.questions is None and not other.timed_out:
+            window = ctx.config["answer_batch_window_seconds"]
+            ctx.state.answer_batch_due = time.time() + window
+            logger.info(f"Holding {player.participant_id}'s questions up to {window}s for a batch")
+            return []
+
+    return _answer_one(ctx, player)
+
+
+def flush_answer_batch(ctx) -> List[Tuple[dict, str, str]]:
+    """Batching window closed: answer whoever is still waiting, one by one."""
+    ctx.state.answer_batch_due = None
+    outgoing = []
+    for player in _waiting_players(ctx):
+        outgoing.extend(_answer_one(ctx, player))
+    return outgoing
+
+
+def _batching_enabled(ctx) -> bool:
+    return (ctx.config.get("answer_batch_window_seconds", 0) > 0
+            and type(ctx.ai).get_answers_batch is not RefereeAI.get_answers_batch)
+
+
+def _waiting_players(ctx) -> List[PlayerState]:
+    return [p for p in (ctx.state.player1, ctx.state.player2)
+            if p.questions is not None and not p.answers_sent and not p.timed_out]
+
+
+def _answer_together(ctx, players: List[PlayerState]) -> List[Tuple[dict, str, str]]:
+    """One get_answers_batch call for both players, split back per player."""
+    ctx.state.answer_batch_due = None
+    service = SERVICE_DEFINITIONS["answers_batch"]
+    deadline_seconds = await_preparation(ctx, service["deadline_seconds"])
+    result = execute_callback(
+        callback_fn=ctx.ai.get_answers_batch,
+        callback_name="answers_batch",
+        ctx=ctx.context_builder.build_answers_batch_ctx(players),
+        deadline_seconds=deadline_seconds,
+    )
+    by_player = result.get("answers_by_player", {})
+
+    outgoing = []
+    for player in players:
+        answers = by_player.get(player.participant_id)
+        errors = validate_output("answers", {"answers": answers})
+        if errors:
+            logger.warning(f"Batched answers for {player.participant_id} invalid "
+                           f"({errors[0]}); calling get_answers")
+            outgoing.extend(_answer_one(ctx, player))
+        else:
+            outgoing.extend(_send_answers(ctx, player, answers))
+    return outgoing
+
+
+def _answer_one(ctx, player: PlayerState) -> List[Tuple[dict, str, str]]:
+    service = SERVICE_DEFINITIONS["answers"]
+    deadline_seconds = await_preparation(ctx, service["deadline_seconds"])
 
     # Build context for student callback
     callback_ctx = ctx.context_builder.build_answers_ctx(player, player.questions)
 
     # Call student callback
-    service = SERVICE_DEFINITIONS["answers"]
     result = execute_callback(
         callback_fn=ctx.ai.get_answers,
         callback_name="answers",
         ctx=callback_ctx,
-        deadline_seconds=service["deadline_seconds"],
+        deadline_seconds=deadline_seconds,
     )
 
-    answers = result.get("answers", [])
+    return _send_answers(ctx, player, result.get("answers", []))
+
 
+def _send_answers(ctx, player: PlayerState, answers: list) -> List[Tuple[dict, str, str]]:
     env, subject = ctx.builder.build_answers_batch(
         player_id=player.participant_id,
         game_id=ctx.state.game_id,
         match_id=ctx.state.match_id,
         answers=answers,
         auth_token=ctx.state.auth_token,
-        correlation_id=correlation_id,
+        correlation_id=player.questions_batch_id,
     )
     player.answers_sent = True
     player.guess_message_id = env["message_id"]
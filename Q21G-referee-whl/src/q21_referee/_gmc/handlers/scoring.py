@@ -13,6 +13,7 @@ from typing import List, Tuple
 from ..state import GamePhase
 from ..context_builder import SERVICE_DEFINITIONS
 from ..callback_executor import execute_callback
+from .preparation import await_preparation
 
 logger = logging.getLogger("q21_referee.router")
 
@@ -34,17 +35,18 @@ def handle_guess(ctx) -> List[Tuple[dict, str, str]]:
 
     player.guess = payload
     correlation_id = body.get("message_id")
+    service = SERVICE_DEFINITIONS["score_feedback"]
+    deadline_seconds = await_preparation(ctx, service["deadline_seconds"])
 
     # Build context for student callback
     callback_ctx = ctx.context_builder.build_score_feedback_ctx(player, payload)
 
     # Call student callback
-    service = SERVICE_DEFINITIONS["score_feedback"]
     result = execute_callback(
         callback_fn=ctx.ai.get_score_feedback,
         callback_name="score_feedback",
         ctx=callback_ctx,
-        deadline_seconds=service["deadline_seconds"],
+        deadline_seconds=deadline_seconds,
     )
 
     league_points = result.get("league_points", 0)
@@ -78,7 +80,7 @@ def handle_guess(ctx) -> List[Tuple[dict, str, str]]:
 
     # If both players scored, send MATCH_RESULT_REPORT
     if ctx.state.both_scores_sent():
-        outgoing.extend(_build_match_result(ctx))
+        outgoing.extend(build_match_result(ctx))
         ctx.state.advance_phase(GamePhase.MATCH_REPORTED)
     else:
         ctx.state.advance_phase(GamePhase.SCORING_COMPLETE)
@@ -86,21 +88,12 @@ def handle_guess(ctx) -> List[Tuple[dict, str, str]]:
     return outgoing
 
 
-def _build_match_result(ctx) -> List[Tuple[dict, str, str]]:
-    """Build MATCH_RESULT_REPORT after both players scored."""
+def build_match_result(ctx) -> List[Tuple[dict, str, str]]:
+    """Build MATCH_RESULT_REPORT once both players are scored or timed out."""
     p1 = ctx.state.player1
     p2 = ctx.state.player2
 
-    # Determine winner
-    if p1.league_points > p2.league_points:
-        winner_id = p1.participant_id
-        is_draw = False
-    elif p2.league_points > p1.league_points:
-        winner_id = p2.participant_id
-        is_draw = False
-    else:
-        winner_id = None
-        is_draw = True
+    winner_id, is_draw = ctx.state.decide_winner()
 
     scores = [
         {
@@ -5,19 +5,75 @@ GMC Warmup Handlers
 ===================
 
 Handlers for new round and warmup response messages.
+
+With ``speculative_round_start`` enabled, get_round_start_info is started
+in the background as soon as the warmup calls go out, and its result is
+picked up when the second warmup response lands. The callback then sees
+``warmup_answer: None`` for both players. Waiting for that result and any
+synchronous retry share one round_start_info deadline.
 """
 
+import time
 import uuid
 import logging
-from typing import List, Tuple
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..state import GamePhase
 from ..context_builder import SERVICE_DEFINITIONS
 from ..callback_executor import execute_callback
+from ...errors import CallbackTimeoutError
+from .preparation import background_pool, start_preparation
 
 logger = logging.getLogger("q21_referee.router")
 
 
+def _prefetch_round_start(ctx) -> None:
+    """Start get_round_start_info in the background (speculative mode)."""
+    service = SERVICE_DEFINITIONS["round_start_info"]
+    ctx.state.round_start_prefetch = background_pool().submit(
+        execute_callback,
+        callback_fn=ctx.ai.get_round_start_info,
+        callback_name="round_start_info",
+        ctx=ctx.context_builder.build_round_start_info_ctx(),
+        deadline_seconds=service["deadline_seconds"],
+        terminate_on_error=False,
+    )
+
+
+def _take_prefetched_round_start(ctx, timeout: float) -> Optional[Dict[str, Any]]:
+    """Result of the background call, or None to run it synchronously."""
+    future: Optional[Future] = ctx.state.round_start_prefetch
+    ctx.state.round_start_prefetch = None
+    if future is None:
+        return None
+    try:
+        return future.result(timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Speculative round_start_info failed ({e}); calling it again")
+        return None
+
+
+def _round_start_info(ctx) -> Dict[str, Any]:
+    """get_round_start_info, prefetched or not, within one service deadline."""
+    deadline_seconds = SERVICE_DEFINITIONS["round_start_info"]["deadline_seconds"]
+    deadline = time.monotonic() + deadline_seconds
+    result = _take_prefetched_round_start(ctx, deadline_seconds)
+    if result is not None:
+        return result
+
+    callback_ctx = ctx.context_builder.build_round_start_info_ctx()
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:  # the prefetch used up the whole budget
+        raise CallbackTimeoutError("round_start_info", deadline_seconds, callback_ctx)
+    return execute_callback(
+        callback_fn=ctx.ai.get_round_start_info,
+        callback_name="round_start_info",
+        ctx=callback_ctx,
+        deadline_seconds=remaining,
+    )
+
+
 def handle_new_round(ctx) -> List[Tuple[dict, str, str]]:
     """
     Handle BROADCAST_NEW_LEAGUE_ROUND message.
@@ -64,6 +120,8 @@ def handle_new_round(ctx) -> List[Tuple[dict, str, str]]:
         outgoing.append((env, subject, player.email))
 
     ctx.state.advance_phase(GamePhase.WARMUP_SENT)
+    if ctx.config.get("speculative_round_start"):
+        _prefetch_round_start(ctx)
     return outgoing
 
 
@@ -71,7 +129,8 @@ def handle_warmup_response(ctx) -> List[Tuple[dict, str, str]]:
     """
     Handle Q21WARMUPRESPONSE message.
 
-    When both players respond, calls get_round_start_info and sends Q21ROUNDSTART.
+    When both players respond, calls get_round_start_info and sends Q21ROUNDSTART,
+    then starts the optional prepare_game hook in the background.
     """
     body = ctx.body
     payload = body.get("payload", {})
@@ -90,17 +149,7 @@ def handle_warmup_response(ctx) -> List[Tuple[dict, str, str]]:
 
     ctx.state.advance_phase(GamePhase.WARMUP_COMPLETE)
 
-    # Build context for student callback
-    callback_ctx = ctx.context_builder.build_round_start_info_ctx()
-
-    # Call student callback
-    service = SERVICE_DEFINITIONS["round_start_info"]
-    result = execute_callback(
-        callback_fn=ctx.ai.get_round_start_info,
-        callback_name="round_start_info",
-        ctx=callback_ctx,
-        deadline_seconds=service["deadline_seconds"],
-    )
+    result = _round_start_info(ctx)
 
     ctx.state.book_name = result.get("book_name", "Unknown Book")
     ctx.state.book_hint = result.get("book_hint", "A famous book")
@@ -122,4 +171,5 @@ def handle_warmup_response(ctx) -> List[Tuple[dict, str, str]]:
         outgoing.append((env, subject, player.email))
 
     ctx.state.advance_phase(GamePhase.ROUND_STARTED)
+    start_preparation(ctx)
     return outgoing
@@ -0,0 +1,92 @@
+# Area: GMC
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._gmc.json_schema — JSON Schema export of callback schemas
+=====================================================================
+
+Translates the validator's CALLBACK_SCHEMAS into standard JSON Schema so
+LLM layers can request schema-constrained (tool) output that already
+satisfies validate_output. CALLBACK_SCHEMAS stays the single source of
+truth; nothing here is validated twice.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .validator import CALLBACK_SCHEMAS
+
+_TYPE_NAMES = {str: "string", int: "integer", float: "number",
+               bool: "boolean", list: "array", dict: "object"}
+
+_CONSTRAINT_KEYS = {
+    "string": {"min_length": "minLength", "max_length": "maxLength"},
+    "array": {"min_length": "minItems", "max_length": "maxItems"},
+    "integer": {"min": "minimum", "max": "maximum"},
+    "number": {"min": "minimum", "max": "maximum"},
+}
+
+
+def callback_json_schema(callback_name: str) -> Dict[str, Any]:
+    """
+    Build a JSON Schema (object) for a callback's output.
+
+    Parameters
+    ----------
+    callback_name : str
+        A key of CALLBACK_SCHEMAS (e.g. "answers", "round_start_info").
+
+    Returns
+    -------
+    Dict[str, Any]
+        JSON Schema with type, required, properties and constraints.
+
+    Raises
+    ------
+    KeyError
+        If the callback has no schema.
+    """
+    return _object_schema(CALLBACK_SCHEMAS[callback_name])
+
+
+def _object_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    properties: Dict[str, Any] = {}
+    constraints = schema.get("constraints", {})
+    items = schema.get("list_item_schema", {})
+    nested = schema.get("nested_schema", {})
+
+    for field, py_type in schema.get("types", {}).items():
+        prop = _type_schema(py_type)
+        for key, value in constraints.get(field, {}).items():
+            if key == "one_of":
+                prop["enum"] = list(value)
+                continue
+            mapped = _CONSTRAINT_KEYS.get(_primary_type(prop), {}).get(key)
+            if mapped:
+                prop[mapped] = value
+        if field in items:
+            prop["items"] = _object_schema(items[field])
+        if field in nested:
+            prop.update(_object_schema(nested[field]))
+        properties[field] = prop
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(schema.get("required", [])),
+    }
+
+
+def _type_schema(py_type: Any) -> Dict[str, Any]:
+    if isinstance(py_type, tuple):
+        names = [_TYPE_NAMES[t] for t in py_type]
+        # JSON Schema "number" already admits integers
+        if set(names) == {"integer", "number"}:
+            return {"type": "number"}
+        return {"type": names}
+    return {"type": _TYPE_NAMES[py_type]}
+
+
+def _primary_type(prop: Dict[str, Any]) -> str:
+    kind = prop["type"]
+    return kind[0] if isinstance(kind, list) else kind
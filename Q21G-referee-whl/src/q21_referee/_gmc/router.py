@@ -21,11 +21,15 @@ from .handlers import (
     handle_new_round,
     handle_warmup_response,
     handle_questions,
+    flush_answer_batch,
     handle_guess,
 )
 
 logger = logging.getLogger("q21_referee.router")
 
+# Internal event: the answer batching window of a game has closed
+ANSWER_BATCH_FLUSH = "ANSWER_BATCH_FLUSH"
+
 
 @dataclass
 class HandlerContext:
@@ -63,15 +67,9 @@ class MessageRouter:
         self.config = config
         self.context_builder = ContextBuilder(config, state)
 
-    def route(
-        self, message_type: str, body: dict, sender_email: str
-    ) -> List[Tuple[dict, str, str]]:
-        """
-        Route an incoming message.
-
-        Returns list of (envelope, subject, recipient_email) tuples.
-        """
-        ctx = HandlerContext(
+    def context(self, body: dict, sender_email: str) -> HandlerContext:
+        """Handler context for a message (or an internal event) in this game."""
+        return HandlerContext(
             ai=self.ai,
             state=self.state,
             builder=self.builder,
@@ -81,6 +79,16 @@ class MessageRouter:
             sender_email=sender_email,
         )
 
+    def route(
+        self, message_type: str, body: dict, sender_email: str
+    ) -> List[Tuple[dict, str, str]]:
+        """
+        Route an incoming message.
+
+        Returns list of (envelope, subject, recipient_email) tuples.
+        """
+        ctx = self.context(body, sender_email)
+
         if message_type == "BROADCAST_NEW_LEAGUE_ROUND":
             return handle_new_round(ctx)
 
@@ -93,6 +101,9 @@ class MessageRouter:
         elif message_type in ("Q21GUESSSUBMISSION", "Q21_GUESS_SUBMISSION"):
             return handle_guess(ctx)
 
+        elif message_type == ANSWER_BATCH_FLUSH:
+            return flush_answer_batch(ctx)
+
         else:
             logger.debug(f"No handler for message_type={message_type}")
             return []
@@ -13,7 +13,7 @@ are ready for the next step.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger("q21_referee.state")
@@ -40,6 +40,7 @@ class PlayerState:
     warmup_answer: Optional[str] = None
     warmup_message_id: Optional[str] = None         # correlation_id for response
     questions: Optional[list] = None
+    questions_batch_id: Optional[str] = None         # incoming Q21QUESTIONSBATCH id
     questions_message_id: Optional[str] = None       # correlation_id for answers
     guess: Optional[Dict[str, Any]] = None
     guess_message_id: Optional[str] = None           # correlation_id for score
@@ -48,6 +49,7 @@ class PlayerState:
     league_points: int = 0
     private_score: float = 0.0
     feedback: Optional[Dict[str, str]] = None  # {opening_sentence, associative_word}
+    timed_out: bool = False                          # missed a response deadline
 
 
 @dataclass
@@ -77,6 +79,15 @@ class GameState:
     # Auth token for this game session
     auth_token: Optional[str] = None
 
+    # Background get_round_start_info call (speculative_round_start)
+    round_start_prefetch: Optional[Any] = None
+
+    # Background prepare_game call, started after round start
+    preparation: Optional[Any] = None
+
+    # Epoch seconds when held questions must be answered alone (batching)
+    answer_batch_due: Optional[float] = None
+
     # Message IDs for correlation
     warmup_call_message_ids: Dict[str, str] = field(default_factory=dict)
     round_start_message_ids: Dict[str, str] = field(default_factory=dict)
@@ -95,8 +106,20 @@ class GameState:
         return None
 
     def both_scores_sent(self) -> bool:
-        return (self.player1 is not None and self.player1.score_sent
-                and self.player2 is not None and self.player2.score_sent)
+        # A player who timed out is never scored; they no longer hold the game up
+        return (self.player1 is not None and (self.player1.score_sent or self.player1.timed_out)
+                and self.player2 is not None and (self.player2.score_sent or self.player2.timed_out))
+
+    def decide_winner(self) -> Tuple[Optional[str], bool]:
+        """(winner participant_id, is_draw); a lone timed-out player loses."""
+        p1, p2 = self.player1, self.player2
+        if p1.timed_out != p2.timed_out:
+            return (p2 if p1.timed_out else p1).participant_id, False
+        if p1.league_points > p2.league_points:
+            return p1.participant_id, False
+        if p2.league_points > p1.league_points:
+            return p2.participant_id, False
+        return None, True
 
     def advance_phase(self, new_phase: GamePhase):
         logger.info(f"[{self.game_id}] Phase: {self.phase.value} → {new_phase.value}")
@@ -110,6 +133,7 @@ class GameState:
                 player.warmup_answer = None
                 player.warmup_message_id = None
                 player.questions = None
+                player.questions_batch_id = None
                 player.questions_message_id = None
                 player.guess = None
                 player.guess_message_id = None
@@ -118,11 +142,19 @@ class GameState:
                 player.league_points = 0
                 player.private_score = 0.0
                 player.feedback = None
+                player.timed_out = False
 
         self.book_name = None
         self.book_hint = None
         self.association_word = None
         self.auth_token = None
+        if self.round_start_prefetch is not None:
+            self.round_start_prefetch.cancel()
+            self.round_start_prefetch = None
+        if self.preparation is not None:
+            self.preparation.cancel()
+            self.preparation = None
+        self.answer_batch_due = None
         self.warmup_call_message_ids.clear()
         self.round_start_message_ids.clear()
         self.phase = GamePhase.IDLE
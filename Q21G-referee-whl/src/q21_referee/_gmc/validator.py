@@ -53,6 +53,10 @@ CALLBACK_SCHEMAS: Dict[str, Dict[str, Any]] = {
             },
         },
     },
+    "answers_batch": {
+        "required": ["answers_by_player"],
+        "types": {"answers_by_player": dict},
+    },
     "score_feedback": {
         "required": ["league_points", "private_score", "breakdown", "feedback"],
         "types": {
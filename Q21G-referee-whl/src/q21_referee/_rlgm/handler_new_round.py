@@ -25,10 +25,10 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
 
     When the League Manager broadcasts a new round:
     1. Extract round_number and round_id
-    2. Look up assignment for this round
-    3. Build GPRM from assignment
+    2. Look up assignments for this round (a referee may have several)
+    3. Build a GPRM per assignment
     4. Transition to IN_GAME state
-    5. Return GPRM for game execution
+    5. Return GPRMs for game execution
     """
 
     def __init__(
@@ -57,7 +57,9 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
             message: The broadcast message
 
         Returns:
-            Dict with round info, assignment, and GPRM, or None if no assignment
+            Dict with round info, the first assignment and its GPRM
+            ("assignment", "gprm"), and one GPRM per assignment ("gprms"),
+            or None if no assignment
         """
         broadcast_id = self.extract_broadcast_id(message)
         payload = self.extract_payload(message)
@@ -72,14 +74,14 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
 
         logger.info(f"New round starting: {round_id} (round {round_number})")
 
-        # Find assignment for this round
-        assignment = self._get_assignment_for_round(round_number)
-        if not assignment:
+        # Find assignments for this round
+        assignments = self._get_assignments_for_round(round_number)
+        if not assignments:
             logger.warning(f"No assignment found for round {round_number}")
             return None
 
-        # Build GPRM
-        gprm = self._build_gprm(assignment, round_number, round_id)
+        # Build one GPRM per match
+        gprms = [self._build_gprm(a, round_number, round_id) for a in assignments]
 
         # Transition to IN_GAME (force=True for out-of-order tolerance)
         self.state_machine.transition(RLGMEvent.ROUND_START, force=True)
@@ -87,16 +89,14 @@ class BroadcastNewRoundHandler(BaseBroadcastHandler):
         return {
             "round_number": round_number,
             "round_id": round_id,
-            "assignment": assignment,
-            "gprm": gprm,
+            "assignment": assignments[0],
+            "gprm": gprms[0],
+            "gprms": gprms,
         }
 
-    def _get_assignment_for_round(self, round_number: int) -> Optional[Dict[str, Any]]:
-        """Find assignment for the given round number."""
-        for assignment in self.assignments:
-            if assignment.get("round_number") == round_number:
-                return assignment
-        return None
+    def _get_assignments_for_round(self, round_number: int) -> List[Dict[str, Any]]:
+        """Find all assignments for the given round number."""
+        return [a for a in self.assignments if a.get("round_number") == round_number]
 
     def _build_gprm(
         self, assignment: Dict[str, Any], round_number: int, round_id: str
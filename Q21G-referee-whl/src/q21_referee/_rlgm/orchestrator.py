@@ -6,9 +6,20 @@ q21_referee._rlgm.orchestrator — RLGM Orchestrator
 
 Main orchestrator that coordinates handlers and GMC.
 Manages the RLGM lifecycle and delegates to appropriate components.
+
+Games are kept in a table keyed by match_id, so a referee assigned
+several matches in a round runs them side by side. Player messages are
+routed by the match/game id they carry, falling back to the sender.
+
+Thread safety: the table, the RLGM state machine and the pending
+outgoing list are guarded by one orchestrator lock; each game's own
+routing runs under that game's lock only. Callers on different threads
+(AsyncRLGMRunner lanes) therefore serialize everything except the work
+inside a game, where the student callbacks run in parallel.
 """
 
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 from .state_machine import RLGMStateMachine
@@ -46,14 +57,16 @@ class RLGMOrchestrator:
         """
         self.config = config
         self.ai = ai
+        self._lock = threading.RLock()
 
         # Core components
         self.state_machine = RLGMStateMachine()
         self.response_builder = RLGMResponseBuilder(config)
         self.router = BroadcastRouter()
 
-        # Current game (if any)
-        self.current_game: Optional[GameManagementCycle] = None
+        # Active games keyed by match_id, in start order
+        self.games: Dict[str, GameManagementCycle] = {}
+        self._latest_match_id: Optional[str] = None
 
         # Assignments storage
         self._assignments: List[Dict[str, Any]] = []
@@ -110,49 +123,120 @@ class RLGMOrchestrator:
         message_type = message.get("message_type", "")
         logger.info(f"Handling LM message: {message_type}")
 
-        result = self.router.route(message)
-
-        # Update assignments if we received them
-        if message_type == "BROADCAST_ASSIGNMENT_TABLE":
-            self._assignments = self._assignment_handler.assignments
-            # Update new round handler with assignments
-            self._new_round_handler.assignments = self._assignments
-
-        # Handle new round - start game and initiate warmup
-        if message_type == "BROADCAST_NEW_LEAGUE_ROUND" and result:
-            gprm = result.get("gprm")
-            if gprm:
-                self.start_game(gprm)
-                # Initiate game sends warmup calls to players
-                warmup_msgs = self.current_game.initiate_game()
-                self._pending_outgoing.extend(warmup_msgs)
+        with self._lock:
+            result = self.router.route(message)
+
+            # Update assignments if we received them
+            if message_type == "BROADCAST_ASSIGNMENT_TABLE":
+                self._assignments = self._assignment_handler.assignments
+                # Update new round handler with assignments
+                self._new_round_handler.assignments = self._assignments
+
+            new_round = message_type == "BROADCAST_NEW_LEAGUE_ROUND" and result
+            games = []
+            if new_round:
+                gprms = result.get("gprms") or [g for g in [result.get("gprm")] if g]
+                games = [self.start_game(gprm) for gprm in gprms]
+
+        # Handle new round - initiate every started game (warmup callbacks
+        # run under the game's lock only)
+        if new_round:
+            for game in games:
+                with game.lock:
+                    outgoing = game.initiate_game()
+                with self._lock:
+                    self._pending_outgoing.extend(outgoing)
             return None  # No email response to LM for new round
 
         return result
 
     def get_pending_outgoing(self) -> List[Tuple[dict, str, str]]:
         """Get and clear pending outgoing player messages."""
-        msgs = self._pending_outgoing
-        self._pending_outgoing = []
+        with self._lock:
+            msgs = self._pending_outgoing
+            self._pending_outgoing = []
         return msgs
 
-    def start_game(self, gprm: GPRM) -> None:
+    @property
+    def current_game(self) -> Optional[GameManagementCycle]:
+        """Most recently started game that is still active (if any)."""
+        return self.games.get(self._latest_match_id) if self._latest_match_id else None
+
+    @current_game.setter
+    def current_game(self, game: Optional[GameManagementCycle]) -> None:
+        with self._lock:
+            if game is None:
+                self.games.pop(self._latest_match_id, None)
+                self._latest_match_id = next(reversed(self.games), None)
+                return
+            self.games[game.gprm.match_id] = game
+            self._latest_match_id = game.gprm.match_id
+
+    def start_game(self, gprm: GPRM) -> GameManagementCycle:
         """
         Start a new game with the given parameters.
 
         Args:
             gprm: Game parameters
+
+        Returns:
+            The new game, also registered under gprm.match_id
         """
         logger.info(f"Starting game: {gprm.match_id}")
-        self.current_game = GameManagementCycle(
-            gprm=gprm, ai=self.ai, config=self.config
-        )
+        game = GameManagementCycle(gprm=gprm, ai=self.ai, config=self.config)
+        with self._lock:
+            self.games.pop(gprm.match_id, None)  # a restarted match goes to the end
+            self.current_game = game
+        return game
+
+    def find_game(
+        self, body: dict, sender_email: str
+    ) -> Optional[GameManagementCycle]:
+        """
+        Find the active game a player message belongs to.
+
+        Matches on payload match_id, then envelope/payload game_id, then the
+        sender being one of the game's players (oldest game first). With a
+        single active game, unmatched messages go to it.
+
+        Args:
+            body: Message body
+            sender_email: Sender's email
+
+        Returns:
+            The game, or None if it cannot be determined
+        """
+        with self._lock:
+            return self._find_game(body, sender_email)
+
+    def _find_game(
+        self, body: dict, sender_email: str
+    ) -> Optional[GameManagementCycle]:
+        payload = body.get("payload") or {}
+        match_id = payload.get("match_id")
+        if match_id in self.games:
+            return self.games[match_id]
+
+        game_id = body.get("game_id") or payload.get("game_id")
+        sender = (sender_email or "").lower()
+        by_sender = None
+        for game in self.games.values():
+            if game_id and game.gprm.game_id == game_id:
+                return game
+            if by_sender is None and sender in (
+                game.gprm.player1_email.lower(), game.gprm.player2_email.lower()
+            ):
+                by_sender = game
+        if by_sender is not None:
+            return by_sender
+        games = list(self.games.values())
+        return games[0] if len(games) == 1 else None
 
     def route_player_message(
         self, message_type: str, body: dict, sender_email: str
     ) -> List[Tuple[dict, str, str]]:
         """
-        Route a player message to the current game.
+        Route a player message to the game it belongs to.
 
         Args:
             message_type: Type of message
@@ -162,30 +246,75 @@ class RLGMOrchestrator:
         Returns:
             List of outgoing messages
         """
-        if not self.current_game:
-            logger.warning("No active game for player message")
+        game = self.find_game(body, sender_email)
+        if not game:
+            logger.warning(
+                f"No active game for {message_type} from {sender_email} "
+                f"({len(self.games)} active)"
+            )
             return []
 
-        outgoing = self.current_game.route_message(message_type, body, sender_email)
+        with game.lock:
+            outgoing = game.route_message(message_type, body, sender_email)
+            complete = game.is_complete()
 
         # Check if game completed
-        if self.current_game.is_complete():
-            self._on_game_complete()
+        if complete:
+            self._on_game_complete(game)
 
         return outgoing
 
-    def _on_game_complete(self) -> None:
-        """Handle game completion."""
-        if not self.current_game:
-            return
+    def expire_response(
+        self, match_id: str, player_email: str, action: str = "forfeit"
+    ) -> List[Tuple[dict, str, str]]:
+        """
+        Apply a missed response deadline to the game it belongs to.
 
-        result = self.current_game.get_result()
+        Args:
+            match_id: Match the response was owed in
+            player_email: Player who did not answer
+            action: "forfeit", "proceed" or "ignore" (see GMC.expire_player)
+
+        Returns:
+            List of outgoing messages
+        """
+        with self._lock:
+            game = self.games.get(match_id)
+        if game is None:
+            return []  # already finished or replaced
+
+        with game.lock:
+            outgoing = game.expire_player(player_email, action)
+            complete = game.is_complete()
+        if complete:
+            self._on_game_complete(game)
+        return outgoing
+
+    def flush_answers(self, match_id: str) -> List[Tuple[dict, str, str]]:
+        """Answer questions a game held for batching once its window closes."""
+        with self._lock:
+            game = self.games.get(match_id)
+        if game is None:
+            return []
+        with game.lock:
+            return game.flush_answers()
+
+    def _on_game_complete(self, game: GameManagementCycle) -> None:
+        """Handle game completion; RLGM leaves IN_GAME once no game is left."""
+        result = game.get_result()
         if result:
             logger.info(f"Game complete: {result.match_id}, winner: {result.winner_id}")
-            self.state_machine.transition(RLGMEvent.GAME_COMPLETE, force=True)
 
-        self.current_game = None
+        with self._lock:
+            if self.games.get(game.gprm.match_id) is game:
+                self.games.pop(game.gprm.match_id)
+            if self._latest_match_id == game.gprm.match_id:
+                self._latest_match_id = next(reversed(self.games), None)
+
+            if result and not self.games:
+                self.state_machine.transition(RLGMEvent.GAME_COMPLETE, force=True)
 
     def get_assignments(self) -> List[Dict[str, Any]]:
         """Get current assignments."""
-        return self._assignments
+        with self._lock:
+            return list(self._assignments)
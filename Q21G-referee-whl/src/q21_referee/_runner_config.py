@@ -9,6 +9,8 @@ Configuration validation and constants for RefereeRunner.
 
 import logging
 
+from ._gmc.router import ANSWER_BATCH_FLUSH
+
 logger = logging.getLogger("q21_referee")
 
 # Message types the referee cares about
@@ -69,3 +71,55 @@ def is_player_message(message_type: str) -> bool:
         "Q21GUESSSUBMISSION",
         "Q21_GUESS_SUBMISSION",
     }
+
+
+# ══════════════════════════════════════════════════════════════
+# DISPATCH PRIORITY
+# ══════════════════════════════════════════════════════════════
+
+# Message classes, most urgent first
+PRIORITY_GAME = 0        # player traffic with a callback deadline running
+PRIORITY_ROUND = 1       # round control from the League Manager
+PRIORITY_SEASON = 2      # season bookkeeping
+PRIORITY_KEEP_ALIVE = 3
+
+_ROUND_MESSAGES = {"BROADCAST_NEW_LEAGUE_ROUND", "BROADCAST_END_LEAGUE_ROUND"}
+
+# Player message → seconds the referee's callback gets to answer it
+# (mirrors SERVICE_DEFINITIONS deadlines of the triggered callback)
+RESPONSE_DEADLINE_SECONDS = {
+    "Q21WARMUPRESPONSE": 60,
+    "Q21_WARMUP_RESPONSE": 60,
+    "Q21QUESTIONSBATCH": 120,
+    "Q21_QUESTIONS_BATCH": 120,
+    "Q21GUESSSUBMISSION": 180,
+    "Q21_GUESS_SUBMISSION": 180,
+}
+
+
+# Internal events, fired by the runner's timer wheel into a game's stream
+# (ANSWER_BATCH_FLUSH: a game's answer batching window closed)
+RESPONSE_TIMEOUT = "RESPONSE_TIMEOUT"           # a player missed a reply deadline
+GAME_EVENTS = {RESPONSE_TIMEOUT, ANSWER_BATCH_FLUSH}
+
+
+def message_priority(message_type: str, received_at: float) -> tuple:
+    """
+    Dispatch rank and deadline (epoch seconds or None) for a message.
+
+    Args:
+        message_type: Protocol message type
+        received_at: Epoch seconds the message was polled
+
+    Returns:
+        (rank, deadline) for PriorityInbox.push
+    """
+    if is_player_message(message_type):
+        return PRIORITY_GAME, received_at + RESPONSE_DEADLINE_SECONDS[message_type]
+    if message_type in GAME_EVENTS:
+        return PRIORITY_GAME, received_at
+    if message_type in _ROUND_MESSAGES:
+        return PRIORITY_ROUND, None
+    if message_type == "BROADCAST_KEEP_ALIVE":
+        return PRIORITY_KEEP_ALIVE, None
+    return PRIORITY_SEASON, None
@@ -5,11 +5,28 @@ Shared utilities used by both RLGM and GMC.
 
 This package contains:
 - Email client for Gmail communication
+- Pluggable transports (Gmail, in-memory, maildir)
+- Background outbox for outgoing messages
+- Adaptive poll scheduler
+- Priority inbox between poll and dispatch
+- Timer wheel for outstanding response deadlines
 - Logging configuration
 - Protocol helpers for message formatting
 """
 
 from .email_client import EmailClient
+from .outbox import SPOOL_MAX_AGE_SECONDS, Outbox, default_spool_path
+from .poll_scheduler import PollScheduler, deadline_epoch
+from .priority_inbox import PriorityInbox
+from .timer_wheel import TimerWheel
+from .transport import (
+    Transport,
+    GmailTransport,
+    InMemoryTransport,
+    MaildirTransport,
+    MemoryBroker,
+    build_transport,
+)
 from .logging_config import (
     setup_logging,
     log_and_terminate,
@@ -31,6 +48,19 @@ from .protocol_logger import get_protocol_logger, ProtocolLogger
 
 __all__ = [
     "EmailClient",
+    "Outbox",
+    "default_spool_path",
+    "SPOOL_MAX_AGE_SECONDS",
+    "PollScheduler",
+    "PriorityInbox",
+    "TimerWheel",
+    "deadline_epoch",
+    "Transport",
+    "GmailTransport",
+    "InMemoryTransport",
+    "MaildirTransport",
+    "MemoryBroker",
+    "build_transport",
     "setup_logging",
     "log_and_terminate",
     "log_callback_error",
@@ -14,6 +14,18 @@ Setup:
     3. Set GMAIL_CREDENTIALS_PATH and GMAIL_TOKEN_PATH in .env
        (use full paths including filename!)
     4. On first run, browser opens for OAuth consent
+
+Sync modes (GMAIL_SYNC_MODE / sync_mode):
+    "unread"  — list is:unread every poll (default)
+    "history" — incremental: fetch only history.list deltas since the last
+                historyId, persisted to GMAIL_HISTORY_PATH across restarts;
+                falls back to a full unread resync when the cursor expires
+
+Threads: the googleapiclient service (httplib2 underneath) is not
+thread-safe, so every thread that calls poll() or send() builds its own
+service on first use; the OAuth credentials are shared. The outbox
+workers therefore send in parallel while the runner polls. poll() itself
+keeps sync state and must be called from one thread at a time.
 """
 
 from __future__ import annotations
@@ -21,6 +33,7 @@ import base64
 import json
 import logging
 import os
+import threading
 import uuid
 from datetime import datetime, timezone
 from email.mime.base import MIMEBase
@@ -28,12 +41,13 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email import encoders
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from .protocol_logger import get_protocol_logger
 
@@ -45,6 +59,14 @@ GMAIL_SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
 ]
 
+# Sub-requests per Gmail batch HTTP call (Google recommends <= 50)
+GMAIL_BATCH_SIZE = 50
+# Page size for messages.list / history.list (pages are followed, no cap)
+LIST_PAGE_SIZE = 100
+
+SYNC_UNREAD = "unread"
+SYNC_HISTORY = "history"
+
 
 class EmailClient:
     """Gmail API client with OAuth2 authentication."""
@@ -54,6 +76,8 @@ class EmailClient:
         credentials_path: str = "",
         token_path: str = "",
         address: str = "",
+        sync_mode: str = "",
+        history_path: str = "",
         **kwargs,  # Accept legacy params for backwards compat
     ):
         """Initialize Gmail client.
@@ -62,6 +86,9 @@ class EmailClient:
             credentials_path: Full path to OAuth client_secret.json
             token_path: Full path to store/load token.json
             address: Gmail address (for logging, auto-detected from API)
+            sync_mode: "unread" or "history" (see module docstring)
+            history_path: Where the history cursor is persisted
+                (default: gmail_history.json next to the token)
         """
         self.credentials_path = credentials_path or os.environ.get(
             "GMAIL_CREDENTIALS_PATH", "client_secret.json"
@@ -70,24 +97,50 @@ class EmailClient:
             "GMAIL_TOKEN_PATH", "token.json"
         )
         self.address = address
-        self._service = None
+        self.sync_mode = sync_mode or os.environ.get("GMAIL_SYNC_MODE", SYNC_UNREAD)
+        self.history_path = Path(
+            history_path or os.environ.get("GMAIL_HISTORY_PATH", "")
+            or Path(self.token_path).with_name("gmail_history.json")
+        )
+        self._local = threading.local()  # per-thread Gmail service
+        self._connect_lock = threading.Lock()
+        self._generation = 0  # bumped by disconnect_imap() for every thread
         self._credentials: Optional[Credentials] = None
+        self._history_id: Optional[str] = None
+        self._pending_ids: List[str] = []  # ids whose get or parse failed
+        self._load_cursor()
+
+    @property
+    def _service(self):
+        """This thread's Gmail service (None until connected)."""
+        if getattr(self._local, "generation", None) != self._generation:
+            return None
+        return getattr(self._local, "service", None)
+
+    @_service.setter
+    def _service(self, service) -> None:
+        self._local.service = service
+        self._local.generation = self._generation
 
     def connect_imap(self) -> None:
         """Establish connection to Gmail API (named for backwards compat)."""
         self._connect()
 
     def _connect(self) -> bool:
-        """Establish connection to Gmail API."""
+        """Connect this thread: shared credentials, a service of its own."""
         try:
-            self._credentials = self._get_credentials()
-            self._service = build("gmail", "v1", credentials=self._credentials)
-
-            # Get user's email address
-            profile = self._service.users().getProfile(userId="me").execute()
-            self.address = profile.get("emailAddress", self.address)
-
-            logger.info(f"Gmail API connected: {self.address}")
+            with self._connect_lock:
+                first = self._credentials is None
+                if first:
+                    self._credentials = self._get_credentials()
+                credentials = self._credentials
+            self._service = build("gmail", "v1", credentials=credentials)
+
+            if first:
+                # Get user's email address
+                profile = self._service.users().getProfile(userId="me").execute()
+                self.address = profile.get("emailAddress", self.address)
+                logger.info(f"Gmail API connected: {self.address}")
             return True
         except Exception as e:
             logger.error(f"Gmail connection failed: {e}")
@@ -134,53 +187,237 @@ class EmailClient:
 
     def disconnect_imap(self) -> None:
         """Close connection (named for backwards compat)."""
-        self._service = None
-        self._credentials = None
+        with self._connect_lock:
+            self._generation += 1  # every thread's service is stale now
+            self._credentials = None
 
     def poll(self, **kwargs) -> List[Dict[str, Any]]:
-        """Poll inbox for new unread messages (oldest first)."""
+        """Poll inbox for new unread messages (oldest first).
+
+        Uses a constant number of HTTP round trips regardless of how many
+        messages arrived: one list, batched gets, one batched attachment
+        fetch and a single batchModify to mark everything read.
+        """
         if not self._service:
             self._connect()
 
         messages = []
         try:
-            # Get unread messages (Gmail returns newest first)
+            if self.sync_mode == SYNC_HISTORY:
+                ids, cursor, retried = self._history_ids()
+            else:
+                ids, cursor, retried = self._list_unread_ids(), None, []
+            messages, failed = self._fetch_and_parse(ids, retried)
+            if self.sync_mode == SYNC_HISTORY:
+                # Committed only now: if anything above raised, the old
+                # cursor stays and the next poll re-reads the same window
+                self._history_id, self._pending_ids = cursor, failed
+                if set(retried).intersection(failed):
+                    # Still unread, so an is:unread listing will find them
+                    logger.warning("Messages still cannot be fetched — full resync next poll")
+                    self._history_id, self._pending_ids = None, []
+                self._save_cursor()
+
+        except Exception as e:
+            logger.error(f"Poll error: {e}")
+
+        return messages
+
+    # ── Mailbox listing ─────────────────────────────────────
+
+    def _list_unread_ids(self) -> List[str]:
+        """All unread message ids, oldest first (follows every page)."""
+        ids: List[str] = []
+        page_token = None
+        while True:
             results = self._service.users().messages().list(
-                userId="me", q="is:unread", maxResults=50
+                userId="me", q="is:unread", maxResults=LIST_PAGE_SIZE,
+                pageToken=page_token,
             ).execute()
+            ids.extend(ref["id"] for ref in results.get("messages", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+        # Gmail returns newest first; reverse to process oldest first
+        # This ensures state machine receives messages in correct sequence
+        return list(reversed(ids))
+
+    def _history_ids(self) -> Tuple[List[str], str, List[str]]:
+        """(ids to fetch, new historyId, ids retried from the last poll).
+
+        Ids are the unread inbox messages added since the stored historyId.
+        Nothing is stored here; poll() commits the new cursor once the
+        fetch succeeded.
+        """
+        if self._history_id is None:
+            return self._full_resync()
 
-            msg_refs = results.get("messages", [])
-
-            # Reverse to process oldest first (chronological order)
-            # This ensures state machine receives messages in correct sequence
-            msg_refs = list(reversed(msg_refs))
+        added: List[str] = []
+        page_token = None
+        try:
+            while True:
+                results = self._service.users().history().list(
+                    userId="me", startHistoryId=self._history_id,
+                    historyTypes=["messageAdded"], maxResults=LIST_PAGE_SIZE,
+                    pageToken=page_token,
+                ).execute()
+                for record in results.get("history", []):
+                    for item in record.get("messagesAdded", []):
+                        labels = item["message"].get("labelIds", [])
+                        if "UNREAD" in labels and "INBOX" in labels:
+                            added.append(item["message"]["id"])
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
+        except HttpError as e:
+            if getattr(e.resp, "status", None) == 404:
+                logger.warning("Gmail history cursor expired — full resync")
+                return self._full_resync()
+            raise
 
-            for ref in msg_refs:
-                try:
-                    msg = self._service.users().messages().get(
-                        userId="me", id=ref["id"], format="full"
-                    ).execute()
+        cursor = str(results.get("historyId", self._history_id))
+        # History is chronological already; retry earlier failures first
+        return list(dict.fromkeys(self._pending_ids + added)), cursor, self._pending_ids
 
-                    parsed = self._parse_message(msg)
-                    if parsed:
-                        messages.append(parsed)
+    def _full_resync(self) -> Tuple[List[str], str, List[str]]:
+        """A cursor of now and every unread message (nothing to retry)."""
+        # Cursor first, so messages arriving during the listing are not lost
+        profile = self._service.users().getProfile(userId="me").execute()
+        cursor = str(profile["historyId"])
+        return self._list_unread_ids(), cursor, []
 
-                    # Mark as read
-                    self._service.users().messages().modify(
-                        userId="me",
-                        id=ref["id"],
-                        body={"removeLabelIds": ["UNREAD"]},
-                    ).execute()
+    # ── Cursor persistence ──────────────────────────────────
 
-                except Exception as e:
-                    logger.warning(f"Failed to process message {ref['id']}: {e}")
+    def _load_cursor(self) -> None:
+        if self.sync_mode != SYNC_HISTORY or not self.history_path.exists():
+            return
+        try:
+            state = json.loads(self.history_path.read_text())
+            self._history_id = state.get("history_id")
+            self._pending_ids = list(state.get("pending_ids", []))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable history cursor: {e}")
+
+    def _save_cursor(self) -> None:
+        state = {"history_id": self._history_id, "pending_ids": self._pending_ids}
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.history_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.history_path)
+
+    def _fetch_and_parse(
+        self, ids: List[str], retried: List[str]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Batch-get, parse and mark read the given message ids (order kept).
+
+        A message that fails to fetch or parse is logged and left unread;
+        the others are still returned and marked read. Returns (messages,
+        failed ids to retry next poll). Fetch failures are always retried;
+        an id in ``retried`` that fails to parse again is dropped.
+        """
+        users = self._service.users()
+        fetched = self._batch_execute(
+            {mid: users.messages().get(userId="me", id=mid, format="full")
+             for mid in ids}
+        )
+        broken = set()
 
-        except Exception as e:
-            logger.error(f"Poll error: {e}")
+        # Prefetch every JSON attachment the bodies don't already cover
+        wanted = {}
+        for mid in ids:
+            if mid not in fetched:
+                continue
+            try:
+                payload = fetched[mid]["payload"]
+                if self._body_json(self._get_body(payload)) is None:
+                    for att_id in self._json_attachment_ids(payload):
+                        wanted[att_id] = users.messages().attachments().get(
+                            userId="me", messageId=mid, id=att_id)
+            except Exception as e:
+                logger.warning(f"Failed to process message {mid}: {e}")
+                broken.add(mid)
+        attachments = {
+            att_id: att.get("data", "")
+            for att_id, att in self._batch_execute(wanted).items()
+        }
 
-        return messages
+        messages = []
+        for mid in ids:
+            if mid not in fetched or mid in broken:
+                continue
+            try:
+                parsed = self._parse_message(fetched[mid], attachments)
+            except Exception as e:
+                logger.warning(f"Failed to process message {mid}: {e}")
+                broken.add(mid)
+                continue
+            if parsed:
+                messages.append(parsed)
+
+        retried = set(retried)
+        for mid in retried.intersection(broken):
+            logger.warning(f"Dropping message {mid}: it cannot be parsed")
+        pending = [mid for mid in ids
+                   if mid not in fetched or (mid in broken and mid not in retried)]
+
+        # Mark as read
+        done = [mid for mid in ids if mid in fetched and mid not in broken]
+        if done:
+            try:
+                users.messages().batchModify(
+                    userId="me",
+                    body={"ids": done, "removeLabelIds": ["UNREAD"]},
+                ).execute()
+            except Exception as e:
+                logger.warning(f"Failed to mark {len(done)} messages read: {e}")
+        return messages, pending
+
+    def _batch_execute(self, requests: Dict[str, Any]) -> Dict[str, Any]:
+        """Run requests as Gmail batch HTTP calls; returns {key: response}.
+
+        Failed sub-requests are logged and left out of the result.
+        """
+        responses: Dict[str, Any] = {}
 
-    def _parse_message(self, msg: dict) -> Optional[Dict[str, Any]]:
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Batch request {request_id} failed: {exception}")
+            else:
+                responses[request_id] = response
+
+        keys = list(requests)
+        for start in range(0, len(keys), GMAIL_BATCH_SIZE):
+            batch = self._service.new_batch_http_request(callback=_collect)
+            for key in keys[start:start + GMAIL_BATCH_SIZE]:
+                batch.add(requests[key], request_id=key)
+            batch.execute()
+        return responses
+
+    @staticmethod
+    def _body_json(body: str) -> Optional[Dict[str, Any]]:
+        if not body:
+            return None
+        try:
+            return json.loads(body.strip())
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+    def _json_attachment_ids(self, payload: dict) -> List[str]:
+        """Attachment ids of JSON parts that need a separate fetch."""
+        ids = []
+        for part in payload.get("parts", []):
+            if part.get("parts"):
+                ids.extend(self._json_attachment_ids(part))
+            filename = part.get("filename", "")
+            if filename.endswith(".json") or part.get("mimeType") == "application/json":
+                att_id = part.get("body", {}).get("attachmentId")
+                if att_id:
+                    ids.append(att_id)
+        return ids
+
+    def _parse_message(
+        self, msg: dict, attachments: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Parse Gmail API message into standard format."""
         headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
 
@@ -193,16 +430,11 @@ class EmailClient:
         body = self._get_body(msg["payload"])
 
         # Try to parse body as JSON first
-        body_json = None
-        if body:
-            try:
-                body_json = json.loads(body.strip())
-            except (json.JSONDecodeError, ValueError):
-                pass
+        body_json = self._body_json(body)
 
         # If no JSON in body, check attachments
         if not body_json:
-            body_json = self._get_json_from_attachments(msg)
+            body_json = self._get_json_from_attachments(msg, attachments)
 
         if body_json:
             logger.debug(f"Parsed JSON with message_type: {body_json.get('message_type', 'N/A')}")
@@ -219,8 +451,14 @@ class EmailClient:
             "raw_body": body,
         }
 
-    def _get_json_from_attachments(self, msg: dict) -> Optional[Dict[str, Any]]:
-        """Extract JSON from email attachments."""
+    def _get_json_from_attachments(
+        self, msg: dict, attachments: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Extract JSON from email attachments.
+
+        `attachments` maps attachmentId → base64 data prefetched by poll();
+        ids missing from it are fetched individually.
+        """
         payload = msg.get("payload", {})
         parts = payload.get("parts", [])
 
@@ -234,7 +472,9 @@ class EmailClient:
 
             # Check nested parts (multipart emails)
             if part.get("parts"):
-                nested_result = self._get_json_from_attachments({"payload": part})
+                nested_result = self._get_json_from_attachments(
+                    {"id": msg.get("id"), "payload": part}, attachments
+                )
                 if nested_result:
                     return nested_result
 
@@ -244,14 +484,17 @@ class EmailClient:
                 attachment_id = body_data.get("attachmentId")
 
                 if attachment_id:
-                    # Fetch attachment content
+                    # Fetch attachment content (unless prefetched)
                     try:
-                        att = self._service.users().messages().attachments().get(
-                            userId="me",
-                            messageId=msg["id"],
-                            id=attachment_id,
-                        ).execute()
-                        data = att.get("data", "")
+                        if attachments is not None and attachment_id in attachments:
+                            data = attachments[attachment_id]
+                        else:
+                            att = self._service.users().messages().attachments().get(
+                                userId="me",
+                                messageId=msg["id"],
+                                id=attachment_id,
+                            ).execute()
+                            data = att.get("data", "")
                         if data:
                             content = base64.urlsafe_b64decode(data).decode("utf-8")
                             return json.loads(content)
@@ -0,0 +1,263 @@
+# Area: Shared
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._shared.outbox — Background outbound send queue
+============================================================
+
+The runners hand outgoing envelopes to an Outbox instead of calling
+transport.send() inline, so routing the next incoming message never waits
+on a Gmail write.
+
+Guarantees:
+    - Bounded concurrency: at most ``workers`` sends in flight
+    - Per-recipient ordering: a recipient's messages go out one at a time,
+      in submit order (different recipients proceed in parallel)
+    - Retry with exponential backoff
+    - Crash safety: every message is written to the spool file when it is
+      submitted and removed once sent, so anything still queued or failing
+      when the process stops is resubmitted by the next Outbox on the same
+      spool - unless it is older than ``max_age`` by then (a stale protocol
+      reply is dropped, not delivered minutes late)
+    - Metrics: sent/failed/retried counters and send-latency percentiles
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set
+
+logger = logging.getLogger("q21_referee.outbox")
+
+LATENCY_WINDOW = 500  # latency samples kept for percentiles
+SPOOL_FILENAME = "q21_outbox.json"
+SPOOL_MAX_AGE_SECONDS = 600  # older spooled messages are dropped on restart
+SPOOL_FIELDS = ("id", "to", "subject", "body", "spooled_at")
+
+
+def default_spool_path(config: Dict[str, Any]) -> str:
+    """config["outbox_spool_path"], else SPOOL_FILENAME next to the log file."""
+    return config.get("outbox_spool_path") or str(
+        Path(config.get("log_file", "q21_referee.log")).with_name(SPOOL_FILENAME)
+    )
+
+
+class Outbox:
+    """Background sender with per-recipient ordering and a retry spool."""
+
+    def __init__(
+        self,
+        transport: Any,
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 1.0,
+        spool_path: str = "",
+        max_age: float = SPOOL_MAX_AGE_SECONDS,
+    ):
+        """
+        Args:
+            transport: Anything with send(to_email, subject, body_dict) -> bool
+            workers: Concurrent sends (distinct recipients only)
+            max_attempts: Attempts per run before a message is left in the spool
+            retry_delay: First backoff in seconds, doubled per failure
+            spool_path: JSON file holding unsent messages ("" = in memory only)
+            max_age: Seconds after submit a spooled message is still resent
+                on start(); older ones are dropped
+        """
+        self.transport = transport
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.spool_path = Path(spool_path) if spool_path else None
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._boxes: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._scheduled: Set[str] = set()  # recipients queued or being sent
+        self._ready: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._spool: Dict[str, Dict[str, Any]] = {}
+        self._threads: List[threading.Thread] = []
+        self._timers: List[threading.Timer] = []
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._counts = {"submitted": 0, "sent": 0, "failed": 0, "retried": 0}
+
+    # ── Lifecycle ──────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start worker threads and resubmit fresh messages left in the spool."""
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"q21-outbox-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        for item in self._load_spool():
+            item["attempts"] = 0
+            self._enqueue(item)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted message is sent or given up on."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._scheduled:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Flush, then stop the workers. Unsent messages stay in the spool."""
+        self.flush(timeout)
+        for timer in self._timers:
+            timer.cancel()
+        for _ in self._threads:
+            self._ready.put(None)
+        for t in self._threads:
+            t.join(timeout=1.0)
+        self._threads = []
+
+    # ── Submission ─────────────────────────────────────────
+
+    def submit(self, to_email: str, subject: str, body_dict: dict) -> None:
+        """Spool and queue one message. Returns without waiting for the send."""
+        item = {
+            "id": uuid.uuid4().hex,
+            "to": to_email,
+            "subject": subject,
+            "body": body_dict,
+            "spooled_at": time.time(),
+            "attempts": 0,
+            "queued_at": time.monotonic(),
+        }
+        with self._lock:
+            self._spool[item["id"]] = {k: item[k] for k in SPOOL_FIELDS}
+            self._save_spool()
+        self._enqueue(item)
+
+    def _enqueue(self, item: Dict[str, Any]) -> None:
+        item.setdefault("queued_at", time.monotonic())
+        key = item["to"].lower()
+        with self._lock:
+            self._counts["submitted"] += 1
+            self._boxes.setdefault(key, deque()).append(item)
+            if key in self._scheduled:
+                return  # the worker on this recipient will reach it in order
+            self._scheduled.add(key)
+        self._ready.put(key)
+
+    # ── Workers ────────────────────────────────────────────
+
+    def _worker(self) -> None:
+        while True:
+            key = self._ready.get()
+            if key is None:
+                return
+            with self._lock:
+                item = self._boxes[key][0]
+            ok = self._attempt(item)
+            with self._lock:
+                if ok or item["attempts"] >= self.max_attempts:
+                    self._boxes[key].popleft()
+                    if not self._boxes[key]:
+                        del self._boxes[key]
+                        self._scheduled.discard(key)
+                        self._idle.notify_all()
+                        continue
+                    delay = 0.0
+                else:
+                    self._counts["retried"] += 1
+                    delay = self.retry_delay * 2 ** (item["attempts"] - 1)
+            self._reschedule(key, delay)
+
+    def _reschedule(self, key: str, delay: float) -> None:
+        if delay <= 0:
+            self._ready.put(key)
+            return
+        timer = threading.Timer(delay, self._ready.put, args=(key,))
+        timer.daemon = True
+        self._timers = [t for t in self._timers if t.is_alive()] + [timer]
+        timer.start()
+
+    def _attempt(self, item: Dict[str, Any]) -> bool:
+        item["attempts"] += 1
+        started = time.monotonic()
+        try:
+            ok = bool(self.transport.send(item["to"], item["subject"], item["body"]))
+        except Exception as e:
+            logger.error(f"Outbox send to {item['to']} raised: {e}")
+            ok = False
+        now = time.monotonic()
+        with self._lock:
+            if ok:
+                self._counts["sent"] += 1
+                self._latencies.append(now - item["queued_at"])
+                if self._spool.pop(item["id"], None) is not None:
+                    self._save_spool()
+            elif item["attempts"] >= self.max_attempts:
+                self._counts["failed"] += 1
+                logger.error(f"Giving up on {item['subject']} → {item['to']} "
+                             f"after {item['attempts']} attempts (kept in spool)")
+        logger.debug(f"Outbox send → {item['to']} ok={ok} in {now - started:.3f}s")
+        return ok
+
+    # ── Spool ──────────────────────────────────────────────
+
+    def _load_spool(self) -> List[Dict[str, Any]]:
+        """Spooled messages still worth sending; stale ones leave the spool."""
+        if not self.spool_path or not self.spool_path.exists():
+            return []
+        try:
+            items = json.loads(self.spool_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.error(f"Outbox spool unreadable, ignoring: {e}")
+            return []
+        cutoff = time.time() - self.max_age
+        fresh = [item for item in items if item.get("spooled_at", 0) >= cutoff]
+        for item in items:
+            if item not in fresh:
+                logger.warning(f"Dropping stale spooled {item.get('subject')} "
+                               f"→ {item.get('to')}")
+        with self._lock:
+            self._spool.update((item["id"], item) for item in fresh)
+            if len(fresh) < len(items):
+                self._save_spool()
+        return [dict(item) for item in fresh]
+
+    def _save_spool(self) -> None:
+        """Atomically rewrite the spool file (caller holds the lock)."""
+        if not self.spool_path:
+            return
+        tmp = self.spool_path.with_suffix(self.spool_path.suffix + ".tmp")
+        try:
+            self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(list(self._spool.values())), encoding="utf-8")
+            os.replace(tmp, self.spool_path)
+        except OSError as e:
+            logger.error(f"Outbox spool write failed: {e}")
+
+    # ── Metrics ────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, queue depth and send latency (queued → delivered)."""
+        with self._lock:
+            samples = sorted(self._latencies)
+            pending = sum(len(box) for box in self._boxes.values())
+            result: Dict[str, Any] = dict(self._counts, pending=pending,
+                                          spooled=len(self._spool))
+
+        def pct(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+        result.update(latency_p50=pct(0.50), latency_p95=pct(0.95),
+                      latency_max=samples[-1] if samples else None)
+        return result
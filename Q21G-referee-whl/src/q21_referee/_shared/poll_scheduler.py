@@ -0,0 +1,93 @@
+# Area: Shared
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._shared.poll_scheduler — Adaptive poll interval
+============================================================
+
+Decides how long the runner sleeps between polls instead of a fixed
+poll_interval_seconds:
+
+    - Burst: while a player owes us a reply (we sent them an envelope with
+      a payload "deadline" and nothing has come back yet) poll every
+      ``burst_interval`` seconds.
+    - Deadline wake-up: never sleep past the earliest outstanding deadline,
+      so the poll that sees a late or missing reply runs right at expiry.
+    - Idle backoff: when nothing is outstanding and polls come back empty,
+      multiply the interval by ``backoff`` up to ``idle_max``. Any
+      incoming message resets it to ``base_interval``.
+"""
+
+from __future__ import annotations
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger("q21_referee.poll")
+
+
+def deadline_epoch(envelope: dict) -> Optional[float]:
+    """Epoch seconds of an envelope's payload deadline, if it has one."""
+    raw = (envelope.get("payload") or {}).get("deadline")
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(str(raw).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class PollScheduler:
+    """Computes the sleep before the next poll."""
+
+    def __init__(
+        self,
+        base_interval: float = 5.0,
+        burst_interval: float = 1.0,
+        idle_max: float = 30.0,
+        backoff: float = 2.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.base_interval = base_interval
+        self.burst_interval = min(burst_interval, base_interval)
+        self.idle_max = max(idle_max, base_interval)
+        self.backoff = max(1.0, backoff)
+        self._clock = clock
+        self._interval = base_interval
+        self._awaiting: Dict[str, float] = {}  # recipient → deadline (epoch)
+
+    # ── Events from the runner ─────────────────────────────
+
+    def note_sent(self, recipient: str, envelope: dict) -> None:
+        """Record an outgoing envelope; a deadline means a reply is owed."""
+        deadline = deadline_epoch(envelope)
+        if deadline is not None:
+            self._awaiting[recipient.lower()] = deadline
+
+    def note_received(self, sender: str) -> None:
+        """Record an incoming message from ``sender``."""
+        self._awaiting.pop(sender.lower(), None)
+        self._interval = self.base_interval
+
+    @property
+    def awaiting(self) -> bool:
+        """True while some player still owes a reply before its deadline."""
+        return bool(self._awaiting)
+
+    # ── Scheduling ─────────────────────────────────────────
+
+    def next_delay(self, received: int = 0) -> float:
+        """Seconds to sleep after a poll that returned ``received`` messages."""
+        now = self._clock()
+        # A deadline that has passed got its wake-up poll; stop bursting for it
+        self._awaiting = {r: d for r, d in self._awaiting.items() if d > now}
+
+        if received:
+            self._interval = self.base_interval
+        elif not self._awaiting:
+            self._interval = min(self._interval * self.backoff, self.idle_max)
+
+        if not self._awaiting:
+            return self._interval
+        until_deadline = min(self._awaiting.values()) - now
+        return max(0.0, min(self.burst_interval, until_deadline))
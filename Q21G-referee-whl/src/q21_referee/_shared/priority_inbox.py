@@ -0,0 +1,102 @@
+# Area: Shared
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._shared.priority_inbox — Deadline-ordered incoming queue
+=====================================================================
+
+Sits between poll and dispatch. Each message is pushed with:
+
+    key       causal stream (e.g. one game, or all League Manager traffic);
+              messages with the same key always come out in push order
+    rank      message class, lower first (game traffic before bookkeeping)
+    deadline  epoch seconds by which handling should finish (None = none)
+
+Only the head of each key competes, ordered by (rank, deadline, arrival),
+so a game's guess submission overtakes a queued keep-alive but never an
+earlier message of its own game.
+"""
+
+from __future__ import annotations
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+_NO_DEADLINE = float("inf")
+
+
+class PriorityInbox:
+    """Priority queue with per-key FIFO ordering and wait-time metrics."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._streams: Dict[str, Deque[Tuple[int, float, int, float, Any]]] = {}
+        self._heap: List[Tuple[int, float, int, str]] = []
+        self._size = 0
+        self._waits: Dict[int, Dict[str, float]] = {}  # rank → wait stats
+
+    def push(self, item: Any, key: str, rank: int, deadline: Optional[float] = None) -> None:
+        """Queue ``item`` on causal stream ``key``."""
+        entry = (rank, _NO_DEADLINE if deadline is None else deadline,
+                 next(self._seq), self._clock(), item)
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = self._streams[key] = deque()
+            stream.append(entry)
+            self._size += 1
+            if len(stream) == 1:  # new head competes
+                heapq.heappush(self._heap, (entry[0], entry[1], entry[2], key))
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the most urgent head item, or None if empty."""
+        with self._lock:
+            if not self._heap:
+                return None
+            _, _, _, key = heapq.heappop(self._heap)
+            stream = self._streams[key]
+            rank, _, _, queued_at, item = stream.popleft()
+            if stream:
+                head = stream[0]
+                heapq.heappush(self._heap, (head[0], head[1], head[2], key))
+            else:
+                del self._streams[key]
+            self._size -= 1
+            self._record_wait(rank, self._clock() - queued_at)
+            return item
+
+    def drain(self) -> List[Any]:
+        """Pop everything in priority order."""
+        items = []
+        while True:
+            item = self.pop()
+            if item is None:
+                return items
+            items.append(item)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ── Metrics ────────────────────────────────────────────
+
+    def _record_wait(self, rank: int, wait: float) -> None:
+        s = self._waits.setdefault(rank, {"count": 0, "total_wait": 0.0, "max_wait": 0.0})
+        s["count"] += 1
+        s["total_wait"] += wait
+        s["max_wait"] = max(s["max_wait"], wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth plus per-rank dequeue count and wait times (seconds)."""
+        with self._lock:
+            return {
+                "depth": self._size,
+                "streams": len(self._streams),
+                "wait_by_rank": {
+                    rank: dict(s, mean_wait=s["total_wait"] / s["count"])
+                    for rank, s in sorted(self._waits.items())
+                },
+            }
@@ -114,12 +114,13 @@ class ProtocolLogger:
             return True
         return game_id[2:4] == "99"
 
-    def _get_role(self, game_id: str = None) -> str:
+    def _get_role(self, game_id: str = None, active: Optional[bool] = None) -> str:
         """Get role string. Empty if unknown round (99), else ACTIVE/INACTIVE."""
         gid = game_id or self._current_game_id
         if self._is_unknown_round(gid):
             return ""
-        return "REFEREE-ACTIVE" if self.role_active else "REFEREE-INACTIVE"
+        active = self.role_active if active is None else active
+        return "REFEREE-ACTIVE" if active else "REFEREE-INACTIVE"
 
     def _now(self) -> str:
         return datetime.now().strftime("%H:%M:%S")
@@ -139,8 +140,13 @@ class ProtocolLogger:
         message_type: str,
         deadline_seconds: int = 0,
         game_id: Optional[str] = None,
+        role_active: Optional[bool] = None,
     ) -> None:
-        """Log a received protocol message."""
+        """Log a received protocol message.
+
+        ``game_id`` / ``role_active`` override the shared context set via
+        set_game_id / set_role_active.
+        """
         # Ensure no None values reach format strings
         gid = game_id or self._current_game_id or "0000000"
         email = email or "unknown"
@@ -149,7 +155,7 @@ class ProtocolLogger:
         expected = EXPECTED_RESPONSES.get(message_type, "Unknown")
         deadline = self._deadline(deadline_seconds)
 
-        role = self._get_role(gid)
+        role = self._get_role(gid, role_active)
         role_part = f"ROLE: {role}" if role else "ROLE:"
         line = (
             f"{GREEN}{self._now()} | GAME-ID: {gid:7} | RECEIVED | "
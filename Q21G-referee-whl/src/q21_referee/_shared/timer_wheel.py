@@ -0,0 +1,135 @@
+# Area: Shared
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._shared.timer_wheel — Hierarchical timer wheel
+==========================================================
+
+Tracks many keyed deadlines (one per outstanding player response, across
+all games) with O(1) schedule and cancel:
+
+    level 0   ``sizes[0]`` slots of one tick each
+    level 1   ``sizes[1]`` slots of ``sizes[0]`` ticks each
+    ...       deadlines beyond the top level wait in an overflow table
+
+A timer sits in the coarsest slot that can hold it. When the finer wheel
+wraps, the next coarse slot is cascaded down, so each timer moves at most
+once per level before it fires. ``advance(now)`` returns the timers that
+expired since the last call; one scheduled in the past fires on the next
+call whatever ``now`` is.
+"""
+
+from __future__ import annotations
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+# Pseudo (level, slot) locations outside the wheels
+_OVERFLOW = (-1, 0)
+_OVERDUE = (-2, 0)
+
+
+class TimerWheel:
+    """Keyed one-shot timers; scheduling a key again replaces its timer."""
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        sizes: Sequence[int] = (64, 64, 64),
+        clock: Callable[[], float] = time.time,
+    ):
+        self.tick = tick
+        self._sizes = tuple(sizes)
+        self._spans = [math.prod(self._sizes[:i]) for i in range(len(self._sizes))]
+        self._range = math.prod(self._sizes)
+        self._levels: List[List[Dict[Hashable, Tuple[int, Any]]]] = [
+            [{} for _ in range(size)] for size in self._sizes
+        ]
+        self._overflow: Dict[Hashable, Tuple[int, Any]] = {}
+        self._overdue: Dict[Hashable, Tuple[int, Any]] = {}
+        self._where: Dict[Hashable, Tuple[int, int]] = {}  # (level, slot)
+        self._now = int(clock() // tick)
+        self._lock = threading.Lock()
+
+    def schedule(self, key: Hashable, when: float, payload: Any = None) -> None:
+        """Fire ``key`` at epoch ``when``."""
+        with self._lock:
+            self._remove(key)
+            due = math.ceil(when / self.tick)
+            if due <= self._now:
+                self._overdue[key] = (due, payload)
+                self._where[key] = _OVERDUE
+            else:
+                self._place(key, due, payload)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the timer for ``key``; False if there was none."""
+        with self._lock:
+            return self._remove(key)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, Any]]:
+        """Move the wheel to ``now``; returns the expired (key, payload) pairs."""
+        target = int(now // self.tick)
+        expired: List[Tuple[Hashable, Any]] = []
+        with self._lock:
+            for key, (_, payload) in self._overdue.items():
+                del self._where[key]
+                expired.append((key, payload))
+            self._overdue.clear()
+            while self._now < target:
+                self._now += 1
+                self._cascade()
+                slot = self._levels[0][self._now % self._sizes[0]]
+                for key, (_, payload) in slot.items():
+                    del self._where[key]
+                    expired.append((key, payload))
+                slot.clear()
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    # ── Internals (lock held) ──────────────────────────────
+
+    def _place(self, key: Hashable, due: int, payload: Any) -> None:
+        delta = due - self._now
+        for level, span in enumerate(self._spans):
+            if delta < span * self._sizes[level]:
+                slot = (due // span) % self._sizes[level]
+                self._levels[level][slot][key] = (due, payload)
+                self._where[key] = (level, slot)
+                return
+        self._overflow[key] = (due, payload)
+        self._where[key] = _OVERFLOW
+
+    def _remove(self, key: Hashable) -> bool:
+        if key not in self._where:
+            return False
+        where = self._where.pop(key)
+        if where == _OVERFLOW:
+            del self._overflow[key]
+        elif where == _OVERDUE:
+            del self._overdue[key]
+        else:
+            level, slot = where
+            del self._levels[level][slot][key]
+        return True
+
+    def _cascade(self) -> None:
+        """Re-place coarse timers that now fall inside the finer wheels."""
+        if self._now % self._range == 0 and self._overflow:
+            pending, self._overflow = self._overflow, {}
+            for key, (due, payload) in pending.items():
+                self._place(key, due, payload)
+        for level in range(len(self._sizes) - 1, 0, -1):
+            span = self._spans[level]
+            if self._now % span:
+                continue
+            slot = self._levels[level][(self._now // span) % self._sizes[level]]
+            pending = dict(slot)
+            slot.clear()
+            for key, (due, payload) in pending.items():
+                self._place(key, due, payload)
@@ -0,0 +1,258 @@
+# Area: Shared
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee._shared.transport — Pluggable message transport
+============================================================
+
+The runners only talk to the Transport interface: connect(), poll(),
+send(), disconnect() and the ``address`` attribute. Three backends exist:
+
+    "gmail"   — GmailTransport, the OAuth Gmail client (default)
+    "memory"  — InMemoryTransport, per-address queues on a shared
+                MemoryBroker; end-to-end protocol tests and load runs
+                deliver messages at memory speed in one process
+    "maildir" — MaildirTransport, one maildir-style directory per address
+                (tmp/ → new/ → cur/), usable across processes on one host
+
+poll() returns messages in the same shape EmailClient produces:
+    {"uid", "subject", "from", "body_json", "raw_body"}
+
+Select a backend with config["transport"] (or the Q21_TRANSPORT env var).
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from .email_client import EmailClient
+from .protocol_logger import get_protocol_logger
+
+logger = logging.getLogger("q21_referee.transport")
+
+TRANSPORT_GMAIL = "gmail"
+TRANSPORT_MEMORY = "memory"
+TRANSPORT_MAILDIR = "maildir"
+
+
+class Transport(ABC):
+    """Message transport used by the runners."""
+
+    address: str = ""
+
+    def connect(self) -> None:
+        """Open the transport (no-op by default)."""
+
+    def disconnect(self) -> None:
+        """Close the transport (no-op by default)."""
+
+    @abstractmethod
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return new incoming messages, oldest first, marking them read."""
+
+    @abstractmethod
+    def send(self, to_email: str, subject: str, body_dict: dict) -> bool:
+        """Deliver one protocol message. Returns False on failure."""
+
+    # Names used by the runners before the transport split
+    def connect_imap(self) -> None:
+        self.connect()
+
+    def disconnect_imap(self) -> None:
+        self.disconnect()
+
+
+def _message(subject: str, from_addr: str, body_dict: dict, uid: str) -> Dict[str, Any]:
+    """Build a poll() record in the EmailClient message shape."""
+    raw = json.dumps(body_dict)
+    return {
+        "uid": uid,
+        "subject": subject,
+        "from": from_addr,
+        "body_json": json.loads(raw),  # decoupled copy, as if it crossed a wire
+        "raw_body": raw,
+    }
+
+
+def _log_sent(to_email: str, body_dict: dict) -> None:
+    """Protocol SENT log line, matching EmailClient.send."""
+    game_id = (body_dict.get("payload") or {}).get("game_id") or body_dict.get("game_id")
+    get_protocol_logger().log_sent(
+        email=to_email,
+        message_type=body_dict.get("message_type") or "",
+        game_id=game_id or None,
+    )
+
+
+# ── Gmail ──────────────────────────────────────────────────
+
+
+class GmailTransport(Transport):
+    """Transport backed by the Gmail API client.
+
+    Safe to share between the runner's poll loop and the outbox workers:
+    EmailClient gives every thread its own Gmail service, so sends run in
+    parallel and polling never waits behind them.
+    """
+
+    def __init__(self, client: EmailClient):
+        self.client = client
+
+    @property
+    def address(self) -> str:
+        return self.client.address
+
+    def connect(self) -> None:
+        self.client.connect_imap()
+
+    def disconnect(self) -> None:
+        self.client.disconnect_imap()
+
+    def poll(self) -> List[Dict[str, Any]]:
+        return self.client.poll()
+
+    def send(self, to_email: str, subject: str, body_dict: dict) -> bool:
+        return self.client.send(to_email, subject, body_dict)
+
+
+# ── In-process ─────────────────────────────────────────────
+
+
+class MemoryBroker:
+    """Thread-safe per-address mailboxes shared by InMemoryTransports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._boxes: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._seq = 0
+
+    def deliver(self, to_email: str, subject: str, from_addr: str, body_dict: dict) -> None:
+        with self._lock:
+            self._seq += 1
+            self._boxes[to_email.lower()].append(
+                _message(subject, from_addr, body_dict, uid=f"mem-{self._seq}")
+            )
+
+    def drain(self, address: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            box = self._boxes.get(address.lower())
+            if not box:
+                return []
+            messages = list(box)
+            box.clear()
+            return messages
+
+    def pending(self, address: str) -> int:
+        with self._lock:
+            return len(self._boxes.get(address.lower(), ()))
+
+
+_default_broker = MemoryBroker()
+
+
+class InMemoryTransport(Transport):
+    """Transport whose mailboxes live on a MemoryBroker in this process."""
+
+    def __init__(self, address: str, broker: Optional[MemoryBroker] = None):
+        self.address = address
+        self.broker = broker or _default_broker
+
+    def poll(self) -> List[Dict[str, Any]]:
+        return self.broker.drain(self.address)
+
+    def send(self, to_email: str, subject: str, body_dict: dict) -> bool:
+        self.broker.deliver(to_email, subject, self.address, body_dict)
+        _log_sent(to_email, body_dict)
+        return True
+
+
+# ── Filesystem ─────────────────────────────────────────────
+
+
+class MaildirTransport(Transport):
+    """Transport over maildir-style directories under a shared root.
+
+    Each address owns <root>/<address>/{tmp,new,cur}. send() writes the
+    message into the recipient's tmp/ and renames it into new/, so readers
+    never see a partial file; poll() moves what it reads into cur/.
+    """
+
+    def __init__(self, root: str, address: str):
+        self.root = Path(root)
+        self.address = address
+
+    def _box(self, address: str) -> Path:
+        box = self.root / address.lower()
+        for sub in ("tmp", "new", "cur"):
+            (box / sub).mkdir(parents=True, exist_ok=True)
+        return box
+
+    def connect(self) -> None:
+        self._box(self.address)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        box = self._box(self.address)
+        messages = []
+        for path in sorted((box / "new").iterdir()):  # names sort by send time
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                os.replace(path, box / "cur" / path.name)
+            except (OSError, ValueError) as e:
+                logger.error(f"Maildir read failed for {path.name}: {e}")
+                continue
+            messages.append(_message(data.get("subject", ""), data.get("from", ""),
+                                     data.get("body_json") or {}, uid=path.stem))
+        return messages
+
+    def send(self, to_email: str, subject: str, body_dict: dict) -> bool:
+        box = self._box(to_email)
+        name = f"{time.time_ns():020d}.{uuid.uuid4().hex[:8]}.json"
+        record = {"subject": subject, "from": self.address, "body_json": body_dict}
+        try:
+            tmp = box / "tmp" / name
+            tmp.write_text(json.dumps(record), encoding="utf-8")
+            os.replace(tmp, box / "new" / name)
+        except OSError as e:
+            logger.error(f"Maildir send failed to {to_email}: {e}")
+            return False
+        _log_sent(to_email, body_dict)
+        return True
+
+
+# ── Factory ────────────────────────────────────────────────
+
+
+def build_transport(config: Dict[str, Any]) -> Transport:
+    """Build the transport selected by config["transport"].
+
+    Args:
+        config: Runner config. Keys read: transport, referee_email,
+            credentials_path, token_path, gmail_sync_mode,
+            gmail_history_path, maildir_path, transport_broker
+
+    Raises:
+        ValueError: If the transport name is unknown
+    """
+    kind = (config.get("transport") or os.environ.get("Q21_TRANSPORT")
+            or TRANSPORT_GMAIL).lower()
+    address = config.get("referee_email", "")
+
+    if kind == TRANSPORT_GMAIL:
+        return GmailTransport(EmailClient(
+            credentials_path=config.get("credentials_path", ""),
+            token_path=config.get("token_path", ""),
+            sync_mode=config.get("gmail_sync_mode", ""),
+            history_path=config.get("gmail_history_path", ""),
+        ))
+    if kind == TRANSPORT_MEMORY:
+        return InMemoryTransport(address, broker=config.get("transport_broker"))
+    if kind == TRANSPORT_MAILDIR:
+        return MaildirTransport(config.get("maildir_path", "mailboxes"), address)
+    raise ValueError(f"Unknown transport: {kind!r}")
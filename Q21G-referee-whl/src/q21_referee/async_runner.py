@@ -0,0 +1,172 @@
+# Area: RLGM
+# PRD: docs/prd-rlgm.md
+"""
+q21_referee.async_runner — asyncio RLGM Runner
+==============================================
+
+Same protocol handling as RLGMRunner, but poll, dispatch and send run as
+separate asyncio tasks connected by queues:
+
+    poll task      transport.poll() in a thread → per-lane dispatch queues
+    lane tasks     one per causal stream — each game, plus League Manager
+                   traffic — fed in priority order from the PriorityInbox;
+                   each handles its messages in order, running the routing
+                   and the blocking student callbacks on a thread pool
+    send task      outbound queue → background Outbox
+
+A slow scoring callback in one game therefore no longer holds up mail for
+other games or the League Manager. Messages within a lane keep their
+arrival order. Lanes share the orchestrator, whose game table and state
+machine are lock-protected (see RLGMOrchestrator), so only the work
+inside different games, the student callbacks, actually overlaps.
+RECEIVED log lines carry their game id explicitly. SIGINT stops polling, lets the lanes finish what they hold,
+flushes the outbox and disconnects.
+
+Usage:
+    runner = AsyncRLGMRunner(config=config, ai=MyRefereeAI())
+    runner.run()                    # or: await runner.run_async()
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import signal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from .callbacks import RefereeAI
+from .rlgm_runner import RLGMRunner
+
+logger = logging.getLogger("q21_referee")
+
+
+class AsyncRLGMRunner(RLGMRunner):
+    """asyncio variant of RLGMRunner with per-game dispatch lanes."""
+
+    def __init__(self, config: Dict[str, Any], ai: RefereeAI):
+        super().__init__(config=config, ai=ai)
+        self.dispatch_workers = config.get("dispatch_workers", 8)
+        self.shutdown_timeout = config.get("shutdown_timeout_seconds", 30)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._outbound: Optional[asyncio.Queue] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lanes: Dict[str, Deque[Tuple[str, dict, str]]] = {}
+        self._lane_tasks: Set[asyncio.Task] = set()
+
+    # ── Lifecycle ──────────────────────────────────────────
+
+    def run(self) -> None:
+        """Start the asyncio event loop. Blocks until interrupted."""
+        asyncio.run(self.run_async())
+
+    def stop(self) -> None:
+        """Request a graceful shutdown (safe from any thread)."""
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def run_async(self) -> None:
+        """Run poll, dispatch and send tasks until stop() or SIGINT."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._outbound = asyncio.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=self.dispatch_workers,
+                                        thread_name_prefix="q21-dispatch")
+        self._install_sigint()
+
+        self._log_startup()
+        await self._loop.run_in_executor(self._pool, self.transport.connect)
+        self.outbox.start()
+        if self.transport.address:
+            self.config["referee_email"] = self.transport.address
+
+        poller = asyncio.create_task(self._poll_loop(), name="q21-poll")
+        sender = asyncio.create_task(self._send_loop(), name="q21-send")
+        try:
+            await self._stop.wait()
+        finally:
+            await self._shutdown(poller, sender)
+
+    def _install_sigint(self) -> None:
+        try:
+            self._loop.add_signal_handler(signal.SIGINT, self._stop.set)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass  # not the main thread, or no loop signal support (Windows)
+
+    async def _shutdown(self, poller: asyncio.Task, sender: asyncio.Task) -> None:
+        poller.cancel()
+        await asyncio.gather(poller, return_exceptions=True)
+        if self._lane_tasks:
+            done, pending = await asyncio.wait(set(self._lane_tasks),
+                                               timeout=self.shutdown_timeout)
+            if pending:
+                logger.warning(f"Shutdown: {len(pending)} dispatch lane(s) still busy")
+        try:
+            await asyncio.wait_for(self._outbound.join(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Shutdown: outbound queue not drained")
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+
+        await self._loop.run_in_executor(None, self.outbox.close)
+        self.transport.disconnect()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._loop.remove_signal_handler(signal.SIGINT)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+        logger.info("Async RLGM Runner stopped.")
+
+    # ── Tasks ──────────────────────────────────────────────
+
+    async def _poll_loop(self) -> None:
+        while not self._stop.is_set():
+            handled = 0
+            try:
+                messages = await self._loop.run_in_executor(self._pool, self.transport.poll)
+                for msg in messages:
+                    parsed = self._parse_incoming(msg)
+                    if parsed:
+                        handled += 1
+                        self._queue_incoming(parsed)
+                self._queue_expired()
+                # Urgent lanes get their thread-pool jobs submitted first
+                for item in self.inbox.drain():
+                    self._enqueue(item)
+            except Exception as e:
+                logger.error(f"Poll error: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stop.wait(),
+                                       timeout=self.scheduler.next_delay(handled))
+            except asyncio.TimeoutError:
+                pass
+
+    def _enqueue(self, item: Tuple[str, dict, str]) -> None:
+        key = self._causal_key(*item)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            task = asyncio.create_task(self._drain_lane(key, lane), name=f"q21-{key}")
+            self._lane_tasks.add(task)
+            task.add_done_callback(self._lane_tasks.discard)
+        lane.append(item)
+
+    async def _drain_lane(self, key: str, lane: Deque[Tuple[str, dict, str]]) -> None:
+        try:
+            while lane:
+                item = lane.popleft()
+                outgoing = await self._loop.run_in_executor(
+                    self._pool, self._handle_message, *item)
+                for out in outgoing:
+                    self._outbound.put_nowait(out)
+        finally:
+            self._lanes.pop(key, None)  # next message for this key starts a new lane
+
+    async def _send_loop(self) -> None:
+        while True:
+            envelope, subject, recipient = await self._outbound.get()
+            try:
+                self._send_messages([(envelope, subject, recipient)])
+            finally:
+                self._outbound.task_done()
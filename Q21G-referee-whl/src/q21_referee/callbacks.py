@@ -29,6 +29,8 @@ from .types import (
     WarmupContext, WarmupResponse,
     RoundStartContext, RoundStartResponse,
     AnswersContext, AnswersResponse,
+    AnswersBatchContext, AnswersBatchResponse,
+    PrepareGameContext,
     ScoreFeedbackContext, ScoreFeedbackResponse,
 )
 
@@ -44,6 +46,12 @@ class RefereeAI(ABC):
     and must return a result dict with the required fields.
 
     See types.py for complete TypedDict definitions of all inputs/outputs.
+
+    One instance serves every game the referee runs. The RLGM runner can
+    run several matches of a round side by side, so callbacks for
+    different games may interleave or run at the same time. Keep any
+    per-game state (the chosen paragraph, caches, ...) keyed by
+    ``ctx["dynamic"]["match_id"]``, not in plain attributes on ``self``.
     """
 
     # ──────────────────────────────────────────────────────────────
@@ -96,7 +104,9 @@ class RefereeAI(ABC):
     def get_round_start_info(self, ctx: RoundStartContext) -> RoundStartResponse:
         """
         Called when BOTH players have responded to the warmup
-        (Q21WARMUPRESPONSE received from both).
+        (Q21WARMUPRESPONSE received from both). With the config flag
+        ``speculative_round_start`` it is instead called in the background
+        as soon as the warmup calls go out, and the warmup answers are None.
 
         You must select a book, write a hint, and choose an association word.
 
@@ -327,3 +337,82 @@ class RefereeAI(ABC):
         the player's guess. Compare them for scoring.
         """
         ...
+
+    # ──────────────────────────────────────────────────────────────
+    # OPTIONAL: Answer both players' questions in one call
+    # ──────────────────────────────────────────────────────────────
+    def get_answers_batch(self, ctx: AnswersBatchContext) -> AnswersBatchResponse:
+        """
+        Optional. Used instead of two get_answers() calls when the config
+        sets ``answer_batch_window_seconds`` and the second player's
+        Q21QUESTIONSBATCH arrives within that window of the first.
+
+        Parameters
+        ----------
+        ctx : AnswersBatchContext
+            {
+                "match_id": str,
+                "game_id": str,
+                "book_name": str,
+                "book_hint": str,
+                "association_word": str,
+                "players": [
+                    {"player_id": str, "player_email": str,
+                     "questions": [...]},   # as in AnswersContext
+                    ...
+                ]
+            }
+
+        Returns
+        -------
+        AnswersBatchResponse
+            {
+                "answers_by_player": {
+                    "<player_id>": [{"question_number": int, "answer": str}, ...],
+                    ...
+                }
+            }
+
+        A player missing from the result, or with invalid answers, falls
+        back to a regular get_answers() call. Like prepare_game, this is
+        only called when overridden; the default does nothing and leaves
+        batching off.
+
+        LLM Tip
+        -------
+        Put the book context (paragraph, hint, word) in the prompt once
+        and list both players' questions after it.
+        """
+        return None
+
+    # ──────────────────────────────────────────────────────────────
+    # OPTIONAL: Use the idle time after round start
+    # ──────────────────────────────────────────────────────────────
+    def prepare_game(self, ctx: PrepareGameContext) -> None:
+        """
+        Optional. Called in the background right after Q21ROUNDSTART is
+        sent, while the players write their questions. The return value
+        is ignored.
+
+        get_answers, get_answers_batch and get_score_feedback are only
+        called once this returns, or after ``prepare_wait_seconds``
+        (default 30) if it is still running. Exceptions are logged.
+
+        Parameters
+        ----------
+        ctx : PrepareGameContext
+            {
+                "match_id": str,
+                "game_id": str,
+                "book_name": str,           # what you chose in callback 2
+                "book_hint": str,
+                "association_word": str
+            }
+
+        LLM Tip
+        -------
+        Summarize what you will be asked about (topics, entities, claims)
+        and keep it on self; the later prompts can then use the summary
+        instead of reasoning over the full text again.
+        """
+        return None
@@ -9,6 +9,7 @@ Provides command line entry point for running the referee.
 Usage:
     python -m q21_referee --demo                    # Run in demo mode
     python -m q21_referee --config config.json      # Run with config file
+    python -m q21_referee --config config.json --async  # asyncio runner
 
 Demo mode can be enabled via:
     1. Command line argument: --demo
@@ -37,6 +38,7 @@ Examples:
   python -m q21_referee --demo
   python -m q21_referee --config config.json
   python -m q21_referee --demo --config config.json
+  python -m q21_referee --demo --async
   DEMO_MODE=true python -m q21_referee --config config.json
         """,
     )
@@ -59,6 +61,13 @@ Examples:
         help="Run single game mode (RefereeRunner) instead of season mode (RLGMRunner)",
     )
 
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run season mode on the asyncio runner (AsyncRLGMRunner)",
+    )
+
     parser.add_argument(
         "--demo-path",
         type=str,
@@ -142,6 +151,9 @@ def main() -> int:
     if args.single_game:
         from .runner import RefereeRunner
         runner = RefereeRunner(config=config, ai=ai)
+    elif args.use_async:
+        from .async_runner import AsyncRLGMRunner
+        runner = AsyncRLGMRunner(config=config, ai=ai)
     else:
         from .rlgm_runner import RLGMRunner
         runner = RLGMRunner(config=config, ai=ai)
@@ -15,29 +15,44 @@ from typing import Dict, Any, List, Tuple
 
 from .callbacks import RefereeAI
 from ._shared import (
-    EmailClient,
+    Outbox,
+    PollScheduler,
+    PriorityInbox,
+    SPOOL_MAX_AGE_SECONDS,
+    TimerWheel,
+    build_transport,
+    deadline_epoch,
+    default_spool_path,
     setup_logging,
     build_subject,
     enable_protocol_mode,
     get_protocol_logger,
 )
+from ._gmc import TIMEOUT_ACTIONS, configure_executor
 from ._rlgm.orchestrator import RLGMOrchestrator
 from ._runner_config import (
     INCOMING_MESSAGE_TYPES,
     validate_config,
     is_lm_message,
     is_player_message,
+    message_priority,
+    PRIORITY_GAME,
+    RESPONSE_TIMEOUT,
+    ANSWER_BATCH_FLUSH,
+    GAME_EVENTS,
 )
 
 logger = logging.getLogger("q21_referee")
 
+LEAGUE_STREAM = "league"
+
 
 class RLGMRunner:
     """
     RLGM-aware runner for season management.
 
     Routes League Manager messages to RLGM orchestrator and
-    player messages to the current active game.
+    player messages to the active game they belong to.
     """
 
     def __init__(self, config: Dict[str, Any], ai: RefereeAI):
@@ -52,16 +67,43 @@ class RLGMRunner:
         # Validate config
         validate_config(config)
 
-        # Build email client (OAuth-based)
-        self.email_client = EmailClient(
-            credentials_path=config.get("credentials_path", ""),
-            token_path=config.get("token_path", ""),
+        # Callback deadline backend (signal / thread / process)
+        configure_executor(config)
+
+        # Build message transport (Gmail by default; see _shared.transport)
+        self.transport = build_transport(config)
+        self.email_client = self.transport  # backwards-compatible name
+
+        # Outgoing envelopes are sent in the background (started by run())
+        self.outbox = Outbox(
+            self.transport,
+            workers=config.get("outbox_workers", 4),
+            spool_path=default_spool_path(config),
+            max_age=config.get("outbox_spool_max_age_seconds", SPOOL_MAX_AGE_SECONDS),
         )
 
         # Build RLGM orchestrator
         self.orchestrator = RLGMOrchestrator(config=config, ai=ai)
 
         self.poll_interval = config.get("poll_interval_seconds", 5)
+        self.scheduler = PollScheduler(
+            base_interval=self.poll_interval,
+            burst_interval=config.get("poll_burst_seconds", 1),
+            idle_max=config.get("poll_idle_max_seconds", 30),
+        )
+
+        # Incoming messages are dispatched most-urgent first
+        self.inbox = PriorityInbox()
+
+        # Every reply a player owes us, keyed (match_id, player_email)
+        self.timers = TimerWheel()
+        self.response_grace = config.get("response_grace_seconds", 30)
+        self.timeout_action = config.get("response_timeout_action", "forfeit")
+        if self.timeout_action not in TIMEOUT_ACTIONS:
+            raise ValueError(
+                f"Unknown response_timeout_action '{self.timeout_action}' "
+                f"(expected one of {', '.join(TIMEOUT_ACTIONS)})"
+            )
 
         # Enable protocol logging mode (suppresses standard logs on terminal)
         enable_protocol_mode()
@@ -73,72 +115,176 @@ class RLGMRunner:
         signal.signal(signal.SIGINT, lambda s, f: setattr(self, "_running", False))
 
         self._log_startup()
-        self.email_client.connect_imap()
+        self.transport.connect()
+        self.outbox.start()
 
         # Update config with actual email address from Gmail API
-        if self.email_client.address:
-            self.config["referee_email"] = self.email_client.address
+        if self.transport.address:
+            self.config["referee_email"] = self.transport.address
 
         while self._running:
             try:
-                self._poll_and_process()
-                time.sleep(self.poll_interval)
+                received = self._poll_and_process()
+                time.sleep(self.scheduler.next_delay(received))
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 logger.error(f"Loop error: {e}", exc_info=True)
                 time.sleep(self.poll_interval)
 
-        self.email_client.disconnect_imap()
+        self.outbox.close()
+        self.transport.disconnect()
         logger.info("RLGM Runner stopped.")
 
     def _log_startup(self) -> None:
         """Log startup information."""
         logger.info("=" * 60)
         logger.info("  Q21 RLGM Runner — Starting")
-        logger.info(f"  Email: {self.email_client.address or 'connecting...'}")
+        logger.info(f"  Email: {self.transport.address or 'connecting...'}")
         logger.info(f"  Group: {self.config.get('group_id', 'N/A')}")
-        logger.info(f"  Poll:  every {self.poll_interval}s")
+        logger.info(f"  Poll:  every {self.poll_interval}s (adaptive)")
         logger.info("=" * 60)
 
-    def _poll_and_process(self) -> None:
-        """Single poll iteration: get emails → route → send."""
-        for msg in self.email_client.poll():
-            subject = msg.get("subject", "")
-            from_addr = msg.get("from", "")
-            body = msg.get("body_json")
-
-            if not body:
-                logger.debug(f"Skipped (no JSON): {subject} from {from_addr}")
-                continue
-
-            message_type = body.get("message_type") or ""
-            sender_dict = body.get("sender") or {}
-            sender = sender_dict.get("email") or from_addr or "unknown"
+    def _poll_and_process(self) -> int:
+        """Single poll iteration: get emails → route → send.
 
-            if message_type not in INCOMING_MESSAGE_TYPES:
-                logger.debug(f"Skipped (unknown type '{message_type}'): {subject}")
-                continue
-
-            logger.debug(f"── Received: {message_type} from {sender}")
+        Returns the number of protocol messages handled.
+        """
+        for msg in self.transport.poll():
+            parsed = self._parse_incoming(msg)
+            if parsed:
+                self._queue_incoming(parsed)
+        self._queue_expired()
+
+        # Most urgent first; per-game order is kept by the inbox
+        handled = 0
+        while (item := self.inbox.pop()) is not None:
+            handled += 1
+            self._send_messages(self._handle_message(*item))
+
+        return handled
+
+    def _queue_incoming(self, item: Tuple[str, dict, str]) -> None:
+        """Push a parsed message on the priority inbox."""
+        message_type, body, sender = item
+        if is_player_message(message_type):
+            game = self.orchestrator.find_game(body, sender)
+            if game is not None:
+                self.timers.cancel((game.gprm.match_id, sender.lower()))
+        rank, deadline = message_priority(message_type, time.time())
+        self.inbox.push(item, key=self._causal_key(*item), rank=rank, deadline=deadline)
+
+    def _queue_expired(self) -> None:
+        """Queue the game event of every timer that has fired.
+
+        Events go on their game's stream, so they are handled in order with
+        that game's messages and never race a reply already queued.
+        """
+        for _, item in self.timers.advance(time.time()):
+            self.inbox.push(item, key=self._causal_key(*item), rank=PRIORITY_GAME)
+
+    def _schedule_event(self, key: tuple, when: float, event: str,
+                        match_id: str, player_email: str = "") -> None:
+        body = {"message_type": event, "payload": {"match_id": match_id}}
+        self.timers.schedule(key, when, payload=(event, body, player_email))
+
+    def _track_response(self, envelope: dict, recipient: str) -> None:
+        """Start the timer for a reply owed by ``recipient`` (if any)."""
+        deadline = deadline_epoch(envelope)
+        match_id = (envelope.get("payload") or {}).get("match_id")
+        if deadline is not None and match_id:
+            self._schedule_event((match_id, recipient.lower()), deadline + self.response_grace,
+                                 RESPONSE_TIMEOUT, match_id, recipient)
+
+    def _causal_key(self, message_type: str, body: dict, sender: str) -> str:
+        """Stream whose messages must be handled in arrival order.
+
+        Player messages belong to their game. League Manager traffic, and
+        player messages whose game does not exist yet, share one stream so
+        they stay behind the broadcast that creates the game.
+        """
+        if message_type in GAME_EVENTS:
+            return f"game:{body['payload']['match_id']}"
+        if is_player_message(message_type):
+            game = self.orchestrator.find_game(body, sender)
+            if game is not None:
+                return f"game:{game.gprm.match_id}"
+        return LEAGUE_STREAM
+
+    def _parse_incoming(self, msg: dict):
+        """Extract (message_type, body, sender) from a polled message.
+
+        Returns None for messages the referee does not handle.
+        """
+        subject = msg.get("subject", "")
+        from_addr = msg.get("from", "")
+        body = msg.get("body_json")
 
-            try:
-                # Update context BEFORE routing so RECEIVED log has correct context
-                self._update_protocol_logger_context(message_type, body)
+        if not body:
+            logger.debug(f"Skipped (no JSON): {subject} from {from_addr}")
+            return None
 
-                # Log the received message with current context
-                self._protocol_logger.log_received(email=sender, message_type=message_type)
+        message_type = body.get("message_type") or ""
+        sender_dict = body.get("sender") or {}
+        sender = sender_dict.get("email") or from_addr or "unknown"
 
-                # Route the message (may create a game, updating context)
-                outgoing = self._route_message(message_type, body, sender)
+        if message_type not in INCOMING_MESSAGE_TYPES:
+            logger.debug(f"Skipped (unknown type '{message_type}'): {subject}")
+            return None
 
-                # Update context again after routing (game may have been created)
-                self._update_protocol_logger_context_after_routing()
+        logger.debug(f"── Received: {message_type} from {sender}")
+        self.scheduler.note_received(sender)
+        return message_type, body, sender
 
-                self._send_messages(outgoing)
-            except Exception as e:
-                logger.error(f"Router error: {e}", exc_info=True)
-                self._protocol_logger.log_error(str(e))
+    def _handle_message(
+        self, message_type: str, body: dict, sender: str
+    ) -> List[Tuple[dict, str, str]]:
+        """Log and route one message; returns the envelopes to send."""
+        if message_type in GAME_EVENTS:
+            return self._handle_game_event(message_type, body, sender)
+        try:
+            # Context comes from the game this message belongs to
+            game = (self.orchestrator.find_game(body, sender)
+                    if is_player_message(message_type) else None)
+
+            # Update context BEFORE routing so RECEIVED log has correct context
+            game_id, active = self._update_protocol_logger_context(message_type, body, game)
+
+            # Log the received message with this message's context, passed
+            # explicitly (other dispatch lanes share the logger)
+            self._protocol_logger.log_received(email=sender, message_type=message_type,
+                                               game_id=game_id, role_active=active)
+
+            # Route the message (may create a game, updating context)
+            outgoing = self._route_message(message_type, body, sender)
+
+            # Update context again after routing (game may have been created)
+            self._update_protocol_logger_context_after_routing(game)
+
+            # Held questions are answered alone when the batching window closes
+            if game is not None and game.answer_batch_due is not None:
+                match_id = game.gprm.match_id
+                self._schedule_event((match_id, ANSWER_BATCH_FLUSH), game.answer_batch_due,
+                                     ANSWER_BATCH_FLUSH, match_id)
+            return outgoing
+        except Exception as e:
+            logger.error(f"Router error: {e}", exc_info=True)
+            self._protocol_logger.log_error(str(e))
+            return []
+
+    def _handle_game_event(
+        self, event: str, body: dict, player_email: str
+    ) -> List[Tuple[dict, str, str]]:
+        """Run a timer-fired game event (missed reply, batching window closed)."""
+        match_id = body["payload"]["match_id"]
+        try:
+            if event == RESPONSE_TIMEOUT:
+                return self.orchestrator.expire_response(
+                    match_id, player_email, self.timeout_action)
+            return self.orchestrator.flush_answers(match_id)
+        except Exception as e:
+            logger.error(f"{event} handling error: {e}", exc_info=True)
+            return []
 
     def _route_message(
         self, message_type: str, body: dict, sender: str
@@ -152,7 +298,7 @@ class RLGMRunner:
                 lm_email = self.config.get("league_manager_email", "")
                 # Build protocol-compliant subject
                 response_type = result.get("message_type", "RESPONSE")
-                referee_email = self.email_client.address or ""
+                referee_email = self.transport.address or ""
                 # Use message_id if present, otherwise generate new tx_id
                 tx_id = result.get("message_id") or None
                 subject = build_subject(
@@ -181,28 +327,36 @@ class RLGMRunner:
     }
 
     def _update_protocol_logger_context(
-        self, message_type: str, body: dict
-    ) -> None:
+        self, message_type: str, body: dict, game=None
+    ) -> Tuple[str, bool]:
         """Update protocol logger context BEFORE routing (for RECEIVED log).
 
+        Returns the (game_id, role_active) it set, so the caller can log
+        the RECEIVED line with them explicitly: with AsyncRLGMRunner other
+        lanes may change the shared logger context in between.
+
         Game ID format: SSRRGGG (SS=season always "01", RR=round, GGG=game)
         - Season-level messages: 0199999 (RR=99 → empty role)
         - Round-level (START-ROUND): 01RR999 (ACTIVE/INACTIVE based on assignment)
         - Game-level (active game): 01RRGGG (ACTIVE)
         """
-        # If we have an active game, use its context (game-level)
-        if self.orchestrator.current_game:
-            gprm = self.orchestrator.current_game.gprm
+        game_id, active = self._log_context(message_type, body, game)
+        self._protocol_logger.set_game_id(game_id)
+        self._protocol_logger.set_role_active(active)
+        return game_id, active
+
+    def _log_context(self, message_type: str, body: dict, game=None) -> Tuple[str, bool]:
+        """(game_id, role_active) a received message is logged under."""
+        # If the message belongs to an active game, use its context (game-level)
+        game = game or self.orchestrator.current_game
+        if game:
+            gprm = game.gprm
             if gprm and gprm.game_id:
-                self._protocol_logger.set_game_id(gprm.game_id)
-                self._protocol_logger.set_role_active(True)
-                return
+                return gprm.game_id, True
 
         # Season-level messages: 0199999, role will be empty (RR=99)
         if message_type in self.SEASON_LEVEL_MESSAGES:
-            self._protocol_logger.set_game_id("0199999")
-            self._protocol_logger.set_role_active(False)
-            return
+            return "0199999", False
 
         # Round-level: BROADCAST_NEW_LEAGUE_ROUND
         if message_type == "BROADCAST_NEW_LEAGUE_ROUND":
@@ -218,19 +372,13 @@ class RLGMRunner:
                 # We're assigned - use game_id from assignment
                 game_id = assignment.get("game_id", "")
                 if game_id:
-                    self._protocol_logger.set_game_id(game_id)
-                    self._protocol_logger.set_role_active(True)
-                    return
+                    return game_id, True
 
             # Not assigned - build placeholder game_id: 01RR999 (no game)
-            game_id = f"01{round_number:02d}999"
-            self._protocol_logger.set_game_id(game_id)
-            self._protocol_logger.set_role_active(False)
-            return
+            return f"01{round_number:02d}999", False
 
         # Default fallback for unknown message types
-        self._protocol_logger.set_game_id("0199999")
-        self._protocol_logger.set_role_active(False)
+        return "0199999", False
 
     def _find_assignment_for_round(self, round_number: int) -> dict:
         """Find assignment for the given round number."""
@@ -239,16 +387,19 @@ class RLGMRunner:
                 return assignment
         return {}
 
-    def _update_protocol_logger_context_after_routing(self) -> None:
+    def _update_protocol_logger_context_after_routing(self, game=None) -> None:
         """Update protocol logger context AFTER routing (for SENT logs)."""
-        # If a game was created during routing, use its context
-        if self.orchestrator.current_game:
-            gprm = self.orchestrator.current_game.gprm
+        # Keep the routed game's context, else use a game created by routing
+        game = game or self.orchestrator.current_game
+        if game:
+            gprm = game.gprm
             if gprm and gprm.game_id:
                 self._protocol_logger.set_game_id(gprm.game_id)
                 self._protocol_logger.set_role_active(True)
 
     def _send_messages(self, outgoing: List[Tuple[dict, str, str]]) -> None:
-        """Send outgoing messages."""
+        """Queue outgoing messages on the background outbox."""
         for envelope, subject, recipient in outgoing:
-            self.email_client.send(recipient, subject, envelope)
+            self.scheduler.note_sent(recipient, envelope)
+            self._track_response(envelope, recipient)
+            self.outbox.submit(recipient, subject, envelope)
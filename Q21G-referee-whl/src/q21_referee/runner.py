@@ -14,9 +14,15 @@ import signal
 from typing import Dict, Any, List, Tuple
 
 from .callbacks import RefereeAI
-from ._shared import EmailClient, setup_logging
-from ._gmc import GameState, GamePhase, PlayerState, EnvelopeBuilder, MessageRouter
+from ._shared import (
+    SPOOL_MAX_AGE_SECONDS, Outbox, PollScheduler, build_transport, default_spool_path,
+    setup_logging,
+)
+from ._gmc import (
+    GameState, GamePhase, PlayerState, EnvelopeBuilder, MessageRouter, configure_executor,
+)
 from ._runner_config import (
+    ANSWER_BATCH_FLUSH,
     INCOMING_MESSAGE_TYPES,
     validate_config,
     is_lm_message,
@@ -47,16 +53,30 @@ class RefereeRunner:
         # Validate config
         validate_config(config)
 
-        # Build email client (OAuth-based)
-        self.email_client = EmailClient(
-            credentials_path=config.get("credentials_path", ""),
-            token_path=config.get("token_path", ""),
+        # Callback deadline backend (signal / thread / process)
+        configure_executor(config)
+
+        # Build message transport (Gmail by default; see _shared.transport)
+        self.transport = build_transport(config)
+        self.email_client = self.transport  # backwards-compatible name
+
+        # Outgoing envelopes are sent in the background (started by run())
+        self.outbox = Outbox(
+            self.transport,
+            workers=config.get("outbox_workers", 4),
+            spool_path=default_spool_path(config),
+            max_age=config.get("outbox_spool_max_age_seconds", SPOOL_MAX_AGE_SECONDS),
         )
 
         # Build GMC components (for backwards compatibility)
         self._init_gmc_components()
 
         self.poll_interval = config.get("poll_interval_seconds", 5)
+        self.scheduler = PollScheduler(
+            base_interval=self.poll_interval,
+            burst_interval=config.get("poll_burst_seconds", 1),
+            idle_max=config.get("poll_idle_max_seconds", 30),
+        )
 
     def _init_gmc_components(self) -> None:
         """Initialize GMC components for single-game mode."""
@@ -88,32 +108,38 @@ class RefereeRunner:
         signal.signal(signal.SIGINT, lambda s, f: setattr(self, "_running", False))
 
         self._log_startup()
-        self.email_client.connect_imap()
+        self.transport.connect()
+        self.outbox.start()
 
         while self._running:
             try:
-                self._poll_and_process()
-                time.sleep(self.poll_interval)
+                received = self._poll_and_process()
+                time.sleep(self.scheduler.next_delay(received))
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 logger.error(f"Loop error: {e}", exc_info=True)
                 time.sleep(self.poll_interval)
 
-        self.email_client.disconnect_imap()
+        self.outbox.close()
+        self.transport.disconnect()
         logger.info("Runner stopped.")
 
     def _log_startup(self) -> None:
         """Log startup information."""
         logger.info("=" * 60)
         logger.info("  Q21 Referee Runner — Starting")
-        logger.info(f"  Email: {self.email_client.address or 'connecting...'}")
-        logger.info(f"  Poll:  every {self.poll_interval}s")
+        logger.info(f"  Email: {self.transport.address or 'connecting...'}")
+        logger.info(f"  Poll:  every {self.poll_interval}s (adaptive)")
         logger.info("=" * 60)
 
-    def _poll_and_process(self) -> None:
-        """Single poll iteration: get emails → route → send."""
-        for msg in self.email_client.poll():
+    def _poll_and_process(self) -> int:
+        """Single poll iteration: get emails → route → send.
+
+        Returns the number of protocol messages handled.
+        """
+        handled = 0
+        for msg in self.transport.poll():
             body = msg.get("body_json")
             if not body:
                 continue
@@ -125,14 +151,30 @@ class RefereeRunner:
                 continue
 
             logger.info(f"── Received: {message_type} from {sender}")
+            handled += 1
+            self.scheduler.note_received(sender)
 
             try:
                 outgoing = self.router.route(message_type, body, sender)
                 for envelope, subject, recipient in outgoing:
-                    self.email_client.send(recipient, subject, envelope)
+                    self.scheduler.note_sent(recipient, envelope)
+                    self.outbox.submit(recipient, subject, envelope)
             except Exception as e:
                 logger.error(f"Router error: {e}", exc_info=True)
 
+        # Answer questions held for batching once the window has closed
+        state = getattr(self, "state", None)
+        if state is not None and state.answer_batch_due is not None \
+                and time.time() >= state.answer_batch_due:
+            try:
+                for envelope, subject, recipient in self.router.route(ANSWER_BATCH_FLUSH, {}, ""):
+                    self.scheduler.note_sent(recipient, envelope)
+                    self.outbox.submit(recipient, subject, envelope)
+            except Exception as e:
+                logger.error(f"{ANSWER_BATCH_FLUSH} handling error: {e}", exc_info=True)
+
+        return handled
+
     def simulate_incoming(self, message: dict) -> List[Tuple[dict, str, str]]:
         """For testing: simulate receiving a message without email."""
         message_type = message.get("message_type", "")
@@ -16,7 +16,7 @@ Use __annotations__ to inspect fields:
     {'round_number': int, 'round_id': str, 'game_id': str, 'players': List[PlayerInfo]}
 """
 
-from typing import TypedDict, List, Literal
+from typing import TypedDict, Dict, List, Literal
 
 
 # ============================================
@@ -205,6 +205,68 @@ class AnswersResponse(TypedDict):
     answers: List[Answer]
 
 
+class PlayerQuestions(TypedDict):
+    """One player's share of an AnswersBatchContext."""
+    player_id: str
+    player_email: str
+    questions: List[PlayerQuestion]
+
+
+class AnswersBatchContext(TypedDict):
+    """Context passed to get_answers_batch() (optional callback).
+
+    Both players' questions, when they arrive within the batching window.
+    Book fields are the same as in AnswersContext.
+
+    Fields
+    ------
+    match_id : str
+        Match identifier.
+    game_id : str
+        Game identifier.
+    book_name, book_hint, association_word : str
+        What YOU chose in get_round_start_info().
+    players : List[PlayerQuestions]
+        Each player's id, email and 20 questions.
+    """
+    match_id: str
+    game_id: str
+    book_name: str
+    book_hint: str
+    association_word: str
+    players: List[PlayerQuestions]
+
+
+class AnswersBatchResponse(TypedDict):
+    """Expected return from get_answers_batch().
+
+    Fields
+    ------
+    answers_by_player : Dict[str, List[Answer]]
+        player_id → that player's answers (same shape as AnswersResponse).
+    """
+    answers_by_player: Dict[str, List[Answer]]
+
+
+class PrepareGameContext(TypedDict):
+    """Context passed to prepare_game() (optional callback).
+
+    Fields
+    ------
+    match_id : str
+        Match identifier.
+    game_id : str
+        Game identifier.
+    book_name, book_hint, association_word : str
+        What YOU chose in get_round_start_info().
+    """
+    match_id: str
+    game_id: str
+    book_name: str
+    book_hint: str
+    association_word: str
+
+
 # ============================================
 # get_score_feedback() Input/Output
 # ============================================
@@ -337,6 +399,10 @@ __all__ = [
     "AnswersContext",
     "Answer",
     "AnswersResponse",
+    "PlayerQuestions",
+    "AnswersBatchContext",
+    "AnswersBatchResponse",
+    "PrepareGameContext",
     # Score feedback types
     "ScoreFeedbackContext",
     "ScoreBreakdown",
@@ -0,0 +1,132 @@
+# Area: RLGM Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for AsyncRLGMRunner over the in-memory transport."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from q21_referee import AsyncRLGMRunner
+from q21_referee._shared.transport import InMemoryTransport, MemoryBroker
+from q21_referee.callbacks import RefereeAI
+
+
+class MockRefereeAI(RefereeAI):
+    """Mock AI for testing."""
+
+    def get_warmup_question(self, ctx):
+        return {"warmup_question": "What is 2+2?"}
+
+    def get_round_start_info(self, ctx):
+        return {"book_name": "Test", "book_hint": "A hint long enough",
+                "association_word": "ocean"}
+
+    def get_answers(self, ctx):
+        return {"answers": []}
+
+    def get_score_feedback(self, ctx):
+        return {"league_points": 10, "private_score": 5.0, "breakdown": {}}
+
+
+def create_runner(broker, runner_cls=AsyncRLGMRunner):
+    config = {
+        "referee_id": "REF001", "referee_email": "ref@test.com", "group_id": "G",
+        "league_id": "L1", "season_id": "S1", "league_manager_email": "lm@test.com",
+        "transport": "memory", "transport_broker": broker,
+        "poll_interval_seconds": 0.01, "poll_burst_seconds": 0.01,
+        "poll_idle_max_seconds": 0.02, "outbox_spool_path": "",
+    }
+    return runner_cls(config=config, ai=MockRefereeAI())
+
+
+async def wait_for_mail(transport, count=1, timeout=3.0):
+    received = []
+    deadline = time.monotonic() + timeout
+    while len(received) < count and time.monotonic() < deadline:
+        received.extend(transport.poll())
+        await asyncio.sleep(0.01)
+    return received
+
+
+def start_season(lm):
+    lm.send("ref@test.com", "start", {
+        "message_type": "BROADCAST_START_SEASON", "broadcast_id": "BC001",
+        "payload": {"season_id": "S1", "league_id": "L1"},
+    })
+
+
+def test_async_runner_replies_and_stops_gracefully():
+    broker = MemoryBroker()
+    runner = create_runner(broker)
+    lm = InMemoryTransport("lm@test.com", broker=broker)
+
+    async def scenario():
+        task = asyncio.create_task(runner.run_async())
+        start_season(lm)
+        replies = await wait_for_mail(lm)
+        runner.stop()
+        await asyncio.wait_for(task, timeout=5)
+        return replies
+
+    replies = asyncio.run(scenario())
+    assert [r["body_json"]["message_type"] for r in replies] == [
+        "SEASON_REGISTRATION_REQUEST"]
+    assert not runner._lanes
+
+
+def test_slow_game_lane_does_not_block_league_lane():
+    broker = MemoryBroker()
+    release = threading.Event()
+    order = []
+
+    class SlowGameRunner(AsyncRLGMRunner):
+        def _causal_key(self, message_type, body, sender):
+            return "game:slow" if sender == "p1@test.com" else super()._causal_key(
+                message_type, body, sender)
+
+        def _handle_message(self, message_type, body, sender):
+            if sender == "p1@test.com":
+                release.wait(5)
+                order.append("slow")
+                return []
+            order.append(message_type)
+            return super()._handle_message(message_type, body, sender)
+
+    runner = create_runner(broker, SlowGameRunner)
+    lm = InMemoryTransport("lm@test.com", broker=broker)
+    p1 = InMemoryTransport("p1@test.com", broker=broker)
+
+    async def scenario():
+        task = asyncio.create_task(runner.run_async())
+        p1.send("ref@test.com", "guess", {"message_type": "Q21GUESSSUBMISSION",
+                                          "payload": {}})
+        await asyncio.sleep(0.05)
+        start_season(lm)
+        replies = await wait_for_mail(lm)
+        release.set()
+        runner.stop()
+        await asyncio.wait_for(task, timeout=5)
+        return replies
+
+    replies = asyncio.run(scenario())
+    assert len(replies) == 1
+    assert order == ["BROADCAST_START_SEASON", "slow"]
+
+
+def test_lane_keeps_arrival_order():
+    runner = create_runner(MemoryBroker())
+    seen = []
+    runner._handle_message = lambda t, b, s: seen.append(b["n"]) or []
+
+    async def scenario():
+        runner._loop = asyncio.get_running_loop()
+        runner._outbound = asyncio.Queue()
+        runner._pool = ThreadPoolExecutor(4)
+        for n in range(10):
+            runner._enqueue(("BROADCAST_KEEP_ALIVE", {"n": n}, "lm@test.com"))
+        await asyncio.gather(*runner._lane_tasks)
+        runner._pool.shutdown()
+
+    asyncio.run(scenario())
+    assert seen == list(range(10))
@@ -0,0 +1,332 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for EmailClient.poll against a local fake Gmail service."""
+
+import base64
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from q21_referee._shared.email_client import (
+    GMAIL_BATCH_SIZE, LIST_PAGE_SIZE, SYNC_HISTORY, EmailClient,
+)
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+class _Request:
+    def __init__(self, gmail, fn):
+        self._gmail, self._fn = gmail, fn
+
+    def execute(self):
+        self._gmail.round_trips += 1
+        return self._fn()
+
+
+class _Batch:
+    def __init__(self, gmail, callback):
+        self._gmail, self._callback, self._requests = gmail, callback, []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        self._gmail.round_trips += 1
+        assert len(self._requests) <= GMAIL_BATCH_SIZE
+        for request_id, request in self._requests:
+            try:
+                self._callback(request_id, request._fn(), None)
+            except Exception as exc:  # per-part failure, like googleapiclient
+                self._callback(request_id, None, exc)
+
+
+class FakeGmail:
+    """In-memory Gmail service exposing the calls EmailClient uses."""
+
+    def __init__(self):
+        self.messages_store = {}     # id → full message
+        self.attachments_store = {}  # attachment id → base64 data
+        self.unread = []             # oldest first
+        self.round_trips = 0
+        self.missing = set()         # ids whose get fails
+        self.log = []                # (history_id, message_id), ascending
+        self.history_id = 1000
+        self.oldest_history = 0      # cursors below this have expired
+
+    def add(self, mid, payload, as_attachment=False):
+        headers = [{"name": "Subject", "value": f"subj-{mid}"},
+                   {"name": "From", "value": "player@example.com"}]
+        if as_attachment:
+            att_id = f"att-{mid}"
+            self.attachments_store[att_id] = _b64(payload)
+            body = {"headers": headers, "parts": [
+                {"mimeType": "text/plain", "body": {"data": ""}},
+                {"filename": "payload.json", "mimeType": "application/json",
+                 "body": {"attachmentId": att_id}},
+            ]}
+        else:
+            body = {"headers": headers, "body": {"data": _b64(payload)}}
+        self.messages_store[mid] = {"id": mid, "payload": body}
+        self.unread.append(mid)
+        self.history_id += 1
+        self.log.append((self.history_id, mid))
+
+    # ── service surface ──
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def attachments(self):
+        return _Attachments(self)
+
+    def history(self):
+        return _History(self)
+
+    def getProfile(self, userId):
+        return _Request(self, lambda: {"emailAddress": "ref@example.com",
+                                       "historyId": str(self.history_id)})
+
+    def list(self, userId, q, maxResults, pageToken=None):
+        refs = [{"id": mid} for mid in reversed(self.unread)]
+        start = int(pageToken or 0)
+        page = {"messages": refs[start:start + maxResults]}
+        if start + maxResults < len(refs):
+            page["nextPageToken"] = str(start + maxResults)
+        return _Request(self, lambda: page)
+
+    def get(self, userId, id, format):
+        def _get():
+            if id in self.missing:
+                raise RuntimeError("404")
+            return self.messages_store[id]
+        return _Request(self, _get)
+
+    def modify(self, userId, id, body):
+        raise AssertionError("poll should use batchModify")
+
+    def batchModify(self, userId, body):
+        def _mark():
+            for mid in body["ids"]:
+                self.unread.remove(mid)
+            return {}
+        return _Request(self, _mark)
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+
+class _History:
+    def __init__(self, gmail):
+        self._gmail = gmail
+
+    def list(self, userId, startHistoryId, historyTypes, maxResults, pageToken=None):
+        gmail = self._gmail
+
+        def _list():
+            if int(startHistoryId) < gmail.oldest_history:
+                raise HttpError(type("Resp", (), {"status": 404, "reason": "gone"})(),
+                                b"expired")
+            records = [{"id": str(hid), "messagesAdded": [
+                          {"message": {"id": mid, "labelIds": ["INBOX", "UNREAD"]}}]}
+                       for hid, mid in gmail.log if hid > int(startHistoryId)]
+            start = int(pageToken or 0)
+            page = {"history": records[start:start + maxResults],
+                    "historyId": str(gmail.history_id)}
+            if start + maxResults < len(records):
+                page["nextPageToken"] = str(start + maxResults)
+            return page
+        return _Request(gmail, _list)
+
+
+class _Attachments:
+    def __init__(self, gmail):
+        self._gmail = gmail
+
+    def get(self, userId, messageId, id):
+        return _Request(self._gmail, lambda: {"data": self._gmail.attachments_store[id]})
+
+
+@pytest.fixture
+def gmail():
+    return FakeGmail()
+
+
+@pytest.fixture
+def client(gmail):
+    c = EmailClient(credentials_path="x", token_path="y", address="ref@example.com")
+    c._service = gmail
+    return c
+
+
+def test_poll_round_trips_constant_for_burst(client, gmail):
+    for i in range(25):
+        gmail.add(f"m{i}", {"message_type": "Q21ANSWERSBATCH", "n": i},
+                  as_attachment=bool(i % 2))
+    messages = client.poll()
+    assert [m["body_json"]["n"] for m in messages] == list(range(25))
+    # list + batched get + batched attachments + batchModify
+    assert gmail.round_trips == 4
+    assert gmail.unread == []
+
+
+def test_batch_execute_chunks_to_batch_size(client, gmail):
+    for i in range(2 * GMAIL_BATCH_SIZE + 1):
+        gmail.add(f"m{i}", {"n": i})
+    requests = {mid: gmail.get(userId="me", id=mid, format="full")
+                for mid in gmail.unread}
+    responses = client._batch_execute(requests)
+    assert len(responses) == 2 * GMAIL_BATCH_SIZE + 1
+    assert gmail.round_trips == 3
+
+
+def test_poll_skips_failed_gets_and_leaves_them_unread(client, gmail):
+    gmail.add("ok", {"n": 1})
+    gmail.add("bad", {"n": 2})
+    gmail.missing.add("bad")
+    messages = client.poll()
+    assert [m["uid"] for m in messages] == ["ok"]
+    assert gmail.unread == ["bad"]
+
+
+def test_poll_skips_undecodable_message_and_marks_the_rest_read(client, gmail):
+    gmail.add("ok1", {"n": 1})
+    gmail.add("bad", {"n": 2})
+    gmail.add("ok2", {"n": 3})
+    gmail.messages_store["bad"]["payload"]["body"]["data"] = (
+        base64.urlsafe_b64encode(b"\xff\xfe not utf-8").decode())
+    assert [m["uid"] for m in client.poll()] == ["ok1", "ok2"]
+    assert gmail.unread == ["bad"]
+    gmail.add("ok3", {"n": 4})
+    assert [m["uid"] for m in client.poll()] == ["ok3"]
+
+
+def test_poll_empty_inbox_makes_single_call(client, gmail):
+    assert client.poll() == []
+    assert gmail.round_trips == 1
+
+
+def test_parse_message_without_prefetch_fetches_attachment(client, gmail):
+    gmail.add("solo", {"message_type": "X"}, as_attachment=True)
+    parsed = client._parse_message(gmail.messages_store["solo"])
+    assert parsed["body_json"] == {"message_type": "X"}
+
+
+# ── Pagination & history sync ──
+
+
+def test_unread_listing_follows_pages_without_cap(client, gmail):
+    for i in range(LIST_PAGE_SIZE + 30):
+        gmail.add(f"m{i}", {"n": i})
+    messages = client.poll()
+    assert [m["body_json"]["n"] for m in messages] == list(range(LIST_PAGE_SIZE + 30))
+
+
+@pytest.fixture
+def history_client(gmail, tmp_path):
+    c = EmailClient(credentials_path="x", token_path=str(tmp_path / "token.json"),
+                    sync_mode=SYNC_HISTORY)
+    c._service = gmail
+    return c
+
+
+def test_history_first_poll_does_full_resync(history_client, gmail, tmp_path):
+    gmail.add("old", {"n": 0})
+    assert [m["uid"] for m in history_client.poll()] == ["old"]
+    state = json.loads((tmp_path / "gmail_history.json").read_text())
+    assert state["history_id"] == str(gmail.history_id)
+
+
+def test_history_poll_fetches_only_deltas(history_client, gmail):
+    gmail.add("old", {"n": 0})
+    history_client.poll()
+    gmail.add("new1", {"n": 1})
+    gmail.add("new2", {"n": 2})
+    gmail.round_trips = 0
+    assert [m["uid"] for m in history_client.poll()] == ["new1", "new2"]
+    assert gmail.round_trips == 3  # history.list + batched get + batchModify
+    assert history_client.poll() == []
+
+
+def test_history_cursor_survives_restart(history_client, gmail, tmp_path):
+    history_client.poll()
+    gmail.add("later", {"n": 1})
+    restarted = EmailClient(credentials_path="x", token_path=str(tmp_path / "token.json"),
+                            sync_mode=SYNC_HISTORY)
+    restarted._service = gmail
+    assert [m["uid"] for m in restarted.poll()] == ["later"]
+
+
+def test_history_expired_cursor_falls_back_to_resync(history_client, gmail):
+    history_client.poll()
+    gmail.add("a", {"n": 1})
+    gmail.oldest_history = gmail.history_id + 1
+    assert [m["uid"] for m in history_client.poll()] == ["a"]
+    assert history_client._history_id == str(gmail.history_id)
+
+
+def test_history_retries_failed_fetch_once(history_client, gmail):
+    history_client.poll()
+    gmail.add("flaky", {"n": 1})
+    gmail.missing.add("flaky")
+    assert history_client.poll() == []
+    gmail.missing.clear()
+    assert [m["uid"] for m in history_client.poll()] == ["flaky"]
+
+
+def test_history_repeated_fetch_failure_resyncs_instead_of_dropping(history_client, gmail):
+    history_client.poll()
+    gmail.add("flaky", {"n": 1})
+    gmail.missing.add("flaky")
+    assert history_client.poll() == []
+    assert history_client.poll() == []  # failed again: resync next poll
+    assert history_client._history_id is None
+    gmail.missing.clear()
+    assert [m["uid"] for m in history_client.poll()] == ["flaky"]
+
+
+def test_history_cursor_kept_when_fetch_fails(history_client, gmail, monkeypatch):
+    history_client.poll()
+    cursor = history_client._history_id
+    gmail.add("during-outage", {"n": 1})
+
+    def outage(*args, **kwargs):
+        raise ConnectionError("network down")
+
+    monkeypatch.setattr(history_client, "_batch_execute", outage)
+    assert history_client.poll() == []
+    assert history_client._history_id == cursor
+    monkeypatch.undo()
+    assert [m["uid"] for m in history_client.poll()] == ["during-outage"]
+
+
+def test_each_thread_builds_its_own_service():
+    c = EmailClient(credentials_path="x", token_path="y", address="ref@example.com")
+    services = []
+
+    def fake_build(*args, **kwargs):
+        service = Mock()
+        service.users().getProfile().execute.return_value = {}
+        services.append(service)
+        return service
+
+    def send():
+        c.send("p@example.com", "s", {"message_type": "X"})
+
+    with patch.object(EmailClient, "_get_credentials", return_value=Mock()) as creds, \
+            patch("q21_referee._shared.email_client.build", side_effect=fake_build):
+        send()
+        send()  # reuses this thread's service
+        t = threading.Thread(target=send)
+        t.start()
+        t.join()
+        c.disconnect_imap()
+        send()  # stale after disconnect: reconnects
+    assert len(services) == 3
+    assert creds.call_count == 2
@@ -0,0 +1,149 @@
+# Area: GMC Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._gmc.executors — callback deadline backends."""
+
+import threading
+import time
+
+import pytest
+
+from q21_referee._gmc.callback_executor import execute_callback
+from q21_referee._gmc.executors import (
+    ProcessExecutor, SignalExecutor, ThreadExecutor, build_executor,
+    callback_stats, current_cancel_token,
+)
+from q21_referee.errors import CallbackTimeoutError
+
+
+def _warmup(ctx):
+    return {"warmup_question": "What is 2 + 2?"}
+
+
+def _sleepy(ctx):
+    time.sleep(ctx["sleep"])
+    return {"warmup_question": "What is 2 + 2?"}
+
+
+def _boom(ctx):
+    raise ValueError("bad input")
+
+
+class _StatefulAI:
+    """Holds an unpicklable resource, like a DB connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def get_answers(self, ctx):
+        return {"answers": []}
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    callback_stats.reset()
+
+
+@pytest.mark.parametrize("executor", [ThreadExecutor(), ProcessExecutor(), SignalExecutor()])
+def test_backends_return_validated_result(executor):
+    result = execute_callback(_warmup, "warmup_question", {}, 5,
+                              terminate_on_error=False, executor=executor)
+    assert result == {"warmup_question": "What is 2 + 2?"}
+    assert callback_stats.snapshot()["warmup_question"]["calls"] == 1
+
+
+@pytest.mark.parametrize("executor", [ThreadExecutor(), ProcessExecutor()])
+def test_backends_enforce_deadline(executor):
+    started = time.monotonic()
+    with pytest.raises(CallbackTimeoutError):
+        executor.run(_sleepy, {"sleep": 5}, "warmup_question", 0.2)
+    assert time.monotonic() - started < 2
+    assert callback_stats.snapshot()["warmup_question"]["timeouts"] == 1
+
+
+def test_thread_backend_cancels_token_at_deadline():
+    seen = {}
+    stopped = threading.Event()
+
+    def cooperative(ctx):
+        token = current_cancel_token()
+        seen["token"] = token
+        while not token.cancelled:
+            time.sleep(0.01)
+        stopped.set()
+        return {}
+
+    with pytest.raises(CallbackTimeoutError):
+        ThreadExecutor().run(cooperative, {}, "answers", 0.1)
+    assert stopped.wait(2)
+    assert not current_cancel_token().cancelled  # caller's context untouched
+
+
+def test_thread_backend_runs_callbacks_in_parallel():
+    executor = ThreadExecutor(max_workers=4)
+    threads = [threading.Thread(target=executor.run,
+                                args=(_sleepy, {"sleep": 0.3}, "answers", 5))
+               for _ in range(4)]
+    started = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - started < 1.0
+    assert callback_stats.snapshot()["answers"]["calls"] == 4
+
+
+def test_signal_backend_off_main_thread_uses_threads():
+    errors = []
+
+    def worker():
+        try:
+            SignalExecutor().run(_sleepy, {"sleep": 5}, "answers", 0.1)
+        except CallbackTimeoutError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join(3)
+    assert len(errors) == 1
+
+
+def test_process_backend_reraises_callback_errors():
+    with pytest.raises(ValueError, match="bad input"):
+        ProcessExecutor().run(_boom, {}, "answers", 5)
+
+
+def test_process_backend_refuses_unpicklable_ai():
+    with pytest.raises(TypeError, match="stateless"):
+        ProcessExecutor().run(_StatefulAI().get_answers, {}, "answers", 5)
+
+
+def test_timeout_raises_without_terminating_when_not_fatal():
+    with pytest.raises(CallbackTimeoutError):
+        execute_callback(_sleepy, "warmup_question", {"sleep": 5}, 0.1,
+                         terminate_on_error=False, executor=ThreadExecutor())
+
+
+def test_thread_backend_timeout_does_not_terminate():
+    executor = ThreadExecutor(max_workers=2)
+    with pytest.raises(CallbackTimeoutError):
+        execute_callback(_sleepy, "warmup_question", {"sleep": 0.5}, 0.1, executor=executor)
+    assert executor.abandoned == 1
+    time.sleep(0.6)
+    assert executor.abandoned == 0
+
+
+def test_signal_backend_main_thread_timeout_still_terminates():
+    with pytest.raises(SystemExit):
+        execute_callback(_sleepy, "warmup_question", {"sleep": 5}, 0.1,
+                         executor=SignalExecutor())
+
+
+def test_build_executor_rejects_unknown_backend():
+    assert isinstance(build_executor("thread"), ThreadExecutor)
+    with pytest.raises(ValueError):
+        build_executor("fiber")
+
+
+def test_signal_backend_main_thread_fractional_deadline():
+    with pytest.raises(CallbackTimeoutError):
+        SignalExecutor().run(_sleepy, {"sleep": 5}, "answers", 0.1)
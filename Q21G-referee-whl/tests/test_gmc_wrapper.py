@@ -2,8 +2,14 @@
 # PRD: docs/prd-rlgm.md
 """Tests for GMC Wrapper Class."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock
+from q21_referee._gmc.callback_executor import execute_callback
+from q21_referee._gmc.context_builder import SERVICE_DEFINITIONS
+from q21_referee._gmc.executors import ThreadExecutor, callback_stats, set_executor
 from q21_referee._gmc.gmc import GameManagementCycle
 from q21_referee._rlgm.gprm import GPRM
 from q21_referee._rlgm.game_result import GameResult
@@ -127,3 +133,314 @@ class TestGameManagementCycle:
         assert result.is_draw is False
         assert result.player1.score == 15
         assert result.player2.score == 10
+
+
+class RoundStartAI(MockRefereeAI):
+    """Mock AI whose round start info passes schema validation."""
+
+    def get_round_start_info(self, ctx):
+        return {"book_name": "Test Book", "book_hint": "A book about testing",
+                "association_word": "test"}
+
+
+class TestResponseTimeout:
+    """Tests for GMC.expire_player."""
+
+    def create_gmc(self):
+        t = TestGameManagementCycle()
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=RoundStartAI(),
+                                  config=t.create_config())
+        gmc.initiate_game()
+        return gmc
+
+    def test_forfeit_reports_responsive_player_as_winner(self):
+        """Test that forfeit ends the match with the silent player losing."""
+        gmc = self.create_gmc()
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+
+        outgoing = gmc.expire_player("p2@test.com", "forfeit")
+
+        assert [env["message_type"] for env, _, _ in outgoing] == ["MATCH_RESULT_REPORT"]
+        assert outgoing[0][2] == "lm@test.com"
+        result = gmc.get_result()
+        assert result.winner_id == "P001" and result.is_draw is False
+        assert result.player2.score == 0
+
+    def test_proceed_starts_round_with_remaining_player(self):
+        """Test that proceed unblocks the warmup and drops the silent player."""
+        gmc = self.create_gmc()
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+
+        outgoing = gmc.expire_player("p2@test.com", "proceed")
+
+        assert [(env["message_type"], to) for env, _, to in outgoing] == [
+            ("Q21ROUNDSTART", "p1@test.com")]
+        assert gmc.is_complete() is False
+        assert gmc.route_message("Q21WARMUPRESPONSE", {"payload": {}}, "p2@test.com") == []
+
+    def test_callback_timeout_forfeits_game_without_exiting(self, monkeypatch):
+        """Test that a thread-backend timeout ends this game, not the process."""
+        monkeypatch.setitem(SERVICE_DEFINITIONS["round_start_info"], "deadline_seconds", 0.1)
+        previous = set_executor(ThreadExecutor())
+        release = threading.Event()
+        try:
+            gmc = self.create_gmc()
+            gmc.ai.get_round_start_info = lambda ctx: release.wait(5) or {}
+            gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+            outgoing = gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}},
+                                         "p2@test.com")
+        finally:
+            release.set()
+            set_executor(previous)
+
+        assert [env["message_type"] for env, _, _ in outgoing] == ["MATCH_RESULT_REPORT"]
+        result = gmc.get_result()
+        assert result.is_draw is True
+        assert result.player1.score == result.player2.score == 3
+
+    def test_ignore_keeps_waiting(self):
+        """Test that ignore leaves the game untouched."""
+        gmc = self.create_gmc()
+        assert gmc.expire_player("p2@test.com", "ignore") == []
+        assert gmc.state.player2.timed_out is False
+
+
+class CountingRoundStartAI(RoundStartAI):
+    """Records when get_round_start_info runs."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_round_start_info(self, ctx):
+        self.calls.append(ctx["dynamic"]["player_a"]["warmup_answer"])
+        return super().get_round_start_info(ctx)
+
+
+class TestSpeculativeRoundStart:
+    """Tests for the speculative_round_start option."""
+
+    def run_warmup(self, speculative):
+        t = TestGameManagementCycle()
+        config = dict(t.create_config(), speculative_round_start=speculative)
+        ai = CountingRoundStartAI()
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=ai, config=config)
+        gmc.initiate_game()
+        if speculative:
+            gmc.state.round_start_prefetch.result(timeout=5)
+            assert ai.calls == [None]
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+        outgoing = gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}},
+                                     "p2@test.com")
+        return ai, outgoing
+
+    def test_round_start_info_prepared_during_warmup(self):
+        """Test that the background result is used once both warmups land."""
+        ai, outgoing = self.run_warmup(speculative=True)
+        assert ai.calls == [None]
+        assert [env["message_type"] for env, _, _ in outgoing] == ["Q21ROUNDSTART"] * 2
+        assert outgoing[0][0]["payload"]["book_name"] == "Test Book"
+
+    def test_retry_after_failed_prefetch_gets_remaining_budget(self, monkeypatch):
+        """Test that a failed prefetch does not grant the retry a fresh deadline."""
+        from q21_referee._gmc.handlers import warmup
+        monkeypatch.setitem(SERVICE_DEFINITIONS["round_start_info"], "deadline_seconds", 1.0)
+        deadlines = []
+
+        def recording(**kwargs):
+            if kwargs["callback_name"] == "round_start_info":
+                deadlines.append(kwargs["deadline_seconds"])
+            return execute_callback(**kwargs)
+
+        monkeypatch.setattr(warmup, "execute_callback", recording)
+        ai = CountingRoundStartAI()
+        original = ai.get_round_start_info
+
+        def slow_then_fail(ctx):
+            if not ai.calls:
+                ai.calls.append("prefetch")
+                time.sleep(0.4)
+                raise RuntimeError("LLM down")
+            return original(ctx)
+
+        ai.get_round_start_info = slow_then_fail
+        t = TestGameManagementCycle()
+        config = dict(t.create_config(), speculative_round_start=True)
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=ai, config=config)
+        gmc.initiate_game()
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+        outgoing = gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}},
+                                     "p2@test.com")
+
+        assert [env["message_type"] for env, _, _ in outgoing] == ["Q21ROUNDSTART"] * 2
+        assert deadlines[0] == 1.0 and deadlines[1] <= 0.7
+
+    def test_default_calls_after_both_warmups(self):
+        """Test that without the flag the callback sees the warmup answers."""
+        ai, outgoing = self.run_warmup(speculative=False)
+        assert ai.calls == ["4"]
+        assert len(outgoing) == 2
+
+
+VALID_ANSWERS = [{"question_number": 1, "answer": "A"}]
+
+
+class BatchAI(RoundStartAI):
+    """Implements get_answers_batch and records which answer path ran."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_answers(self, ctx):
+        self.calls.append(("single", ctx["dynamic"]["player_id"]))
+        return {"answers": VALID_ANSWERS}
+
+    def get_answers_batch(self, ctx):
+        players = ctx["dynamic"]["players"]
+        self.calls.append(("batch", [p["player_id"] for p in players]))
+        return {"answers_by_player": {p["player_id"]: VALID_ANSWERS for p in players}}
+
+
+class TestAnswerBatching:
+    """Tests for the answer_batch_window_seconds option."""
+
+    def create_gmc(self, window=30):
+        t = TestGameManagementCycle()
+        config = dict(t.create_config(), answer_batch_window_seconds=window)
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=BatchAI(), config=config)
+        gmc.initiate_game()
+        return gmc
+
+    def questions(self, gmc, sender):
+        body = {"message_id": f"q-{sender}", "payload": {"questions": [{"question_number": 1}]}}
+        return gmc.route_message("Q21QUESTIONSBATCH", body, sender)
+
+    def test_both_players_answered_in_one_call(self):
+        """Test that the second batch inside the window triggers one batch call."""
+        gmc = self.create_gmc()
+        assert self.questions(gmc, "p1@test.com") == []
+        assert gmc.answer_batch_due is not None
+
+        outgoing = self.questions(gmc, "p2@test.com")
+
+        assert gmc.ai.calls == [("batch", ["P001", "P002"])]
+        assert sorted(to for _, _, to in outgoing) == ["p1@test.com", "p2@test.com"]
+        assert outgoing[0][0]["correlation_id"] == "q-p1@test.com"
+        assert gmc.answer_batch_due is None
+
+    def test_flush_answers_waiting_player_alone(self):
+        """Test that closing the window answers the held player singly."""
+        gmc = self.create_gmc()
+        self.questions(gmc, "p1@test.com")
+
+        outgoing = gmc.flush_answers()
+
+        assert gmc.ai.calls == [("single", "P001")]
+        assert [to for _, _, to in outgoing] == ["p1@test.com"]
+        assert self.questions(gmc, "p2@test.com")[0][2] == "p2@test.com"
+        assert gmc.ai.calls[-1] == ("single", "P002")
+
+    def test_window_off_answers_immediately(self):
+        """Test that without a window each player is answered on arrival."""
+        gmc = self.create_gmc(window=0)
+        assert len(self.questions(gmc, "p1@test.com")) == 1
+        assert gmc.ai.calls == [("single", "P001")]
+
+    def test_ai_without_batch_hook_answers_immediately(self):
+        """Test that the window is ignored when get_answers_batch is not overridden."""
+        t = TestGameManagementCycle()
+        config = dict(t.create_config(), answer_batch_window_seconds=30)
+        ai = RoundStartAI()
+        ai.get_answers = lambda ctx: {"answers": VALID_ANSWERS}
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=ai, config=config)
+        gmc.initiate_game()
+        assert len(self.questions(gmc, "p1@test.com")) == 1
+        assert gmc.answer_batch_due is None
+
+
+class PreparingAI(BatchAI):
+    """Implements prepare_game; records what get_answers saw."""
+
+    def __init__(self, release=None):
+        super().__init__()
+        self.release = release
+        self.prepared = None
+
+    def prepare_game(self, ctx):
+        if self.release is not None:
+            self.release.wait(5)
+        self.prepared = ctx["dynamic"]["book_name"]
+
+    def get_answers(self, ctx):
+        self.calls.append(("single", self.prepared))
+        return {"answers": VALID_ANSWERS}
+
+
+class TestPrepareGame:
+    """Tests for the optional prepare_game hook."""
+
+    def start_round(self, ai, **config):
+        t = TestGameManagementCycle()
+        gmc = GameManagementCycle(gprm=t.create_gprm(), ai=ai,
+                                  config=dict(t.create_config(), **config))
+        gmc.initiate_game()
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p1@test.com")
+        gmc.route_message("Q21WARMUPRESPONSE", {"payload": {"answer": "4"}}, "p2@test.com")
+        return gmc
+
+    def test_answers_wait_for_preparation(self):
+        """Test that get_answers runs after prepare_game has finished."""
+        release = threading.Event()
+        gmc = self.start_round(PreparingAI(release))
+        assert gmc.state.preparation is not None
+        threading.Timer(0.1, release.set).start()
+
+        body = {"message_id": "q1", "payload": {"questions": [{"question_number": 1}]}}
+        outgoing = gmc.route_message("Q21QUESTIONSBATCH", body, "p1@test.com")
+
+        assert gmc.ai.calls == [("single", "Test Book")]
+        assert len(outgoing) == 1
+
+    def test_slow_preparation_does_not_block_answers(self):
+        """Test that answers go out after prepare_wait_seconds regardless."""
+        release = threading.Event()
+        gmc = self.start_round(PreparingAI(release), prepare_wait_seconds=0.05)
+
+        body = {"message_id": "q1", "payload": {"questions": [{"question_number": 1}]}}
+        outgoing = gmc.route_message("Q21QUESTIONSBATCH", body, "p1@test.com")
+        release.set()
+
+        assert gmc.ai.calls == [("single", None)]
+        assert len(outgoing) == 1
+
+    def test_wait_comes_out_of_the_answers_deadline(self, monkeypatch):
+        """Test that get_answers only gets what the wait left of its deadline."""
+        from q21_referee._gmc.handlers import questions
+        deadlines = []
+
+        def recording(**kwargs):
+            deadlines.append(kwargs["deadline_seconds"])
+            return execute_callback(**kwargs)
+
+        monkeypatch.setattr(questions, "execute_callback", recording)
+        release = threading.Event()
+        gmc = self.start_round(PreparingAI(release), prepare_wait_seconds=0.2)
+
+        body = {"message_id": "q1", "payload": {"questions": [{"question_number": 1}]}}
+        gmc.route_message("Q21QUESTIONSBATCH", body, "p1@test.com")
+        release.set()
+
+        full = SERVICE_DEFINITIONS["answers"]["deadline_seconds"]
+        assert full - 1 < deadlines[0] <= full - 0.2
+
+    def test_preparation_runs_through_the_executor(self):
+        """Test that prepare_game gets a deadline and shows up in callback stats."""
+        callback_stats.reset()
+        gmc = self.start_round(PreparingAI())
+        gmc.state.preparation.result(timeout=5)
+        assert callback_stats.snapshot()["prepare_game"]["calls"] == 1
+
+    def test_not_started_without_override(self):
+        """Test that AIs without prepare_game get no background call."""
+        gmc = self.start_round(RoundStartAI())
+        assert gmc.state.phase.value == "round_started"
+        assert gmc.state.preparation is None
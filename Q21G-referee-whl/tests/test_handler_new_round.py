@@ -151,3 +151,20 @@ class TestBroadcastNewRoundHandler:
 
         # Should default to round 0 and not find assignment
         assert result is None
+
+    def test_builds_one_gprm_per_assignment_in_round(self):
+        """Test that every assignment in the round gets its own GPRM."""
+        handler, _ = self.create_handler_in_running_state()
+        handler.assignments.append({
+            "round_number": 1,
+            "game_id": "0101002",
+            "player1_id": "P005",
+            "player1_email": "p5@test.com",
+            "player2_id": "P006",
+            "player2_email": "p6@test.com",
+        })
+
+        result = handler.handle(self.create_round_message())
+
+        assert [g.player1_id for g in result["gprms"]] == ["P001", "P005"]
+        assert result["gprm"] is result["gprms"][0]
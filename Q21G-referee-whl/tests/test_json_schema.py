@@ -0,0 +1,43 @@
+# Area: GMC Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._gmc.json_schema — JSON Schema export."""
+
+import pytest
+
+from q21_referee._gmc.json_schema import callback_json_schema
+from q21_referee._gmc.validator import CALLBACK_SCHEMAS
+
+
+@pytest.mark.parametrize("name", list(CALLBACK_SCHEMAS))
+def test_every_callback_exports_an_object_schema(name):
+    schema = callback_json_schema(name)
+    assert schema["type"] == "object"
+    assert schema["required"] == CALLBACK_SCHEMAS[name]["required"]
+
+
+def test_answers_items_carry_enum_and_minimum():
+    answers = callback_json_schema("answers")["properties"]["answers"]
+    assert answers["type"] == "array"
+    assert answers["minItems"] == 1
+    item = answers["items"]["properties"]
+    assert item["answer"]["enum"] == ["A", "B", "C", "D", "Not Relevant"]
+    assert item["question_number"] == {"type": "integer", "minimum": 1}
+
+
+def test_string_length_constraints_map_to_min_max_length():
+    hint = callback_json_schema("round_start_info")["properties"]["book_hint"]
+    assert hint == {"type": "string", "minLength": 10, "maxLength": 200}
+
+
+def test_nested_schema_and_numeric_union():
+    schema = callback_json_schema("score_feedback")
+    assert schema["properties"]["private_score"] == {
+        "type": "number", "minimum": 0, "maximum": 100}
+    breakdown = schema["properties"]["breakdown"]
+    assert breakdown["type"] == "object"
+    assert "opening_sentence_score" in breakdown["required"]
+
+
+def test_unknown_callback_raises():
+    with pytest.raises(KeyError):
+        callback_json_schema("nope")
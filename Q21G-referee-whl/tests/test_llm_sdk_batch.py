@@ -0,0 +1,77 @@
+# Area: LLM SDK Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for sdk.llm_sdk.core batch scoring — must equal the scalar path."""
+
+import random
+
+import pytest
+
+from sdk.llm_sdk.core import ScoreCalculator
+
+np = pytest.importorskip("numpy")
+
+WORDS = ["Gradient", "gradient", "GRADIENT", "descent", "weights", "the", "a",
+         "רשתות", "נוירונים", "והרשת", "לומדות", "ß", "İstanbul", "data."]
+SPECIAL = [None, "", " ", "   \t\n", "a", "A"]
+
+
+def _text(rng):
+    if rng.random() < 0.2:
+        return rng.choice(SPECIAL)
+    words = [rng.choice(WORDS) for _ in range(rng.randint(1, 8))]
+    return rng.choice([" ", "  ", "\t"]).join(words)
+
+
+def _variant(rng, text):
+    """A guess derived from ``text``: exact, re-cased, truncated or unrelated."""
+    if text is None or rng.random() < 0.3:
+        return _text(rng)
+    return rng.choice([text, text.upper(), text.lower(), text.swapcase(),
+                       text[: len(text) // 2], text + " extra"])
+
+
+def _rows(seed, n=300):
+    rng = random.Random(seed)
+    actuals = [_text(rng) for _ in range(n)]
+    return rng, actuals, [_variant(rng, a) for a in actuals]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+@pytest.mark.parametrize("seed", range(5))
+def test_similarity_batch_equals_scalar(seed, chunk_size):
+    _, actuals, guesses = _rows(seed)
+    calc = ScoreCalculator()
+
+    batch = calc.calculate_similarity_batch(actuals, guesses, chunk_size=chunk_size)
+
+    expected = [calc.calculate_similarity(a, g) for a, g in zip(actuals, guesses)]
+    assert batch.tolist() == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+@pytest.mark.parametrize("seed", range(5))
+def test_player_scores_batch_equals_scalar(seed, chunk_size):
+    rng, actuals, guesses = _rows(seed, n=120)
+    words = [rng.choice(WORDS + SPECIAL) for _ in guesses]
+    word_guesses = [_variant(rng, w) for w in words]
+    justifications = [_text(rng) or "" for _ in guesses]
+    calc = ScoreCalculator()
+
+    batch = calc.calculate_player_scores_batch(
+        actuals, words, guesses, justifications, word_guesses, justifications[::-1],
+        chunk_size=chunk_size)
+
+    for i, row in enumerate(zip(actuals, words, guesses, justifications,
+                                word_guesses, justifications[::-1])):
+        scalar = calc.calculate_player_scores(*row)
+        assert {key: batch[key][i].item() for key in scalar} == scalar, row
+
+
+def test_single_actual_applies_to_every_guess():
+    calc = ScoreCalculator()
+    guesses = ["Gradient descent", "GRADIENT DESCENT", "", None, "   "]
+
+    batch = calc.calculate_similarity_batch("gradient descent", guesses, chunk_size=2)
+
+    assert batch.tolist() == [calc.calculate_similarity("gradient descent", g)
+                              for g in guesses]
@@ -2,6 +2,8 @@
 # PRD: docs/prd-rlgm.md
 """Tests for RLGM Orchestrator."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock
 from q21_referee._rlgm.orchestrator import RLGMOrchestrator
@@ -136,3 +138,101 @@ class TestRLGMOrchestrator:
         )
 
         assert outgoing == []
+
+
+class RoundStartAI(MockRefereeAI):
+    """Mock AI whose round-start info passes validation."""
+
+    def get_round_start_info(self, ctx):
+        return {"book_name": "Test", "book_hint": "A hint long enough",
+                "association_word": "ocean"}
+
+
+class TestMultiGameOrchestration:
+    """Tests for running several games at once."""
+
+    def create_orchestrator(self):
+        config = {
+            "referee_id": "REF001",
+            "referee_email": "ref@test.com",
+            "league_id": "LEAGUE001",
+            "season_id": "SEASON_2026_Q1",
+            "league_manager_email": "lm@test.com",
+        }
+        orchestrator = RLGMOrchestrator(config=config, ai=RoundStartAI())
+        for n, (a, b) in enumerate([("p1", "p2"), ("p3", "p4")], start=1):
+            game = orchestrator.start_game(GPRM(
+                player1_email=f"{a}@test.com", player1_id=a.upper(),
+                player2_email=f"{b}@test.com", player2_id=b.upper(),
+                season_id="SEASON_2026_Q1", game_id=f"010100{n}",
+                match_id=f"010100{n}", round_id="ROUND_1", round_number=1,
+            ))
+            game.initiate_game()
+        return orchestrator
+
+    def warmup(self, orchestrator, sender, **ids):
+        body = {"message_type": "Q21WARMUPRESPONSE",
+                "payload": {"answer": "4", **ids}}
+        return orchestrator.route_player_message("Q21WARMUPRESPONSE", body, sender)
+
+    def test_games_are_kept_side_by_side(self):
+        """Test that starting a second game does not replace the first."""
+        orchestrator = self.create_orchestrator()
+
+        assert list(orchestrator.games) == ["0101001", "0101002"]
+        assert orchestrator.current_game.gprm.match_id == "0101002"
+
+    def test_routes_by_match_id_then_sender(self):
+        """Test player messages reach their own game and progress independently."""
+        orchestrator = self.create_orchestrator()
+
+        assert self.warmup(orchestrator, "p3@test.com", match_id="0101002") == []
+        assert self.warmup(orchestrator, "p1@test.com") == []
+        outgoing = self.warmup(orchestrator, "p4@test.com")
+
+        assert {r for _, _, r in outgoing} == {"p3@test.com", "p4@test.com"}
+        game1 = orchestrator.games["0101001"]
+        assert game1.state.player1.warmup_answer == "4"
+        assert game1.state.player2.warmup_answer is None
+
+    def test_unknown_sender_with_several_games_is_dropped(self):
+        """Test that an unattributable message is not guessed into a game."""
+        orchestrator = self.create_orchestrator()
+
+        assert self.warmup(orchestrator, "stranger@test.com") == []
+
+    def test_completed_game_leaves_others_running(self):
+        """Test that completing one game removes only that game."""
+        orchestrator = self.create_orchestrator()
+        game1 = orchestrator.games["0101001"]
+        game1.is_complete = lambda: True
+        game1.get_result = lambda: None
+
+        self.warmup(orchestrator, "p1@test.com")
+
+        assert list(orchestrator.games) == ["0101002"]
+        assert orchestrator.current_game.gprm.match_id == "0101002"
+
+    def test_busy_game_blocks_only_itself(self):
+        """Test that a game stuck in a callback leaves the table and other games usable."""
+        orchestrator = self.create_orchestrator()
+        game1 = orchestrator.games["0101001"]
+        entered, release = threading.Event(), threading.Event()
+
+        def slow_route(*args):
+            entered.set()
+            release.wait(5)
+            return []
+
+        game1.route_message = slow_route
+        worker = threading.Thread(target=self.warmup, args=(orchestrator, "p1@test.com"))
+        worker.start()
+        try:
+            assert entered.wait(2)
+            assert self.warmup(orchestrator, "p3@test.com") == []
+            assert orchestrator.games["0101002"].state.player1.warmup_answer == "4"
+            assert orchestrator.handle_lm_message({"message_type": "BROADCAST_START_SEASON",
+                                                   "payload": {}}) is not None
+        finally:
+            release.set()
+            worker.join(5)
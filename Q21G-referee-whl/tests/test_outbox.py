@@ -0,0 +1,148 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._shared.outbox — background send queue."""
+
+import json
+import threading
+import time
+
+from q21_referee._shared.outbox import Outbox, default_spool_path
+
+
+class _Transport:
+    """Records sends; per-recipient delay and scripted failures."""
+
+    def __init__(self, delay=0.0, fail=None):
+        self.delay = delay
+        self.fail = fail or {}  # subject → number of failures before success
+        self.sent = []
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.max_in_flight = 0
+        self.overlap_same_recipient = False
+
+    def send(self, to, subject, body):
+        with self.lock:
+            if self.in_flight.get(to):
+                self.overlap_same_recipient = True
+            self.in_flight[to] = self.in_flight.get(to, 0) + 1
+            self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[to] -= 1
+            if self.fail.get(subject, 0) > 0:
+                self.fail[subject] -= 1
+                return False
+            self.sent.append((to, subject))
+        return True
+
+
+def test_submit_returns_before_slow_send():
+    transport = _Transport(delay=0.2)
+    outbox = Outbox(transport, workers=2)
+    outbox.start()
+    started = time.monotonic()
+    outbox.submit("p1@t.com", "s", {})
+    assert time.monotonic() - started < 0.1
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    assert transport.sent == [("p1@t.com", "s")]
+
+
+def test_per_recipient_order_with_parallel_recipients():
+    transport = _Transport(delay=0.01)
+    outbox = Outbox(transport, workers=4)
+    outbox.start()
+    for n in range(5):
+        for to in ("a@t.com", "b@t.com", "c@t.com"):
+            outbox.submit(to, f"{to}-{n}", {})
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    for to in ("a@t.com", "b@t.com", "c@t.com"):
+        assert [s for r, s in transport.sent if r == to] == [f"{to}-{n}" for n in range(5)]
+    assert not transport.overlap_same_recipient
+    assert 1 < transport.max_in_flight <= 3
+
+
+def test_retry_keeps_order_and_counts():
+    transport = _Transport(fail={"first": 2})
+    outbox = Outbox(transport, workers=2, retry_delay=0.01)
+    outbox.start()
+    outbox.submit("a@t.com", "first", {})
+    outbox.submit("a@t.com", "second", {})
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    assert transport.sent == [("a@t.com", "first"), ("a@t.com", "second")]
+    stats = outbox.stats()
+    assert stats["sent"] == 2 and stats["retried"] == 2 and stats["spooled"] == 0
+    assert stats["latency_max"] is not None
+
+
+def test_exhausted_message_is_spooled_and_resent_after_restart(tmp_path):
+    spool = tmp_path / "outbox.json"
+    outbox = Outbox(_Transport(fail={"s": 99}), max_attempts=2,
+                    retry_delay=0.01, spool_path=str(spool))
+    outbox.start()
+    outbox.submit("a@t.com", "s", {"n": 1})
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    assert outbox.stats()["failed"] == 1
+    assert [item["body"] for item in json.loads(spool.read_text())] == [{"n": 1}]
+
+    transport = _Transport()
+    restarted = Outbox(transport, spool_path=str(spool))
+    restarted.start()
+    assert restarted.flush(timeout=5)
+    restarted.close()
+    assert transport.sent == [("a@t.com", "s")]
+    assert json.loads(spool.read_text()) == []
+
+
+def test_queued_message_is_spooled_before_it_is_sent(tmp_path):
+    spool = tmp_path / "outbox.json"
+    outbox = Outbox(_Transport(), spool_path=str(spool))  # not started: a crash
+    outbox.submit("a@t.com", "s", {"n": 1})
+    assert [item["body"] for item in json.loads(spool.read_text())] == [{"n": 1}]
+
+    transport = _Transport()
+    restarted = Outbox(transport, spool_path=str(spool))
+    restarted.start()
+    assert restarted.flush(timeout=5)
+    restarted.close()
+    assert transport.sent == [("a@t.com", "s")]
+    assert json.loads(spool.read_text()) == []
+
+
+def test_stale_spooled_message_is_dropped_on_start(tmp_path):
+    spool = tmp_path / "outbox.json"
+    old = {"id": "1", "to": "a@t.com", "subject": "old", "body": {},
+           "spooled_at": time.time() - 3600}
+    new = dict(old, id="2", subject="new", spooled_at=time.time())
+    spool.write_text(json.dumps([old, new]))
+
+    transport = _Transport()
+    outbox = Outbox(transport, spool_path=str(spool), max_age=600)
+    outbox.start()
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    assert transport.sent == [("a@t.com", "new")]
+    assert json.loads(spool.read_text()) == []
+
+
+def test_send_exception_counts_as_failure():
+    class Boom:
+        def send(self, *a):
+            raise RuntimeError("network")
+
+    outbox = Outbox(Boom(), max_attempts=1)
+    outbox.start()
+    outbox.submit("a@t.com", "s", {})
+    assert outbox.flush(timeout=5)
+    outbox.close()
+    assert outbox.stats()["failed"] == 1
+
+
+def test_default_spool_lives_next_to_the_log_file(tmp_path):
+    log_file = str(tmp_path / "logs" / "referee.log")
+    assert default_spool_path({"log_file": log_file}) == str(tmp_path / "logs" / "q21_outbox.json")
+    assert default_spool_path({"outbox_spool_path": "x.json", "log_file": log_file}) == "x.json"
@@ -0,0 +1,71 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._shared.poll_scheduler — adaptive polling."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from q21_referee._shared.poll_scheduler import PollScheduler
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _envelope(deadline_epoch):
+    iso = datetime.fromtimestamp(deadline_epoch, tz=timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%f+00:00")
+    return {"message_type": "Q21WARMUPCALL", "payload": {"deadline": iso}}
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return PollScheduler(base_interval=5, burst_interval=1, idle_max=40, clock=clock)
+
+
+def test_idle_backoff_grows_to_cap_and_resets_on_message(scheduler):
+    assert [scheduler.next_delay() for _ in range(5)] == [10, 20, 40, 40, 40]
+    scheduler.note_received("lm@test.com")
+    assert scheduler.next_delay(received=1) == 5
+
+
+def test_burst_while_reply_owed_then_back_to_idle(scheduler, clock):
+    scheduler.note_sent("p1@test.com", _envelope(clock.now + 120))
+    scheduler.note_sent("p2@test.com", _envelope(clock.now + 120))
+    assert scheduler.awaiting
+    assert scheduler.next_delay() == 1
+    scheduler.note_received("P1@test.com")
+    assert scheduler.next_delay(received=1) == 1  # p2 still owes a reply
+    scheduler.note_received("p2@test.com")
+    assert not scheduler.awaiting
+    assert scheduler.next_delay(received=1) == 5
+
+
+def test_wakes_exactly_at_deadline_and_stops_bursting_after(scheduler, clock):
+    scheduler.note_sent("p1@test.com", _envelope(clock.now + 0.25))
+    assert scheduler.next_delay() == pytest.approx(0.25, abs=1e-3)
+    clock.now += 0.25
+    assert scheduler.next_delay() == 10  # expired: back to idle backoff
+    assert not scheduler.awaiting
+
+
+def test_envelopes_without_deadline_do_not_trigger_burst(scheduler):
+    scheduler.note_sent("lm@test.com", {"message_type": "SEASON_REGISTRATION_REQUEST"})
+    scheduler.note_sent("p1@test.com", {"payload": {"deadline": "garbage"}})
+    assert not scheduler.awaiting
+    assert scheduler.next_delay() == 10
+
+
+def test_intervals_are_clamped_to_base():
+    s = PollScheduler(base_interval=60, burst_interval=90, idle_max=30)
+    assert s.burst_interval == 60 and s.idle_max == 60
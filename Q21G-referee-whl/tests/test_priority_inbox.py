@@ -0,0 +1,62 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._shared.priority_inbox and dispatch priorities."""
+
+from q21_referee._runner_config import (
+    PRIORITY_GAME, PRIORITY_KEEP_ALIVE, PRIORITY_ROUND, PRIORITY_SEASON, message_priority,
+)
+from q21_referee._shared.priority_inbox import PriorityInbox
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_game_traffic_overtakes_bookkeeping():
+    inbox = PriorityInbox()
+    inbox.push("keep-alive", "league", PRIORITY_KEEP_ALIVE)
+    inbox.push("guess", "game:A", PRIORITY_GAME, deadline=300)
+    assert inbox.drain() == ["guess", "keep-alive"]
+
+
+def test_earlier_deadline_first_within_class():
+    inbox = PriorityInbox()
+    inbox.push("score", "game:A", PRIORITY_GAME, deadline=500)
+    inbox.push("answers", "game:B", PRIORITY_GAME, deadline=200)
+    assert inbox.drain() == ["answers", "score"]
+
+
+def test_same_key_stays_fifo_even_if_later_item_is_more_urgent():
+    inbox = PriorityInbox()
+    inbox.push("season", "league", PRIORITY_SEASON)
+    inbox.push("late-warmup", "league", PRIORITY_GAME, deadline=1)
+    inbox.push("other-game", "game:B", PRIORITY_GAME, deadline=50)
+    assert inbox.drain() == ["other-game", "season", "late-warmup"]
+
+
+def test_stats_report_depth_and_wait_by_rank():
+    clock = Clock()
+    inbox = PriorityInbox(clock=clock)
+    inbox.push("a", "game:A", PRIORITY_GAME, deadline=1)
+    inbox.push("b", "league", PRIORITY_SEASON)
+    assert inbox.stats()["depth"] == 2 and len(inbox) == 2
+    clock.now += 2
+    inbox.pop()
+    clock.now += 3
+    inbox.pop()
+    stats = inbox.stats()
+    assert stats["depth"] == 0 and stats["streams"] == 0
+    assert stats["wait_by_rank"][PRIORITY_GAME]["max_wait"] == 2
+    assert stats["wait_by_rank"][PRIORITY_SEASON]["mean_wait"] == 5
+
+
+def test_message_priority_classes():
+    assert message_priority("Q21GUESSSUBMISSION", 10) == (PRIORITY_GAME, 190)
+    assert message_priority("Q21QUESTIONSBATCH", 10) == (PRIORITY_GAME, 130)
+    assert message_priority("BROADCAST_NEW_LEAGUE_ROUND", 10) == (PRIORITY_ROUND, None)
+    assert message_priority("BROADCAST_ASSIGNMENT_TABLE", 10) == (PRIORITY_SEASON, None)
+    assert message_priority("BROADCAST_KEEP_ALIVE", 10) == (PRIORITY_KEEP_ALIVE, None)
@@ -106,6 +106,17 @@ class TestProtocolLogger:
         logger.set_role_active(True)
         assert logger.role_active is True
 
+    def test_log_received_explicit_context_overrides_shared(self, capsys):
+        """Test that explicit game_id/role_active win over the shared context."""
+        logger = ProtocolLogger()
+        logger.set_game_id("0101002")
+        logger.set_role_active(False)
+        logger.log_received(email="p1@test.com", message_type="Q21WARMUPRESPONSE",
+                            game_id="0101001", role_active=True)
+        out = capsys.readouterr().out
+        assert "GAME-ID: 0101001" in out
+        assert "REFEREE-ACTIVE" in out
+
     def test_get_role_active(self):
         """Test getting role string when active."""
         logger = ProtocolLogger()
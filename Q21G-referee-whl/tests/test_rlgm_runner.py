@@ -7,6 +7,7 @@ from unittest.mock import Mock, MagicMock, patch
 from q21_referee.rlgm_runner import RLGMRunner
 from q21_referee.callbacks import RefereeAI
 from q21_referee._rlgm.enums import RLGMState
+from q21_referee._rlgm.gprm import GPRM
 
 
 class MockRefereeAI(RefereeAI):
@@ -40,8 +41,8 @@ class TestRLGMRunner:
             "league_manager_email": "lm@test.com",
         }
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_rlgm_runner_creation(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_rlgm_runner_creation(self, mock_transport):
         """Test RLGM runner can be created."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -51,8 +52,8 @@ class TestRLGMRunner:
         assert runner.orchestrator is not None
         assert runner.orchestrator.state_machine.current_state == RLGMState.INIT_START_STATE
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_lm_messages_routed_to_rlgm(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_lm_messages_routed_to_rlgm(self, mock_transport):
         """Test that LM messages are routed to orchestrator."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -71,8 +72,8 @@ class TestRLGMRunner:
         assert outgoing[0][0]["message_type"] == "SEASON_REGISTRATION_REQUEST"
         assert runner.orchestrator.state_machine.current_state == RLGMState.WAITING_FOR_CONFIRMATION
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_player_messages_routed_to_gmc(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_player_messages_routed_to_gmc(self, mock_transport):
         """Test that player messages are routed to current game."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -102,8 +103,8 @@ class TestProtocolLoggerContext:
             "league_manager_email": "lm@test.com",
         }
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_season_level_message_uses_0199999(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_season_level_message_uses_0199999(self, mock_transport):
         """Test that season-level messages set game_id to 0199999."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -115,8 +116,8 @@ class TestProtocolLoggerContext:
 
         assert runner._protocol_logger._current_game_id == "0199999"
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_season_registration_response_uses_0199999(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_season_registration_response_uses_0199999(self, mock_transport):
         """Test that SEASON_REGISTRATION_RESPONSE sets game_id to 0199999."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -127,8 +128,8 @@ class TestProtocolLoggerContext:
 
         assert runner._protocol_logger._current_game_id == "0199999"
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_assignment_table_uses_0199999(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_assignment_table_uses_0199999(self, mock_transport):
         """Test that BROADCAST_ASSIGNMENT_TABLE sets game_id to 0199999."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -142,8 +143,8 @@ class TestProtocolLoggerContext:
 
         assert runner._protocol_logger._current_game_id == "0199999"
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_new_round_without_assignment_uses_round_format(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_new_round_without_assignment_uses_round_format(self, mock_transport):
         """Test BROADCAST_NEW_LEAGUE_ROUND with no assignment uses 01RR999."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -160,8 +161,8 @@ class TestProtocolLoggerContext:
         # Not assigned, so inactive
         assert runner._protocol_logger.role_active is False
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_new_round_with_assignment_uses_game_id(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_new_round_with_assignment_uses_game_id(self, mock_transport):
         """Test BROADCAST_NEW_LEAGUE_ROUND with assignment uses assigned game_id."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -181,8 +182,8 @@ class TestProtocolLoggerContext:
         assert runner._protocol_logger._current_game_id == "0102001"
         assert runner._protocol_logger.role_active is True
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_active_game_uses_gprm_game_id(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_active_game_uses_gprm_game_id(self, mock_transport):
         """Test that when a game is active, its GPRM game_id is used."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -201,8 +202,8 @@ class TestProtocolLoggerContext:
         assert runner._protocol_logger._current_game_id == "0105003"
         assert runner._protocol_logger.role_active is True
 
-    @patch("q21_referee.rlgm_runner.EmailClient")
-    def test_league_completed_uses_0199999(self, mock_email):
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_league_completed_uses_0199999(self, mock_transport):
         """Test that LEAGUE_COMPLETED sets game_id to 0199999."""
         config = self.create_config()
         ai = MockRefereeAI()
@@ -212,3 +213,96 @@ class TestProtocolLoggerContext:
         runner._update_protocol_logger_context("LEAGUE_COMPLETED", body)
 
         assert runner._protocol_logger._current_game_id == "0199999"
+
+
+class TestPriorityDispatch:
+    """Tests for the priority inbox between poll and dispatch."""
+
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_player_message_dispatched_before_keep_alive(self, mock_transport):
+        """Test that game traffic is handled before queued bookkeeping."""
+        config = TestRLGMRunner().create_config()
+        runner = RLGMRunner(config=config, ai=MockRefereeAI())
+        runner.orchestrator.start_game(GPRM(
+            player1_email="p1@test.com", player1_id="P1",
+            player2_email="p2@test.com", player2_id="P2",
+            season_id="S1", game_id="0101001", match_id="0101001",
+            round_id="R1", round_number=1,
+        ))
+        runner.transport.poll.return_value = [
+            {"from": "lm@test.com", "body_json": {"message_type": "BROADCAST_KEEP_ALIVE"}},
+            {"from": "p1@test.com", "body_json": {"message_type": "Q21GUESSSUBMISSION"}},
+        ]
+        handled = []
+        runner._handle_message = lambda t, b, s: handled.append(t) or []
+
+        assert runner._poll_and_process() == 2
+        assert handled == ["Q21GUESSSUBMISSION", "BROADCAST_KEEP_ALIVE"]
+        assert runner.inbox.stats()["depth"] == 0
+
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_player_message_for_unknown_game_waits_behind_league(self, mock_transport):
+        """Test that a player message with no game yet keeps broadcast order."""
+        config = TestRLGMRunner().create_config()
+        runner = RLGMRunner(config=config, ai=MockRefereeAI())
+        runner.transport.poll.return_value = [
+            {"from": "lm@test.com", "body_json": {"message_type": "BROADCAST_NEW_LEAGUE_ROUND"}},
+            {"from": "p1@test.com", "body_json": {"message_type": "Q21WARMUPRESPONSE"}},
+        ]
+        handled = []
+        runner._handle_message = lambda t, b, s: handled.append(t) or []
+
+        runner._poll_and_process()
+        assert handled == ["BROADCAST_NEW_LEAGUE_ROUND", "Q21WARMUPRESPONSE"]
+
+
+class TestResponseDeadlines:
+    """Tests for the timer wheel tracking owed player replies."""
+
+    def start_game(self, runner):
+        game = runner.orchestrator.start_game(GPRM(
+            player1_email="p1@test.com", player1_id="P1",
+            player2_email="p2@test.com", player2_id="P2",
+            season_id="S1", game_id="0101001", match_id="0101001",
+            round_id="R1", round_number=1,
+        ))
+        runner.outbox = Mock()
+        runner._send_messages(game.initiate_game())
+        return game
+
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_reply_cancels_its_timer(self, mock_transport):
+        """Test that warmup calls start timers and a reply cancels one."""
+        runner = RLGMRunner(config=TestRLGMRunner().create_config(), ai=MockRefereeAI())
+        self.start_game(runner)
+        assert len(runner.timers) == 2
+
+        runner.transport.poll.return_value = [
+            {"from": "p1@test.com", "body_json": {
+                "message_type": "Q21WARMUPRESPONSE", "payload": {"answer": "4"}}},
+        ]
+        runner._poll_and_process()
+        assert ("0101001", "p1@test.com") not in runner.timers
+        assert ("0101001", "p2@test.com") in runner.timers
+
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_expired_reply_forfeits_and_frees_game(self, mock_transport):
+        """Test that an overdue reply reports the match and drops the game."""
+        runner = RLGMRunner(config=TestRLGMRunner().create_config(), ai=MockRefereeAI())
+        self.start_game(runner)
+        runner._schedule_event(("0101001", "p2@test.com"), 0,
+                               "RESPONSE_TIMEOUT", "0101001", "p2@test.com")
+        runner.transport.poll.return_value = []
+
+        assert runner._poll_and_process() == 1
+        recipient, _, envelope = runner.outbox.submit.call_args.args
+        assert recipient == "lm@test.com"
+        assert envelope["message_type"] == "MATCH_RESULT_REPORT"
+        assert runner.orchestrator.games == {}
+
+    @patch("q21_referee.rlgm_runner.build_transport")
+    def test_unknown_timeout_action_rejected(self, mock_transport):
+        """Test that a misspelled response_timeout_action fails fast."""
+        config = dict(TestRLGMRunner().create_config(), response_timeout_action="skip")
+        with pytest.raises(ValueError):
+            RLGMRunner(config=config, ai=MockRefereeAI())
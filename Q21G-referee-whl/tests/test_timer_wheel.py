@@ -0,0 +1,60 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._shared.timer_wheel."""
+
+from q21_referee._shared.timer_wheel import TimerWheel
+
+
+def make_wheel(sizes=(4, 4)):
+    return TimerWheel(tick=1.0, sizes=sizes, clock=lambda: 0.0)
+
+
+def test_timer_fires_at_its_deadline_not_before():
+    wheel = make_wheel()
+    wheel.schedule("a", 3, payload="p1")
+    assert wheel.advance(2) == []
+    assert wheel.advance(3) == [("a", "p1")]
+    assert len(wheel) == 0
+
+
+def test_cancel_removes_timer():
+    wheel = make_wheel()
+    wheel.schedule("a", 2)
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    assert wheel.advance(10) == []
+
+
+def test_reschedule_replaces_previous_deadline():
+    wheel = make_wheel()
+    wheel.schedule("a", 2)
+    wheel.schedule("a", 9)
+    assert wheel.advance(8) == []
+    assert [k for k, _ in wheel.advance(9)] == ["a"]
+
+
+def test_far_timers_cascade_through_levels_and_overflow():
+    wheel = make_wheel()  # level 0 covers 4 ticks, level 1 covers 16
+    deadlines = {"near": 3, "mid": 7, "edge": 15, "far": 40}
+    for key, when in deadlines.items():
+        wheel.schedule(key, when)
+    fired = {}
+    for now in range(1, 45):
+        for key, _ in wheel.advance(now):
+            fired[key] = now
+    assert fired == deadlines
+
+
+def test_overdue_deadline_fires_on_next_advance():
+    wheel = make_wheel()
+    wheel.advance(5)
+    wheel.schedule("late", 1)
+    assert "late" in wheel
+    assert [k for k, _ in wheel.advance(6)] == ["late"]
+
+
+def test_advance_skipping_many_ticks_returns_everything_due():
+    wheel = make_wheel()
+    for i in range(1, 30):
+        wheel.schedule(i, i)
+    assert sorted(k for k, _ in wheel.advance(100)) == list(range(1, 30))
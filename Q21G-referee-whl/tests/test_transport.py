@@ -0,0 +1,145 @@
+# Area: Shared Tests
+# PRD: docs/prd-rlgm.md
+"""Tests for q21_referee._shared.transport — pluggable transports."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from q21_referee._shared.transport import (
+    GmailTransport, InMemoryTransport, MaildirTransport, MemoryBroker, build_transport,
+)
+from q21_referee.callbacks import RefereeAI
+from q21_referee.rlgm_runner import RLGMRunner
+from q21_referee.runner import RefereeRunner
+
+
+class _AI(RefereeAI):
+    def get_warmup_question(self, ctx):
+        return {"warmup_question": "What is 2+2?"}
+
+    def get_round_start_info(self, ctx):
+        return {"book_name": "Test", "book_hint": "A test", "association_word": "test"}
+
+    def get_answers(self, ctx):
+        return {"answers": ["A"]}
+
+    def get_score_feedback(self, ctx):
+        return {"league_points": 10, "private_score": 5.0, "breakdown": {}}
+
+
+def test_memory_round_trip_and_isolation():
+    broker = MemoryBroker()
+    a = InMemoryTransport("a@test.com", broker=broker)
+    b = InMemoryTransport("b@test.com", broker=broker)
+    body = {"message_type": "PING", "payload": {"n": 1}}
+    assert a.send("B@test.com", "subj", body)
+    body["payload"]["n"] = 2  # sender mutation must not leak
+
+    assert a.poll() == []
+    [msg] = b.poll()
+    assert msg["from"] == "a@test.com" and msg["subject"] == "subj"
+    assert msg["body_json"] == {"message_type": "PING", "payload": {"n": 1}}
+    assert b.poll() == []
+
+
+def test_maildir_round_trip_preserves_order(tmp_path):
+    a = MaildirTransport(str(tmp_path), "a@test.com")
+    b = MaildirTransport(str(tmp_path), "b@test.com")
+    for n in range(3):
+        a.send("b@test.com", f"s{n}", {"n": n})
+    assert [m["body_json"]["n"] for m in b.poll()] == [0, 1, 2]
+    assert b.poll() == []
+    assert len(list((tmp_path / "b@test.com" / "cur").iterdir())) == 3
+
+
+def test_maildir_skips_corrupt_files(tmp_path):
+    b = MaildirTransport(str(tmp_path), "b@test.com")
+    b.connect()
+    (tmp_path / "b@test.com" / "new" / "0.bad.json").write_text("{not json")
+    MaildirTransport(str(tmp_path), "a@test.com").send("b@test.com", "s", {"n": 1})
+    assert [m["body_json"] for m in b.poll()] == [{"n": 1}]
+
+
+def test_gmail_transport_sends_in_parallel():
+    class _Client:
+        address = "ref@example.com"
+
+        def __init__(self):
+            self.active, self.peak = 0, 0
+            self._lock = threading.Lock()
+
+        def send(self, to_email, subject, body_dict):
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with self._lock:
+                self.active -= 1
+            return True
+
+    client = _Client()
+    transport = GmailTransport(client)
+    threads = [threading.Thread(target=transport.send, args=(f"p{i}@x", "s", {}))
+               for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client.peak > 1
+
+
+def test_build_transport_selects_backend(tmp_path):
+    broker = MemoryBroker()
+    mem = build_transport({"transport": "memory", "referee_email": "r@t.com",
+                           "transport_broker": broker})
+    assert isinstance(mem, InMemoryTransport) and mem.broker is broker
+    md = build_transport({"transport": "maildir", "maildir_path": str(tmp_path)})
+    assert isinstance(md, MaildirTransport)
+    with patch("q21_referee._shared.transport.EmailClient") as client:
+        assert isinstance(build_transport({}), GmailTransport)
+        client.assert_called_once()
+    with pytest.raises(ValueError):
+        build_transport({"transport": "pigeon"})
+
+
+def test_runner_runs_over_memory_transport():
+    broker = MemoryBroker()
+    config = {
+        "referee_id": "REF001", "referee_email": "ref@test.com", "group_id": "G",
+        "league_id": "L1", "season_id": "S1", "league_manager_email": "lm@test.com",
+        "transport": "memory", "transport_broker": broker,
+    }
+    runner = RLGMRunner(config=config, ai=_AI())
+    lm = InMemoryTransport("lm@test.com", broker=broker)
+    lm.send("ref@test.com", "start", {
+        "message_type": "BROADCAST_START_SEASON", "broadcast_id": "BC001",
+        "payload": {"season_id": "S1", "league_id": "L1"},
+    })
+
+    runner.outbox.start()
+    runner._poll_and_process()
+    assert runner.outbox.flush(timeout=5)
+    runner.outbox.close()
+
+    [reply] = lm.poll()
+    assert reply["body_json"]["message_type"] == "SEASON_REGISTRATION_REQUEST"
+    assert reply["from"] == "ref@test.com"
+
+
+def test_single_game_runner_survives_batch_flush_error():
+    config = {
+        "referee_id": "REF001", "referee_email": "ref@test.com", "group_id": "G",
+        "league_id": "L1", "season_id": "S1", "league_manager_email": "lm@test.com",
+        "game_id": "0101001",
+        "player1_email": "p1@test.com", "player1_id": "P1",
+        "player2_email": "p2@test.com", "player2_id": "P2",
+        "transport": "memory", "transport_broker": MemoryBroker(),
+    }
+    runner = RefereeRunner(config=config, ai=_AI())
+    runner.state.answer_batch_due = 0
+    with patch.object(runner.router, "route", side_effect=RuntimeError("boom")) as route:
+        assert runner._poll_and_process() == 0
+    route.assert_called_once_with("ANSWER_BATCH_FLUSH", {}, "")
@@ -9,7 +9,10 @@ from knowledge_base.corpus_builder import build_corpus
 from knowledge_base.paragraph_filter import is_valid_paragraph
 from knowledge_base.pdf_parser import extract_text_from_pdf, split_into_paragraphs
 from knowledge_base.embedding_builder import compute_embeddings_parallel
-from knowledge_base.llm_client import call_llm, call_llm_batch
+from knowledge_base.llm_client import call_llm, call_llm_batch, set_hedging_policy
+from knowledge_base.llm_hedging import HedgingPolicy
+from knowledge_base.model_router import ModelRouter
+from knowledge_base.deadline import Deadline, deadline_scope, deadline_from_ctx
 from knowledge_base.skill_plugin import (
     SkillPlugin,
     MarkdownSkillPlugin,
@@ -23,7 +26,9 @@ __all__ = [
     "build_corpus", "is_valid_paragraph",
     "extract_text_from_pdf", "split_into_paragraphs",
     "compute_embeddings_parallel",
-    "call_llm", "call_llm_batch",
+    "call_llm", "call_llm_batch", "set_hedging_policy", "HedgingPolicy",
+    "ModelRouter",
+    "Deadline", "deadline_scope", "deadline_from_ctx",
     "SkillPlugin", "MarkdownSkillPlugin", "SkillRegistry",
     "build_default_registry", "BUILTIN_SKILLS",
 ]
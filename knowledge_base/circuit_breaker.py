@@ -0,0 +1,154 @@
+"""Circuit breaker for the LLM client — fail fast during API outages.
+
+Building Block: CircuitBreaker
+    Input Data:  per-call outcomes (success + latency, or failure)
+    Output Data: allow() decisions; CircuitOpenError raised by call_llm when open
+    Setup Data:  error/slow-rate threshold, latency threshold, window, cooldown
+
+Without a breaker every callback spends its full retry budget against a
+degraded API before reaching its local fallback, so every game runs at
+the deadline edge. The breaker watches a rolling window of outcomes and
+opens when the share of failed *or* slow calls crosses the threshold.
+While open, calls are refused immediately and callers drop straight into
+their locally computed fallbacks. After `cooldown` seconds a single probe
+is let through (half-open): success closes the circuit, failure re-opens it.
+
+One breaker is kept per client object (breaker_for), so independent
+clients — and independent tests — never share state.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Callable, Optional
+
+import anthropic
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+DEFAULT_WINDOW = 20
+DEFAULT_MIN_CALLS = 5
+DEFAULT_BAD_RATE = 0.5        # share of failed/slow calls that trips the breaker
+DEFAULT_SLOW_SECONDS = 45.0   # a successful call slower than this counts as bad
+DEFAULT_COOLDOWN = 30.0
+
+
+class CircuitOpenError(anthropic.APIConnectionError):
+    """Raised by call_llm instead of calling an API the breaker considers down.
+
+    Subclasses APIConnectionError so existing fallback paths handle it.
+    """
+
+    def __init__(self, retry_in: float) -> None:
+        super().__init__(message=f"LLM circuit open (probe in {retry_in:.0f}s)",
+                         request=None)
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Rolling-window breaker tripping on error rate or latency."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, min_calls: int = DEFAULT_MIN_CALLS,
+                 bad_rate: float = DEFAULT_BAD_RATE,
+                 slow_seconds: float = DEFAULT_SLOW_SECONDS,
+                 cooldown: float = DEFAULT_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.min_calls = min_calls
+        self.bad_rate = bad_rate
+        self.slow_seconds = slow_seconds
+        self.cooldown = cooldown
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)  # True = bad
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until the next half-open probe (0 when not open)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.cooldown - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (claims the probe slot if half-open)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() < self._opened_at + self.cooldown:
+                    return False
+                self._state = HALF_OPEN
+                self._probing = False
+                logger.info("LLM circuit half-open — probing")
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def release(self) -> None:
+        """Give back a claimed probe slot for a call that never hit the API."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self, latency: float) -> None:
+        slow = latency > self.slow_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probing = False
+                if slow:
+                    self._trip()
+                else:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                    logger.info("LLM circuit closed")
+                return
+            self._outcomes.append(slow)
+            self._maybe_trip()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probing = False
+                self._trip()
+                return
+            self._outcomes.append(True)
+            self._maybe_trip()
+
+    def _maybe_trip(self) -> None:
+        n = len(self._outcomes)
+        if n >= self.min_calls and sum(self._outcomes) / n >= self.bad_rate:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        logger.warning("LLM circuit opened for %.0fs", self.cooldown)
+
+
+_breakers: "weakref.WeakKeyDictionary[object, CircuitBreaker]" = weakref.WeakKeyDictionary()
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(client) -> Optional[CircuitBreaker]:
+    """The breaker guarding `client` (created on first use)."""
+    with _breakers_lock:
+        try:
+            if client not in _breakers:
+                _breakers[client] = CircuitBreaker()
+            return _breakers[client]
+        except TypeError:  # not weak-referenceable — run unguarded
+            return None
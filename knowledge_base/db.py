@@ -4,9 +4,14 @@ Building Block: ParagraphDB
     Input Data:  paragraph dicts with id, pdf_name, opening_sentence, full_text, word_count
     Output Data: paragraph dicts via get_by_id, get_random, search_text, get_by_pdf_name
     Setup Data:  paragraphs.db file at knowledge_base/data/paragraphs.db (built by corpus_builder)
+
+One ParagraphDB is shared by the referee's callback threads, so the
+connection is opened with check_same_thread=False and every statement
+runs under the instance lock.
 """
 
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -31,81 +36,104 @@ def _row_to_dict(row: sqlite3.Row) -> dict:
 
 
 class ParagraphDB:
-    """SQLite wrapper for the paragraphs corpus."""
+    """SQLite wrapper for the paragraphs corpus; safe to share between threads."""
 
     def __init__(self, db_path: Optional[Path] = None):
         self._db_path = db_path or DEFAULT_DB_PATH
-        self._conn = sqlite3.connect(str(self._db_path))
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
 
     def create_db(self, paragraphs: list[dict]) -> None:
         """Create table and insert all paragraph records."""
-        self._conn.execute(_SCHEMA)
-        self._conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_pdf ON paragraphs(pdf_name)"
-        )
-        for p in paragraphs:
+        with self._lock:
+            self._conn.execute(_SCHEMA)
             self._conn.execute(
-                "INSERT OR REPLACE INTO paragraphs VALUES (?,?,?,?,?,?,?,?)",
-                (p["id"], p["pdf_name"], p.get("pdf_filename", ""),
-                 p["paragraph_index"], p["opening_sentence"],
-                 p["text"], p["word_count"],
-                 1 if p.get("is_valid", True) else 0),
+                "CREATE INDEX IF NOT EXISTS idx_pdf ON paragraphs(pdf_name)"
             )
-        self._conn.commit()
+            for p in paragraphs:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO paragraphs VALUES (?,?,?,?,?,?,?,?)",
+                    (p["id"], p["pdf_name"], p.get("pdf_filename", ""),
+                     p["paragraph_index"], p["opening_sentence"],
+                     p["text"], p["word_count"],
+                     1 if p.get("is_valid", True) else 0),
+                )
+            self._conn.commit()
 
     def get_by_id(self, paragraph_id: str) -> Optional[dict]:
-        row = self._conn.execute(
+        row = self._fetchone(
             "SELECT * FROM paragraphs WHERE id = ?", (paragraph_id,)
-        ).fetchone()
+        )
         return _row_to_dict(row) if row else None
 
     def get_by_pdf_name(self, pdf_name: str) -> list[dict]:
-        rows = self._conn.execute(
+        rows = self._fetchall(
             "SELECT * FROM paragraphs WHERE pdf_name = ?", (pdf_name,)
-        ).fetchall()
+        )
         return [_row_to_dict(r) for r in rows]
 
     def get_random(
         self, min_words: int = 50, max_words: int = 150,
         min_difficulty: float = 0.0, max_difficulty: float = 1.0,
     ) -> Optional[dict]:
-        row = self._conn.execute(
+        row = self._fetchone(
             "SELECT * FROM paragraphs "
             "WHERE word_count BETWEEN ? AND ? "
             "AND COALESCE(difficulty_score, 0.5) BETWEEN ? AND ? "
             "AND COALESCE(is_valid, 1) = 1 "
             "ORDER BY RANDOM() LIMIT 1",
             (min_words, max_words, min_difficulty, max_difficulty),
-        ).fetchone()
+        )
         if not row:
-            row = self._conn.execute(
+            row = self._fetchone(
                 "SELECT * FROM paragraphs "
                 "WHERE COALESCE(is_valid, 1) = 1 "
                 "ORDER BY RANDOM() LIMIT 1"
-            ).fetchone()
+            )
         return _row_to_dict(row) if row else None
 
+    def get_by_difficulty(
+        self, min_difficulty: float, max_difficulty: float,
+        min_words: int = 0, max_words: int = 100000,
+    ) -> list[dict]:
+        """All valid paragraphs in a difficulty and word-count band."""
+        rows = self._fetchall(
+            "SELECT * FROM paragraphs "
+            "WHERE word_count BETWEEN ? AND ? "
+            "AND COALESCE(difficulty_score, 0.5) BETWEEN ? AND ? "
+            "AND COALESCE(is_valid, 1) = 1",
+            (min_words, max_words, min_difficulty, max_difficulty),
+        )
+        return [_row_to_dict(r) for r in rows]
+
     def search_text(self, query: str) -> list[dict]:
-        rows = self._conn.execute(
+        rows = self._fetchall(
             "SELECT * FROM paragraphs WHERE full_text LIKE ?",
             (f"%{query}%",),
-        ).fetchall()
+        )
         return [_row_to_dict(r) for r in rows]
 
     def get_all_pdf_names(self) -> list[str]:
-        rows = self._conn.execute(
+        rows = self._fetchall(
             "SELECT DISTINCT pdf_name FROM paragraphs ORDER BY pdf_name"
-        ).fetchall()
+        )
         return [r["pdf_name"] for r in rows]
 
     def count(self) -> int:
-        return self._conn.execute(
-            "SELECT COUNT(*) FROM paragraphs"
-        ).fetchone()[0]
+        return self._fetchone("SELECT COUNT(*) FROM paragraphs")[0]
 
     def close(self) -> None:
-        self._conn.close()
+        with self._lock:
+            self._conn.close()
 
 
 def build_sqlite(paragraphs: list[dict], db_path: Path) -> None:
@@ -0,0 +1,116 @@
+"""Callback deadline budget, propagated to every LLM call via contextvars.
+
+Building Block: Deadline / deadline_scope / deadline_from_ctx
+    Input Data:  budget in seconds (ctx["service"]["deadline_seconds"] from the SDK)
+    Output Data: remaining-seconds queries and clamped per-call timeouts
+    Setup Data:  SAFETY_MARGIN seconds reserved for the local fallback + send
+
+The referee SDK terminates the process when a callback overruns its
+SERVICE_DEFINITIONS deadline. Callbacks open a deadline scope on entry;
+call_llm, its retry loop and the helpers' multi-attempt loops consult the
+active Deadline so timeouts shrink to the remaining budget and retries are
+skipped once they would eat into the reserve — a fallback answer always
+goes out in time.
+
+A scope may also take a ``cancelled`` check (e.g. the referee SDK's
+cancel token): once it returns True the deadline counts as expired, so
+the same checks stop starting new LLM calls.
+
+Usage::
+
+    with deadline_from_ctx(ctx):
+        raw = call_llm(client, prompt, timeout=60.0)  # clamped automatically
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+SAFETY_MARGIN = 5.0       # seconds kept back for fallback logic + envelope send
+MIN_CALL_SECONDS = 3.0    # an LLM call with less budget than this is not worth starting
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("q21g_deadline", default=None)
+
+
+class Deadline:
+    """A fixed point in (monotonic) time that work must finish before."""
+
+    def __init__(self, seconds: float, margin: float = SAFETY_MARGIN,
+                 clock: Callable[[], float] = time.monotonic,
+                 cancelled: Optional[Callable[[], bool]] = None) -> None:
+        self._clock = clock
+        self._cancelled = cancelled
+        self.expires_at = clock() + max(0.0, seconds - margin)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative; 0 once cancelled)."""
+        if self._cancelled is not None and self._cancelled():
+            return 0.0
+        return max(0.0, self.expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def allows(self, seconds: float) -> bool:
+        """True if at least `seconds` of budget remain."""
+        return self.remaining() >= seconds
+
+    def clamp(self, timeout: float) -> float:
+        """Shrink a per-call timeout so it cannot outlive the deadline."""
+        return min(timeout, self.remaining())
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.1f}s)"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The innermost active Deadline, or None outside any scope."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float, margin: float = SAFETY_MARGIN,
+                   cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Deadline]:
+    """Activate a deadline for the enclosed block.
+
+    Nested scopes never extend an outer budget: the earlier of the two
+    deadlines stays in force.
+    """
+    deadline = Deadline(seconds, margin, cancelled=cancelled)
+    outer = _current.get()
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def deadline_from_ctx(ctx: dict, default_seconds: Optional[float] = None,
+                      margin: float = SAFETY_MARGIN,
+                      cancelled: Optional[Callable[[], bool]] = None,
+                      ) -> Iterator[Optional[Deadline]]:
+    """Open a deadline scope from an SDK callback ctx.
+
+    Reads ctx["service"]["deadline_seconds"] (set by the referee SDK's
+    SERVICE_DEFINITIONS); falls back to `default_seconds`, and to no
+    deadline at all when neither is available.
+    """
+    service = (ctx or {}).get("service") or {}
+    seconds = service.get("deadline_seconds") or default_seconds
+    if not seconds:
+        yield None
+        return
+    with deadline_scope(float(seconds), margin, cancelled=cancelled) as deadline:
+        yield deadline
+
+
+def time_left(default: float = float("inf")) -> float:
+    """Remaining seconds of the active deadline, or `default` if none."""
+    deadline = _current.get()
+    return deadline.remaining() if deadline is not None else default
@@ -0,0 +1,205 @@
+"""Offline hint pool — validated hint/word/domain triples ready for round start.
+
+Building Block: HintPool, build_hint_pool
+    Input Data:  medium-difficulty paragraphs from ParagraphDB, a hint
+                 generator paragraph -> {book_hint, association_word,
+                 association_domain} (or None)
+    Output Data: rows of the `hints` table, ranked by findability_rank
+                 (1 = the hint's top vector-search hit is its own paragraph);
+                 take() prefers ranks nearest PREFERRED_RANK
+    Setup Data:  paragraphs.db with difficulty_score, optional VectorStore
+
+build_hint_pool runs the generator concurrently (LLM calls are I/O-bound)
+and keeps only hints whose paragraph is found by searching its PDF with
+the hint. At round start HintPool.take() is one indexed query; live
+generation is only needed once the pool runs dry.
+
+HintPool, like ParagraphDB, is shared by the referee's callback threads:
+its connection allows any thread and statements run under its lock.
+take() claims its row inside one IMMEDIATE transaction, so two takers
+(threads or processes on the same file) never get the same hint.
+"""
+
+import contextvars
+import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
+
+from knowledge_base.db import ParagraphDB, DEFAULT_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+MEDIUM_DIFFICULTY = (0.4, 0.7)
+SEARCH_DEPTH = 10  # hints ranked below this are not "findable"
+
+# The findability rank to aim for: a good hint matches a few paragraphs,
+# not just one (STRATEGY.md §2). Rank 1 makes the game too easy.
+PREFERRED_RANK = 3
+
+_HINTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    paragraph_id TEXT NOT NULL REFERENCES paragraphs(id),
+    book_hint TEXT NOT NULL,
+    association_word TEXT NOT NULL,
+    association_domain TEXT NOT NULL,
+    findability_rank INTEGER,
+    used INTEGER DEFAULT 0
+)
+"""
+
+
+def _rank_in(results: list[dict], paragraph_id: str) -> Optional[int]:
+    for rank, r in enumerate(results, start=1):
+        if r.get("id") == paragraph_id:
+            return rank
+    return None
+
+
+def findability_rank(vs, hint: str, paragraph: dict) -> Optional[int]:
+    """1-based position of the paragraph when searching its PDF with the hint."""
+    results = vs.search_by_pdf(hint, paragraph.get("pdf_name", ""), n_results=SEARCH_DEPTH)
+    return _rank_in(results, paragraph["id"])
+
+
+def findability_ranks(vs, hints: list[str], paragraph: dict) -> list[Optional[int]]:
+    """findability_rank of several hints, from one batched vector search."""
+    batches = vs.search_by_pdf_batch(hints, paragraph.get("pdf_name", ""),
+                                     n_results=SEARCH_DEPTH)
+    return [_rank_in(results, paragraph["id"]) for results in batches]
+
+
+def preferred_index(ranks: list[Optional[int]]) -> Optional[int]:
+    """Index of the findable rank nearest PREFERRED_RANK (better rank on ties), or None."""
+    findable = [(abs(rank - PREFERRED_RANK), rank, i)
+                for i, rank in enumerate(ranks) if rank is not None]
+    return min(findable)[2] if findable else None
+
+
+class HintPool:
+    """The `hints` table next to `paragraphs` in the same SQLite file; thread-safe."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._conn = sqlite3.connect(str(db_path or DEFAULT_DB_PATH), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._conn.execute(_HINTS_SCHEMA)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_hints_unused "
+            "ON hints(used, findability_rank)"
+        )
+        self._conn.commit()
+
+    def add(self, paragraph_id: str, hint: dict, rank: Optional[int]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO hints (paragraph_id, book_hint, association_word, "
+                "association_domain, findability_rank) VALUES (?,?,?,?,?)",
+                (paragraph_id, hint["book_hint"], hint["association_word"],
+                 hint["association_domain"], rank),
+            )
+            self._conn.commit()
+
+    def take(self) -> Optional[dict]:
+        """Unused hint nearest PREFERRED_RANK, joined with its paragraph (marked used), or None."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")  # write lock before the SELECT
+            try:
+                row = self._conn.execute(
+                    "SELECT h.id AS hint_id, h.book_hint, h.association_word, "
+                    "h.association_domain, h.findability_rank, p.* "
+                    "FROM hints h JOIN paragraphs p ON p.id = h.paragraph_id "
+                    "WHERE h.used = 0 "
+                    "ORDER BY ABS(COALESCE(h.findability_rank, ?) - ?), "
+                    "COALESCE(h.findability_rank, ?) LIMIT 1",
+                    (SEARCH_DEPTH + 1, PREFERRED_RANK, SEARCH_DEPTH + 1),
+                ).fetchone()
+                if row:
+                    self._conn.execute("UPDATE hints SET used = 1 WHERE id = ?",
+                                       (row["hint_id"],))
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return dict(row) if row else None
+
+    def remaining(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM hints WHERE used = 0"
+            ).fetchone()[0]
+
+    def pooled_paragraph_ids(self) -> set[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT paragraph_id FROM hints").fetchall()
+        return {r[0] for r in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _candidate(generate: Callable, vs, paragraph: dict):
+    """Generate hint(s) and keep the one nearest PREFERRED_RANK; None if unusable."""
+    hints = generate(paragraph)
+    hints = [hints] if isinstance(hints, dict) else hints or []
+    hints = [h for h in hints if h and h.get("book_hint")]
+    if not hints:
+        return None
+    if vs is None:
+        return hints[0], None
+    ranks = findability_ranks(vs, [h["book_hint"] for h in hints], paragraph)
+    best = preferred_index(ranks)
+    return (hints[best], ranks[best]) if best is not None else None
+
+
+def build_hint_pool(
+    generate: Callable[[dict], Optional[dict]],
+    db_path: Optional[Path] = None,
+    vs=None,
+    max_workers: int = 5,
+    difficulty: tuple[float, float] = MEDIUM_DIFFICULTY,
+    min_words: int = 30,
+    max_words: int = 200,
+) -> int:
+    """Pool a hint for every medium paragraph not pooled yet; returns count added.
+
+    ``generate`` returns one hint or a list of candidates; with ``vs`` the
+    findable candidate nearest PREFERRED_RANK is pooled. It is called from
+    worker threads (each in a copy of the caller's context); results are
+    written from the calling thread.
+    """
+    db = ParagraphDB(db_path)
+    pool = HintPool(db_path)
+    pooled = pool.pooled_paragraph_ids()
+    todo = [p for p in db.get_by_difficulty(*difficulty, min_words=min_words,
+                                            max_words=max_words)
+            if p["id"] not in pooled]
+    logger.info("Generating hints for %d paragraphs with %d threads", len(todo), max_workers)
+
+    added = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(contextvars.copy_context().run, _candidate, generate, vs, p): p
+            for p in todo
+        }
+        for future in as_completed(futures):
+            paragraph = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.error("Hint generation failed for %s: %s", paragraph["id"], exc)
+                continue
+            if result is None:
+                continue
+            hint, rank = result
+            pool.add(paragraph["id"], hint, rank)
+            added += 1
+
+    logger.info("Hint pool: %d added, %d unused", added, pool.remaining())
+    pool.close()
+    db.close()
+    return added
@@ -5,6 +5,7 @@ ThreadPoolExecutor.  This module extends llm_client.py with batch
 capabilities while keeping the single-call interface unchanged.
 """
 
+import contextvars
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -41,6 +42,9 @@ def call_llm_batch(
     Returns:
         List of response strings, in the same order as the input
         prompts.  Failed calls return an empty string.
+
+    Each worker runs in a copy of the caller's context, so an active
+    deadline scope (knowledge_base.deadline) also bounds the batch.
     """
     if not prompts:
         return []
@@ -58,7 +62,7 @@ def call_llm_batch(
 
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {
-            pool.submit(_call_one, i, p): i
+            pool.submit(contextvars.copy_context().run, _call_one, i, p): i
             for i, p in enumerate(prompts)
         }
         for future in as_completed(futures):
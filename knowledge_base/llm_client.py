@@ -3,18 +3,38 @@
 Provides both single-call and batch (multithreaded) interfaces.
 Batch calls use ThreadPoolExecutor for concurrent I/O-bound API requests.
 
+Every call honours the active callback Deadline (knowledge_base.deadline):
+the per-call timeout is clamped to the remaining budget and retries are
+skipped when the backoff would overrun it.
+
+A per-client CircuitBreaker (knowledge_base.circuit_breaker) refuses calls
+while the API is failing or slow, so callers reach their local fallbacks
+immediately instead of burning the retry budget.
+
+``schema=`` requests schema-constrained output through a forced tool call
+and returns the tool input as JSON text (knowledge_base.structured_output).
+
+Calls tagged with ``skill=`` can be hedged against tail latency once a
+HedgingPolicy is installed (knowledge_base.llm_hedging, opt-in).
+
 Building Block: call_llm / call_llm_batch
     Input Data:  anthropic.Anthropic client, prompt string(s), max_tokens, timeout
     Output Data: LLM response text string(s)
     Setup Data:  ANTHROPIC_API_KEY env var, claude-sonnet-4-20250514 model
 """
 
+import contextvars
+import json
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import anthropic
 
+from knowledge_base.circuit_breaker import CircuitOpenError, breaker_for
+from knowledge_base.deadline import MIN_CALL_SECONDS, current_deadline
+from knowledge_base.llm_hedging import HedgingPolicy
+
 MODEL = "claude-sonnet-4-20250514"
 logger = logging.getLogger(__name__)
 
@@ -26,32 +46,129 @@ _RETRYABLE = (
 )
 
 
+_hedging_policy: HedgingPolicy | None = None
+
+
+def set_hedging_policy(policy: HedgingPolicy | None) -> None:
+    """Install (or with None, remove) the process-wide hedging policy."""
+    global _hedging_policy
+    _hedging_policy = policy
+
+
+TOOL_NAME = "respond"
+
+
+def _tool_params(schema: dict) -> dict:
+    """messages.create kwargs forcing output through a tool with `schema`.
+
+    Tool inputs must be objects, so non-object schemas are wrapped as
+    {"items": ...} (structured_output.decode unwraps them).
+    """
+    if schema.get("type") != "object":
+        schema = {"type": "object", "properties": {"items": schema},
+                  "required": ["items"]}
+    return {
+        "tools": [{"name": TOOL_NAME, "description": "Return the answer.",
+                   "input_schema": schema}],
+        "tool_choice": {"type": "tool", "name": TOOL_NAME},
+    }
+
+
+def _response_text(resp) -> str:
+    """Text of a response: the forced tool's input as JSON, else the first text block."""
+    for block in resp.content:
+        if getattr(block, "type", None) == "tool_use":
+            return json.dumps(block.input, ensure_ascii=False)
+    return resp.content[0].text
+
+
+class DeadlineExceededError(anthropic.APITimeoutError):
+    """Raised instead of starting an LLM call the deadline can no longer afford.
+
+    Subclasses APITimeoutError so the callers' existing
+    ``except (anthropic.APIError, ...)`` fallback paths handle it unchanged.
+    """
+
+    def __init__(self, remaining: float) -> None:
+        anthropic.APIConnectionError.__init__(
+            self, message=f"Deadline budget exhausted ({remaining:.1f}s left)",
+            request=None,
+        )
+        self.remaining = remaining
+
+
 def call_llm(client: anthropic.Anthropic, prompt: str, max_tokens: int = 1024,
-             timeout: float = 30.0, retries: int = 2) -> str:
+             timeout: float = 30.0, retries: int = 2, *,
+             skill: str | None = None, model: str = MODEL,
+             schema: dict | None = None) -> str:
     """LLM call with retry on timeout/rate-limit/connection errors.
 
+    `model` overrides the default model (see knowledge_base.model_router).
+    `schema` forces a tool call with that input schema; the tool input is
+    returned as JSON text.
+    When `skill` is given and a hedging policy is installed, each attempt
+    is hedged against that skill's rolling p90 latency.
+
     Raises the original exception after exhausting retries.
     Raises AuthenticationError immediately (no retry).
+    Raises DeadlineExceededError when the active deadline cannot fit a call.
+    Raises CircuitOpenError without calling the API while the breaker is open.
     """
+    deadline = current_deadline()
+    breaker = breaker_for(client)
+    extra = _tool_params(schema) if schema else {}
+
+    def _request():
+        call_timeout = timeout
+        if deadline is not None:
+            if not deadline.allows(MIN_CALL_SECONDS):
+                logger.warning("Skipping LLM call: %r", deadline)
+                raise DeadlineExceededError(deadline.remaining())
+            call_timeout = deadline.clamp(timeout)
+        return client.with_options(timeout=call_timeout).messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            **extra,
+        )
+
+    policy = _hedging_policy if skill else None
     for attempt in range(retries + 1):
+        if breaker is not None and not breaker.allow():
+            logger.warning("LLM circuit open — skipping call")
+            raise CircuitOpenError(breaker.retry_in())
+        start = time.monotonic()
         try:
-            resp = client.with_options(timeout=timeout).messages.create(
-                model=MODEL,
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            return resp.content[0].text
+            resp = policy.run(skill, _request) if policy else _request()
         except _RETRYABLE as e:
+            if breaker is not None:
+                if isinstance(e, DeadlineExceededError):
+                    breaker.release()  # never reached the API
+                else:
+                    breaker.record_failure()
+            wait = 2 ** attempt  # 1s, 2s
+            if deadline is not None and not deadline.allows(wait + MIN_CALL_SECONDS):
+                logger.error("LLM failed, no budget left to retry: %s", e)
+                raise
             if attempt == retries:
                 logger.error("LLM failed after %d retries: %s", retries, e)
                 raise
-            wait = 2 ** attempt  # 1s, 2s
             logger.warning("LLM retry %d/%d after %s (wait %ds)",
                            attempt + 1, retries, type(e).__name__, wait)
             time.sleep(wait)
+            continue
         except anthropic.AuthenticationError:
             logger.error("Invalid API key — check ANTHROPIC_API_KEY")
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception:
+            if breaker is not None:
+                breaker.release()
             raise
+        if breaker is not None:
+            breaker.record_success(time.monotonic() - start)
+        return _response_text(resp)
     raise anthropic.APIError("Exhausted retries")
 
 
@@ -69,6 +186,7 @@ def call_llm_batch(
     run concurrently.
 
     Returns list of responses in input order. Failed calls return "".
+    Worker threads inherit the caller's deadline scope.
     """
     if not prompts:
         return []
@@ -86,7 +204,7 @@ def call_llm_batch(
                 len(prompts), max_workers)
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {
-            pool.submit(_call_one, i, p): i
+            pool.submit(contextvars.copy_context().run, _call_one, i, p): i
             for i, p in enumerate(prompts)
         }
         for future in as_completed(futures):
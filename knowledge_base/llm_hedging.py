@@ -0,0 +1,171 @@
+"""Hedged LLM requests — duplicate slow calls to cut tail latency.
+
+Building Block: HedgingPolicy
+    Input Data:  skill name, zero-arg callable performing one API request
+    Output Data: the first successful response of primary / hedge
+    Setup Data:  percentile (default p90), rolling window size, per-skill hedge budgets
+
+Opt-in (see llm_client.set_hedging_policy). For each skill the policy keeps
+a rolling window of single-request latencies. When a request has not
+returned by the skill's rolling p90, a duplicate is fired and whichever
+finishes first wins. The synchronous Anthropic client cannot abort an
+in-flight HTTP request, so the loser is cancelled if still queued and
+otherwise abandoned (its response is discarded; its latency still feeds
+the window).
+
+Hedges are rate-limited per skill with a token bucket: every primary
+request earns `ratio` tokens (capped at `burst`) and every hedge spends
+one, so hedges never exceed roughly ratio x requests against the API quota.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PERCENTILE = 0.9
+DEFAULT_WINDOW = 200
+MIN_SAMPLES = 20          # below this, fall back to default_delay
+DEFAULT_DELAY = 10.0      # seconds before hedging a skill with no history
+DEFAULT_RATIO = 0.1       # hedges per primary request
+DEFAULT_BURST = 2.0
+
+
+class _SkillStats:
+    """Per-skill latency window, hedge budget and counters."""
+
+    def __init__(self, window: int, ratio: float, burst: float) -> None:
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class HedgingPolicy:
+    """Fire a duplicate request when the first exceeds the skill's rolling p90."""
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        window: int = DEFAULT_WINDOW,
+        min_samples: int = MIN_SAMPLES,
+        default_delay: float = DEFAULT_DELAY,
+        budgets: dict[str, float] | None = None,
+        default_ratio: float = DEFAULT_RATIO,
+        burst: float = DEFAULT_BURST,
+        max_workers: int = 8,
+    ) -> None:
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.budgets = dict(budgets or {})
+        self.default_ratio = default_ratio
+        self.burst = burst
+        self._skills: dict[str, _SkillStats] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="llm-hedge")
+
+    def _stats(self, skill: str) -> _SkillStats:
+        if skill not in self._skills:
+            ratio = self.budgets.get(skill, self.default_ratio)
+            self._skills[skill] = _SkillStats(self.window, ratio, self.burst)
+        return self._skills[skill]
+
+    # ── Latency window ──────────────────────────────────────
+
+    def record(self, skill: str, latency: float) -> None:
+        """Add one single-request latency sample for `skill`."""
+        with self._lock:
+            self._stats(skill).latencies.append(latency)
+
+    def hedge_delay(self, skill: str) -> float:
+        """Seconds to wait on the primary before hedging (rolling percentile)."""
+        with self._lock:
+            samples = sorted(self._stats(skill).latencies)
+        if len(samples) < self.min_samples:
+            return self.default_delay
+        idx = min(len(samples) - 1, int(self.percentile * len(samples)))
+        return samples[idx]
+
+    # ── Budget ──────────────────────────────────────────────
+
+    def _earn(self, skill: str) -> None:
+        with self._lock:
+            s = self._stats(skill)
+            s.requests += 1
+            s.tokens = min(s.burst, s.tokens + s.ratio)
+
+    def _try_spend(self, skill: str) -> bool:
+        with self._lock:
+            s = self._stats(skill)
+            if s.ratio <= 0 or s.tokens < 1.0:
+                return False
+            s.tokens -= 1.0
+            s.hedges += 1
+            return True
+
+    def stats(self, skill: str) -> dict:
+        """Counters for one skill: requests, hedges, hedge_wins, hedge_delay."""
+        delay = self.hedge_delay(skill)
+        with self._lock:
+            s = self._stats(skill)
+            return {"requests": s.requests, "hedges": s.hedges,
+                    "hedge_wins": s.hedge_wins, "hedge_delay": delay}
+
+    # ── Execution ───────────────────────────────────────────
+
+    def _submit(self, skill: str, fn: Callable[[], T]) -> Future:
+        start = time.monotonic()
+        fut = self._pool.submit(fn)
+
+        def _on_done(f: Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                self.record(skill, time.monotonic() - start)
+
+        fut.add_done_callback(_on_done)
+        return fut
+
+    def run(self, skill: str, fn: Callable[[], T]) -> T:
+        """Run `fn`, hedging it once if it outlives the skill's delay.
+
+        Returns the first successful result. If every attempt fails,
+        re-raises the last exception (so callers' retry logic still applies).
+        """
+        self._earn(skill)
+        primary = self._submit(skill, fn)
+        done, _ = wait([primary], timeout=self.hedge_delay(skill))
+        if done or not self._try_spend(skill):
+            return primary.result()
+
+        logger.info("Hedging slow '%s' request", skill)
+        hedge = self._submit(skill, fn)
+        pending = {primary, hedge}
+        last_exc: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if fut is hedge:
+                        with self._lock:
+                            self._stats(skill).hedge_wins += 1
+                    return fut.result()
+                last_exc = fut.exception()
+        raise last_exc  # type: ignore[misc]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
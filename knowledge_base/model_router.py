@@ -0,0 +1,114 @@
+"""Model cascade routing — small fast model first, escalate on rejection.
+
+Building Block: ModelRouter
+    Input Data:  Anthropic client, prompt, skill name, optional accept(raw) check
+    Output Data: LLM response text from the first model whose output is accepted
+    Setup Data:  per-skill routing table (ROUTING_TABLE), SMALL_MODEL / LARGE_MODEL
+
+Cheap, structured tasks (warmup arithmetic, A/B/C/D answering, hint taboo
+repair) rarely need the large model. The router tries the skill's models
+in order and escalates to the next one only when the call fails or the
+caller's ``accept`` check rejects the output (invalid JSON, missing
+answers, low self-reported confidence). Skills absent from the table go
+straight to the large model, so routing is a no-op for everything else.
+
+Per-(skill, model) counters and latencies are kept for tuning the table.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import anthropic
+
+from knowledge_base import llm_client
+
+logger = logging.getLogger(__name__)
+
+SMALL_MODEL = "claude-3-5-haiku-20241022"
+LARGE_MODEL = llm_client.MODEL
+
+ROUTING_TABLE: dict[str, tuple[str, ...]] = {
+    "warmup_solver": (SMALL_MODEL, LARGE_MODEL),
+    "referee_question_answerer": (SMALL_MODEL, LARGE_MODEL),
+    "hint_taboo_repair": (SMALL_MODEL, LARGE_MODEL),
+}
+
+
+def _empty_stats() -> dict:
+    return {"calls": 0, "accepted": 0, "rejected": 0, "errors": 0, "latency": 0.0}
+
+
+class ModelRouter:
+    """Per-skill model cascade with success/latency stats."""
+
+    def __init__(self, table: Optional[dict[str, tuple[str, ...]]] = None,
+                 default: tuple[str, ...] = (LARGE_MODEL,)) -> None:
+        self._table = dict(ROUTING_TABLE if table is None else table)
+        self._default = default
+        self._stats: dict[tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def models_for(self, skill: str) -> tuple[str, ...]:
+        return self._table.get(skill, self._default)
+
+    def set_route(self, skill: str, models: tuple[str, ...]) -> None:
+        """Override the cascade for one skill (e.g. pin to a single model)."""
+        self._table[skill] = tuple(models)
+
+    def _record(self, skill: str, model: str, outcome: str, latency: float) -> None:
+        with self._lock:
+            s = self._stats.setdefault((skill, model), _empty_stats())
+            s["calls"] += 1
+            s[outcome] += 1
+            s["latency"] += latency
+
+    def stats(self) -> dict[str, dict[str, dict]]:
+        """{skill: {model: {calls, accepted, rejected, errors, avg_latency}}}."""
+        out: dict[str, dict[str, dict]] = {}
+        with self._lock:
+            for (skill, model), s in self._stats.items():
+                entry = {k: s[k] for k in ("calls", "accepted", "rejected", "errors")}
+                entry["avg_latency"] = s["latency"] / s["calls"] if s["calls"] else 0.0
+                out.setdefault(skill, {})[model] = entry
+        return out
+
+    def complete(self, client, prompt: str, *, skill: str,
+                 accept: Optional[Callable[[str], bool]] = None,
+                 call: Optional[Callable[..., str]] = None, **kwargs) -> str:
+        """Run the skill's cascade and return the first accepted output.
+
+        `call` defaults to llm_client.call_llm; callers pass their own
+        module-level reference so test patches keep working. If every
+        model's output is rejected, the last output is returned for the
+        caller's own fallback handling; if the last model errors, its
+        exception propagates.
+        """
+        call = call or llm_client.call_llm
+        models = self.models_for(skill)
+        raw = ""
+        for i, model in enumerate(models):
+            last = i == len(models) - 1
+            start = time.monotonic()
+            try:
+                raw = call(client, prompt, model=model, skill=skill, **kwargs)
+            except (anthropic.APIError, anthropic.APIConnectionError):
+                self._record(skill, model, "errors", time.monotonic() - start)
+                if last:
+                    raise
+                logger.warning("%s failed on %s — escalating", skill, model)
+                continue
+            latency = time.monotonic() - start
+            if accept is None or accept(raw):
+                self._record(skill, model, "accepted", latency)
+                return raw
+            self._record(skill, model, "rejected", latency)
+            if not last:
+                logger.info("%s output rejected on %s — escalating", skill, model)
+        return raw
+
+
+router = ModelRouter()
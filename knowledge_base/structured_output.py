@@ -0,0 +1,186 @@
+"""Schema-constrained LLM output — validating decoder with cheap repair.
+
+Building Block: decode / complete_structured
+    Input Data:  raw LLM text (tool-call JSON or prose with embedded JSON), JSON Schema
+    Output Data: (decoded value or None, list of remaining schema errors)
+    Setup Data:  schemas from the helpers (referee ones derive from
+                 q21_referee.callback_json_schema)
+
+call_llm(..., schema=S) forces the model to answer through a tool whose
+input_schema is S and returns that tool input as JSON text, so parsing
+rarely fails. decode() still accepts prose-wrapped JSON (older prompts,
+test doubles) and applies local repairs before validating: numeric
+strings → numbers, case/whitespace-insensitive enum matches, overlong
+strings and arrays trimmed. complete_structured() spends one retry, with
+the validation errors fed back, only when repair was not enough.
+
+Only the JSON Schema subset the game schemas use is supported: type,
+properties, required, items, enum, minimum/maximum, minLength/maxLength,
+minItems/maxItems.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any, Callable, Optional
+
+import anthropic
+
+from knowledge_base import llm_client
+
+logger = logging.getLogger(__name__)
+
+_JSON_TYPES = {
+    "object": dict, "array": list, "string": str,
+    "integer": int, "number": (int, float), "boolean": bool,
+}
+
+
+# ── Extraction ──────────────────────────────────────────────
+
+
+def extract_json(raw: str) -> Any:
+    """Parse `raw` as JSON, else the outermost {...} or [...] inside it; None if neither."""
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        pass
+    patterns = [r'\{[\s\S]*\}', r'\[[\s\S]*\]']
+    if 0 <= raw.find("[") < raw.find("{") or "{" not in raw:
+        patterns.reverse()  # outermost bracket comes first
+    for pattern in patterns:
+        match = re.search(pattern, raw)
+        if match:
+            try:
+                return json.loads(match.group())
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+# ── Validation ──────────────────────────────────────────────
+
+
+def _type_ok(value: Any, kind: Any) -> bool:
+    kinds = kind if isinstance(kind, list) else [kind]
+    for k in kinds:
+        expected = _JSON_TYPES[k]
+        if isinstance(value, bool) and k in ("integer", "number"):
+            continue
+        if isinstance(value, expected):
+            return True
+    return False
+
+
+def validate(value: Any, schema: dict, path: str = "$") -> list[str]:
+    """Schema errors for `value` (empty when valid)."""
+    kind = schema.get("type")
+    if kind and not _type_ok(value, kind):
+        return [f"{path}: expected {kind}, got {type(value).__name__}"]
+    errors: list[str] = []
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} not in {schema['enum']}")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            errors.append(f"{path}: {value} < {schema['minimum']}")
+        if "maximum" in schema and value > schema["maximum"]:
+            errors.append(f"{path}: {value} > {schema['maximum']}")
+    if isinstance(value, str):
+        if len(value) < schema.get("minLength", 0):
+            errors.append(f"{path}: shorter than {schema['minLength']}")
+        if len(value) > schema.get("maxLength", float("inf")):
+            errors.append(f"{path}: longer than {schema['maxLength']}")
+    if isinstance(value, list):
+        if len(value) < schema.get("minItems", 0):
+            errors.append(f"{path}: fewer than {schema['minItems']} items")
+        if len(value) > schema.get("maxItems", float("inf")):
+            errors.append(f"{path}: more than {schema['maxItems']} items")
+        if "items" in schema:
+            for i, item in enumerate(value):
+                errors.extend(validate(item, schema["items"], f"{path}[{i}]"))
+    if isinstance(value, dict):
+        for field in schema.get("required", []):
+            if field not in value:
+                errors.append(f"{path}: missing '{field}'")
+        for field, sub in schema.get("properties", {}).items():
+            if field in value:
+                errors.extend(validate(value[field], sub, f"{path}.{field}"))
+    return errors
+
+
+# ── Repair ──────────────────────────────────────────────────
+
+
+def repair(value: Any, schema: dict) -> Any:
+    """Apply cheap, meaning-preserving fixes; returns a new value."""
+    kind = schema.get("type")
+    kinds = kind if isinstance(kind, list) else [kind]
+
+    if isinstance(value, str) and ("integer" in kinds or "number" in kinds):
+        try:
+            number = float(value.strip())
+            value = int(number) if "integer" in kinds and number.is_integer() else number
+        except ValueError:
+            pass
+    if isinstance(value, float) and kinds == ["integer"] and value.is_integer():
+        value = int(value)
+    if isinstance(value, str) and "enum" in schema and value not in schema["enum"]:
+        lookup = {str(e).strip().lower(): e for e in schema["enum"]}
+        value = lookup.get(value.strip().lower(), value)
+    if isinstance(value, str) and "maxLength" in schema and len(value) > schema["maxLength"]:
+        cut = value[:schema["maxLength"]]
+        value = cut.rsplit(" ", 1)[0] if " " in cut else cut
+    if isinstance(value, list):
+        if "maxItems" in schema:
+            value = value[:schema["maxItems"]]
+        if "items" in schema:
+            value = [repair(item, schema["items"]) for item in value]
+    if isinstance(value, dict) and "properties" in schema:
+        value = {k: repair(v, schema["properties"][k]) if k in schema["properties"] else v
+                 for k, v in value.items()}
+    return value
+
+
+def decode(raw: str, schema: dict) -> tuple[Any, list[str]]:
+    """Extract, repair and validate. Returns (value or None, errors)."""
+    value = extract_json(raw)
+    if value is None:
+        return None, ["$: no JSON found"]
+    # A bare array answered for an {"items": [...]} wrapper, or vice versa
+    if schema.get("type") == "array" and isinstance(value, dict) and isinstance(value.get("items"), list):
+        value = value["items"]
+    value = repair(value, schema)
+    return value, validate(value, schema)
+
+
+# ── Completion with one informed retry ──────────────────────
+
+
+def complete_structured(client, prompt: str, schema: dict, *,
+                        call: Optional[Callable[..., str]] = None,
+                        retries: int = 1, **kwargs) -> tuple[Any, list[str]]:
+    """Ask for schema-constrained output; retry with the errors if repair fails.
+
+    `call` defaults to llm_client.call_llm (callers pass their own
+    reference so patches apply). API errors on the *first* attempt
+    propagate; on a retry they keep the best earlier decode.
+    """
+    call = call or llm_client.call_llm
+    value, errors = decode(call(client, prompt, schema=schema, **kwargs), schema)
+    for _ in range(retries):
+        if not errors:
+            break
+        logger.info("Structured output invalid (%s) — retrying", "; ".join(errors[:3]))
+        feedback = (f"{prompt}\n\nYour previous output was invalid: "
+                    f"{'; '.join(errors[:10])}. Respond again, matching the schema exactly.")
+        try:
+            retry_value, retry_errors = decode(call(client, feedback, schema=schema, **kwargs), schema)
+        except (anthropic.APIError, anthropic.APIConnectionError):
+            break
+        if retry_value is not None and (value is None or len(retry_errors) <= len(errors)):
+            value, errors = retry_value, retry_errors
+    return value, errors
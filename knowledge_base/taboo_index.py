@@ -0,0 +1,83 @@
+"""Taboo-word index — forbidden word forms per paragraph, built once.
+
+Building Block: TabooIndex
+    Input Data:  paragraph text, candidate hint text
+    Output Data: frozenset of forbidden forms per paragraph; hint words that
+                 hit it
+    Setup Data:  HEBREW_PREFIXES, MIN_STEM
+
+A hint must not reuse the paragraph's words. Hebrew attaches clitic
+prefixes (ה ו ב ל מ ש כ) to words, so "ורשתות" and "הרשתות" are the same
+word to a reader but not to a string compare. Each word therefore also
+contributes its forms with up to three leading prefix letters removed
+(while at least MIN_STEM letters remain), and a hint word is taboo when
+any of its forms is in the paragraph's set. The set is built once per
+paragraph text; checking a hint is a few set lookups per hint word.
+"""
+
+import re
+import threading
+
+HEBREW_PREFIXES = frozenset("הובלמשכ")
+MAX_PREFIXES = 3
+MIN_STEM = 3
+
+_PUNCT = re.compile(r"[^\w\s]")
+
+
+def extract_words(text: str) -> set[str]:
+    """Normalized word set: punctuation dropped, lowercased, 2+ characters."""
+    return {w for w in _PUNCT.sub("", text).lower().split() if len(w) > 1}
+
+
+def word_forms(word: str) -> list[str]:
+    """The word plus its Hebrew prefix-stripped forms."""
+    forms = [word]
+    for _ in range(MAX_PREFIXES):
+        if word[0] not in HEBREW_PREFIXES or len(word) - 1 < MIN_STEM:
+            break
+        word = word[1:]
+        forms.append(word)
+    return forms
+
+
+class TabooIndex:
+    """Paragraph text → forbidden forms, cached for the process lifetime."""
+
+    def __init__(self):
+        self._forms: dict[str, frozenset[str]] = {}
+        self._samples: dict[tuple[str, int], tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def forbidden(self, text: str) -> frozenset[str]:
+        forms = self._forms.get(text)
+        if forms is None:
+            forms = frozenset(f for w in extract_words(text) for f in word_forms(w))
+            with self._lock:
+                self._forms[text] = forms
+        return forms
+
+    def build(self, texts) -> None:
+        """Precompute the sets for many paragraphs (e.g. at startup)."""
+        for text in texts:
+            self.forbidden(text)
+
+    def check(self, hint: str, text: str) -> set[str]:
+        """Hint words (surface form) whose forms appear in the paragraph."""
+        forbidden = self.forbidden(text)
+        return {w for w in extract_words(hint)
+                if any(f in forbidden for f in word_forms(w))}
+
+    def sample(self, text: str, limit: int = 60) -> tuple[str, int]:
+        """(comma-joined first ``limit`` sorted words, total word count) for prompts."""
+        key = (text, limit)
+        cached = self._samples.get(key)
+        if cached is None:
+            words = sorted(extract_words(text))
+            cached = (", ".join(words[:limit]), len(words))
+            with self._lock:
+                self._samples[key] = cached
+        return cached
+
+
+taboo_index = TabooIndex()
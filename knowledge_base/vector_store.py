@@ -95,19 +95,19 @@ class VectorStore:
         self._collection = col
         print(f"ChromaDB built with {len(paragraphs)} vectors")
 
-    def _format_results(self, results: dict) -> list[dict]:
-        """Convert ChromaDB query results to flat list of dicts."""
+    def _format_results(self, results: dict, query: int = 0) -> list[dict]:
+        """Convert ChromaDB query results (of the query-th query) to flat list of dicts."""
         out = []
-        if not results["ids"] or not results["ids"][0]:
+        if not results["ids"] or not results["ids"][query]:
             return out
-        for idx in range(len(results["ids"][0])):
+        for idx in range(len(results["ids"][query])):
             entry = {
-                "id": results["ids"][0][idx],
-                "text": results["documents"][0][idx],
-                "distance": results["distances"][0][idx],
+                "id": results["ids"][query][idx],
+                "text": results["documents"][query][idx],
+                "distance": results["distances"][query][idx],
             }
-            if results["metadatas"] and results["metadatas"][0]:
-                entry.update(results["metadatas"][0][idx])
+            if results["metadatas"] and results["metadatas"][query]:
+                entry.update(results["metadatas"][query][idx])
             out.append(entry)
         return out
 
@@ -129,6 +129,24 @@ class VectorStore:
         )
         return self._format_results(results)
 
+    def search_by_pdf_batch(
+        self, queries: list[str], pdf_name: str, n_results: int = 10
+    ) -> list[list[dict]]:
+        """search_by_pdf for several queries with one embedding batch and index query."""
+        if not queries:
+            return []
+        col = self._get_collection()
+        results = col.query(
+            query_texts=list(queries),
+            n_results=n_results,
+            where={"pdf_name": pdf_name},
+        )
+        return [self._format_results(results, i) for i in range(len(queries))]
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with the index's model (no collection access)."""
+        return [list(v) for v in self._ef(texts)]
+
     def count(self) -> int:
         return self._get_collection().count()
 
@@ -0,0 +1,161 @@
+"""Tests for knowledge_base.circuit_breaker and the local LLM fallbacks."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import anthropic
+import pytest
+
+from knowledge_base.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, breaker_for,
+)
+from knowledge_base.llm_client import call_llm
+
+for _d in ("Q21G-player-whl", "Q21G-referee-whl/examples"):
+    sys.path.insert(0, str(Path(__file__).parent.parent / _d))
+
+
+@pytest.fixture
+def clock():
+    return [0.0]
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(window=10, min_calls=4, bad_rate=0.5,
+                          slow_seconds=5.0, cooldown=30.0, clock=lambda: clock[0])
+
+
+def _timeout():
+    return anthropic.APITimeoutError(request=MagicMock())
+
+
+# ── State machine ──
+
+
+def test_trips_on_error_rate(breaker):
+    for _ in range(2):
+        breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_trips_on_latency(breaker):
+    for _ in range(4):
+        breaker.record_success(9.0)
+    assert breaker.state == OPEN
+
+
+def test_half_open_allows_single_probe(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock[0] = 31.0
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # probe already in flight
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_failed_probe_reopens(breaker, clock):
+    for _ in range(4):
+        breaker.record_failure()
+    clock[0] = 31.0
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.retry_in() == pytest.approx(30.0)
+
+
+# ── call_llm integration ──
+
+
+def _client(side_effect):
+    client = MagicMock(spec=anthropic.Anthropic)
+    client.with_options.return_value = client
+    client.messages.create.side_effect = side_effect
+    return client
+
+
+@patch("knowledge_base.llm_client.time.sleep")
+def test_call_llm_fails_fast_once_open(mock_sleep):
+    client = _client(_timeout())
+    for _ in range(2):  # trips after 5 failures, mid-retry of the 2nd call
+        with pytest.raises(anthropic.APIConnectionError):
+            call_llm(client, "p")
+    assert breaker_for(client).state == OPEN
+    calls_before = client.messages.create.call_count
+    with pytest.raises(CircuitOpenError):
+        call_llm(client, "p")
+    assert client.messages.create.call_count == calls_before
+
+
+def test_breakers_are_per_client():
+    assert breaker_for(MagicMock()) is not breaker_for(MagicMock())
+
+
+def test_circuit_open_error_hits_existing_fallbacks():
+    assert issubclass(CircuitOpenError, anthropic.APIConnectionError)
+
+
+# ── Local fallbacks ──
+
+
+def test_answer_questions_answers_lexically_when_llm_down():
+    from referee_helpers import answer_questions
+    questions = [
+        {"question_number": 1, "question_text": "Which term?",
+         "options": {"A": "gradient", "B": "river", "C": "poetry", "D": "music"}},
+        {"question_number": 2, "question_text": "Is it?",
+         "options": {"A": "Yes", "B": "No", "C": "Partially", "D": "Not applicable"}},
+    ]
+    with patch("referee_helpers.call_llm", side_effect=CircuitOpenError(10)):
+        result = answer_questions(None, "The gradient descent update rule.", questions)
+    assert [a["answer"] for a in result] == ["A", "Not Relevant"]
+
+
+def test_local_questions_use_distinctive_candidate_terms():
+    from player_helpers import local_questions
+    cands = [{"full_text": "gradient descent optimizes neural weights"},
+             {"full_text": "river basins shape regional climate"},
+             {"full_text": "sonnet meter defines classical poetry"}]
+    questions = local_questions(cands, "hint")
+    assert len(questions) == 20
+    first = questions[0]["options"]
+    assert {"gradient", "river", "sonnet"} <= set(first.values())
+    assert [q["question_number"] for q in questions] == list(range(1, 21))
+
+
+def test_generate_questions_falls_back_locally():
+    from player_helpers import generate_questions
+    cands = [{"full_text": "gradient descent optimizes"},
+             {"full_text": "river basins shape climate"}]
+    with patch("player_helpers.call_llm", side_effect=CircuitOpenError(10)):
+        questions = generate_questions(None, cands, "book", "hint", "word")
+    assert questions[0]["question_text"] == "Which of these terms does the paragraph use?"
+
+
+def test_local_rank_follows_answered_options():
+    from player_guess import local_rank
+    cands = [{"full_text": "river basins"}, {"full_text": "gradient descent"}]
+    sent = [{"question_number": 1, "options": {"A": "river", "B": "gradient"}}]
+    assert local_rank(cands, sent, [{"question_number": 1, "answer": "B"}]) == 1
+    assert local_rank(cands, sent, [{"question_number": 1, "answer": "Not Relevant"}]) == 0
+
+
+def test_score_guess_scores_locally_when_llm_down():
+    from referee_scoring import score_guess
+    guess = {"opening_sentence": "Gradient descent updates weights.",
+             "sentence_justification": "Q1(A) Q2(B) Q3(A) gradient weights",
+             "associative_word": "gradient",
+             "word_justification": "Q4(A) Q5(B) gradient",
+             "confidence": 0.8}
+    with patch("referee_helpers.call_llm", side_effect=CircuitOpenError(10)):
+        result = score_guess(None, "Gradient descent updates weights.", "gradient",
+                             "Gradient descent updates weights iteratively.", guess)
+    assert result["league_points"] == 3
+    assert "100%" in result["feedback"]["opening_sentence"]
@@ -0,0 +1,114 @@
+"""Tests for knowledge_base.deadline — budget propagation into call_llm."""
+
+from unittest.mock import MagicMock, patch
+
+import anthropic
+import pytest
+
+from knowledge_base.deadline import (
+    Deadline, current_deadline, deadline_from_ctx, deadline_scope, time_left,
+)
+from knowledge_base.llm_client import DeadlineExceededError, call_llm, call_llm_batch
+
+
+def _mock_client(text="ok"):
+    block = MagicMock()
+    block.text = text
+    resp = MagicMock()
+    resp.content = [block]
+    client = MagicMock(spec=anthropic.Anthropic)
+    client.with_options.return_value = client
+    client.messages.create.return_value = resp
+    return client
+
+
+# ── Deadline primitives ──
+
+
+def test_deadline_reserves_margin():
+    now = [100.0]
+    d = Deadline(60, margin=5, clock=lambda: now[0])
+    assert d.remaining() == 55
+    now[0] += 50
+    assert d.remaining() == 5
+    assert d.clamp(30) == 5
+    now[0] += 10
+    assert d.expired()
+
+
+def test_no_scope_means_no_deadline():
+    assert current_deadline() is None
+    assert time_left() == float("inf")
+
+
+def test_nested_scope_never_extends_outer():
+    with deadline_scope(20, margin=0) as outer:
+        with deadline_scope(120, margin=0) as inner:
+            assert inner is outer
+        with deadline_scope(5, margin=0) as tighter:
+            assert tighter.remaining() <= 5
+    assert current_deadline() is None
+
+
+def test_cancelled_deadline_has_no_time_left():
+    flag = {"cancelled": False}
+    ctx = {"service": {"deadline_seconds": 60}}
+    with deadline_from_ctx(ctx, margin=0, cancelled=lambda: flag["cancelled"]) as d:
+        assert time_left() > 50
+        flag["cancelled"] = True
+        assert d.expired() and time_left() == 0.0
+        with pytest.raises(DeadlineExceededError):
+            call_llm(_mock_client(), "hi", retries=0)
+
+
+def test_deadline_from_ctx_reads_service():
+    ctx = {"dynamic": {}, "service": {"deadline_seconds": 60}}
+    with deadline_from_ctx(ctx, margin=5) as d:
+        assert 54 < d.remaining() <= 55
+    with deadline_from_ctx({"service": {}}) as d:
+        assert d is None
+    with deadline_from_ctx({}, default_seconds=30, margin=0) as d:
+        assert 29 < d.remaining() <= 30
+
+
+# ── call_llm integration ──
+
+
+def test_call_llm_timeout_clamped_to_budget():
+    client = _mock_client()
+    with deadline_scope(20, margin=0):
+        call_llm(client, "prompt", timeout=90.0)
+    timeout = client.with_options.call_args.kwargs["timeout"]
+    assert timeout <= 20
+
+
+def test_call_llm_skips_call_when_budget_spent():
+    client = _mock_client()
+    with deadline_scope(1, margin=0):
+        with pytest.raises(DeadlineExceededError):
+            call_llm(client, "prompt")
+    client.messages.create.assert_not_called()
+
+
+def test_deadline_error_caught_by_existing_fallbacks():
+    assert issubclass(DeadlineExceededError, anthropic.APIError)
+    assert issubclass(DeadlineExceededError, anthropic.APIConnectionError)
+
+
+@patch("knowledge_base.llm_client.time.sleep")
+def test_call_llm_no_retry_when_backoff_overruns(mock_sleep):
+    client = _mock_client()
+    client.messages.create.side_effect = anthropic.APITimeoutError(request=MagicMock())
+    with deadline_scope(3.5, margin=0):
+        with pytest.raises(anthropic.APITimeoutError):
+            call_llm(client, "prompt", retries=2)
+    assert client.messages.create.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_call_llm_batch_threads_inherit_deadline():
+    client = _mock_client()
+    with deadline_scope(1, margin=0):
+        results = call_llm_batch(client, ["a", "b"], max_workers=2)
+    assert results == ["", ""]
+    client.messages.create.assert_not_called()
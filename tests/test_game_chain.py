@@ -51,7 +51,7 @@ def test_full_game_chain(referee, player):
             "service": {},
         })
     assert "book_name" in round_info
-    assert referee._paragraph_text is not None
+    assert referee._game().paragraph_text is not None
 
     with patch("player_helpers.call_llm", side_effect=lambda c, p, **kw: _route_llm_call(p)):
         questions_result = player.get_questions({
@@ -30,9 +30,9 @@ def player():
 
 def test_game_with_unknown_book_name(referee, player):
     """Player should still produce a valid guess even if book_name doesn't match."""
-    referee._paragraph_text = "Some unknown paragraph text."
-    referee._opening_sentence = "Some unknown paragraph text."
-    referee._association_word = "mystery"
+    referee._game().paragraph_text = "Some unknown paragraph text."
+    referee._game().opening_sentence = "Some unknown paragraph text."
+    referee._game().association_word = "mystery"
 
     with patch("player_helpers.call_llm", side_effect=lambda c, p, **kw: _route_llm_call(p)):
         questions_result = player.get_questions({
@@ -73,7 +73,7 @@ def test_multiple_rounds_use_different_paragraphs(referee):
                 },
                 "service": {},
             })
-        paragraphs.add(referee._opening_sentence)
+        paragraphs.add(referee._game().opening_sentence)
     assert len(paragraphs) > 1
 
 
@@ -0,0 +1,142 @@
+"""Tests for the offline hint pool (temporary SQLite DB, fake vector store)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from knowledge_base.db import ParagraphDB
+from knowledge_base.hint_pool import (
+    HintPool, build_hint_pool, findability_rank, findability_ranks,
+)
+
+
+def _paragraph(pid, difficulty, words=80):
+    return {"id": pid, "pdf_name": "course.pdf", "paragraph_index": 0,
+            "opening_sentence": f"Opening {pid}.", "text": f"Body of {pid}.",
+            "word_count": words, "difficulty": difficulty}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "paragraphs.db"
+    paragraphs = [_paragraph("p1", 0.5), _paragraph("p2", 0.6),
+                  _paragraph("easy", 0.1), _paragraph("long", 0.5, words=500)]
+    db = ParagraphDB(path)
+    db.create_db(paragraphs)
+    db._conn.execute("ALTER TABLE paragraphs ADD COLUMN difficulty_score REAL")
+    for p in paragraphs:
+        db._conn.execute("UPDATE paragraphs SET difficulty_score = ? WHERE id = ?",
+                         (p["difficulty"], p["id"]))
+    db._conn.commit()
+    db.close()
+    return path
+
+
+class FakeVectorStore:
+    """search_by_pdf returns the ids listed for each hint."""
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def search_by_pdf(self, query, pdf_name, n_results=10):
+        return [{"id": pid} for pid in self.hits.get(query, [])][:n_results]
+
+    def search_by_pdf_batch(self, queries, pdf_name, n_results=10):
+        self.batches = getattr(self, "batches", 0) + 1
+        return [self.search_by_pdf(q, pdf_name, n_results) for q in queries]
+
+
+def _generate(paragraph):
+    pid = paragraph["id"]
+    return {"book_hint": f"hint {pid}", "association_word": "river",
+            "association_domain": "nature"}
+
+
+def test_findability_rank_is_one_based_position():
+    vs = FakeVectorStore({"h": ["x", "p1"]})
+    assert findability_rank(vs, "h", {"id": "p1", "pdf_name": "a"}) == 2
+    assert findability_rank(vs, "h", {"id": "p9", "pdf_name": "a"}) is None
+
+
+def test_findability_ranks_uses_one_batched_search():
+    vs = FakeVectorStore({"a": ["p1"], "b": ["x", "y", "p1"], "c": ["x"]})
+    assert findability_ranks(vs, ["a", "b", "c"], {"id": "p1", "pdf_name": "a"}) == [1, 3, None]
+    assert vs.batches == 1
+
+
+def test_build_pools_only_findable_medium_paragraphs(db_path):
+    vs = FakeVectorStore({"hint p1": ["p1"], "hint p2": ["p9"]})  # p2 not findable
+    assert build_hint_pool(_generate, db_path=db_path, vs=vs, max_workers=2) == 1
+
+    pool = HintPool(db_path)
+    assert pool.pooled_paragraph_ids() == {"p1"}
+    pool.close()
+
+
+def test_build_skips_already_pooled_and_rejected(db_path):
+    vs = FakeVectorStore({"hint p1": ["p1"], "hint p2": ["x", "p2"]})
+    build_hint_pool(_generate, db_path=db_path, vs=vs)
+    calls = []
+    assert build_hint_pool(lambda p: calls.append(p["id"]), db_path=db_path, vs=vs) == 0
+    assert calls == []
+
+
+def test_take_prefers_rank_nearest_three_then_exhausts(db_path):
+    vs = FakeVectorStore({"hint p1": ["x", "p1"], "hint p2": ["p2"]})
+    build_hint_pool(_generate, db_path=db_path, vs=vs)
+    pool = HintPool(db_path)
+
+    first = pool.take()
+    assert first["id"] == "p1" and first["findability_rank"] == 2
+    assert first["book_hint"] == "hint p1" and first["full_text"] == "Body of p1."
+    assert pool.take()["id"] == "p2"
+    assert pool.take() is None and pool.remaining() == 0
+    pool.close()
+
+
+def test_take_order_nearest_three_better_rank_on_ties(db_path):
+    pool = HintPool(db_path)
+    for rank in (1, 5, None, 4, 2, 3):
+        pool.add("p1", {"book_hint": f"r{rank}", "association_word": "w",
+                        "association_domain": "d"}, rank)
+    assert [pool.take()["findability_rank"] for _ in range(6)] == [3, 2, 4, 1, 5, None]
+    pool.close()
+
+
+def test_build_pools_candidate_nearest_three(db_path):
+    def candidates(paragraph):
+        return [{"book_hint": f"{paragraph['id']} {n}", "association_word": "w",
+                 "association_domain": "d"} for n in ("a", "b", "c")]
+    vs = FakeVectorStore({"p1 a": ["p1"], "p1 b": ["x", "y", "z", "p1"], "p1 c": ["x"],
+                          "p2 a": ["x"], "p2 b": ["x"], "p2 c": ["x"]})
+    assert build_hint_pool(candidates, db_path=db_path, vs=vs) == 1
+
+    pool = HintPool(db_path)
+    taken = pool.take()
+    assert taken["book_hint"] == "p1 b" and taken["findability_rank"] == 4
+    pool.close()
+
+
+def test_take_from_many_threads_hands_out_each_hint_once(db_path):
+    pool = HintPool(db_path)
+    for n in range(20):
+        pool.add("p1", {"book_hint": f"h{n}", "association_word": "w",
+                        "association_domain": "d"}, n % 5 + 1)
+    other = HintPool(db_path)  # a second connection competes for the same rows
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        taken = list(ex.map(lambda i: (pool if i % 2 else other).take(), range(24)))
+
+    hints = [t["book_hint"] for t in taken if t]
+    assert sorted(hints) == sorted(f"h{n}" for n in range(20))
+    assert pool.remaining() == 0
+    pool.close()
+    other.close()
+
+
+def test_paragraph_db_is_usable_from_other_threads(db_path):
+    db = ParagraphDB(db_path)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        counts = list(ex.map(lambda _: db.count(), range(8)))
+    assert counts == [4] * 8
+    db.close()
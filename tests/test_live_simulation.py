@@ -62,8 +62,8 @@ def test_live_full_game(referee, player):
     print(f"  book_name: {round_info['book_name']}")
     print(f"  book_hint: {round_info['book_hint']}")
     print(f"  association_word: {round_info['association_word']}")
-    print(f"  [SECRET] opening_sentence: {referee._opening_sentence[:80]}...")
-    print(f"  [SECRET] association_word: {referee._association_word}")
+    print(f"  [SECRET] opening_sentence: {referee._game().opening_sentence[:80]}...")
+    print(f"  [SECRET] association_word: {referee._game().association_word}")
 
     assert round_info["book_name"]
     assert round_info["book_hint"]
@@ -147,9 +147,9 @@ def test_live_full_game(referee, player):
     # Compare guess vs actual
     print(f"\n{'='*60}")
     print("COMPARISON:")
-    print(f"  Actual sentence: {referee._opening_sentence[:80]}...")
+    print(f"  Actual sentence: {referee._game().opening_sentence[:80]}...")
     print(f"  Guessed sentence: {guess['opening_sentence'][:80]}...")
-    match = guess["opening_sentence"].strip() == referee._opening_sentence.strip()
+    match = guess["opening_sentence"].strip() == referee._game().opening_sentence.strip()
     print(f"  EXACT MATCH: {'YES' if match else 'NO'}")
 
     assert 0 <= score["league_points"] <= 3
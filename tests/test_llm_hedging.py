@@ -0,0 +1,159 @@
+"""Tests for knowledge_base.llm_hedging — hedged requests against a fake server."""
+
+import itertools
+import threading
+import time
+from unittest.mock import MagicMock
+
+import anthropic
+import pytest
+
+from knowledge_base import llm_client
+from knowledge_base.llm_client import call_llm
+from knowledge_base.llm_hedging import HedgingPolicy
+
+FAST, SLOW = 0.005, 0.4
+
+
+class _FakeServer:
+    """Fake Anthropic client whose latency follows an injected sequence."""
+
+    def __init__(self, latencies):
+        self._latencies = itertools.cycle(latencies)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.messages = self
+
+    def with_options(self, **kwargs):
+        return self
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+            delay = next(self._latencies)
+        time.sleep(delay)
+        block = MagicMock()
+        block.text = f"resp-{n}"
+        resp = MagicMock()
+        resp.content = [block]
+        return resp
+
+
+@pytest.fixture
+def policy():
+    p = HedgingPolicy(min_samples=10, default_delay=1.0, default_ratio=0.5, burst=3)
+    llm_client.set_hedging_policy(p)
+    yield p
+    llm_client.set_hedging_policy(None)
+    p.shutdown()
+
+
+def _timed(fn):
+    start = time.monotonic()
+    fn()
+    return time.monotonic() - start
+
+
+# ── Latency window ──
+
+
+def test_hedge_delay_defaults_until_enough_samples():
+    p = HedgingPolicy(min_samples=5, default_delay=7.0)
+    for _ in range(4):
+        p.record("s", 0.1)
+    assert p.hedge_delay("s") == 7.0
+    p.record("s", 0.1)
+    assert p.hedge_delay("s") == pytest.approx(0.1)
+
+
+def test_hedge_delay_is_rolling_p90_per_skill():
+    p = HedgingPolicy(min_samples=1, window=10)
+    for i in range(1, 11):
+        p.record("a", float(i))
+    p.record("b", 0.5)
+    assert p.hedge_delay("a") == 10.0
+    assert p.hedge_delay("b") == 0.5
+    for _ in range(10):  # window rolls over
+        p.record("a", 1.0)
+    assert p.hedge_delay("a") == 1.0
+
+
+# ── Hedging behaviour ──
+
+
+def test_fast_call_is_not_hedged(policy):
+    server = _FakeServer([FAST])
+    assert call_llm(server, "p", skill="s") == "resp-1"
+    assert server.calls == 1
+    assert policy.stats("s")["hedges"] == 0
+
+
+def test_slow_primary_loses_to_hedge(policy):
+    for _ in range(10):
+        policy.record("s", FAST)
+    server = _FakeServer([SLOW, FAST])
+    elapsed = _timed(lambda: call_llm(server, "p", skill="s"))
+    assert elapsed < SLOW / 2
+    assert server.calls == 2
+    stats = policy.stats("s")
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+
+
+def test_failed_hedge_still_returns_primary(policy):
+    for _ in range(10):
+        policy.record("s", FAST)
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) == 2:
+            raise anthropic.APITimeoutError(request=MagicMock())
+        time.sleep(0.05)
+        return "primary"
+
+    assert policy.run("s", fn) == "primary"
+
+
+def test_all_attempts_failing_reraises(policy):
+    policy.default_delay = 0.0
+
+    def fn():
+        raise anthropic.APITimeoutError(request=MagicMock())
+
+    with pytest.raises(anthropic.APITimeoutError):
+        policy.run("s", fn)
+
+
+def test_budget_caps_hedges_per_skill():
+    p = HedgingPolicy(min_samples=1, default_ratio=0.0, budgets={"cheap": 1.0}, burst=1)
+    for skill in ("cheap", "capped"):
+        p.record(skill, FAST)
+    server = _FakeServer([0.05])
+    p.run("capped", lambda: server.create())
+    p.run("cheap", lambda: server.create())
+    assert p.stats("capped")["hedges"] == 0
+    assert p.stats("cheap")["hedges"] == 1
+    p.shutdown()
+
+
+def test_untagged_calls_bypass_policy(policy):
+    server = _FakeServer([FAST])
+    call_llm(server, "p")
+    assert policy.stats("s")["requests"] == 0
+
+
+def test_hedging_cuts_tail_latency_on_injected_distribution(policy):
+    # Every 10th response is slow; hedged calls should never wait it out.
+    latencies = [FAST] * 9 + [SLOW]
+    baseline = _FakeServer(latencies)
+    llm_client.set_hedging_policy(None)
+    unhedged = [_timed(lambda: call_llm(baseline, "p")) for _ in range(20)]
+
+    llm_client.set_hedging_policy(policy)
+    server = _FakeServer(latencies)
+    hedged = [_timed(lambda: call_llm(server, "p", skill="s")) for _ in range(20)]
+
+    assert max(unhedged) >= SLOW
+    assert max(hedged[10:]) < SLOW / 2
+    assert policy.stats("s")["hedges"] <= 3
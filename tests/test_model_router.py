@@ -0,0 +1,111 @@
+"""Tests for knowledge_base.model_router — small-model-first cascade."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import anthropic
+import pytest
+
+from knowledge_base.model_router import LARGE_MODEL, SMALL_MODEL, ModelRouter
+
+for _d in ("Q21G-player-whl", "Q21G-referee-whl/examples"):
+    sys.path.insert(0, str(Path(__file__).parent.parent / _d))
+
+
+def _scripted(outputs):
+    """Fake call_llm returning outputs per model; records models used."""
+    used = []
+
+    def call(client, prompt, **kw):
+        used.append(kw["model"])
+        out = outputs[kw["model"]]
+        if isinstance(out, Exception):
+            raise out
+        return out
+
+    return call, used
+
+
+@pytest.fixture
+def router():
+    return ModelRouter({"cheap": (SMALL_MODEL, LARGE_MODEL)})
+
+
+def test_accepted_small_output_skips_large(router):
+    call, used = _scripted({SMALL_MODEL: "ok", LARGE_MODEL: "big"})
+    assert router.complete(None, "p", skill="cheap", accept=lambda r: r == "ok",
+                           call=call) == "ok"
+    assert used == [SMALL_MODEL]
+
+
+def test_rejected_output_escalates(router):
+    call, used = _scripted({SMALL_MODEL: "bad", LARGE_MODEL: "ok"})
+    assert router.complete(None, "p", skill="cheap", accept=lambda r: r == "ok",
+                           call=call) == "ok"
+    assert used == [SMALL_MODEL, LARGE_MODEL]
+    stats = router.stats()["cheap"]
+    assert stats[SMALL_MODEL]["rejected"] == 1
+    assert stats[LARGE_MODEL]["accepted"] == 1
+
+
+def test_small_model_error_escalates(router):
+    err = anthropic.APITimeoutError(request=MagicMock())
+    call, used = _scripted({SMALL_MODEL: err, LARGE_MODEL: "ok"})
+    assert router.complete(None, "p", skill="cheap", call=call) == "ok"
+    assert router.stats()["cheap"][SMALL_MODEL]["errors"] == 1
+
+
+def test_last_model_error_propagates(router):
+    err = anthropic.APITimeoutError(request=MagicMock())
+    call, _ = _scripted({SMALL_MODEL: err, LARGE_MODEL: err})
+    with pytest.raises(anthropic.APITimeoutError):
+        router.complete(None, "p", skill="cheap", call=call)
+
+
+def test_all_rejected_returns_last_output(router):
+    call, _ = _scripted({SMALL_MODEL: "bad", LARGE_MODEL: "worse"})
+    assert router.complete(None, "p", skill="cheap", accept=lambda r: False,
+                           call=call) == "worse"
+
+
+def test_unrouted_skill_uses_large_model_only(router):
+    call, used = _scripted({LARGE_MODEL: "ok"})
+    router.complete(None, "p", skill="scorer", call=call)
+    assert used == [LARGE_MODEL]
+
+
+# ── Integration with helpers ──
+
+
+def test_answer_questions_escalates_on_incomplete_answers():
+    from referee_helpers import answer_questions
+    questions = [{"question_number": n, "question_text": "q", "options": {}}
+                 for n in (1, 2)]
+    partial = json.dumps([{"question_number": 1, "answer": "A"}])
+    full = json.dumps([{"question_number": 1, "answer": "A"},
+                       {"question_number": 2, "answer": "B"}])
+    call, used = _scripted({SMALL_MODEL: partial, LARGE_MODEL: full})
+    with patch("referee_helpers.call_llm", side_effect=call):
+        result = answer_questions(None, "text", questions)
+    assert [a["answer"] for a in result] == ["A", "B"]
+    assert used == [SMALL_MODEL, LARGE_MODEL]
+
+
+def test_warmup_llm_fallback_low_confidence_escalates():
+    from player_helpers import solve_warmup
+    call, used = _scripted({
+        SMALL_MODEL: '{"answer": 12, "confidence": 0.3}',
+        LARGE_MODEL: '{"answer": 15, "confidence": 0.95}',
+    })
+    with patch("player_helpers.call_llm", side_effect=call):
+        assert solve_warmup("seven plus eight?", client=object()) == "15"
+    assert used == [SMALL_MODEL, LARGE_MODEL]
+
+
+def test_warmup_regex_path_makes_no_llm_call():
+    from player_helpers import solve_warmup
+    with patch("player_helpers.call_llm") as mock_llm:
+        assert solve_warmup("What is 2 + 2?", client=object()) == "4"
+    mock_llm.assert_not_called()
@@ -61,6 +61,21 @@ def test_warmup_callback_returns_dict(ai):
     assert result == {"answer": "7"}
 
 
+def test_warmup_callback_runs_under_warmup_budget(ai):
+    from knowledge_base.deadline import time_left
+    from my_player import WARMUP_BUDGET_SECONDS
+    seen = []
+
+    def solve(question, client=None):
+        seen.append(time_left())
+        return "7"
+
+    ctx = {"dynamic": {"warmup_question": "What is 3 + 4?"}, "service": {}}
+    with patch("my_player.solve_warmup", side_effect=solve):
+        ai.get_warmup_answer(ctx)
+    assert 0 < seen[0] <= WARMUP_BUDGET_SECONDS
+
+
 def test_warmup_extra_whitespace():
     from player_helpers import solve_warmup
     assert solve_warmup("What is  7  +  8 ?") == "15"
@@ -0,0 +1,94 @@
+"""Tests for the referee answer cache and its use in answer_questions."""
+
+import sys
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "Q21G-referee-whl" / "examples"
+sys.path.insert(0, str(EXAMPLES_DIR))
+
+from referee_answer_cache import AnswerCache  # noqa: E402
+
+OPTIONS = {"A": "Biology", "B": "Physics", "C": "History", "D": "Art"}
+
+
+def _q(n, text, options=OPTIONS):
+    return {"question_number": n, "question_text": text, "options": dict(options)}
+
+
+def test_exact_hit_ignores_case_and_punctuation():
+    cache = AnswerCache()
+    cache.store([_q(1, "Is it about science?")], [{"question_number": 1, "answer": "B"}])
+    hits, misses = cache.lookup([_q(7, "is it about SCIENCE"), _q(8, "Other?")])
+    assert hits == {7: "B"}
+    assert [q["question_number"] for q in misses] == [8]
+
+
+def test_shuffled_options_map_to_new_letter():
+    cache = AnswerCache()
+    cache.store([_q(1, "Field?")], [{"question_number": 1, "answer": "B"}])  # Physics
+    shuffled = {"A": "Physics", "B": "Biology", "C": "Art", "D": "History"}
+    hits, _ = cache.lookup([_q(2, "Field?", shuffled)])
+    assert hits == {2: "A"}
+
+
+def test_different_options_never_hit():
+    cache = AnswerCache()
+    cache.store([_q(1, "Field?")], [{"question_number": 1, "answer": "A"}])
+    hits, misses = cache.lookup([_q(2, "Field?", {**OPTIONS, "D": "Music"})])
+    assert hits == {} and len(misses) == 1
+
+
+def test_semantic_match_above_threshold_only():
+    vectors = {"which field is it": [1.0, 0.0], "what field is this": [0.99, 0.05],
+               "who wrote it": [0.0, 1.0]}
+    cache = AnswerCache(embed=lambda texts: [vectors[t] for t in texts], threshold=0.95)
+    cache.store([_q(1, "Which field is it?")], [{"question_number": 1, "answer": "C"}])
+    hits, misses = cache.lookup([_q(2, "What field is this?"), _q(3, "Who wrote it?")])
+    assert hits == {2: "C"}
+    assert [q["question_number"] for q in misses] == [3]
+    assert cache.semantic_hits == 1
+
+
+def test_embedding_runs_outside_the_lock():
+    held = []
+
+    def embed(texts):
+        held.append(cache._lock.locked())
+        return [[1.0, 0.0] for _ in texts]
+
+    cache = AnswerCache(embed=embed)
+    cache.store([_q(1, "Which field is it?")], [{"question_number": 1, "answer": "C"}])
+    hits, _ = cache.lookup([_q(2, "What field is this?")])
+    assert hits == {2: "C"}
+    assert held == [False, False]
+
+
+def test_answer_questions_sends_only_misses_to_llm():
+    from referee_helpers import answer_questions
+    cache = AnswerCache()
+    first = [_q(1, "Q one?"), _q(2, "Q two?")]
+    llm = json.dumps([{"question_number": 1, "answer": "A"},
+                      {"question_number": 2, "answer": "D"}])
+    with patch("referee_helpers.call_llm", return_value=llm):
+        answer_questions(None, "paragraph", first, cache=cache)
+
+    second = [_q(1, "Q two?"), _q(2, "Q three?")]
+    llm = json.dumps([{"question_number": 2, "answer": "B"}])
+    with patch("referee_helpers.call_llm", return_value=llm) as call:
+        result = answer_questions(None, "paragraph", second, cache=cache)
+    prompt = call.call_args.args[1]
+    assert "Q three?" in prompt and "Q two?" not in prompt
+    assert result == [{"question_number": 1, "answer": "D"},
+                      {"question_number": 2, "answer": "B"}]
+
+
+def test_answer_questions_skips_llm_when_all_cached():
+    from referee_helpers import answer_questions
+    cache = AnswerCache()
+    cache.store([_q(1, "Q?")], [{"question_number": 1, "answer": "Not Relevant"}])
+    with patch("referee_helpers.call_llm") as call:
+        result = answer_questions(None, "paragraph", [_q(4, "Q?")], cache=cache)
+    call.assert_not_called()
+    assert result == [{"question_number": 4, "answer": "Not Relevant"}]
@@ -0,0 +1,95 @@
+"""Tests for the hybrid (local embedding + LLM) referee answerer."""
+
+import sys
+import json
+import random
+import zlib
+from pathlib import Path
+from unittest.mock import patch
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "Q21G-referee-whl" / "examples"
+sys.path.insert(0, str(EXAMPLES_DIR))
+
+from referee_answering import HybridAnswerer, split_sentences  # noqa: E402
+
+PARAGRAPH = ("Photosynthesis converts sunlight into chemical energy. "
+             "Chlorophyll absorbs light inside the chloroplast.")
+
+
+def _embed(texts):
+    """Bag-of-words vectors (crc32 buckets) — deterministic stand-in for a model."""
+    vectors = []
+    for text in texts:
+        v = [0.0] * 64
+        for w in text.lower().replace(".", " ").replace("?", " ").split():
+            v[zlib.crc32(w.encode()) % 64] += 1.0
+        vectors.append(v)
+    return vectors
+
+
+CLEAR = {"question_number": 1, "question_text": "Which pigment absorbs light?",
+         "options": {"A": "Chlorophyll inside the chloroplast", "B": "Hemoglobin in blood",
+                     "C": "Keratin in hair", "D": "Melanin in skin"}}
+YES_NO = {"question_number": 2, "question_text": "Is the paragraph long?",
+          "options": {"A": "Yes", "B": "No", "C": "Maybe", "D": "Unknown"}}
+
+
+def _calibrated(answerer):
+    """Feed the answerer enough agreeing audits to trust its local answers."""
+    answerer.record({n: ("A", 1.0) for n in range(answerer.min_samples)},
+                    {n: "A" for n in range(answerer.min_samples)})
+    return answerer
+
+
+def test_split_sentences():
+    assert split_sentences(PARAGRAPH) == [
+        "Photosynthesis converts sunlight into chemical energy.",
+        "Chlorophyll absorbs light inside the chloroplast."]
+
+
+def test_clear_question_local_ambiguous_to_llm():
+    answerer = _calibrated(HybridAnswerer(_embed, margin=0.1, min_similarity=0.3,
+                                          audit_rate=0.0))
+    local, audit = answerer.split(PARAGRAPH, [CLEAR, YES_NO])
+    assert local == {1: "A"} and audit == {}
+
+
+def test_uncalibrated_answerer_audits_everything():
+    answerer = HybridAnswerer(_embed, margin=0.1, min_similarity=0.3, audit_rate=0.0)
+    local, audit = answerer.split(PARAGRAPH, [CLEAR, YES_NO])
+    assert local == {} and list(audit) == [1] and audit[1][0] == "A"
+
+
+def test_negated_questions_go_to_llm():
+    answerer = _calibrated(HybridAnswerer(_embed, margin=0.1, min_similarity=0.3,
+                                          audit_rate=0.0))
+    negated = dict(CLEAR, question_text="Which pigment does NOT absorb light?")
+    hebrew = dict(CLEAR, question_number=3, question_text="איזה פיגמנט אינו בולע אור?")
+    assert answerer.split(PARAGRAPH, [negated, hebrew]) == ({}, {})
+
+
+def test_answer_questions_sends_only_ambiguous_questions():
+    from referee_helpers import answer_questions
+    answerer = _calibrated(HybridAnswerer(_embed, margin=0.1, min_similarity=0.3,
+                                          audit_rate=0.0))
+    raw = json.dumps([{"question_number": 2, "answer": "B"}])
+    with patch("referee_helpers.call_llm", return_value=raw) as mock:
+        answers = answer_questions(None, PARAGRAPH, [CLEAR, YES_NO], answerer=answerer)
+    prompt = mock.call_args[0][1]
+    assert answers == [{"question_number": 1, "answer": "A"},
+                       {"question_number": 2, "answer": "B"}]
+    assert "Q2:" in prompt and "Q1:" not in prompt
+
+
+def test_audited_answers_track_agreement():
+    from referee_helpers import answer_questions
+    answerer = HybridAnswerer(_embed, margin=0.1, min_similarity=0.3, audit_rate=1.0,
+                              rng=random.Random(0))
+    raw = json.dumps([{"question_number": 1, "answer": "A"}])
+    for _ in range(3):
+        with patch("referee_helpers.call_llm", return_value=raw):
+            answer_questions(None, PARAGRAPH, [CLEAR], answerer=answerer)
+    stats = answerer.agreement()
+    assert stats["samples"] == 3 and stats["agreement"] == 1.0
+    assert answerer.calibrated_margin(target=0.9, min_samples=3) is not None
+    assert answerer.calibrated_margin(target=0.9, min_samples=4) is None
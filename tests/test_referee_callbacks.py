@@ -61,9 +61,9 @@ def test_round_start_selects_paragraph(ai):
         assert "book_name" in result
         assert "book_hint" in result
         assert "association_word" in result
-        assert ai._paragraph_text is not None
-        assert ai._opening_sentence is not None
-        assert ai._association_word == "gradient"
+        assert ai._game().paragraph_text is not None
+        assert ai._game().opening_sentence is not None
+        assert ai._game().association_word == "gradient"
 
 
 def test_round_start_medium_difficulty(ai):
@@ -77,7 +77,7 @@ def test_round_start_medium_difficulty(ai):
             "service": {},
         }
         ai.get_round_start_info(ctx)
-        wc = len(ai._paragraph_text.split())
+        wc = len(ai._game().paragraph_text.split())
         assert wc >= 30
 
 
@@ -85,7 +85,7 @@ def test_round_start_medium_difficulty(ai):
 
 
 def test_answers_returns_20(ai):
-    ai._paragraph_text = "This is a test paragraph about machine learning."
+    ai._game().paragraph_text = "This is a test paragraph about machine learning."
     questions = [
         {"question_number": i, "question_text": f"Q{i}?",
          "options": {"A": "Yes", "B": "No", "C": "Maybe", "D": "N/A"}}
@@ -103,7 +103,7 @@ def test_answers_returns_20(ai):
 
 def test_answers_fallback_when_no_paragraph(ai):
     """When no paragraph stored, return Not Relevant for all."""
-    ai._paragraph_text = None
+    ai._game().paragraph_text = None
     questions = [
         {"question_number": i, "question_text": f"Q{i}?",
          "options": {"A": "Y", "B": "N", "C": "M", "D": "X"}}
@@ -135,4 +135,42 @@ def test_round_start_returns_domain_not_secret(ai):
         }
         result = ai.get_round_start_info(ctx)
     assert result["association_word"] == "mathematics"
-    assert ai._association_word == "gradient"
+    assert ai._game().association_word == "gradient"
+
+
+# ── Concurrent matches ──
+
+
+def test_interleaved_matches_keep_their_own_paragraph(ai):
+    """A second match's round start must not replace the first match's paragraph."""
+    paragraphs = iter([
+        {"pdf_name": "a.pdf", "full_text": "First paragraph.", "opening_sentence": "First."},
+        {"pdf_name": "b.pdf", "full_text": "Second paragraph.", "opening_sentence": "Second."},
+    ])
+    ai._hint_pool.take = lambda: None
+    ai._db.get_random = lambda **_kw: next(paragraphs)
+    with patch("my_ai.generate_hint_and_word", side_effect=_mock_llm_hint):
+        for match_id in ("M1", "M2"):
+            ai.get_round_start_info({"dynamic": {"match_id": match_id}, "service": {}})
+
+    questions = [{"question_number": 1, "question_text": "Q?",
+                  "options": {"A": "Y", "B": "N", "C": "M", "D": "X"}}]
+    with patch("my_ai.answer_questions", return_value=[]) as answer:
+        ai.get_answers({"dynamic": {"match_id": "M1", "questions": questions}, "service": {}})
+    assert answer.call_args.args[1] == "First paragraph."
+    assert ai._game("M2").opening_sentence == "Second."
+
+
+def test_answers_batch_uses_one_shared_call(ai):
+    ai._game("M1").paragraph_text = "A paragraph."
+    questions = [{"question_number": 1, "question_text": "Q?", "options": {}}]
+    players = [{"player_id": "P1", "questions": questions},
+               {"player_id": "P2", "questions": questions}]
+    answers = {"P1": [{"question_number": 1, "answer": "A"}],
+               "P2": [{"question_number": 1, "answer": "C"}]}
+    with patch("my_ai.answer_questions_batch", return_value=answers) as batch:
+        result = ai.get_answers_batch(
+            {"dynamic": {"match_id": "M1", "players": players}, "service": {}})
+    assert result == {"answers_by_player": answers}
+    assert batch.call_args.args[1] == "A paragraph."
+    assert set(batch.call_args.args[2]) == {"P1", "P2"}
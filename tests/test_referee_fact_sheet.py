@@ -0,0 +1,58 @@
+"""Tests for the referee fact sheet and its use in answering and scoring."""
+
+import sys
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import anthropic
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "Q21G-referee-whl" / "examples"
+sys.path.insert(0, str(EXAMPLES_DIR))
+
+from referee_fact_sheet import build_fact_sheet, render_fact_sheet  # noqa: E402
+
+PARAGRAPH = "Neural networks learn weights. Backpropagation computes gradients."
+SHEET = {"topics": ["neural networks"], "entities": ["backpropagation"],
+         "claims": ["Backpropagation computes gradients."],
+         "sentence_types": ["claim", "definition"]}
+QUESTIONS = [{"question_number": 1, "question_text": "Is it about networks?",
+              "options": {"A": "Yes", "B": "No", "C": "Maybe", "D": "Unknown"}}]
+
+
+def test_build_fact_sheet_adds_local_fields():
+    with patch("referee_helpers.call_llm", return_value=json.dumps(SHEET)):
+        sheet = build_fact_sheet(None, PARAGRAPH, "Neural networks learn weights.")
+    assert sheet["entities"] == ["backpropagation"]
+    assert sheet["word_count"] == 7
+    assert "Opening sentence: Neural networks learn weights." in render_fact_sheet(sheet)
+
+
+def test_build_fact_sheet_none_when_llm_down():
+    err = anthropic.APIConnectionError(request=None)
+    with patch("referee_helpers.call_llm", side_effect=err):
+        assert build_fact_sheet(None, PARAGRAPH) is None
+
+
+def test_answer_prompt_uses_sheet_instead_of_skill():
+    from referee_helpers import answer_questions
+    raw = json.dumps([{"question_number": 1, "answer": "A"}])
+    with patch("referee_helpers.call_llm", return_value=raw) as mock:
+        answers = answer_questions(None, PARAGRAPH, QUESTIONS, fact_sheet=dict(SHEET))
+    prompt = mock.call_args[0][1]
+    assert answers == [{"question_number": 1, "answer": "A"}]
+    assert "FACT SHEET:" in prompt and "Backpropagation computes gradients." in prompt
+    assert "Question Answerer" not in prompt
+    assert "PARAGRAPH TEXT:" not in prompt and PARAGRAPH not in prompt
+
+
+def test_score_prompt_uses_sheet_instead_of_paragraph():
+    from referee_scoring import score_guess
+    guess = {"opening_sentence": "Networks learn.", "sentence_justification": "Q1",
+             "associative_word": "gradient", "word_justification": "Q2", "confidence": 0.5}
+    with patch("referee_helpers.call_llm", return_value="{}") as mock:
+        score_guess(None, "Neural networks learn weights.", "gradient", PARAGRAPH, guess,
+                    fact_sheet=dict(SHEET))
+    prompt = mock.call_args[0][1]
+    assert "PARAGRAPH FACT SHEET:" in prompt
+    assert "PARAGRAPH TEXT:" not in prompt
@@ -68,6 +68,54 @@ def test_hint_retries_on_taboo_overlap():
     assert result["book_hint"] == "computational pattern recognition"
 
 
+class _BatchVectorStore:
+    """search_by_pdf_batch returns the ids listed for each hint."""
+
+    def __init__(self, hits):
+        self.hits = hits
+        self.queries = []
+
+    def search_by_pdf_batch(self, queries, pdf_name, n_results=10):
+        self.queries.append(list(queries))
+        return [[{"id": pid} for pid in self.hits.get(q, [])][:n_results] for q in queries]
+
+
+def _candidates(*hints):
+    return json.dumps({"candidates": [
+        {"book_hint": h, "association_word": "brain", "association_domain": "biology"}
+        for h in hints]})
+
+
+def test_hint_candidates_ranked_in_one_call():
+    """Taboo candidates are dropped; the one nearest the preferred rank wins."""
+    from referee_helpers import generate_hint_and_word
+    paragraph = {"id": "p1", "pdf_name": "a.pdf",
+                 "full_text": "Neural networks learn patterns.", "opening_sentence": "Neural."}
+    vs = _BatchVectorStore({
+        "exact pattern recognition": ["p1"],
+        "broad computational topic": ["x", "y", "p1"],
+        "vague idea": ["x"],
+    })
+    raw = _candidates("neural modeling", "exact pattern recognition",
+                      "broad computational topic", "vague idea")
+    with patch("referee_helpers.call_llm", return_value=raw) as llm:
+        result = generate_hint_and_word(None, paragraph, vs=vs)
+    assert result["book_hint"] == "broad computational topic"
+    assert llm.call_count == 1
+    assert vs.queries == [["exact pattern recognition", "broad computational topic", "vague idea"]]
+
+
+def test_hint_retries_when_no_candidate_is_findable():
+    from referee_helpers import generate_hint_and_word
+    paragraph = {"id": "p1", "pdf_name": "a.pdf",
+                 "full_text": "Neural networks learn patterns.", "opening_sentence": "Neural."}
+    vs = _BatchVectorStore({"specific recognition": ["x", "p1"]})
+    with patch("referee_helpers.call_llm",
+               side_effect=[_candidates("vague idea"), _candidates("specific recognition")]):
+        result = generate_hint_and_word(None, paragraph, vs=vs)
+    assert result["book_hint"] == "specific recognition"
+
+
 # ── Answer parsing edge cases ──
 
 
@@ -101,3 +149,20 @@ def test_answers_all_not_relevant_on_bad_json():
         result = answer_questions(None, "paragraph text", questions)
     assert len(result) == 20
     assert all(a["answer"] == "Not Relevant" for a in result)
+
+
+def test_answers_batch_sends_paragraph_once_for_both_players():
+    from referee_helpers import answer_questions_batch
+    questions = [{"question_number": 1, "question_text": "Q1?",
+                  "options": {"A": "Y", "B": "N", "C": "M", "D": "X"}}]
+    reply = json.dumps({"P1": [{"question_number": 1, "answer": "A"}],
+                        "P2": [{"question_number": 1, "answer": "B"}]})
+    with patch("referee_helpers.call_llm", return_value=reply) as llm:
+        result = answer_questions_batch(None, "unique paragraph text",
+                                        {"P1": questions, "P2": questions})
+    assert llm.call_count == 1
+    prompt = llm.call_args.args[1]
+    assert prompt.count("unique paragraph text") == 1
+    assert "PLAYER P1 QUESTIONS" in prompt and "PLAYER P2 QUESTIONS" in prompt
+    assert result == {"P1": [{"question_number": 1, "answer": "A"}],
+                      "P2": [{"question_number": 1, "answer": "B"}]}
@@ -50,9 +50,9 @@ def _make_llm_score_response(ss, sj, ws, wj):
 
 
 def test_score_feedback_format(ai):
-    ai._opening_sentence = "Test sentence."
-    ai._association_word = "gradient"
-    ai._paragraph_text = "Full paragraph text."
+    ai._game().opening_sentence = "Test sentence."
+    ai._game().association_word = "gradient"
+    ai._game().paragraph_text = "Full paragraph text."
 
     with patch("my_ai.score_guess", side_effect=_mock_score):
         ctx = {
@@ -93,7 +93,7 @@ def test_score_weighted_formula():
     from referee_scoring import score_guess
     raw = _make_llm_score_response(100, 80, 60, 40)
     with patch("referee_helpers.call_llm", return_value=raw):
-        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS)
+        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS, tiered=False)
     expected = round(100 * 0.50 + 80 * 0.20 + 60 * 0.20 + 40 * 0.10, 1)
     assert result["private_score"] == expected  # 82.0
     assert result["league_points"] == 2
@@ -103,7 +103,7 @@ def test_score_perfect_gets_3_points():
     from referee_scoring import score_guess
     raw = _make_llm_score_response(100, 100, 100, 100)
     with patch("referee_helpers.call_llm", return_value=raw):
-        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS)
+        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS, tiered=False)
     assert result["private_score"] == 100.0
     assert result["league_points"] == 3
 
@@ -112,7 +112,7 @@ def test_score_zero_gets_0_points():
     from referee_scoring import score_guess
     raw = _make_llm_score_response(0, 0, 0, 0)
     with patch("referee_helpers.call_llm", return_value=raw):
-        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS)
+        result = score_guess(None, "s", "w", "p", _DUMMY_GUESS, tiered=False)
     assert result["private_score"] == 0.0
     assert result["league_points"] == 0
 
@@ -121,7 +121,8 @@ def test_score_fallback_on_bad_json():
     """When LLM returns garbage, defaults (30/40/20/40) are used."""
     from referee_scoring import score_guess
     with patch("referee_helpers.call_llm", return_value="Sorry I can't help"):
-        result = score_guess(None, "actual sent", "word", "para", _DUMMY_GUESS)
+        result = score_guess(None, "actual sent", "word", "para", _DUMMY_GUESS,
+                             tiered=False)
     expected = round(30 * 0.50 + 40 * 0.20 + 20 * 0.20 + 40 * 0.10, 1)
     assert result["private_score"] == expected  # 31.0
     assert result["league_points"] == 0
@@ -129,14 +130,89 @@ def test_score_fallback_on_bad_json():
     assert "word" in result["feedback"]["associative_word"]
 
 
+# ── Tiered scoring ──
+
+
+_PARAGRAPH = "Gradient descent updates model weights step by step along the gradient."
+
+
+def _guess(sentence, word, sentence_just="Q1(A) Q2(B) Q3(A) gradient weights",
+           word_just="Q4(A) Q5(B) gradient"):
+    return {"opening_sentence": sentence, "sentence_justification": sentence_just,
+            "associative_word": word, "word_justification": word_just, "confidence": 0.7}
+
+
+def _feedback_words(result):
+    return [len(text.split()) for text in result["feedback"].values()]
+
+
+def test_tiered_exact_guess_scored_locally():
+    from referee_scoring import score_guess
+    actual = "Gradient descent updates model weights."
+    with patch("referee_helpers.call_llm") as mock:
+        result = score_guess(None, actual, "gradient", _PARAGRAPH, _guess(actual, "gradient"))
+    mock.assert_not_called()
+    assert result["breakdown"]["opening_sentence_score"] == 98.0
+    assert result["league_points"] == 3
+    assert all(150 <= n <= 200 for n in _feedback_words(result))
+
+
+def _embed_like(similar):
+    """Two-sentence embed stub: parallel vectors if ``similar``, else orthogonal."""
+    return lambda texts: [[1.0, 0.0], [1.0, 0.0] if similar else [0.0, 1.0]]
+
+
+def test_tiered_unrelated_guess_scored_locally():
+    from referee_scoring import score_guess
+    guess = _guess("Photosynthesis happens in leaves.", "biology", "No idea.", "Just a guess.")
+    with patch("referee_helpers.call_llm") as mock:
+        result = score_guess(None, "Gradient descent updates model weights.", "gradient",
+                             _PARAGRAPH, guess, embed=_embed_like(False))
+    mock.assert_not_called()
+    assert result["league_points"] == 0
+    assert all(150 <= n <= 200 for n in _feedback_words(result))
+
+
+@pytest.mark.parametrize("embed", [None, _embed_like(True)])
+def test_tiered_paraphrase_without_shared_words_asks_llm(embed):
+    """A correct paraphrase sharing no word must not be zeroed as unrelated."""
+    from referee_scoring import score_guess
+    actual = "Neural networks learn representations from data."
+    guess = _guess("Deep models acquire internal encodings from examples.", "learning",
+                   "Q1(A) Q2(B) Q3(A) networks data", "Q4(A) Q5(B) learn")
+    paragraph = actual + " Training adjusts weights to reduce the loss."
+    raw = json.dumps({"opening_sentence_score": 85, "sentence_justification_score": 80,
+                      "associative_word_score": 80, "word_justification_score": 80})
+    with patch("referee_helpers.call_llm", return_value=raw) as mock:
+        result = score_guess(None, actual, "learning", paragraph, guess, embed=embed)
+    mock.assert_called_once()
+    assert "opening_sentence_score" in mock.call_args.kwargs["schema"]["properties"]
+    assert result["breakdown"]["opening_sentence_score"] == 85.0
+
+
+def test_tiered_borderline_asks_llm_for_uncertain_components_only():
+    from referee_scoring import score_guess
+    actual = "Gradient descent updates model weights."
+    guess = _guess("Gradient descent changes the weights.", "optimization")
+    raw = json.dumps({"associative_word_score": 90, "sentence_justification_score": 90,
+                      "word_justification_score": 90, "opening_sentence_score": 90})
+    with patch("referee_helpers.call_llm", return_value=raw) as mock:
+        result = score_guess(None, actual, "gradient", _PARAGRAPH, guess)
+    mock.assert_called_once()
+    assert mock.call_args.kwargs["max_tokens"] == 256
+    assert "feedback" not in json.dumps(mock.call_args.kwargs["schema"])
+    assert result["breakdown"]["associative_word_score"] == 90.0
+    assert all(150 <= n <= 200 for n in _feedback_words(result))
+
+
 def test_score_uses_stored_values_when_ctx_is_none(ai):
-    """When ctx has None for actuals, self._opening_sentence is used."""
-    ai._opening_sentence = "Stored sentence."
-    ai._association_word = "stored_word"
-    ai._paragraph_text = "Full paragraph."
+    """When ctx has None for actuals, the stored opening sentence is used."""
+    ai._game().opening_sentence = "Stored sentence."
+    ai._game().association_word = "stored_word"
+    ai._game().paragraph_text = "Full paragraph."
     called_with = {}
 
-    def capture_score(_client, sent, word, para, guess):
+    def capture_score(_client, sent, word, para, guess, **_kwargs):
         called_with["sentence"] = sent
         called_with["word"] = word
         return _mock_score()
@@ -0,0 +1,114 @@
+"""Tests for knowledge_base.structured_output — decoder, repair, tool-mode calls."""
+
+import json
+from unittest.mock import MagicMock
+
+import anthropic
+
+from knowledge_base.llm_client import TOOL_NAME, call_llm
+from knowledge_base.structured_output import complete_structured, decode, validate
+
+ANSWERS = {
+    "type": "array", "minItems": 1,
+    "items": {
+        "type": "object",
+        "properties": {"question_number": {"type": "integer", "minimum": 1},
+                       "answer": {"type": "string",
+                                  "enum": ["A", "B", "C", "D", "Not Relevant"]}},
+        "required": ["question_number", "answer"],
+    },
+}
+HINT = {"type": "object",
+        "properties": {"book_hint": {"type": "string", "minLength": 10, "maxLength": 30}},
+        "required": ["book_hint"]}
+
+
+# ── decode / repair ──
+
+
+def test_decode_accepts_prose_wrapped_json():
+    value, errors = decode('Sure! [{"question_number": 1, "answer": "A"}] done', ANSWERS)
+    assert value == [{"question_number": 1, "answer": "A"}]
+    assert errors == []
+
+
+def test_decode_repairs_numbers_and_enum_case():
+    raw = json.dumps([{"question_number": "2", "answer": " not relevant "}])
+    value, errors = decode(raw, ANSWERS)
+    assert value == [{"question_number": 2, "answer": "Not Relevant"}]
+    assert errors == []
+
+
+def test_decode_trims_overlong_strings_at_word_boundary():
+    value, errors = decode(json.dumps({"book_hint": "word " * 20}), HINT)
+    assert len(value["book_hint"]) <= 30 and not value["book_hint"].endswith(" ")
+    assert errors == []
+
+
+def test_decode_unwraps_tool_items_wrapper():
+    value, _ = decode(json.dumps({"items": [{"question_number": 1, "answer": "B"}]}), ANSWERS)
+    assert value == [{"question_number": 1, "answer": "B"}]
+
+
+def test_decode_reports_unrepairable_errors():
+    value, errors = decode(json.dumps([{"question_number": 0, "answer": "E"}]), ANSWERS)
+    assert value is not None
+    assert any("< 1" in e for e in errors) and any("not in" in e for e in errors)
+    assert decode("no json here", ANSWERS) == (None, ["$: no JSON found"])
+
+
+def test_validate_rejects_bool_as_integer():
+    assert validate(True, {"type": "integer"})
+
+
+# ── complete_structured ──
+
+
+def test_complete_structured_retries_once_with_errors():
+    prompts = []
+
+    def call(client, prompt, **kw):
+        prompts.append(prompt)
+        assert kw["schema"] is HINT
+        return '{"book_hint": "short"}' if len(prompts) == 1 else '{"book_hint": "a longer hint"}'
+
+    value, errors = complete_structured(None, "p", HINT, call=call)
+    assert value == {"book_hint": "a longer hint"} and errors == []
+    assert "shorter than 10" in prompts[1]
+
+
+def test_complete_structured_skips_retry_when_valid():
+    call = MagicMock(return_value='{"book_hint": "valid enough hint"}')
+    complete_structured(None, "p", HINT, call=call)
+    assert call.call_count == 1
+
+
+def test_complete_structured_keeps_first_result_when_retry_errors():
+    outputs = iter(['{"book_hint": "short"}',
+                    anthropic.APITimeoutError(request=MagicMock())])
+
+    def call(client, prompt, **kw):
+        out = next(outputs)
+        if isinstance(out, Exception):
+            raise out
+        return out
+
+    value, errors = complete_structured(None, "p", HINT, call=call)
+    assert value == {"book_hint": "short"} and errors
+
+
+# ── call_llm tool mode ──
+
+
+def test_call_llm_schema_forces_tool_and_returns_input_json():
+    block = MagicMock(type="tool_use", input={"items": [{"question_number": 1, "answer": "C"}]})
+    client = MagicMock(spec=anthropic.Anthropic)
+    client.with_options.return_value = client
+    client.messages.create.return_value = MagicMock(content=[block])
+
+    raw = call_llm(client, "p", schema=ANSWERS)
+
+    kwargs = client.messages.create.call_args.kwargs
+    assert kwargs["tool_choice"] == {"type": "tool", "name": TOOL_NAME}
+    assert kwargs["tools"][0]["input_schema"]["properties"]["items"] == ANSWERS
+    assert decode(raw, ANSWERS)[0] == [{"question_number": 1, "answer": "C"}]
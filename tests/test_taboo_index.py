@@ -0,0 +1,40 @@
+"""Tests for the taboo-word index (Hebrew prefix forms, per-paragraph cache)."""
+
+from knowledge_base.taboo_index import TabooIndex, extract_words, word_forms
+
+
+def test_word_forms_strip_hebrew_prefixes():
+    assert word_forms("ורשתות") == ["ורשתות", "רשתות"]
+    assert word_forms("ובהרשתות")[:4] == ["ובהרשתות", "בהרשתות", "הרשתות", "רשתות"]
+    assert word_forms("network") == ["network"]
+
+
+def test_word_forms_keep_short_stems():
+    # "בית" would leave a 2-letter stem, so it is not stripped
+    assert word_forms("בית") == ["בית"]
+
+
+def test_prefixed_hint_word_is_taboo():
+    index = TabooIndex()
+    assert index.check("הרשתות העמוקות", "למידת עמוקה ורשתות") == {"הרשתות"}
+    assert index.check("ברשתות", "רשתות") == {"ברשתות"}
+    assert index.check("ביולוגיה", "מתמטיקה ופיזיקה") == set()
+
+
+def test_forbidden_set_is_cached_per_paragraph():
+    index = TabooIndex()
+    text = "the cat sat on the mat"
+    assert index.forbidden(text) is index.forbidden(text)
+    index.build(["other paragraph"])
+    assert "paragraph" in index.forbidden("other paragraph")
+
+
+def test_sample_is_sorted_and_counted():
+    index = TabooIndex()
+    sample, count = index.sample("zeta alpha, beta alpha", limit=2)
+    assert sample == "alpha, beta"
+    assert count == 3
+
+
+def test_extract_words_matches_helper_semantics():
+    assert extract_words("Don't stop, ok?") == {"dont", "stop", "ok"}